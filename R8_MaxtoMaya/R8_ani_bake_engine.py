@@ -0,0 +1,432 @@
+'''
+R8 Bake Engine
+Bake_Control_Set 컨트롤 베이킹 엔진과 엔진 비교 벤치마크입니다.
+
+엔진 종류:
+- bakeResults: cmds.bakeResults(simulation=True) - 기존 방식, Undo 가능
+- api:         컨스트레인이 구동하는 TRS 채널을 프레임마다 한 번씩 평가해 샘플링하고,
+               컨스트레인을 지운 뒤 MFnAnimCurve.addKeys로 채널당 한 번에 키를 기록 - Undo 불가
+- auto:        의존성 분석 결과 api 엔진으로 같은 결과를 낼 수 있으면 api, 아니면 bakeResults
+
+api 엔진은 프레임을 옮길 때 씬 전체를 한 번 평가(Evaluation Manager parallel 모드)하고
+모든 채널 값을 한 번에 읽으므로, 컨트롤마다 DG를 따로 당기는 bakeResults보다 빠릅니다.
+다음 경우에는 프레임 순서 평가(simulation)가 필요하므로 bakeResults를 사용합니다.
+- 컨스트레인 상류에 expression, 다이나믹스 등 이전 프레임 상태에 의존하는 노드가 있음
+- 채널이 pairBlend 등 컨스트레인이 아닌 노드로 구동됨 (기존 키와 블렌드)
+
+벤치마크는 같은 씬 파일을 엔진마다 다시 열어 베이킹하고, 처리 시간과
+베이킹 전 컨스트레인 평가값 대비 최대 오차를 비교합니다.
+    mayapy R8_ani_bake_engine.py <베이킹 전 씬 파일>
+
+Qt에 의존하지 않으며, 패키지 __init__을 거치지 않고 mayapy 작업 모듈에서도 직접 임포트할 수 있습니다.
+'''
+import os
+import sys
+import math
+import time
+import json
+import tempfile
+
+from maya import cmds
+from maya.api import OpenMaya as om2
+from maya.api import OpenMayaAnim as om2anim
+
+BAKE_CTRL_SET = 'Bake_Control_Set'
+
+BAKE_ENGINE_AUTO = 'auto'
+BAKE_ENGINE_API = 'api'
+BAKE_ENGINE_BAKE_RESULTS = 'bakeResults'
+BAKE_ENGINES = (BAKE_ENGINE_AUTO, BAKE_ENGINE_API, BAKE_ENGINE_BAKE_RESULTS)
+
+# 베이킹 채널 (속성 이름 -> 종류)
+BAKE_CHANNELS = {
+    'translateX': 'translate', 'translateY': 'translate', 'translateZ': 'translate',
+    'rotateX': 'rotate', 'rotateY': 'rotate', 'rotateZ': 'rotate',
+    'scaleX': 'scale', 'scaleY': 'scale', 'scaleZ': 'scale',
+}
+ROTATE_ATTRIBUTES = ('rotateX', 'rotateY', 'rotateZ')
+
+# 이전 프레임 상태에 의존할 수 있어 프레임 순서 평가가 필요한 노드 타입
+SIMULATION_NODE_TYPES = (
+    'expression', 'nucleus', 'nCloth', 'nRigid', 'nParticle', 'particle', 'hairSystem',
+    'rigidBody', 'rigidSolver', 'dynamicConstraint', 'fluidShape', 'bifrostGraphShape'
+)
+
+
+class BakeChannel:
+    """컨스트레인이 구동하는 컨트롤 채널 하나"""
+
+    def __init__(self, control, attribute, plug, driver):
+        self.control = control
+        self.attribute = attribute
+        self.kind = BAKE_CHANNELS[attribute]
+        self.plug = plug
+        self.driver = driver
+
+    @property
+    def name(self):
+        return f'{self.control}.{self.attribute}'
+
+
+# =============================================================================
+# 의존성 분석
+# =============================================================================
+
+def _get_plug(plug_name):
+    selection = om2.MSelectionList()
+    selection.add(plug_name)
+    return selection.getPlug(0)
+
+
+def collect_bake_channels(controls):
+    """컨트롤의 TRS 채널과 채널을 구동하는 노드를 한 번에 조회합니다.
+
+    Returns:
+        tuple: ([BakeChannel] 컨스트레인 구동 채널, {채널 이름: 구동 노드} 컨스트레인이 아닌 노드로 구동되는 채널)
+    """
+    pairs = cmds.listConnections(controls, source=True, destination=False,
+                                 connections=True, plugs=True) or []
+    driver_nodes = {source.split('.', 1)[0] for source in pairs[1::2]}
+    constraints = set(cmds.ls(list(driver_nodes), type='constraint') or []) if driver_nodes else set()
+
+    channels, other_drivers = [], {}
+    for destination, source in zip(pairs[0::2], pairs[1::2]):
+        control, attribute = destination.split('.', 1)
+        if attribute not in BAKE_CHANNELS:
+            continue
+        driver = source.split('.', 1)[0]
+        if driver in constraints:
+            channels.append(BakeChannel(control, attribute, _get_plug(destination), driver))
+        else:
+            other_drivers[destination] = driver
+    return channels, other_drivers
+
+
+def analyze_bake(controls):
+    """api 엔진으로 베이킹할 수 있는지 분석합니다.
+
+    Returns:
+        tuple: ([BakeChannel], [bakeResults(simulation)가 필요한 이유])
+    """
+    channels, other_drivers = collect_bake_channels(controls)
+    reasons = []
+
+    if not channels:
+        reasons.append("컨스트레인으로 구동되는 채널 없음")
+
+    blended = [name for name, driver in other_drivers.items()
+               if cmds.nodeType(driver) not in ('animCurveTL', 'animCurveTA', 'animCurveTU')]
+    if blended:
+        reasons.append(f"컨스트레인 외 노드로 구동되는 채널 {len(blended)}개 (예: {blended[0]})")
+
+    constraints = sorted({channel.driver for channel in channels})
+    if constraints:
+        history = cmds.listHistory(constraints) or []
+        simulated = cmds.ls(history, type=list(SIMULATION_NODE_TYPES)) or []
+        if simulated:
+            reasons.append(f"프레임 순서 평가가 필요한 노드 {len(simulated)}개 (예: {simulated[0]})")
+
+    return channels, reasons
+
+
+# =============================================================================
+# 샘플링
+# =============================================================================
+
+def _set_evaluation_mode(mode):
+    """Evaluation Manager 모드를 바꾸고 이전 모드를 반환합니다."""
+    try:
+        previous = cmds.evaluationManager(query=True, mode=True)[0]
+        if previous != mode:
+            cmds.evaluationManager(mode=mode)
+        return previous
+    except Exception:
+        return None
+
+
+def _frame_times(start_frame, end_frame):
+    unit = om2.MTime.uiUnit()
+    return [om2.MTime(float(frame), unit) for frame in range(int(start_frame), int(end_frame) + 1)]
+
+
+def sample_plugs(plugs, start_frame, end_frame):
+    """프레임마다 씬을 한 번 평가하고 모든 플러그 값을 읽습니다. (내부 단위)
+
+    Returns:
+        tuple: ([MTime], [[값, ...] 플러그별])
+    """
+    times = _frame_times(start_frame, end_frame)
+    values = [[] for _ in plugs]
+
+    current_time = om2anim.MAnimControl.currentTime()
+    previous_mode = _set_evaluation_mode('parallel')
+    # 대화형 세션에서는 프레임마다 뷰포트를 다시 그리지 않도록 갱신을 멈춤
+    suspended = (om2.MGlobal.mayaState() == om2.MGlobal.kInteractive
+                 and not cmds.refresh(query=True, suspend=True))
+    if suspended:
+        cmds.refresh(suspend=True)
+    try:
+        for mtime in times:
+            om2anim.MAnimControl.setCurrentTime(mtime)
+            for plug, samples in zip(plugs, values):
+                samples.append(plug.asDouble())
+    finally:
+        if suspended:
+            cmds.refresh(suspend=False)
+        if previous_mode:
+            _set_evaluation_mode(previous_mode)
+        om2anim.MAnimControl.setCurrentTime(current_time)
+
+    return times, values
+
+
+def _control_rotate_orders(controls):
+    orders = {}
+    for control in controls:
+        try:
+            orders[control] = cmds.getAttr(f'{control}.rotateOrder')
+        except ValueError:
+            orders[control] = 0
+    return orders
+
+
+def minimize_rotation(channels, values):
+    """컨트롤별 회전 샘플을 이전 프레임과 가장 가까운 오일러 해로 바꿉니다. (bakeResults minimizeRotation)"""
+    rotate_index = {}
+    for index, channel in enumerate(channels):
+        if channel.kind == 'rotate':
+            rotate_index.setdefault(channel.control, {})[channel.attribute] = index
+
+    orders = _control_rotate_orders(list(rotate_index))
+    for control, indices in rotate_index.items():
+        if len(indices) != 3:
+            # 일부 축만 구동되면 축별로 360도 단위만 보정
+            for index in indices.values():
+                samples = values[index]
+                for i in range(1, len(samples)):
+                    turns = round((samples[i] - samples[i - 1]) / (2 * math.pi))
+                    samples[i] -= turns * 2 * math.pi
+            continue
+
+        rx, ry, rz = (values[indices[attr]] for attr in ROTATE_ATTRIBUTES)
+        previous = None
+        for i in range(len(rx)):
+            euler = om2.MEulerRotation(rx[i], ry[i], rz[i], orders[control])
+            if previous is not None:
+                euler = euler.closestSolution(previous)
+                rx[i], ry[i], rz[i] = euler.x, euler.y, euler.z
+            previous = euler
+
+
+# =============================================================================
+# 베이킹 엔진
+# =============================================================================
+
+def bake_with_bake_results(controls, start_frame, end_frame):
+    """cmds.bakeResults(simulation=True)로 베이킹합니다."""
+    cmds.bakeResults(controls, simulation=True, t=(start_frame, end_frame),
+                     sampleBy=1, oversamplingRate=1, disableImplicitControl=True,
+                     preserveOutsideKeys=True, sparseAnimCurveBake=False,
+                     removeBakedAttributeFromLayer=False,
+                     removeBakedAnimFromLayer=False, bakeOnOverrideLayer=False,
+                     minimizeRotation=True, controlPoints=False, shape=True)
+
+
+def bake_with_api(channels, start_frame, end_frame, timings=None):
+    """컨스트레인 구동 채널을 샘플링하고 MFnAnimCurve.addKeys로 한 번에 키를 기록합니다.
+
+    샘플링 후 채널을 구동하던 컨스트레인은 삭제됩니다. (bakeResults disableImplicitControl 대응)
+    """
+    timings = timings if timings is not None else {}
+
+    start = time.time()
+    times, values = sample_plugs([channel.plug for channel in channels], start_frame, end_frame)
+    minimize_rotation(channels, values)
+    timings['sample'] = time.time() - start
+
+    start = time.time()
+    constraints = sorted({channel.driver for channel in channels})
+    cmds.delete(constraints)
+
+    time_array = om2.MTimeArray(times)
+    tangent = om2anim.MFnAnimCurve.kTangentGlobal
+    for channel, samples in zip(channels, values):
+        curve = om2anim.MFnAnimCurve()
+        curve.create(channel.plug)
+        curve.addKeys(time_array, om2.MDoubleArray(samples), tangent, tangent)
+    timings['write'] = time.time() - start
+    return timings
+
+
+def bake_controls(controls, start_frame, end_frame, engine=BAKE_ENGINE_AUTO):
+    """컨트롤들을 지정한 엔진으로 베이킹합니다.
+
+    Returns:
+        dict: engine(실제 사용한 엔진), reasons(bakeResults를 선택한 이유), channels, timings(단계별 초)
+    """
+    if engine not in BAKE_ENGINES:
+        raise ValueError(f"알 수 없는 베이킹 엔진: {engine}")
+
+    start_frame = int(start_frame)
+    end_frame = int(end_frame)
+    result = {'engine': engine, 'reasons': [], 'channels': 0, 'timings': {}}
+
+    if engine != BAKE_ENGINE_BAKE_RESULTS:
+        start = time.time()
+        channels, reasons = analyze_bake(controls)
+        result['timings']['analyze'] = time.time() - start
+        result['reasons'] = reasons
+        if engine == BAKE_ENGINE_API and not channels:
+            raise RuntimeError("api 엔진으로 베이킹할 채널이 없습니다.")
+        if engine == BAKE_ENGINE_API or not reasons:
+            result['engine'] = BAKE_ENGINE_API
+            result['channels'] = len(channels)
+            bake_with_api(channels, start_frame, end_frame, result['timings'])
+            return result
+
+    result['engine'] = BAKE_ENGINE_BAKE_RESULTS
+    start = time.time()
+    bake_with_bake_results(controls, start_frame, end_frame)
+    result['timings']['bake'] = time.time() - start
+    return result
+
+
+def format_bake_result(result):
+    """bake_controls 결과를 한 줄 문자열로 만듭니다."""
+    timings = ', '.join(f"{name} {elapsed:.2f}초" for name, elapsed in result['timings'].items())
+    text = f"베이킹 엔진: {result['engine']} ({timings})"
+    if result['engine'] == BAKE_ENGINE_API:
+        text += f" - 채널 {result['channels']}개"
+    if result['reasons']:
+        text += f" - bakeResults 사용 이유: {'; '.join(result['reasons'])}"
+    return text
+
+
+# =============================================================================
+# 벤치마크
+# =============================================================================
+
+def _channel_plugs(controls):
+    names, plugs = [], []
+    for control in controls:
+        for attribute in BAKE_CHANNELS:
+            name = f'{control}.{attribute}'
+            try:
+                plugs.append(_get_plug(name))
+            except RuntimeError:
+                continue
+            names.append(name)
+    return names, plugs
+
+
+def _max_difference(names, reference, values):
+    """채널 종류별 최대 오차와 오차가 가장 큰 채널을 반환합니다. (translate: cm, rotate: 도)"""
+    worst = {kind: (0.0, None) for kind in set(BAKE_CHANNELS.values())}
+    for name, expected, actual in zip(names, reference, values):
+        kind = BAKE_CHANNELS[name.rsplit('.', 1)[1]]
+        for a, b in zip(expected, actual):
+            diff = a - b
+            if kind == 'rotate':
+                # 360도 차이는 같은 회전
+                diff = math.degrees(math.remainder(diff, 2 * math.pi))
+            diff = abs(diff)
+            if diff > worst[kind][0]:
+                worst[kind] = (diff, name)
+    return {kind: {'max': value, 'channel': name} for kind, (value, name) in worst.items()}
+
+
+def _open_bake_scene(scene_file):
+    cmds.file(scene_file, open=True, force=True)
+    if not cmds.objExists(BAKE_CTRL_SET):
+        raise RuntimeError(f"'{BAKE_CTRL_SET}' 세트가 없습니다: {scene_file}")
+    controls = cmds.sets(BAKE_CTRL_SET, q=True) or []
+    start_frame = int(cmds.playbackOptions(q=True, minTime=True))
+    end_frame = int(cmds.playbackOptions(q=True, maxTime=True))
+    return controls, start_frame, end_frame
+
+
+def benchmark_bake_engines(scene_file=None, engines=(BAKE_ENGINE_BAKE_RESULTS, BAKE_ENGINE_API)):
+    """같은 클립을 엔진별로 베이킹해 처리 시간과 수치 오차를 비교합니다.
+
+    Args:
+        scene_file (str): 스켈레톤 매칭까지 마친 베이킹 전 씬 파일. None이면 현재 씬을 임시 파일로 저장해 사용하고,
+                          끝나면 현재 씬(베이킹 전 상태)을 다시 엽니다.
+        engines (tuple): 비교할 엔진
+
+    Returns:
+        dict: reference_time(기준 샘플링 초), frames, channels, engines({엔진: {time, result, difference}}),
+              engine_difference(첫 두 엔진 결과 간 오차)
+    """
+    restore_name = None
+    if scene_file is None:
+        restore_name = cmds.file(query=True, sceneName=True)
+        scene_file = os.path.join(tempfile.gettempdir(), 'r8_bake_benchmark.mb').replace('\\', '/')
+        cmds.file(rename=scene_file)
+        cmds.file(save=True, type='mayaBinary', force=True)
+
+    report = {'scene_file': scene_file, 'engines': {}}
+    try:
+        # 기준값: 베이킹 전 컨스트레인 평가값
+        controls, start_frame, end_frame = _open_bake_scene(scene_file)
+        names, plugs = _channel_plugs(controls)
+        start = time.time()
+        _, reference = sample_plugs(plugs, start_frame, end_frame)
+        report['reference_time'] = time.time() - start
+        report['frames'] = end_frame - start_frame + 1
+        report['channels'] = len(names)
+
+        baked_values = {}
+        for engine in engines:
+            controls, start_frame, end_frame = _open_bake_scene(scene_file)
+            start = time.time()
+            result = bake_controls(controls, start_frame, end_frame, engine=engine)
+            elapsed = time.time() - start
+
+            _, plugs = _channel_plugs(controls)
+            _, values = sample_plugs(plugs, start_frame, end_frame)
+            baked_values[engine] = values
+            report['engines'][engine] = {
+                'time': elapsed,
+                'result': result,
+                'difference': _max_difference(names, reference, values),
+            }
+
+        if len(engines) >= 2:
+            report['engine_difference'] = _max_difference(
+                names, baked_values[engines[0]], baked_values[engines[1]])
+    finally:
+        if restore_name is not None:
+            cmds.file(scene_file, open=True, force=True)
+            if restore_name:
+                cmds.file(rename=restore_name)
+
+    return report
+
+
+def format_benchmark(report):
+    """벤치마크 결과를 여러 줄 문자열로 만듭니다."""
+    lines = [f"베이킹 벤치마크: {report['scene_file']}",
+             f"프레임 {report['frames']}개, 채널 {report['channels']}개, 기준 샘플링 {report['reference_time']:.2f}초"]
+    for engine, data in report['engines'].items():
+        difference = ', '.join(f"{kind} {value['max']:.6f}" for kind, value in sorted(data['difference'].items()))
+        lines.append(f"- {engine}: {data['time']:.2f}초 (실제 엔진 {data['result']['engine']}) / 최대 오차 {difference}")
+    if 'engine_difference' in report:
+        difference = ', '.join(f"{kind} {value['max']:.6f}"
+                               for kind, value in sorted(report['engine_difference'].items()))
+        lines.append(f"- 엔진 간 최대 오차: {difference}")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("사용법: mayapy R8_ani_bake_engine.py <베이킹 전 씬 파일> [엔진 ...]")
+        sys.exit(1)
+
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    try:
+        benchmark = benchmark_bake_engines(sys.argv[1], tuple(sys.argv[2:]) or (BAKE_ENGINE_BAKE_RESULTS, BAKE_ENGINE_API))
+        print(format_benchmark(benchmark))
+        print(json.dumps(benchmark, ensure_ascii=False, default=str))
+    finally:
+        maya.standalone.uninitialize()
@@ -6,9 +6,17 @@ import os
 import time
 import subprocess
 import tempfile
+from collections import deque
+from functools import partial
 from maya import cmds, mel
 import maya.OpenMayaUI as omui
 
+from . import R8_job_runner
+from . import R8_job_profiler
+from . import R8_job_policy
+from . import R8_log
+from . import R8_ani_build_cache
+
 # Maya 버전에 따른 PySide 모듈 임포트 개선
 maya_version = mel.eval('getApplicationVersionAsFloat()')
 try:
@@ -81,6 +89,35 @@ def get_mayapy_path(maya_exe):
 # Maya 실행 파일 경로
 MAYA_EXE = get_maya_exe_path()
 
+# mayapy 작업 모듈(R8_ani_batch_worker) 위치
+# 패키지 __init__의 UI 임포트를 피하기 위해 폴더를 직접 sys.path에 추가합니다.
+WORKER_MODULE_DIR = os.path.dirname(os.path.abspath(__file__)).replace('\\', '/')
+
+# 파일 하나를 처리하고 종료하는 mayapy 스크립트
+COLD_JOB_SCRIPT = '''
+import maya.standalone
+maya.standalone.initialize(name='python')
+
+import sys
+sys.path.insert(0, r"{module_dir}")
+import R8_ani_batch_worker
+
+success = R8_ani_batch_worker.run_single_job(r"{rig_file}", r"{fbx_path}", r"{output_file}", {frontX_v}, "{job_id}")
+print(f"처리 결과: {{success}}")
+'''
+
+# 리그를 열어둔 채 stdin으로 작업을 받아 처리하는 웜 워커 스크립트
+WARM_WORKER_SCRIPT = '''
+import maya.standalone
+maya.standalone.initialize(name='python')
+
+import sys
+sys.path.insert(0, r"{module_dir}")
+import R8_ani_batch_worker
+
+R8_ani_batch_worker.serve(r"{rig_file}")
+'''
+
 def get_maya_main_window():
     """Maya 메인 윈도우를 반환합니다."""
     main_window_ptr = omui.MQtUtil.mainWindow()
@@ -90,21 +127,69 @@ def time_change_set():
     """시간 단위를 60fps로 설정합니다."""
     cmds.currentUnit(time='ntscf')
 
+def get_hidden_startupinfo():
+    """Windows에서 콘솔 창 없이 프로세스를 실행하기 위한 STARTUPINFO를 반환합니다."""
+    if os.name != 'nt':
+        return None
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return startupinfo
+
+def get_default_worker_count():
+    """권장 동시 워커 수를 반환합니다. (mayapy 프로세스당 메모리 사용량을 고려해 코어 수의 절반)"""
+    return max(1, (os.cpu_count() or 2) // 2)
+
 class BatchProcessManager:
-    """배치 프로세스 관리 클래스"""
+    """배치 프로세스 관리 클래스
+    
+    워커 슬롯마다 전용 대기열을 두고 최대 max_workers개의 mayapy 프로세스를 동시에 실행합니다.
+    대기열이 빈 워커는 가장 긴 대기열에서 작업을 가져옵니다.
+    
+    persistent_workers가 True이면 워커마다 mayapy를 한 번만 실행하고(웜 워커)
+    리그를 열어둔 채 stdin으로 작업 요청을 보냅니다.
+    
+    두 모드 모두 작업 상태는 자식 프로세스가 stdout으로 보내는 R8_job_runner 이벤트로 판단합니다.
+    
+    변환 결과는 저장 폴더의 빌드 매니페스트(R8_ani_build_cache)에 기록되며,
+    skip_unchanged가 True이면 입력이 바뀌지 않은 파일은 건너뜁니다.
+    """
     
     def __init__(self):
-        self.current_export_info = None
         self.check_export_timer = None
-        self.file_queue = []
-        self.current_index = 0
+        self.file_queue = []         # 전체 처리 대상 파일 목록
+        self.workers = []            # 워커 슬롯 목록
+        self.max_workers = 1
+        self.persistent_workers = False  # 웜 워커 모드
+        self.quiet_logs = True       # 워커 항목별 로그 생략 (R8_log 조용한 모드)
+        self.completed_count = 0     # 완료(성공/실패)된 파일 수
         self.progress_callback = None
         self.file_result_callback = None
-        self.current_process = None  # 현재 실행 중인 프로세스
         self.is_cancelled = False    # 취소 플래그
+        self.build_manifest = None   # 저장 폴더의 변환 기록
+        self.skipped_files = []      # 최신 상태라 건너뛴 파일 목록
+        self.run_id = None           # 프로파일 데이터베이스의 실행 ID (R8_job_profiler)
+        self.duration_model = None   # 기록 기반 처리 시간 예측 (R8_job_policy.DurationModel)
+        self.input_sizes = {}        # 파일 -> FBX 크기 (바이트)
+        self.retry_counts = {}       # 파일 -> 재시도 횟수
+        self.retry_after = {}        # 파일 -> 재시도 대기가 끝나는 시각 (그 전에는 다른 워커가 가져가지 않음)
+    
+    def _create_worker(self, worker_id):
+        """워커 슬롯을 생성합니다."""
+        return {
+            'worker_id': worker_id,
+            'queue': deque(),        # 워커 전용 대기열
+            'job': None,             # 실행 중인 mayapy 프로세스 (R8_job_runner.JobProcess)
+            'export_info': None,     # 현재 처리 중인 파일 정보
+            'warm_script': None      # 웜 워커 부트스트랩 스크립트
+        }
+    
+    def is_worker_busy(self, worker):
+        """워커가 파일을 처리 중인지 확인합니다."""
+        return worker['export_info'] is not None
         
     def cancel_batch_process(self):
-        """배치 프로세스를 취소합니다."""
+        """배치 프로세스를 취소합니다. 실행 중인 모든 워커 프로세스를 종료합니다."""
         print("배치 프로세스 취소 요청...")
         self.is_cancelled = True
         
@@ -114,38 +199,24 @@ class BatchProcessManager:
             self.check_export_timer = None
             print("프로세스 모니터링 타이머 중지됨")
         
-        # 현재 실행 중인 프로세스 종료
-        if self.current_process:
-            try:
-                # Windows에서 프로세스 트리 전체 종료
-                subprocess.run(['taskkill', '/F', '/T', '/PID', str(self.current_process.pid)], 
-                             capture_output=True, text=True, timeout=10)
-                print(f"프로세스 (PID: {self.current_process.pid}) 강제 종료됨")
-                self.current_process = None
-            except Exception as e:
-                print(f"프로세스 종료 중 오류: {e}")
-        
-        # 임시 파일 정리
-        if self.current_export_info:
-            try:
-                temp_script = self.current_export_info.get('temp_script')
-                status_file = self.current_export_info.get('status_file')
-                
-                if temp_script and os.path.exists(temp_script):
-                    os.remove(temp_script)
-                    print(f"임시 스크립트 파일 삭제: {temp_script}")
-                
-                if status_file and os.path.exists(status_file):
-                    os.remove(status_file)
-                    print(f"상태 파일 삭제: {status_file}")
-                    
-            except Exception as e:
-                print(f"임시 파일 정리 중 오류: {e}")
+        for worker in self.workers:
+            # 워커 프로세스 종료
+            self._terminate_worker_process(worker)
+            self._cleanup_temp_files(worker['warm_script'])
+            
+            # 임시 파일 정리
+            if worker['export_info']:
+                self._cleanup_temp_files(worker['export_info'].get('temp_script'))
+            
+            worker['export_info'] = None
+            worker['queue'].clear()
         
         # 상태 초기화
-        self.current_export_info = None
+        self.workers = []
         self.file_queue = []
-        self.current_index = 0
+        self.completed_count = 0
+        R8_job_profiler.end_run(self.run_id)
+        self.run_id = None
         
         # 취소 콜백 호출
         if self.progress_callback:
@@ -153,7 +224,7 @@ class BatchProcessManager:
         
         print("배치 프로세스 취소 완료")
         
-    def start_batch_process(self, rig_file, fbx_files, fbx_folder, save_folder, frontX_v, progress_callback=None, file_result_callback=None):
+    def start_batch_process(self, rig_file, fbx_files, fbx_folder, save_folder, frontX_v, progress_callback=None, file_result_callback=None, max_workers=1, persistent_workers=False, skip_unchanged=False):
         """배치 프로세스를 시작합니다."""
         # 취소 플래그 초기화
         self.is_cancelled = False
@@ -182,14 +253,52 @@ class BatchProcessManager:
                 progress_callback(error_msg, 0, 0)
             return False
         
-        self.file_queue = fbx_files
-        self.current_index = 0
+        # 빌드 매니페스트 준비 (입력 해시는 성공한 파일을 기록할 때 사용)
+        self.build_manifest = R8_ani_build_cache.BuildManifest(save_folder)
+        self.rig_hash = R8_ani_build_cache.hash_file(rig_file)
+        self.script_version = R8_ani_build_cache.get_script_version()
+        self.skipped_files = []
+        
+        if skip_unchanged:
+            rebuild, self.skipped_files = R8_ani_build_cache.plan_batch(rig_file, fbx_files, fbx_folder, save_folder, frontX_v)
+            for fbx_file in self.skipped_files:
+                print(f"[건너뜀] {fbx_file} - 최신 상태")
+            for fbx_file, reason in rebuild:
+                print(f"[재변환] {fbx_file} - {reason}")
+            fbx_files = [fbx_file for fbx_file, _ in rebuild]
+            
+            if not fbx_files:
+                print("모든 파일이 최신 상태입니다.")
+                if progress_callback:
+                    progress_callback("모든 파일이 최신 상태입니다.", 0, 0)
+                return True
+        
+        self.file_queue = list(fbx_files)
+        self.completed_count = 0
         self.rig_file = rig_file
         self.fbx_folder = fbx_folder
         self.save_folder = save_folder
         self.frontX_v = frontX_v
         self.progress_callback = progress_callback
         self.file_result_callback = file_result_callback
+        self.max_workers = max(1, min(int(max_workers or 1), len(self.file_queue) or 1))
+        self.persistent_workers = bool(persistent_workers)
+        
+        # 파일별 / 단계별 처리 시간을 기록할 실행 등록
+        self.run_id = R8_job_profiler.begin_run('ani_batch_process', file_count=len(self.file_queue),
+                                                max_workers=self.max_workers, warm=self.persistent_workers,
+                                                rig_file=rig_file)
+        
+        # 기록으로 파일별 처리 시간을 예측해 긴 파일부터 가장 한가한 워커에 분배 (파일별 제한 시간에도 사용)
+        self.duration_model = R8_job_policy.DurationModel.from_history('ani_batch_process', warm=self.persistent_workers)
+        self.input_sizes = {fbx_file: self._input_size(fbx_file) for fbx_file in self.file_queue}
+        self.retry_counts = {}
+        self.retry_after = {}
+        
+        self.workers = [self._create_worker(i + 1) for i in range(self.max_workers)]
+        assignments = R8_job_policy.assign_longest_first(self.file_queue, self._expected_cost, self.max_workers)
+        for worker, assigned in zip(self.workers, assignments):
+            worker['queue'].extend(assigned)
         
         print(f"배치 프로세스 시작: {len(fbx_files)}개 파일")
         print(f"리그 파일: {rig_file}")
@@ -197,37 +306,151 @@ class BatchProcessManager:
         print(f"저장 폴더: {save_folder}")
         print(f"FrontX 모드: {frontX_v}")
         print(f"mayapy 경로: {mayapy_path}")
+        print(f"동시 워커 수: {self.max_workers} ({'웜 워커' if self.persistent_workers else '파일별 프로세스'})")
+        print(f"처리 시간 예측 기록: {self.duration_model.sample_count}개")
         print("=" * 50)
         
-        # 첫 번째 파일 처리 시작
-        self.process_next_file()
+        # 모든 워커의 이벤트 큐를 하나의 타이머로 메인 스레드에서 소비
+        if self.check_export_timer:
+            self.check_export_timer.stop()
+        self.check_export_timer = QtCore.QTimer()
+        self.check_export_timer.timeout.connect(self.check_process_status)
+        # 파일이 아닌 메모리 큐만 확인하므로 짧은 주기로 확인
+        self.check_export_timer.start(200)
+        
+        # 각 워커의 첫 번째 파일 처리 시작
+        for worker in self.workers:
+            self.process_next_file(worker)
         return True
     
-    def process_next_file(self):
-        """다음 파일을 처리합니다."""
+    def _input_size(self, fbx_file):
+        try:
+            return os.path.getsize(os.path.join(self.fbx_folder, fbx_file))
+        except OSError:
+            return 0
+    
+    def _expected_cost(self, fbx_file):
+        return self.duration_model.cost(self.input_sizes.get(fbx_file))
+    
+    def _job_timeout(self, fbx_file):
+        """파일별 제한 시간 (기록이 없으면 R8_job_policy.DEFAULT_TIMEOUT)"""
+        return R8_job_policy.timeout_for(self.duration_model.predict(self.input_sizes.get(fbx_file)))
+    
+    def _retry_or_fail(self, worker, fbx_file, reason):
+        """일시적 실패(크래시, 타임아웃, 시작 실패)면 대기 후 새 프로세스로 다시 시도하고, 아니면 실패로 마무리합니다."""
+        attempt = self.retry_counts.get(fbx_file, 0) + 1
+        if self.is_cancelled or not R8_job_policy.should_retry(reason, attempt):
+            if worker['export_info']:
+                self._complete_file_processing(worker, fbx_file, False)
+            else:
+                self._finish_file(worker, fbx_file, False)
+            return
+        
+        self.retry_counts[fbx_file] = attempt
+        delay = R8_job_policy.retry_delay(attempt)
+        self.retry_after[fbx_file] = time.time() + delay
+        print(f"[재시도] {fbx_file} - {reason}, {delay:.0f}초 후 새 프로세스로 다시 시도 "
+              f"({attempt}/{R8_job_policy.MAX_RETRIES}, 워커 {worker['worker_id']})")
+        
+        if worker['export_info']:
+            self._cleanup_temp_files(worker['export_info']['temp_script'])
+            worker['export_info'] = None
+        worker['queue'].appendleft(fbx_file)
+        QtCore.QTimer.singleShot(int(delay * 1000), partial(self.process_next_file, worker))
+    
+    def _take_next_file(self, worker):
+        """워커의 다음 파일을 가져옵니다. 대기열이 비어 있으면 가장 긴 대기열의 뒤쪽에서 가져옵니다."""
+        if worker['queue']:
+            return worker['queue'].popleft()
+        
+        now = time.time()
+        for other in sorted(self.workers, key=lambda w: len(w['queue']), reverse=True):
+            for fbx_file in reversed(other['queue']):
+                # 재시도 대기 중인 파일은 대기 시간이 끝날 때까지 원래 워커에 남겨 둠
+                if self.retry_after.get(fbx_file, 0) <= now:
+                    other['queue'].remove(fbx_file)
+                    return fbx_file
+        return None
+    
+    def process_next_file(self, worker):
+        """워커의 다음 파일을 처리합니다."""
         # 취소 상태 확인
         if self.is_cancelled:
             print("배치 처리가 취소되어 중단됩니다.")
             return
-            
-        if self.current_index >= len(self.file_queue):
-            # 모든 파일 처리 완료
-            print("=" * 50)
-            print("모든 파일 처리 완료!")
-            if self.progress_callback:
-                self.progress_callback("모든 파일 처리 완료", self.current_index, len(self.file_queue))
+        
+        # 취소 전 배치에서 예약된 타이머는 무시 (새 배치의 파일을 가져가지 않도록)
+        if not any(w is worker for w in self.workers):
             return
         
-        current_file = self.file_queue[self.current_index]
-        print(f"\n[{self.current_index + 1}/{len(self.file_queue)}] 처리 시작: {current_file}")
+        if self.is_worker_busy(worker):
+            return
+        
+        current_file = self._take_next_file(worker)
+        if current_file is None:
+            # 이 워커에 남은 작업 없음 - 모든 워커가 끝났는지 확인
+            self._check_all_completed()
+            return
+        
+        total = len(self.file_queue)
+        print(f"\n[워커 {worker['worker_id']}] [{self.completed_count + 1}/{total}] 처리 시작: {current_file}")
         
         if self.progress_callback:
-            self.progress_callback(f"처리 중: {current_file}", self.current_index, len(self.file_queue))
+            self.progress_callback(f"처리 중: {current_file} (워커 {worker['worker_id']})", self.completed_count, total)
         
         # 백그라운드 프로세스 시작
-        self.background_process(current_file)
+        self.background_process(current_file, worker)
     
-    def background_process(self, fbx_file):
+    def _finish_file(self, worker, fbx_file, success):
+        """파일 하나의 처리를 마무리하고 워커에 다음 파일을 할당합니다."""
+        worker['export_info'] = None
+        if not self.persistent_workers:
+            worker['job'] = None
+        self.completed_count += 1
+        self._record_build(fbx_file, success)
+        
+        if self.file_result_callback:
+            self.file_result_callback(fbx_file, success)
+        
+        if not self.is_cancelled:
+            QtCore.QTimer.singleShot(500, partial(self.process_next_file, worker))
+    
+    def _record_build(self, fbx_file, success):
+        """변환 결과를 빌드 매니페스트에 반영합니다. 실패한 파일은 다음 실행에서 다시 변환됩니다."""
+        if self.build_manifest is None:
+            return
+        try:
+            if success:
+                fbx_path = os.path.join(self.fbx_folder, fbx_file)
+                self.build_manifest.record(fbx_file, fbx_path, self.rig_hash, self.frontX_v, self.script_version)
+            else:
+                self.build_manifest.forget(fbx_file)
+            self.build_manifest.save()
+        except OSError as e:
+            print(f"빌드 매니페스트 기록 실패: {fbx_file} ({e})")
+    
+    def _check_all_completed(self):
+        """모든 워커가 작업을 마쳤는지 확인하고 완료를 알립니다."""
+        if any(self.is_worker_busy(w) or w['queue'] for w in self.workers):
+            return
+        
+        if self.check_export_timer:
+            self.check_export_timer.stop()
+            self.check_export_timer = None
+        
+        # 웜 워커 종료
+        for worker in self.workers:
+            self._stop_warm_worker(worker)
+        
+        # 모든 파일 처리 완료
+        R8_job_profiler.end_run(self.run_id)
+        self.run_id = None
+        print("=" * 50)
+        print("모든 파일 처리 완료!")
+        if self.progress_callback:
+            self.progress_callback("모든 파일 처리 완료", self.completed_count, len(self.file_queue))
+    
+    def background_process(self, fbx_file, worker):
         """Maya standalone을 사용하여 배치 처리"""
         # 취소 상태 확인
         if self.is_cancelled:
@@ -240,10 +463,7 @@ class BatchProcessManager:
             if not os.path.exists(fbx_path):
                 error_msg = f"FBX 파일이 존재하지 않습니다: {fbx_path}"
                 print(error_msg)
-                if self.file_result_callback:
-                    self.file_result_callback(fbx_file, False)
-                self.current_index += 1
-                QtCore.QTimer.singleShot(500, self.process_next_file)
+                self._finish_file(worker, fbx_file, False)
                 return False
             
             # 모든 경로 정규화
@@ -252,19 +472,19 @@ class BatchProcessManager:
             fbx_path = fbx_path.replace('\\', '/')
             save_folder = self.save_folder.replace('\\', '/')
             
-            # 처리 상태 추적을 위한 상태 파일 경로
+            # 작업 식별자 (워커별로 고유, 이벤트의 job_id로 사용)
             timestamp = int(time.time())
             basename = os.path.basename(fbx_file).replace('.', '_')
-            status_file = os.path.join(tempfile.gettempdir(), f'maya_batch_status_{basename}_{timestamp}.txt')
+            job_tag = f"{basename}_w{worker['worker_id']}_{timestamp}"
             
             # 저장 폴더 생성
             if not os.path.exists(save_folder):
-                os.makedirs(save_folder)
+                os.makedirs(save_folder, exist_ok=True)
             
             # 출력 파일 경로
             output_file = os.path.join(save_folder, f"{os.path.splitext(fbx_file)[0]}.ma")
             
-            print(f"백그라운드 처리 시작:")
+            print(f"백그라운드 처리 시작 (워커 {worker['worker_id']}):")
             print(f"  - FBX 파일: {fbx_file}")
             print(f"  - 리그 파일: {rig_file}")
             print(f"  - 출력 파일: {output_file}")
@@ -274,680 +494,67 @@ class BatchProcessManager:
                 print("배치 처리가 취소되어 프로세스 시작을 중단합니다.")
                 return False
             
+            # 웜 워커 모드: 실행 중인 워커 프로세스에 작업 요청 전송
+            if self.persistent_workers:
+                return self._dispatch_warm_job(worker, fbx_file, rig_file, fbx_path, output_file)
+            
             # 각 파일마다 고유한 임시 스크립트 파일 생성
-            temp_script = os.path.join(tempfile.gettempdir(), f'maya_batch_{basename}_{timestamp}.py')
+            temp_script = os.path.join(tempfile.gettempdir(), f'maya_batch_{job_tag}.py')
             
             with open(temp_script, 'w', encoding='utf-8') as f:
-                f.write(f'''
-import maya.standalone
-maya.standalone.initialize(name='python')
-
-from maya import cmds, mel
-import os
-import sys
-import time
-
-def main():
-    try:
-        def joint_segment_scale(root_joint, val=1):
-            try:    
-                all_joints = cmds.ls(root_joint, dag=True, type='joint')
-                for jnt in all_joints:
-                    cmds.setAttr(f'{{jnt}}.segmentScaleCompensate', val)
-            except Exception as e:
-                print(f"조인트 세그먼트 스케일 설정 중 오류: {{e}}")
-                return False
-            return True
-        
-        def get_colon_prefixes():
-            all_objects = cmds.ls()
-            prefixes = set()
-            for obj in all_objects:
-                name_parts = obj.split(':')
-                if len(name_parts) > 1:
-                    prefixes.add(name_parts[0])
-            return prefixes
-        
-        def skeleton_bindpose(selectObjects, prefix):
-            print(f"skeleton_bindpose 실행 - 대상 오브젝트: {{len(selectObjects)}}개")
-            cmds.playbackOptions(min=-10)
-            cmds.currentTime(-10)        
-            for obj in selectObjects:
-                if cmds.objExists(f'{{prefix}}:{{obj}}'):
-                    if obj == 'Root': 
-                        continue
-                    tg_obj = f'{{prefix}}:{{obj}}'
-                    for ax in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz']:
-                        try:
-                            tv = cmds.getAttr(f'{{obj}}.{{ax}}')
-                            cmds.setAttr(f'{{tg_obj}}.{{ax}}', tv)
-                            cmds.setKeyframe(f'{{tg_obj}}.{{ax}}')
-                        except Exception as e:
-                            print(f"속성 설정 실패: {{obj}}.{{ax}} - {{e}}")
-                            continue
-        
-        def joint_Exists(joints, pre_):
-            joint_list = []
-            if not joints:
-                return joint_list
-                
-            for jnt in joints:
-                if cmds.objExists(f'{{pre_}}:{{jnt}}'):
-                    joint_list.append(jnt)
-            return joint_list
-        
-        def ik_fk_control_blend(attrName='FKIKBlend'):
-            """
-            마야 씬에서 FKIKBlend 속성을 가진 컨트롤러들을 찾습니다.
-            Args:
-                attrName (str): 찾을 속성 이름 (기본값: 'FKIKBlend')
-                
-            Returns:
-                list: FKIKBlend 속성을 가진 컨트롤러 리스트
-            """
-            controllers_with_fkik = []
-            
-            # 씬의 모든 객체를 검색
-            all_objects = cmds.ls(type='transform')
-            
-            for obj in all_objects:
-                # 객체에 지정된 속성이 존재하는지 확인
-                if cmds.attributeQuery(attrName, node=obj, exists=True):
-                    controllers_with_fkik.append(obj)
-            
-            if controllers_with_fkik:
-                print(f"{{attrName}} 속성을 가진 컨트롤러들: {{controllers_with_fkik}}")
-            else:
-                print(f"{{attrName}} 속성을 가진 컨트롤러를 찾을 수 없습니다.")
-            
-            return controllers_with_fkik
-        
-        def bake_animation(controls, startFrame, endFrame):
-            # 프레임 값 안전 처리
-            try:
-                startFrame = int(startFrame) if startFrame is not None else 0
-                endFrame = int(endFrame) if endFrame is not None else 100
-                
-                if not controls:
-                    print("베이킹할 컨트롤이 없습니다.")
-                    return
-                    
-                print(f"베이킹 실행: 컨트롤 {{len(controls)}}개, 프레임 {{startFrame}}-{{endFrame}}")
-                
-                cmds.bakeResults(controls, simulation=True, t=(startFrame, endFrame),
-                               sampleBy=1, oversamplingRate=1, disableImplicitControl=True,
-                               preserveOutsideKeys=True, sparseAnimCurveBake=False, 
-                               removeBakedAttributeFromLayer=False,
-                               removeBakedAnimFromLayer=False, bakeOnOverrideLayer=False, 
-                               minimizeRotation=True, controlPoints=False, shape=True)
-                
-                print("베이킹 완료")
-                
-            except Exception as e:
-                print(f"베이킹 중 오류 발생: {{e}}")
-                raise
-        
-        def main_controller_move(prefix):
-            """
-            루트 조인트의 위치를 확인 MainExtra2 값을 이동합니다.
-            
-            Args:
-                prefix (str): 네임스페이스 프리픽스
-            """
-            if cmds.objExists(f'{{prefix}}:Root'):
-                root_transX = cmds.getAttr(f'{{prefix}}:Root.tx')
-                root_transY = cmds.getAttr(f'{{prefix}}:Root.ty')
-                root_transZ = cmds.getAttr(f'{{prefix}}:Root.tz')
-                if root_transX or root_transY or root_transZ:
-                    if cmds.objExists('MainExtra2'):
-                        cmds.move(root_transX, root_transY, root_transZ, 'MainExtra2')
-        
-        def skeleton_control_match(frontAxis='frontX'):
-            nonlocal contList
-            
-            # 현재 타임라인의 시작 프레임과 마지막 프레임 가져오기
-            current_start_frame = cmds.playbackOptions(query=True, minTime=True)
-            current_end_frame = cmds.playbackOptions(query=True, maxTime=True)
-            
-            try:
-                # 상수 정의
-                SKEL_SET = 'Skeleton_Set'
-                BAKE_CTRL_SET = 'Bake_Control_Set'
-                
-                # IK/FK 컨트롤러 처리
-                ik_fk_contols = ik_fk_control_blend()
-                if ik_fk_contols:
-                    print(f"IK/FK 컨트롤러들: {{ik_fk_contols}}")
-                    for cont in ik_fk_contols:
-                        try:
-                            cmds.setAttr(cont + '.FKIKBlend', 0)
-                            print(f"{{cont}}.FKIKBlend를 0으로 설정")
-                        except Exception as e:
-                            print(f"{{cont}}.FKIKBlend 설정 실패: {{e}}")
-                else:
-                    print("IK/FK 컨트롤러를 찾을 수 없습니다.")
-                
-                contList = []  # 함수 시작 시 초기화
-                
-                # 모든 콜론 프리픽스를 가져옵니다.
-                prefixes = list(get_colon_prefixes())
-                if not prefixes:
-                    print("오류: 네임스페이스를 찾을 수 없습니다.")
-                    return False
-                    
-                # FBX 파일의 네임스페이스 찾기 (file_name과 일치하는 것)
-                target_prefix = None
-                for prefix in prefixes:
-                    if prefix == file_name:
-                        target_prefix = prefix
-                        break
-                
-                if not target_prefix:
-                    print(f"오류: FBX 네임스페이스 '{{file_name}}'를 찾을 수 없습니다.")
-                    print(f"사용 가능한 네임스페이스: {{prefixes}}")
-                    # 첫 번째 네임스페이스 사용 (fallback)
-                    target_prefix = prefixes[0]
-                    print(f"첫 번째 네임스페이스를 사용합니다: {{target_prefix}}")
-                    
-                print(f"사용할 네임스페이스: {{target_prefix}}")
-                
-                # main_controller_move 실행
-                main_controller_move(target_prefix)
-                
-                try:
-                    set_node = SKEL_SET
-                    if not cmds.objExists(set_node):
-                        print(f"경고: {{set_node}} 세트가 존재하지 않습니다.")
-                        return False
-                        
-                    members = cmds.sets(set_node, q=True) 
-                    if not members:
-                        print(f"경고: {{set_node}} 세트가 비어있습니다.")
-                        return False
-                        
-                    print(f"Skeleton_Set 멤버: {{members}}")
-                    selectObjects = joint_Exists(members, target_prefix)
-                    print(f"존재하는 조인트: {{selectObjects}}")
-                    
-                    if not selectObjects:
-                        print("오류: 매칭되는 조인트가 없습니다.")
-                        return False
-                    
-                    cmds.select(clear=True)
-                    
-                    # root_grp 생성 및 설정
-                    if not cmds.objExists('root_grp'):
-                        cmds.group(em=True, name='root_grp')
-                        
-                    root_joint = f'{{target_prefix}}:Root'
-                    if cmds.objExists(root_joint):
-                        if not cmds.listRelatives(root_joint, p=True):
-                            cmds.parent(root_joint, 'root_grp')
-                            print(f"{{root_joint}}를 root_grp에 부모 설정")
-                    else:
-                        print(f"경고: {{target_prefix}}:Root 객체가 존재하지 않습니다.")
-                    
-                    # 방향 설정
-                    if frontAxis == 'frontX':
-                        if cmds.objExists('MainExtra2'):
-                            cmds.setAttr('MainExtra2.rotateY', 90)
-                        cmds.setAttr('root_grp.rotateY', 0)
-                        print("FrontX 모드로 설정")
-                    else:
-                        if cmds.objExists('MainExtra2'):
-                            cmds.setAttr('MainExtra2.rotateY', 0)
-                        cmds.setAttr('root_grp.rotateY', -90)   
-                        print("FrontZ 모드로 설정")
-                         
-                    # skeleton_bindpose 실행
-                    skeleton_bindpose(selectObjects, target_prefix)  
-                    if cmds.objExists(f'{{target_prefix}}:Root'):
-                        joint_segment_scale(f'{{target_prefix}}:Root', val=1)    
-                
-                except Exception as e:
-                    print(f'skeleton_control_match 오류: {{e}}')
-                    return False
-
-                # 컨트롤 매칭 부분
-                contList = []
-                aniJointList = []
-
-                print("컨트롤 매칭 시작...")
-                for obj in selectObjects:
-                    try:
-                        if cmds.objExists(obj):
-                            parent_constraints = cmds.listConnections(obj, type='parentConstraint')
-                            if not parent_constraints:
-                                continue
-                            
-                            target_loc = cmds.parentConstraint(parent_constraints[0], query=True, targetList=True)
-                            
-                            if target_loc and len(target_loc) > 0:
-                                # rotate 속성 연결 확인
-                                try:
-                                    rotate_connections = cmds.listConnections(target_loc[0] + '.rotate')
-                                    rotate_locator = None  # 초기화
-                                    
-                                    if rotate_connections:
-                                        for cont in rotate_connections:
-                                            cont_shape = cmds.listRelatives(cont, children=True)
-                                            if cont_shape:
-                                                # 수정: 리스트가 반환될 수 있으므로 첫 번째 요소 확인
-                                                if isinstance(cont_shape, list) and len(cont_shape) > 0:
-                                                    if cmds.nodeType(cont_shape[0]) == 'locator':
-                                                        rotate_locator = cont
-                                                        break
-                                                elif cmds.nodeType(cont_shape) == 'locator':
-                                                    rotate_locator = cont
-                                                    break
-                                    
-                                        if rotate_locator:
-                                            aniJoint = f'{{target_prefix}}:{{obj}}'
-                                            if cmds.objExists(aniJoint):
-                                                aniJointList.append(aniJoint)    
-                                            locCon = rotate_locator  # 수정: rotate_locator 사용
-                                            parent_grp = cmds.listRelatives(f'{{locCon}}_grp', parent=True)
-                                            if parent_grp:
-                                                contList.append(parent_grp[0])
-                                except Exception as e:
-                                    print(f"객체 {{obj}}의 rotate 연결 확인 중 오류: {{e}}")
-                                    continue
-                    except Exception as e:
-                        print(f"오브젝트 {{obj}} 처리 중 오류: {{e}}")
-                        continue
-                             
-                print(f"찾은 컨트롤: {{len(contList)}}개")
-                print(f"애니메이션 조인트: {{len(aniJointList)}}개")
-                
-                if not contList:
-                    print("경고: 컨트롤을 찾을 수 없습니다.")
-                    return False
-                    
-                # 컨트롤 세트 생성
-                set_name = 'Bake_Control_Set'
-                if cmds.objExists(set_name):
-                    cmds.delete(set_name)
-                cmds.sets(contList, name=set_name)  
-                cmds.select(clear=True)  
-                
-                # 컨트롤과 조인트 연결
-                for j, c in zip(aniJointList, contList):
-                    print(f"처리 중: {{j}} -> {{c}}")
-                    try:
-                        if not cmds.objExists(c):
-                            print(f"경고: 컨트롤러 {{c}}가 존재하지 않습니다. 건너뜁니다.")
-                            continue
-                        
-                        # 기존 로케이터와 그룹이 있는지 확인하고 삭제
-                        ctl_loc_name = f'{{c}}_ctl'
-                        ctl_grp_name = f'{{ctl_loc_name}}_grp'
-                        
-                        # 기존 컨스트레인 조인트 삭제
-                        if cmds.objExists('RootX_M'):
-                            existing_constraints = cmds.listConnections('RootX_M', type='constraint', source=True)
-                            if existing_constraints:
-                                # 조인트 타입만 필터링
-                                joint_constraints = []
-                                for constraint in existing_constraints:
-                                    if cmds.objExists(constraint):
-                                        # 컨스트레인의 타겟을 확인하여 조인트인지 검사
-                                        targets = cmds.listConnections(constraint, source=True, destination=False)
-                                        if targets:
-                                            for target in targets:
-                                                if cmds.nodeType(target) == 'joint':
-                                                    joint_constraints.append(constraint)
-                                                    break
-                                existing_constraints = joint_constraints
-                                # 컨스트레인 삭제
-                                if existing_constraints:
-                                    for constraint in existing_constraints:
-                                        try:
-                                            print(f'기존 컨스트레인 {{constraint}} 확인됨 (삭제하지 않음)')
-                                            # cmds.delete(constraint)  # 실제로는 삭제하지 않음
-                                        except Exception as e:
-                                            print(f"기존 컨스트레인 {{constraint}} 처리 중 오류: {{e}}")
-                        
-                        # 기존 로케이터 그룹 삭제 (조인트의 자식으로 있는 경우)
-                        joint_children = cmds.listRelatives(j, children=True, type='transform')
-                        if joint_children:
-                            for child in joint_children:
-                                if child.endswith('_ctl_grp'):
-                                    try:
-                                        cmds.delete(child)
-                                        print(f"기존 로케이터 그룹 {{child}} 삭제됨")
-                                    except Exception as e:
-                                        print(f"기존 로케이터 그룹 {{child}} 삭제 중 오류: {{e}}")
-                        
-                        # 씬에서 기존 로케이터와 그룹 삭제
-                        if cmds.objExists(ctl_grp_name):
-                            try:
-                                cmds.delete(ctl_grp_name)
-                                print(f"기존 로케이터 그룹 {{ctl_grp_name}} 삭제됨")
-                            except Exception as e:
-                                print(f"기존 로케이터 그룹 {{ctl_grp_name}} 삭제 중 오류: {{e}}")
-                        
-                        if cmds.objExists(ctl_loc_name):
-                            try:
-                                cmds.delete(ctl_loc_name)
-                                print(f"기존 로케이터 {{ctl_loc_name}} 삭제됨")
-                            except Exception as e:
-                                print(f"기존 로케이터 {{ctl_loc_name}} 삭제 중 오류: {{e}}")
-                            
-                        c_ro = cmds.getAttr(f'{{c}}.rotateOrder')
-                        ctlLoc = cmds.spaceLocator(p=(0, 0, 0), name=f'{{c}}_ctl')
-                        cmds.setAttr(f'{{ctlLoc[0]}}.rotateOrder', c_ro)
-                        ctlLocGrp = cmds.group(em=True, name=f'{{ctlLoc[0]}}_grp')
-                        cmds.parent(ctlLoc, ctlLocGrp)
-                        cmds.delete(cmds.pointConstraint(c, ctlLocGrp, mo=False))
-                        cmds.delete(cmds.orientConstraint(c, ctlLocGrp, mo=False))
-                        cmds.parent(ctlLocGrp, j)
-                        cmds.select(clear=True)
-                        
-                        # 속성 존재 여부 확인 후 컨스트레인 생성
-                        try:
-                            if cmds.attributeQuery('tx', node=c, exists=True) and cmds.getAttr(c + '.tx', keyable=True):
-                                cmds.parentConstraint(ctlLoc, c, mo=True)
-                                print(f"Parent constraint 생성됨: {{ctlLoc}} -> {{c}}")
-                        except Exception as e:
-                            print(f"Parent constraint 생성 실패: {{e}}")
-                            
-                        try:          
-                            if cmds.attributeQuery('sx', node=c, exists=True) and cmds.getAttr(c + '.sx', keyable=True):
-                                cmds.scaleConstraint(ctlLoc, c, mo=True)
-                                print(f"Scale constraint 생성됨: {{ctlLoc}} -> {{c}}")
-                        except Exception as e:
-                            print(f"Scale constraint 생성 실패: {{e}}")
-                            
-                    except Exception as e:
-                        print(f"컨트롤러 {{c}} 처리 중 오류 발생: {{str(e)}}")
-                        continue
-                
-                # 현재 타임라인 프레임 범위를 다시 적용
-                cmds.playbackOptions(minTime=current_start_frame, maxTime=current_end_frame)
-                
-                return True
-            
-            except Exception as e:
-                print(f"skeleton_control_match 실행 중 오류 발생: {{e}}")
-                # 현재 타임라인 프레임 범위를 다시 적용 (finally 블록 대신)
-                try:
-                    cmds.playbackOptions(minTime=current_start_frame, maxTime=current_end_frame)
-                except:
-                    pass
-                return False
-        
-        def control_bake():
-            nonlocal contList
-            print("control_bake 실행...")
-            
-            try:
-                # Bake_Control_Set에서 컨트롤 리스트 가져오기
-                if cmds.objExists('Bake_Control_Set'):
-                    bake_controls = cmds.sets('Bake_Control_Set', q=True)
-                    if bake_controls:
-                        contList = bake_controls
-                        print(f"Bake_Control_Set에서 {{len(contList)}}개 컨트롤을 가져왔습니다.")
-                    else:
-                        print("'Bake_Control_Set' 세트가 비어있습니다.")
-                        return False
-                else:
-                    print("'Bake_Control_Set' 세트가 존재하지 않습니다.")
-                    return False
-                
-                if not contList:
-                    print("경고: 베이킹할 컨트롤이 없습니다.")
-                    return False
-                    
-                # 타임라인 범위 가져오기
-                startFrame = cmds.playbackOptions(q=True, minTime=True)
-                endFrame = cmds.playbackOptions(q=True, maxTime=True)
-                
-                print(f"컨트롤 베이킹 시작: {{len(contList)}}개 컨트롤")
-                print(f"프레임 범위: {{startFrame}} - {{endFrame}}")
-                
-                bake_animation(contList, startFrame, endFrame)
-                return True
-                
-            except Exception as e:
-                print(f"컨트롤 베이킹 중 오류 발생: {{e}}")
-                return False
-        
-        def remove_references_direct():
-            """직접 구현된 레퍼런스 제거 함수"""
-            print("\\n=== 직접 레퍼런스 제거 실행 ===")
-            try:
-                # 모든 레퍼런스 노드 찾기
-                reference_nodes = cmds.ls(type='reference')
-                
-                if not reference_nodes:
-                    print("씬에 레퍼런스 노드가 없습니다.")
-                    return True
-                
-                removed_count = 0
-                
-                for ref_node in reference_nodes:
-                    try:
-                        # 'sharedReferenceNode'는 기본 시스템 레퍼런스이므로 제외
-                        if ref_node == 'sharedReferenceNode':
-                            continue
-                        
-                        # 레퍼런스가 로드되어 있는지 확인
-                        if cmds.referenceQuery(ref_node, isLoaded=True):
-                            # 레퍼런스 파일 경로 가져오기
-                            ref_file = cmds.referenceQuery(ref_node, filename=True)
-                            print(f"레퍼런스 제거 중: {{os.path.basename(ref_file)}}")
-                            
-                            # 레퍼런스 제거
-                            cmds.file(ref_file, removeReference=True)
-                            removed_count += 1
-                            print(f"성공적으로 제거됨: {{os.path.basename(ref_file)}}")
-                            
-                        else:
-                            print(f"레퍼런스가 로드되지 않음: {{ref_node}}")
-                            
-                    except Exception as e:
-                        print(f"레퍼런스 제거 실패 - {{ref_node}}: {{str(e)}}")
-                        continue
-                
-                print(f"총 제거된 레퍼런스: {{removed_count}}개")
-                
-                # 씬 정리
-                try:
-                    print("사용하지 않는 노드들 정리 중...")
-                    
-                    # fosterParent 노드들 삭제
-                    foster_parents = cmds.ls(type="fosterParent")
-                    if foster_parents:
-                        for foster_parent in foster_parents:
-                            try:
-                                if cmds.objExists(foster_parent):
-                                    cmds.delete(foster_parent)
-                                    print(f"fosterParent 노드 삭제됨: {{foster_parent}}")
-                            except Exception as e:
-                                print(f"fosterParent 노드 삭제 실패 - {{foster_parent}}: {{str(e)}}")                      
-                    # root_grp 노드 삭제
-                    if cmds.objExists("root_grp"):
-                        try:
-                            cmds.delete("root_grp")
-                            print("root_grp 노드 삭제됨")
-                        except Exception as e:
-                            print(f"root_grp 노드 삭제 실패: {{str(e)}}")
-                            
-                    if cmds.objExists("Root"):
-                        try:
-                            cmds.delete("Root")
-                            print("Root 조인트 삭제됨")
-                        except Exception as e:
-                            print(f"Root 조인트 삭제 실패: {{str(e)}}")
-                
-                    print("사용하지 않는 노드들 정리 완료")
-                    
-                except Exception as e:
-                    print(f"사용하지 않는 노드들 정리 중 오류 발생: {{str(e)}}")
-                            
-                
-                return True
-                
-            except Exception as e:
-                print(f"직접 레퍼런스 제거 중 오류: {{e}}")
-                return False
-        
-        # 시간 단위를 60fps로 설정
-        cmds.currentUnit(time='ntscf')
-        
-        # 1. 새로운 씬으로 시작 (기본 씬 생성)
-        print("새로운 씬 생성...")
-        cmds.file(new=True, force=True)
-        
-        # 2. 리그 파일 열기
-        rig_file = r"{rig_file}"
-        print(f"리그 파일 열기: {{rig_file}}")
-        cmds.file(rig_file, open=True, force=True)
-        
-        # 3. 단일 FBX 파일을 레퍼런스로 불러오기
-        fbx_file = r"{fbx_path}"
-        file_name = os.path.basename(fbx_file).split('.')[0]
-        print(f"FBX 레퍼런스 불러오기: {{fbx_file}}")
-        print(f"네임스페이스: {{file_name}}")
-        
-        # FBX 플러그인 로드
-        if not cmds.pluginInfo('fbxmaya', query=True, loaded=True):
-            cmds.loadPlugin('fbxmaya')
-        
-        # FBX 파일 레퍼런스 로드
-        cmds.file(fbx_file, reference=True, namespace=file_name)
-        
-        # 4. R8_ani_skeleton_match 모듈의 함수들을 직접 구현
-        
-        # 상수 정의
-        SKEL_SET = 'Skeleton_Set'
-        BAKE_CTRL_SET = 'Bake_Control_Set'
-        contList = []
-        
-        # 5. 스켈레톤 매칭 및 베이킹 실행
-        print("\\n=== 스켈레톤 매칭 시작 ===")
-        frontAxis = 'frontX' if {self.frontX_v} else 'frontZ'
-        
-        if not skeleton_control_match(frontAxis):
-            print("스켈레톤 매칭 실패")
-            raise Exception("스켈레톤 매칭 실패")
-        
-        print("\\n=== 컨트롤 베이킹 시작 ===")
-        if not control_bake():
-            print("컨트롤 베이킹 실패")
-            raise Exception("컨트롤 베이킹 실패")
-        
-        # 6. 레퍼런스 파일 제거 (Maya 파일 저장 전에 실행)
-        print("\\n=== 레퍼런스 파일 제거 (저장 전) ===")  
-        if not remove_references_direct():
-            print("레퍼런스 파일 제거 실패")
-            raise Exception("레퍼런스 파일 제거 실패")
-        
-        # 7. 지정 폴더에 Maya 파일 저장
-        output_file = r"{output_file}"
-        print(f"\\n=== 파일 저장: {{output_file}} ===")
-          
-        # 결과 확인 및 상태 파일 작성
-        status_file = r"{status_file}"
-        
-        # 출력 디렉토리 생성
-        output_dir = os.path.dirname(output_file)
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
-        
-        # Maya 파일 저장 (기존 파일이 있으면 덮어쓰기)
-        cmds.file(rename=output_file)
-        cmds.file(save=True, type='mayaAscii', force=True)
-        print(f"파일 저장 완료: {{os.path.basename(output_file)}}")
-                
-        # 파일 생성 확인
-        if os.path.exists(output_file):
-            file_size = os.path.getsize(output_file)
-            print(f"성공: Maya 파일 생성됨 ({{file_size}} 바이트)")
-            with open(status_file, 'w') as sf:
-                sf.write(f"SUCCESS\\n{{output_file}}\\n{{file_size}}")
-            return True
-        else:
-            print(f"실패: Maya 파일이 생성되지 않음")
-            with open(status_file, 'w') as sf:
-                sf.write(f"FAIL\\n{{output_file}}\\n0")
-            return False
-            
-    except Exception as e:
-        import traceback
-        print(f"오류 발생: {{e}}")
-        print(traceback.format_exc())
-        # 상태 파일에 오류 정보 기록
-        with open(r"{status_file}", 'w') as sf:
-            sf.write(f"ERROR\\n{{e}}")
-        return False
-
-success = main()
-print(f"처리 결과: {{success}}")
-''')
+                f.write(COLD_JOB_SCRIPT.format(
+                    module_dir=WORKER_MODULE_DIR,
+                    rig_file=rig_file,
+                    fbx_path=fbx_path,
+                    output_file=output_file,
+                    frontX_v=bool(self.frontX_v),
+                    job_id=job_tag
+                ))
             
             # mayapy를 사용한 독립 실행 명령
             mayapy_path = get_mayapy_path(maya_exe)
             if not mayapy_path:
                 error_msg = "mayapy.exe를 찾을 수 없습니다."
                 print(error_msg)
-                if self.file_result_callback:
-                    self.file_result_callback(fbx_file, False)
-                self.current_index += 1
-                QtCore.QTimer.singleShot(500, self.process_next_file)
+                self._cleanup_temp_files(temp_script)
+                self._finish_file(worker, fbx_file, False)
                 return False
                 
-            command = f'"{mayapy_path}" "{temp_script}"'
+            command = [mayapy_path, '-u', temp_script]
             
-            print(f"실행 명령: {command}")
+            print(f"실행 명령: {' '.join(command)}")
             
             # 취소 상태 확인 - 프로세스 시작 직전
             if self.is_cancelled:
                 print("배치 처리가 취소되어 프로세스 실행을 중단합니다.")
                 # 임시 스크립트 파일 삭제
-                try:
-                    if os.path.exists(temp_script):
-                        os.remove(temp_script)
-                except Exception as e:
-                    print(f"임시 스크립트 파일 삭제 중 오류: {e}")
+                self._cleanup_temp_files(temp_script)
                 return False
             
-            # 상태 추적을 위한 정보 저장
-            self.current_export_info = {
-                'fbx_file': fbx_file,
-                'output_file': output_file,
-                'status_file': status_file,
-                'temp_script': temp_script,
-                'start_time': time.time()
-            }
-            
-            # subprocess 실행
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            
+            # subprocess 실행 (stdout 이벤트는 리더 스레드가 수집)
             try:
-                process = subprocess.Popen(command, shell=True, startupinfo=startupinfo)
-                print(f"프로세스 시작됨 (PID: {process.pid})")
+                job = R8_job_runner.JobProcess(command, env=self._worker_environment(),
+                                               startupinfo=get_hidden_startupinfo())
+                print(f"프로세스 시작됨 (워커 {worker['worker_id']}, PID: {job.pid})")
             except Exception as e:
                 print(f"프로세스 시작 실패: {e}")
                 # 임시 파일 정리
-                self._cleanup_temp_files(temp_script, status_file)
-                if self.file_result_callback:
-                    self.file_result_callback(fbx_file, False)
-                self.current_index += 1
-                QtCore.QTimer.singleShot(500, self.process_next_file)
+                self._cleanup_temp_files(temp_script)
+                self._retry_or_fail(worker, fbx_file, R8_job_policy.FAILURE_START)
                 return False
             
-            # 타이머를 설정하여 주기적으로 처리 상태 확인
-            if hasattr(self, 'check_export_timer') and self.check_export_timer:
-                self.check_export_timer.stop()
-                
-            self.check_export_timer = QtCore.QTimer()
-            self.check_export_timer.timeout.connect(self.check_process_status)
-            self.check_export_timer.start(1000)  # 1초마다 확인
-            
-            self.current_process = process
+            # 상태 추적을 위한 정보 저장
+            worker['job'] = job
+            worker['export_info'] = {
+                'fbx_file': fbx_file,
+                'output_file': output_file,
+                'temp_script': temp_script,
+                'job_id': job_tag,
+                'start_time': time.time(),
+                'startup_since': None,
+                'cold': False,
+                'timeout': self._job_timeout(fbx_file)
+            }
             
             return True
         
@@ -955,13 +562,94 @@ print(f"처리 결과: {{success}}")
             print(f"백그라운드 처리 오류: {e}")
             # 취소 상태가 아닌 경우에만 다음 파일 처리
             if not self.is_cancelled:
-                if self.file_result_callback:
-                    self.file_result_callback(fbx_file, False)
-                self.current_index += 1
-                QtCore.QTimer.singleShot(500, self.process_next_file)
+                self._finish_file(worker, fbx_file, False)
             return False
     
-    def _cleanup_temp_files(self, temp_script, status_file):
+    def _worker_environment(self):
+        """워커 프로세스 환경 변수. quiet_logs이면 항목별 로그를 생략하는 조용한 모드로 실행합니다."""
+        return R8_log.quiet_environment() if self.quiet_logs else None
+    
+    def _start_warm_worker(self, worker, rig_file):
+        """워커 슬롯의 웜 mayapy 프로세스를 시작합니다."""
+        mayapy_path = get_mayapy_path(MAYA_EXE)
+        if not mayapy_path:
+            print("mayapy.exe를 찾을 수 없습니다.")
+            return False
+        
+        warm_script = os.path.join(tempfile.gettempdir(), f'maya_batch_worker_w{worker["worker_id"]}_{int(time.time())}.py')
+        with open(warm_script, 'w', encoding='utf-8') as f:
+            f.write(WARM_WORKER_SCRIPT.format(module_dir=WORKER_MODULE_DIR, rig_file=rig_file))
+        
+        try:
+            job = R8_job_runner.JobProcess([mayapy_path, '-u', warm_script], use_stdin=True,
+                                           env=self._worker_environment(),
+                                           startupinfo=get_hidden_startupinfo())
+        except Exception as e:
+            print(f"웜 워커 시작 실패: {e}")
+            self._cleanup_temp_files(warm_script)
+            return False
+        
+        worker['job'] = job
+        worker['warm_script'] = warm_script
+        print(f"웜 워커 시작됨 (워커 {worker['worker_id']}, PID: {job.pid})")
+        return True
+    
+    def _dispatch_warm_job(self, worker, fbx_file, rig_file, fbx_path, output_file):
+        """웜 워커에 작업 요청을 보냅니다. 워커가 없거나 종료되었으면 새로 시작합니다.
+        
+        새로 시작한 워커는 ready 이벤트까지(mayapy 초기화)와 첫 리그 로드(open_rig 단계)를
+        STARTUP_TIMEOUT으로 따로 제한하고, 작업 제한 시간은 그 시간을 뺀 나머지에만 적용합니다.
+        """
+        cold = worker['job'] is None or not worker['job'].is_running()
+        if cold:
+            self._cleanup_temp_files(worker['warm_script'])
+            if not self._start_warm_worker(worker, rig_file):
+                self._retry_or_fail(worker, fbx_file, R8_job_policy.FAILURE_START)
+                return False
+        
+        job_id = f"{worker['worker_id']}-{int(time.time() * 1000)}"
+        request = {
+            'job_id': job_id,
+            'rig_file': rig_file,
+            'fbx_file': fbx_path,
+            'output_file': output_file.replace('\\', '/'),
+            'frontX': bool(self.frontX_v)
+        }
+        
+        try:
+            worker['job'].send(request)
+        except (OSError, ValueError) as e:
+            print(f"웜 워커 작업 전송 실패: {e}")
+            self._terminate_worker_process(worker)
+            self._finish_file(worker, fbx_file, False)
+            return False
+        
+        worker['export_info'] = {
+            'fbx_file': fbx_file,
+            'output_file': output_file,
+            'temp_script': None,
+            'job_id': job_id,
+            'start_time': None if cold else time.time(),   # 초기화 중이면 ready 이벤트에서 시작
+            'startup_since': time.time() if cold else None,  # 초기화 / 첫 리그 로드 구간 시작 시각
+            'cold': cold,
+            'timeout': self._job_timeout(fbx_file)
+        }
+        return True
+    
+    def _stop_warm_worker(self, worker):
+        """웜 워커에 종료 요청을 보내고 부트스트랩 스크립트를 정리합니다."""
+        job = worker['job']
+        if job is not None and job.is_running():
+            try:
+                job.send({'command': 'shutdown'})
+                job.close_stdin()
+            except (OSError, ValueError):
+                self._terminate_worker_process(worker)
+        worker['job'] = None
+        self._cleanup_temp_files(worker['warm_script'])
+        worker['warm_script'] = None
+    
+    def _cleanup_temp_files(self, temp_script):
         """임시 파일들을 정리합니다."""
         try:
             if temp_script and os.path.exists(temp_script):
@@ -969,136 +657,150 @@ print(f"처리 결과: {{success}}")
                 print(f"임시 스크립트 파일 삭제: {temp_script}")
         except Exception as e:
             print(f"임시 스크립트 파일 삭제 중 오류: {e}")
-        
-        try:
-            if status_file and os.path.exists(status_file):
-                os.remove(status_file)
-                print(f"상태 파일 삭제: {status_file}")
-        except Exception as e:
-            print(f"상태 파일 삭제 중 오류: {e}")
     
     def check_process_status(self):
-        """배치 처리 상태를 주기적으로 확인"""
+        """모든 워커의 작업 이벤트를 주기적으로 소비"""
         # 취소 상태 확인
         if self.is_cancelled:
             print("배치 처리가 취소되어 상태 확인을 중단합니다.")
             if self.check_export_timer:
                 self.check_export_timer.stop()
             return
-            
-        if not hasattr(self, 'current_export_info') or not self.current_export_info:
-            if self.check_export_timer:
-                self.check_export_timer.stop()
-            return
         
-        output_file = self.current_export_info['output_file']
-        status_file = self.current_export_info['status_file']
-        current_fbx_file = self.current_export_info['fbx_file']
-        temp_script = self.current_export_info['temp_script']
+        for worker in self.workers:
+            if not self.is_worker_busy(worker):
+                # 대기 중인 웜 워커의 출력도 비워 로그를 유지
+                if worker['job'] is not None:
+                    worker['job'].poll_events()
+                continue
+            self._check_worker_status(worker)
+    
+    def _check_worker_status(self, worker):
+        """워커 하나의 이벤트를 처리합니다. 실패는 해당 파일에만 적용되고 웜 워커는 다음 작업에서 재시작됩니다."""
+        export_info = worker['export_info']
+        current_fbx_file = export_info['fbx_file']
+        job = worker['job']
+        
+        for kind, payload in job.poll_events():
+            if kind == 'event':
+                if payload.get('event') == 'ready':
+                    print(f"웜 워커 준비 완료 (워커 {worker['worker_id']})")
+                    if export_info['start_time'] is None:
+                        export_info['start_time'] = time.time()
+                        export_info['startup_since'] = None
+                elif payload.get('job_id') == export_info['job_id']:
+                    self._track_cold_start(export_info, payload)
+                    if self._handle_job_event(worker, payload):
+                        return
+            
+            elif kind == 'exit':
+                # 종료 이벤트 없이 프로세스가 끝난 경우 (크래시) 타임아웃까지 기다리지 않고 실패 처리
+                print(f"[실패] {current_fbx_file} - 프로세스가 결과 없이 종료됨 (워커 {worker['worker_id']}, 종료 코드: {payload})")
+                for line in job.log_tail:
+                    print(f"  {line}")
+                worker['job'] = None
+                self._retry_or_fail(worker, current_fbx_file, R8_job_policy.FAILURE_CRASH)
+                return
+        
+        # 웜 워커 초기화 / 첫 리그 로드 중에는 작업 제한 시간 대신 STARTUP_TIMEOUT 적용
+        if export_info['startup_since'] is not None:
+            if time.time() - export_info['startup_since'] > R8_job_policy.STARTUP_TIMEOUT:
+                print(f"[타임아웃] {current_fbx_file} - 워커 초기화 시간 초과 "
+                      f"({R8_job_policy.STARTUP_TIMEOUT}초, 워커 {worker['worker_id']})")
+                self._terminate_worker_process(worker)
+                self._retry_or_fail(worker, current_fbx_file, R8_job_policy.FAILURE_TIMEOUT)
+            return
         
-        # 실행 시간이 너무 오래 걸리면 타임아웃
-        elapsed_time = time.time() - self.current_export_info['start_time']
-        if elapsed_time > 300:  # 5분 타임아웃
-            print(f"[타임아웃] {current_fbx_file} - 처리 시간 초과")
-            if self.check_export_timer:
-                self.check_export_timer.stop()
-            
-            # 현재 프로세스 종료
-            self._terminate_current_process()
-            
-            # 실패 콜백 호출
-            if self.file_result_callback:
-                self.file_result_callback(current_fbx_file, False)
-            
-            # 임시 파일 정리
-            self._cleanup_temp_files(temp_script, status_file)
-            
-            self.current_index += 1
-            QtCore.QTimer.singleShot(500, self.process_next_file)
+        # 예상 처리 시간으로 정한 제한 시간을 넘기면 타임아웃 (웜 워커는 다음 작업에서 재시작)
+        if time.time() - export_info['start_time'] > export_info['timeout']:
+            print(f"[타임아웃] {current_fbx_file} - 처리 시간 초과 ({export_info['timeout']:.0f}초, 워커 {worker['worker_id']})")
+            self._terminate_worker_process(worker)
+            self._retry_or_fail(worker, current_fbx_file, R8_job_policy.FAILURE_TIMEOUT)
+    
+    def _track_cold_start(self, export_info, event):
+        """새 웜 워커의 첫 작업에서 리그 로드(open_rig) 시간을 작업 제한 시간에서 뺍니다."""
+        if not export_info['cold'] or event.get('event') != 'step' or event.get('name') != 'open_rig':
             return
+        if event.get('state') == 'begin':
+            export_info['startup_since'] = time.time()
+        elif event.get('state') == 'end' and export_info['startup_since'] is not None:
+            export_info['start_time'] += time.time() - export_info['startup_since']
+            export_info['startup_since'] = None
+            export_info['cold'] = False
+    
+    def _handle_job_event(self, worker, event):
+        """현재 작업의 이벤트 하나를 처리합니다. 작업이 끝났으면 True를 반환합니다."""
+        export_info = worker['export_info']
+        current_fbx_file = export_info['fbx_file']
+        event_type = event.get('event')
         
-        # 상태 파일이 존재하는지 확인
-        if os.path.exists(status_file):
-            try:
-                with open(status_file, 'r') as f:
-                    status_info = f.read().strip().split('\n')
-                    status = status_info[0]
-                
-                # 상태에 따라 처리
-                if status == 'SUCCESS':
-                    print(f"[성공] {current_fbx_file} - 처리 완료")
-                    if len(status_info) > 2:
-                        file_size = status_info[2]
-                        print(f"  파일 크기: {file_size} 바이트")
-                        print(f"  저장 위치: {os.path.basename(output_file)}")
-                    
-                    # 성공 콜백 호출
-                    if self.file_result_callback:
-                        self.file_result_callback(current_fbx_file, True)
-                    
-                    # 처리 완료 후 정리
-                    self._complete_file_processing(temp_script, status_file)
-                    
-                elif status == 'FAIL' or status == 'ERROR':
-                    print(f"[실패] {current_fbx_file} - 처리 실패")
-                    if len(status_info) > 1:
-                        error_msg = status_info[1]
-                        print(f"  오류: {error_msg}")
-                    
-                    # 실패 콜백 호출
-                    if self.file_result_callback:
-                        self.file_result_callback(current_fbx_file, False)
-                    
-                    # 처리 완료 후 정리
-                    self._complete_file_processing(temp_script, status_file)
-                    
-            except Exception as e:
-                print(f"상태 파일 읽기 오류: {e}")
+        if event_type == 'step' and event.get('state') == 'end':
+            print(f"  [워커 {worker['worker_id']}] {event.get('name')}: {event.get('elapsed', 0):.2f}초")
         
-        # 상태 파일이 없지만 출력 파일이 존재하면 성공으로 간주
-        elif os.path.exists(output_file) and os.path.getsize(output_file) > 0:
-            print(f"[성공] {current_fbx_file} - Maya 파일 확인됨")
-            print(f"  파일 크기: {os.path.getsize(output_file)} 바이트")
-            print(f"  저장 위치: {os.path.basename(output_file)}")
-            
-            # 성공 콜백 호출
-            if self.file_result_callback:
-                self.file_result_callback(current_fbx_file, True)
-            
-            # 처리 완료 후 정리
-            self._complete_file_processing(temp_script, status_file)
+        elif event_type == 'progress':
+            if self.progress_callback:
+                self.progress_callback(f"처리 중: {current_fbx_file} - {event.get('message')} ({event.get('percent', 0)}%)",
+                                       self.completed_count, len(self.file_queue))
+        
+        elif event_type == 'warning':
+            print(f"  [경고] {current_fbx_file}: {event.get('message')}")
+        
+        elif event_type in R8_job_runner.TERMINAL_EVENTS:
+            success = event_type == 'success'
+            if success:
+                print(f"[성공] {current_fbx_file} - 처리 완료 (워커 {worker['worker_id']}, {event.get('elapsed', 0):.1f}초)")
+                print(f"  파일 크기: {event.get('file_size')} 바이트")
+                print(f"  저장 위치: {os.path.basename(export_info['output_file'])}")
+            else:
+                print(f"[실패] {current_fbx_file} - 처리 실패 (워커 {worker['worker_id']})")
+                print(f"  오류: {event.get('message')}")
+                if event.get('traceback'):
+                    print(event['traceback'])
+            
+            if event.get('steps'):
+                print(f"  단계별 시간: {R8_job_runner.format_step_timings(event['steps'])}")
+            
+            # 1회성 프로세스는 mayapy 초기화 시간까지 포함해 기록
+            spawn_time = None if self.persistent_workers else worker['job'].spawn_time
+            R8_job_profiler.record_job(R8_job_runner.build_job_record(
+                export_info['job_id'], current_fbx_file, event, spawn_time,
+                tool='ani_batch_process', warm=self.persistent_workers,
+                input_size=self.input_sizes.get(current_fbx_file),
+                retries=self.retry_counts.get(current_fbx_file, 0)), run_id=self.run_id)
+            
+            self._complete_file_processing(worker, current_fbx_file, success)
+            return True
+        
+        return False
     
-    def _terminate_current_process(self):
-        """현재 실행 중인 프로세스를 종료합니다."""
-        if self.current_process:
-            try:
-                subprocess.run(['taskkill', '/F', '/T', '/PID', str(self.current_process.pid)], 
-                             capture_output=True, text=True, timeout=10)
-                print(f"프로세스 (PID: {self.current_process.pid}) 강제 종료됨")
-                self.current_process = None
-            except Exception as e:
-                print(f"프로세스 종료 중 오류: {e}")
+    def _terminate_worker_process(self, worker):
+        """워커의 실행 중인 프로세스를 종료합니다."""
+        job = worker['job']
+        if job:
+            job.kill()
+            print(f"프로세스 (워커 {worker['worker_id']}, PID: {job.pid}) 강제 종료됨")
+            worker['job'] = None
     
-    def _complete_file_processing(self, temp_script, status_file):
+    def _complete_file_processing(self, worker, fbx_file, success):
         """파일 처리 완료 후 정리 작업을 수행합니다."""
-        # 임시 파일 정리
-        self._cleanup_temp_files(temp_script, status_file)
+        export_info = worker['export_info']
         
-        # 타이머 중지 및 프로세스 정리
-        if self.check_export_timer:
-            self.check_export_timer.stop()
-        self.current_process = None
+        # 임시 파일 정리
+        self._cleanup_temp_files(export_info['temp_script'])
         
-        # 다음 파일 처리
-        self.current_index += 1
-        QtCore.QTimer.singleShot(500, self.process_next_file)
+        # 결과 콜백 호출 후 다음 파일 처리
+        self._finish_file(worker, fbx_file, success)
 
 # 전역 배치 프로세스 매니저 인스턴스
 batch_manager = BatchProcessManager()
 
-def start_batch_process(rig_file, fbx_files, fbx_folder, save_folder, frontX_v, progress_callback=None, file_result_callback=None):
+def start_batch_process(rig_file, fbx_files, fbx_folder, save_folder, frontX_v, progress_callback=None, file_result_callback=None, max_workers=1, persistent_workers=False, skip_unchanged=False):
     """배치 프로세스를 시작하는 함수"""
-    return batch_manager.start_batch_process(rig_file, fbx_files, fbx_folder, save_folder, frontX_v, progress_callback, file_result_callback)
+    return batch_manager.start_batch_process(rig_file, fbx_files, fbx_folder, save_folder, frontX_v, progress_callback, file_result_callback, max_workers, persistent_workers, skip_unchanged)
+
+def get_rebuild_plan(rig_file, fbx_files, fbx_folder, save_folder, frontX_v):
+    """다시 변환할 파일과 건너뛸 파일 목록을 반환하는 함수 (Dry Run)"""
+    return R8_ani_build_cache.plan_batch(rig_file, fbx_files, fbx_folder, save_folder, frontX_v)
 
 def cancel_batch_process():
     """배치 프로세스를 취소하는 함수"""
@@ -1109,28 +811,15 @@ def is_batch_running():
     if batch_manager.is_cancelled:
         return False
     
-    # 현재 프로세스가 실행 중인지 확인
-    if batch_manager.current_process is not None:
-        # 프로세스가 실제로 실행 중인지 확인
-        try:
-            if batch_manager.current_process.poll() is None:
-                return True
-            else:
-                # 프로세스가 종료된 경우 정리
-                batch_manager.current_process = None
-        except Exception as e:
-            print(f"프로세스 상태 확인 중 오류: {e}")
-            batch_manager.current_process = None
+    for worker in batch_manager.workers:
+        # 파일을 처리 중이거나 대기 중인 파일이 있는 워커
+        if batch_manager.is_worker_busy(worker) or worker['queue']:
+            return True
     
     # 타이머가 실행 중인지 확인
     if batch_manager.check_export_timer is not None and batch_manager.check_export_timer.isActive():
         return True
     
-    # 대기 중인 파일이 있는지 확인
-    if (batch_manager.file_queue and 
-        batch_manager.current_index < len(batch_manager.file_queue)):
-        return True
-    
     return False
 
 def get_batch_status():
@@ -1140,8 +829,9 @@ def get_batch_status():
     elif is_batch_running():
         if batch_manager.file_queue:
             total = len(batch_manager.file_queue)
-            current = batch_manager.current_index
-            return f"실행 중 ({current}/{total})"
+            current = batch_manager.completed_count
+            active = sum(1 for w in batch_manager.workers if batch_manager.is_worker_busy(w))
+            return f"실행 중 ({current}/{total}, 워커 {active}/{len(batch_manager.workers)})"
         else:
             return "실행 중"
     else:
@@ -0,0 +1,638 @@
+'''
+Maya Standalone Animation Batch Worker
+mayapy 프로세스 안에서 실행되는 FBX -> Maya 변환 작업 모듈입니다.
+R8_ani_batch_process가 생성한 부트스트랩 스크립트에서 임포트합니다.
+
+- run_single_job(): 파일 하나를 변환하고 종료합니다. (1회성 프로세스)
+- serve(): 프로세스를 유지하며 stdin으로 작업을 받아 처리합니다. (웜 워커)
+
+진행 상황과 결과는 R8_job_runner 이벤트로 stdout에 출력합니다.
+Qt에 의존하지 않으며, 패키지 __init__을 거치지 않도록 R8_job_runner를 직접 임포트합니다.
+'''
+import os
+import sys
+import json
+import tempfile
+import hashlib
+import uuid
+
+from maya import cmds
+
+import R8_log
+from R8_job_runner import JobReporter, emit_event
+from R8_ani_bindpose import apply_bind_pose, format_bind_pose_result
+from R8_ani_scene_snapshot import SceneSnapshot, build_scene_snapshot
+from R8_ani_bake_engine import BAKE_ENGINE_AUTO, bake_controls, format_bake_result
+from R8_ani_reference_remove import (run_scene_cleanup, format_cleanup_report,
+                                     STEP_REFERENCES, STEP_FOSTER_PARENTS, STEP_EXTRA_NODES)
+
+# 상수 정의
+SKEL_SET = 'Skeleton_Set'
+BAKE_CTRL_SET = 'Bake_Control_Set'
+
+log = R8_log.get_logger(__name__)
+
+# 배치 작업은 Undo가 필요 없으므로 의존성 분석 후 api 엔진을 우선 사용
+BAKE_ENGINE = BAKE_ENGINE_AUTO
+
+
+def joint_segment_scale(root_joint, val=1):
+    try:
+        all_joints = cmds.ls(root_joint, dag=True, type='joint')
+        for jnt in all_joints:
+            cmds.setAttr(f'{jnt}.segmentScaleCompensate', val)
+    except Exception as e:
+        print(f"조인트 세그먼트 스케일 설정 중 오류: {e}")
+        return False
+    return True
+
+def get_colon_prefixes(snapshot=None):
+    if snapshot is not None:
+        return set(snapshot.prefixes)
+    all_objects = cmds.ls()
+    prefixes = set()
+    for obj in all_objects:
+        name_parts = obj.split(':')
+        if len(name_parts) > 1:
+            prefixes.add(name_parts[0])
+    return prefixes
+
+def skeleton_bindpose(selectObjects, prefix):
+    print(f"skeleton_bindpose 실행 - 대상 오브젝트: {len(selectObjects)}개")
+    # 배치 작업은 Undo가 필요 없으므로 MDGModifier 한 번으로 기록
+    result = apply_bind_pose(selectObjects, prefix, undoable=False)
+    log.summary(format_bind_pose_result(result))
+    for plug_name in result['missing']:
+        log.detail(f"속성 없음: {plug_name}")
+    return result
+
+def joint_Exists(joints, pre_, snapshot=None):
+    joint_list = []
+    if not joints:
+        return joint_list
+
+    exists = snapshot.exists if snapshot is not None else cmds.objExists
+    for jnt in joints:
+        if exists(f'{pre_}:{jnt}'):
+            joint_list.append(jnt)
+    return joint_list
+
+def ik_fk_control_blend(attrName='FKIKBlend', snapshot=None):
+    """
+    마야 씬에서 FKIKBlend 속성을 가진 컨트롤러들을 찾습니다.
+    Args:
+        attrName (str): 찾을 속성 이름 (기본값: 'FKIKBlend')
+        snapshot (SceneSnapshot): 씬 스냅샷 (있으면 색인된 결과 사용)
+
+    Returns:
+        list: FKIKBlend 속성을 가진 컨트롤러 리스트
+    """
+    if snapshot is None:
+        snapshot = SceneSnapshot(attributes=())
+    controllers_with_fkik = snapshot.nodes_with_attribute(attrName)
+
+    if controllers_with_fkik:
+        print(f"{attrName} 속성을 가진 컨트롤러들: {controllers_with_fkik}")
+    else:
+        print(f"{attrName} 속성을 가진 컨트롤러를 찾을 수 없습니다.")
+
+    return controllers_with_fkik
+
+def bake_animation(controls, startFrame, endFrame, engine=BAKE_ENGINE):
+    # 프레임 값 안전 처리
+    try:
+        startFrame = int(startFrame) if startFrame is not None else 0
+        endFrame = int(endFrame) if endFrame is not None else 100
+
+        if not controls:
+            print("베이킹할 컨트롤이 없습니다.")
+            return
+
+        print(f"베이킹 실행: 컨트롤 {len(controls)}개, 프레임 {startFrame}-{endFrame}")
+
+        result = bake_controls(controls, startFrame, endFrame, engine=engine)
+        log.summary(format_bake_result(result))
+
+        print("베이킹 완료")
+
+    except Exception as e:
+        print(f"베이킹 중 오류 발생: {e}")
+        raise
+
+def main_controller_move(prefix):
+    """
+    루트 조인트의 위치를 확인 MainExtra2 값을 이동합니다.
+
+    Args:
+        prefix (str): 네임스페이스 프리픽스
+    """
+    if cmds.objExists(f'{prefix}:Root'):
+        root_transX = cmds.getAttr(f'{prefix}:Root.tx')
+        root_transY = cmds.getAttr(f'{prefix}:Root.ty')
+        root_transZ = cmds.getAttr(f'{prefix}:Root.tz')
+        if root_transX or root_transY or root_transZ:
+            if cmds.objExists('MainExtra2'):
+                cmds.move(root_transX, root_transY, root_transZ, 'MainExtra2')
+
+def skeleton_control_match(file_name, frontAxis='frontX', reporter=None):
+    # 현재 타임라인의 시작 프레임과 마지막 프레임 가져오기
+    current_start_frame = cmds.playbackOptions(query=True, minTime=True)
+    current_end_frame = cmds.playbackOptions(query=True, maxTime=True)
+
+    try:
+        # 네임스페이스, FKIKBlend, 컨스트레인 연결을 한 번에 조회
+        snapshot = build_scene_snapshot()
+        log.summary(snapshot.summary())
+
+        # IK/FK 컨트롤러 처리
+        ik_fk_contols = ik_fk_control_blend(snapshot=snapshot)
+        if ik_fk_contols:
+            print(f"IK/FK 컨트롤러들: {ik_fk_contols}")
+            for cont in ik_fk_contols:
+                try:
+                    cmds.setAttr(cont + '.FKIKBlend', 0)
+                    log.detail(f"{cont}.FKIKBlend를 0으로 설정")
+                except Exception as e:
+                    print(f"{cont}.FKIKBlend 설정 실패: {e}")
+        else:
+            print("IK/FK 컨트롤러를 찾을 수 없습니다.")
+
+        # 모든 콜론 프리픽스를 가져옵니다.
+        prefixes = list(get_colon_prefixes(snapshot))
+        if not prefixes:
+            print("오류: 네임스페이스를 찾을 수 없습니다.")
+            return False
+
+        # FBX 파일의 네임스페이스 찾기 (file_name과 일치하는 것)
+        target_prefix = None
+        for prefix in prefixes:
+            if prefix == file_name:
+                target_prefix = prefix
+                break
+
+        if not target_prefix:
+            print(f"오류: FBX 네임스페이스 '{file_name}'를 찾을 수 없습니다.")
+            print(f"사용 가능한 네임스페이스: {prefixes}")
+            # 첫 번째 네임스페이스 사용 (fallback)
+            target_prefix = prefixes[0]
+            print(f"첫 번째 네임스페이스를 사용합니다: {target_prefix}")
+
+        print(f"사용할 네임스페이스: {target_prefix}")
+
+        # main_controller_move 실행
+        main_controller_move(target_prefix)
+
+        try:
+            set_node = SKEL_SET
+            if not cmds.objExists(set_node):
+                print(f"경고: {set_node} 세트가 존재하지 않습니다.")
+                return False
+
+            members = cmds.sets(set_node, q=True)
+            if not members:
+                print(f"경고: {set_node} 세트가 비어있습니다.")
+                return False
+
+            log.debug(f"Skeleton_Set 멤버: {members}")
+            selectObjects = joint_Exists(members, target_prefix, snapshot)
+            log.debug(f"존재하는 조인트: {selectObjects}")
+
+            if not selectObjects:
+                print("오류: 매칭되는 조인트가 없습니다.")
+                return False
+
+            cmds.select(clear=True)
+
+            # root_grp 생성 및 설정
+            if not cmds.objExists('root_grp'):
+                cmds.group(em=True, name='root_grp')
+
+            root_joint = f'{target_prefix}:Root'
+            if cmds.objExists(root_joint):
+                if not cmds.listRelatives(root_joint, p=True):
+                    cmds.parent(root_joint, 'root_grp')
+                    print(f"{root_joint}를 root_grp에 부모 설정")
+            else:
+                print(f"경고: {target_prefix}:Root 객체가 존재하지 않습니다.")
+
+            # 방향 설정
+            if frontAxis == 'frontX':
+                if cmds.objExists('MainExtra2'):
+                    cmds.setAttr('MainExtra2.rotateY', 90)
+                cmds.setAttr('root_grp.rotateY', 0)
+                print("FrontX 모드로 설정")
+            else:
+                if cmds.objExists('MainExtra2'):
+                    cmds.setAttr('MainExtra2.rotateY', 0)
+                cmds.setAttr('root_grp.rotateY', -90)
+                print("FrontZ 모드로 설정")
+
+            # skeleton_bindpose 실행 (배치 작업은 단계 시간을 따로 기록)
+            if reporter is not None:
+                reporter.begin_step('bind_pose', "바인드 포즈 적용")
+            skeleton_bindpose(selectObjects, target_prefix)
+            if cmds.objExists(f'{target_prefix}:Root'):
+                joint_segment_scale(f'{target_prefix}:Root', val=1)
+            if reporter is not None:
+                reporter.begin_step('control_match', "컨트롤 매칭")
+
+        except Exception as e:
+            print(f'skeleton_control_match 오류: {e}')
+            return False
+
+        # 컨트롤 매칭 부분
+        contList = []
+        aniJointList = []
+
+        print("컨트롤 매칭 시작...")
+        # 조인트 -> parentConstraint -> 타겟 rotate 로케이터 -> 컨트롤 그룹 (스냅샷 조회)
+        for obj in selectObjects:
+            try:
+                if snapshot.exists(obj):
+                    rotate_locator = snapshot.find_rotate_locator(obj)
+                    if rotate_locator:
+                        aniJoint = f'{target_prefix}:{obj}'
+                        if snapshot.exists(aniJoint):
+                            aniJointList.append(aniJoint)
+                        parent_grp = snapshot.parent_of(f'{rotate_locator}_grp')
+                        if parent_grp:
+                            contList.append(parent_grp)
+            except Exception as e:
+                log.warning(f"오브젝트 {obj} 처리 중 오류: {e}")
+                continue
+
+        log.summary(f"찾은 컨트롤: {len(contList)}개")
+        log.summary(f"애니메이션 조인트: {len(aniJointList)}개")
+
+        if not contList:
+            print("경고: 컨트롤을 찾을 수 없습니다.")
+            return False
+
+        # 컨트롤 세트 생성
+        set_name = BAKE_CTRL_SET
+        if cmds.objExists(set_name):
+            cmds.delete(set_name)
+        cmds.sets(contList, name=set_name)
+        cmds.select(clear=True)
+
+        # 컨트롤과 조인트 연결
+        for j, c in zip(aniJointList, contList):
+            log.detail(f"처리 중: {j} -> {c}")
+            try:
+                if not cmds.objExists(c):
+                    log.warning(f"경고: 컨트롤러 {c}가 존재하지 않습니다. 건너뜁니다.")
+                    continue
+
+                # 기존 로케이터와 그룹이 있는지 확인하고 삭제
+                ctl_loc_name = f'{c}_ctl'
+                ctl_grp_name = f'{ctl_loc_name}_grp'
+
+                # 기존 컨스트레인 조인트 삭제
+                if cmds.objExists('RootX_M'):
+                    existing_constraints = cmds.listConnections('RootX_M', type='constraint', source=True)
+                    if existing_constraints:
+                        # 조인트 타입만 필터링
+                        joint_constraints = []
+                        for constraint in existing_constraints:
+                            if cmds.objExists(constraint):
+                                # 컨스트레인의 타겟을 확인하여 조인트인지 검사
+                                targets = cmds.listConnections(constraint, source=True, destination=False)
+                                if targets:
+                                    for target in targets:
+                                        if cmds.nodeType(target) == 'joint':
+                                            joint_constraints.append(constraint)
+                                            break
+                        existing_constraints = joint_constraints
+                        # 컨스트레인 삭제
+                        if existing_constraints:
+                            for constraint in existing_constraints:
+                                try:
+                                    log.debug(f'기존 컨스트레인 {constraint} 확인됨 (삭제하지 않음)')
+                                    # cmds.delete(constraint)  # 실제로는 삭제하지 않음
+                                except Exception as e:
+                                    log.warning(f"기존 컨스트레인 {constraint} 처리 중 오류: {e}")
+
+                # 기존 로케이터 그룹 삭제 (조인트의 자식으로 있는 경우)
+                joint_children = cmds.listRelatives(j, children=True, type='transform')
+                if joint_children:
+                    for child in joint_children:
+                        if child.endswith('_ctl_grp'):
+                            try:
+                                cmds.delete(child)
+                                log.detail(f"기존 로케이터 그룹 {child} 삭제됨")
+                            except Exception as e:
+                                log.warning(f"기존 로케이터 그룹 {child} 삭제 중 오류: {e}")
+
+                # 씬에서 기존 로케이터와 그룹 삭제
+                if cmds.objExists(ctl_grp_name):
+                    try:
+                        cmds.delete(ctl_grp_name)
+                        log.detail(f"기존 로케이터 그룹 {ctl_grp_name} 삭제됨")
+                    except Exception as e:
+                        log.warning(f"기존 로케이터 그룹 {ctl_grp_name} 삭제 중 오류: {e}")
+
+                if cmds.objExists(ctl_loc_name):
+                    try:
+                        cmds.delete(ctl_loc_name)
+                        log.detail(f"기존 로케이터 {ctl_loc_name} 삭제됨")
+                    except Exception as e:
+                        log.warning(f"기존 로케이터 {ctl_loc_name} 삭제 중 오류: {e}")
+
+                c_ro = cmds.getAttr(f'{c}.rotateOrder')
+                ctlLoc = cmds.spaceLocator(p=(0, 0, 0), name=f'{c}_ctl')
+                cmds.setAttr(f'{ctlLoc[0]}.rotateOrder', c_ro)
+                ctlLocGrp = cmds.group(em=True, name=f'{ctlLoc[0]}_grp')
+                cmds.parent(ctlLoc, ctlLocGrp)
+                cmds.delete(cmds.pointConstraint(c, ctlLocGrp, mo=False))
+                cmds.delete(cmds.orientConstraint(c, ctlLocGrp, mo=False))
+                cmds.parent(ctlLocGrp, j)
+                cmds.select(clear=True)
+
+                # 속성 존재 여부 확인 후 컨스트레인 생성
+                try:
+                    if cmds.attributeQuery('tx', node=c, exists=True) and cmds.getAttr(c + '.tx', keyable=True):
+                        cmds.parentConstraint(ctlLoc, c, mo=True)
+                        log.detail(f"Parent constraint 생성됨: {ctlLoc} -> {c}")
+                except Exception as e:
+                    log.warning(f"Parent constraint 생성 실패: {e}")
+
+                try:
+                    if cmds.attributeQuery('sx', node=c, exists=True) and cmds.getAttr(c + '.sx', keyable=True):
+                        cmds.scaleConstraint(ctlLoc, c, mo=True)
+                        log.detail(f"Scale constraint 생성됨: {ctlLoc} -> {c}")
+                except Exception as e:
+                    log.warning(f"Scale constraint 생성 실패: {e}")
+
+            except Exception as e:
+                log.warning(f"컨트롤러 {c} 처리 중 오류 발생: {str(e)}")
+                continue
+
+        # 현재 타임라인 프레임 범위를 다시 적용
+        cmds.playbackOptions(minTime=current_start_frame, maxTime=current_end_frame)
+
+        return True
+
+    except Exception as e:
+        print(f"skeleton_control_match 실행 중 오류 발생: {e}")
+        # 현재 타임라인 프레임 범위를 다시 적용 (finally 블록 대신)
+        try:
+            cmds.playbackOptions(minTime=current_start_frame, maxTime=current_end_frame)
+        except:
+            pass
+        return False
+
+def control_bake():
+    print("control_bake 실행...")
+
+    try:
+        # Bake_Control_Set에서 컨트롤 리스트 가져오기
+        if cmds.objExists(BAKE_CTRL_SET):
+            contList = cmds.sets(BAKE_CTRL_SET, q=True)
+            if contList:
+                print(f"Bake_Control_Set에서 {len(contList)}개 컨트롤을 가져왔습니다.")
+            else:
+                print("'Bake_Control_Set' 세트가 비어있습니다.")
+                return False
+        else:
+            print("'Bake_Control_Set' 세트가 존재하지 않습니다.")
+            return False
+
+        # 타임라인 범위 가져오기
+        startFrame = cmds.playbackOptions(q=True, minTime=True)
+        endFrame = cmds.playbackOptions(q=True, maxTime=True)
+
+        print(f"컨트롤 베이킹 시작: {len(contList)}개 컨트롤")
+        print(f"프레임 범위: {startFrame} - {endFrame}")
+
+        bake_animation(contList, startFrame, endFrame)
+        return True
+
+    except Exception as e:
+        print(f"컨트롤 베이킹 중 오류 발생: {e}")
+        return False
+
+def remove_references_direct():
+    """레퍼런스를 제거하고 fosterParent, root_grp, Root를 정리합니다. (R8_ani_reference_remove 일괄 정리 엔진)"""
+    print("\n=== 직접 레퍼런스 제거 실행 ===")
+    try:
+        report = run_scene_cleanup(
+            steps=(STEP_REFERENCES, STEP_FOSTER_PARENTS, STEP_EXTRA_NODES),
+            extra_nodes=('root_grp', 'Root'))
+        log.summary(format_cleanup_report(report))
+        return True
+
+    except Exception as e:
+        print(f"직접 레퍼런스 제거 중 오류: {e}")
+        return False
+
+
+class RigSceneCache:
+    """웜 워커에서 리그 씬을 빠르게 다시 열기 위한 캐시
+
+    리그가 .ma이고 외부 레퍼런스가 없으면 처음 열 때 mayaBinary 스냅샷을 임시 폴더에 저장하고,
+    이후 작업에서는 스냅샷을 열어 ASCII 파싱 비용을 줄입니다. 리그 파일이 수정되면 스냅샷을 다시 만듭니다.
+
+    스냅샷은 여러 워커가 공유하므로 워커별 임시 이름으로 저장한 뒤 os.replace로 교체합니다.
+    스냅샷을 열 수 없으면 삭제하고 원본 리그로 되돌아갑니다.
+    """
+
+    def __init__(self):
+        self.rig_file = None
+        self.rig_mtime = None
+        self.scene_file = None
+
+    def reset_scene(self, rig_file):
+        """리그가 열린 초기 상태로 씬을 되돌립니다."""
+        rig_mtime = os.path.getmtime(rig_file)
+        if rig_file != self.rig_file or rig_mtime != self.rig_mtime:
+            self._build_snapshot(rig_file, rig_mtime)
+        elif self.scene_file == self.rig_file:
+            cmds.file(self.scene_file, open=True, force=True)
+        else:
+            try:
+                cmds.file(self.scene_file, open=True, force=True)
+            except Exception as e:
+                print(f"리그 스냅샷 열기 실패 (원본 리그 사용): {e}")
+                self._discard_snapshot()
+                cmds.file(self.rig_file, open=True, force=True)
+
+    def _build_snapshot(self, rig_file, rig_mtime):
+        print(f"리그 파일 열기: {rig_file}")
+        cmds.file(rig_file, open=True, force=True)
+
+        self.rig_file = rig_file
+        self.rig_mtime = rig_mtime
+        self.scene_file = rig_file
+
+        if not rig_file.lower().endswith('.ma') or cmds.file(query=True, reference=True):
+            return
+
+        key = hashlib.md5(f"{rig_file}|{rig_mtime}".encode('utf-8')).hexdigest()[:12]
+        snapshot_file = os.path.join(tempfile.gettempdir(), f'maya_batch_rig_{key}.mb').replace('\\', '/')
+        if os.path.exists(snapshot_file):
+            self.scene_file = snapshot_file
+            return
+
+        # 다른 워커가 같은 스냅샷을 쓰는 중일 수 있으므로 고유한 임시 이름으로 저장 후 교체
+        temp_file = f'{snapshot_file[:-3]}.{os.getpid()}_{uuid.uuid4().hex[:8]}.mb'
+        try:
+            cmds.file(rename=temp_file)
+            cmds.file(save=True, type='mayaBinary', force=True)
+            os.replace(temp_file, snapshot_file)
+            print(f"리그 스냅샷 저장: {snapshot_file}")
+            self.scene_file = snapshot_file
+        except Exception as e:
+            print(f"리그 스냅샷 저장 실패 (원본 리그 사용): {e}")
+            if os.path.exists(temp_file):
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
+
+    def _discard_snapshot(self):
+        """열 수 없는 스냅샷을 지우고 이후 작업은 원본 리그를 사용합니다."""
+        try:
+            os.remove(self.scene_file)
+        except OSError:
+            pass
+        self.scene_file = self.rig_file
+
+
+def convert_fbx(rig_file, fbx_file, output_file, frontX_v, rig_cache=None, reporter=None):
+    """리그 씬에 FBX를 레퍼런스로 불러와 매칭/베이킹 후 Maya 파일로 저장합니다.
+
+    Returns:
+        int: 저장된 파일 크기 (바이트). 실패 시 예외 발생
+    """
+    if reporter is None:
+        reporter = JobReporter()
+
+    # 시간 단위를 60fps로 설정
+    cmds.currentUnit(time='ntscf')
+
+    # 1-2. 리그 파일 열기 (웜 워커는 캐시된 리그 씬 사용)
+    reporter.begin_step('open_rig', "리그 파일 열기", 10)
+    if rig_cache is not None:
+        rig_cache.reset_scene(rig_file)
+    else:
+        print("새로운 씬 생성...")
+        cmds.file(new=True, force=True)
+        print(f"리그 파일 열기: {rig_file}")
+        cmds.file(rig_file, open=True, force=True)
+
+    # 3. 단일 FBX 파일을 레퍼런스로 불러오기
+    reporter.begin_step('reference_fbx', "FBX 레퍼런스 불러오기", 25)
+    file_name = os.path.basename(fbx_file).split('.')[0]
+    print(f"FBX 레퍼런스 불러오기: {fbx_file}")
+    print(f"네임스페이스: {file_name}")
+
+    # FBX 플러그인 로드
+    if not cmds.pluginInfo('fbxmaya', query=True, loaded=True):
+        cmds.loadPlugin('fbxmaya')
+
+    # FBX 파일 레퍼런스 로드
+    cmds.file(fbx_file, reference=True, namespace=file_name)
+
+    # 4. 스켈레톤 매칭 및 베이킹 실행
+    reporter.begin_step('skeleton_match', "스켈레톤 매칭", 40)
+    print("\n=== 스켈레톤 매칭 시작 ===")
+    frontAxis = 'frontX' if frontX_v else 'frontZ'
+
+    if not skeleton_control_match(file_name, frontAxis, reporter):
+        print("스켈레톤 매칭 실패")
+        raise Exception("스켈레톤 매칭 실패")
+
+    reporter.begin_step('control_bake', "컨트롤 베이킹", 60)
+    print("\n=== 컨트롤 베이킹 시작 ===")
+    if not control_bake():
+        print("컨트롤 베이킹 실패")
+        raise Exception("컨트롤 베이킹 실패")
+
+    # 5. 레퍼런스 파일 제거 (Maya 파일 저장 전에 실행)
+    reporter.begin_step('remove_references', "레퍼런스 파일 제거", 80)
+    print("\n=== 레퍼런스 파일 제거 (저장 전) ===")
+    if not remove_references_direct():
+        print("레퍼런스 파일 제거 실패")
+        raise Exception("레퍼런스 파일 제거 실패")
+
+    # 6. 지정 폴더에 Maya 파일 저장
+    reporter.begin_step('save', "Maya 파일 저장", 90)
+    print(f"\n=== 파일 저장: {output_file} ===")
+
+    # 출력 디렉토리 생성
+    output_dir = os.path.dirname(output_file)
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    # Maya 파일 저장 (기존 파일이 있으면 덮어쓰기)
+    cmds.file(rename=output_file)
+    cmds.file(save=True, type='mayaAscii', force=True)
+    print(f"파일 저장 완료: {os.path.basename(output_file)}")
+
+    # 파일 생성 확인
+    if not os.path.exists(output_file):
+        raise Exception("Maya 파일이 생성되지 않음")
+
+    file_size = os.path.getsize(output_file)
+    print(f"성공: Maya 파일 생성됨 ({file_size} 바이트)")
+    reporter.end_step()
+    return file_size
+
+
+def _run_job(reporter, rig_file, fbx_file, output_file, frontX_v, rig_cache=None):
+    """작업 하나를 실행하고 started / success / error 이벤트를 출력합니다."""
+    reporter.started(fbx_file=fbx_file, output_file=output_file)
+    try:
+        file_size = convert_fbx(rig_file, fbx_file, output_file, frontX_v, rig_cache, reporter)
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        reporter.error(e)
+        return False
+
+    reporter.success(output_file=output_file, file_size=file_size)
+    return True
+
+
+def run_single_job(rig_file, fbx_file, output_file, frontX_v, job_id=None):
+    """파일 하나를 변환하고 결과를 이벤트로 출력합니다. (1회성 프로세스용)"""
+    return _run_job(JobReporter(job_id), rig_file, fbx_file, output_file, frontX_v)
+
+
+def serve(rig_file):
+    """웜 워커 루프: stdin으로 JSON 작업 요청을 한 줄씩 받아 처리하고 결과를 이벤트로 출력합니다.
+
+    요청: {"job_id": ..., "fbx_file": ..., "output_file": ..., "frontX": true, "rig_file": (선택)}
+          {"command": "shutdown"}
+    이벤트: R8JOB:{"event": "ready" | "started" | "step" | "progress" | "success" | "error", "job_id": ..., ...}
+    """
+    rig_cache = RigSceneCache()
+
+    # FBX 플러그인은 프로세스당 한 번만 로드
+    if not cmds.pluginInfo('fbxmaya', query=True, loaded=True):
+        cmds.loadPlugin('fbxmaya')
+
+    emit_event('ready', pid=os.getpid())
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            print(f"잘못된 작업 요청 무시: {line}")
+            continue
+
+        if request.get('command') == 'shutdown':
+            break
+
+        reporter = JobReporter(request.get('job_id'))
+        if 'fbx_file' not in request or 'output_file' not in request:
+            reporter.error(f"작업 요청에 필수 항목이 없습니다: {line}")
+            continue
+
+        _run_job(reporter, request.get('rig_file') or rig_file, request['fbx_file'],
+                 request['output_file'], request.get('frontX', True), rig_cache)
+
+    print("웜 워커 종료")
@@ -0,0 +1,207 @@
+'''
+R8 Bind Pose Engine
+스켈레톤 셋 조인트의 TRS 값을 FBX 네임스페이스 조인트에 한 번에 복사하고 키를 설정합니다.
+
+기존 방식은 조인트 x 채널(9개)마다 attributeQuery / getAttr / setAttr / setKeyframe을 각각 호출했습니다.
+이 엔진은 다음 단계로 나누어 처리합니다.
+- resolve: 원본/타겟 노드를 MSelectionList 하나로 찾고, 채널별 MPlug와 잠금 여부를 캐시
+- read:    원본 TRS 값을 OpenMaya2 플러그에서 한 번에 읽기
+- write:   MDGModifier 한 번(undoable=False) 또는 setAttr 루프(undoable=True)로 쓰기
+- key:     setKeyframe 한 번으로 모든 채널에 키 설정
+
+Qt에 의존하지 않으며, 패키지 __init__을 거치지 않고 mayapy 작업 모듈에서도 직접 임포트할 수 있습니다.
+'''
+import time
+
+from maya import cmds
+from maya.api import OpenMaya as om2
+
+# 바인드 포즈 채널 (단축 이름, 플러그 이름, 값 종류)
+BIND_POSE_CHANNELS = (
+    ('tx', 'translateX', 'distance'),
+    ('ty', 'translateY', 'distance'),
+    ('tz', 'translateZ', 'distance'),
+    ('rx', 'rotateX', 'angle'),
+    ('ry', 'rotateY', 'angle'),
+    ('rz', 'rotateZ', 'angle'),
+    ('sx', 'scaleX', 'double'),
+    ('sy', 'scaleY', 'double'),
+    ('sz', 'scaleZ', 'double'),
+)
+
+# 바인드 포즈를 적용하지 않는 조인트 (root_grp 아래에서 위치를 유지)
+SKIP_JOINTS = ('Root',)
+
+BIND_POSE_FRAME = -10
+
+PHASES = ('resolve', 'read', 'write', 'key')
+
+
+def _get_dependency_nodes(node_names):
+    """노드 이름 리스트를 MObject 딕셔너리로 변환합니다. 없는 노드는 제외합니다."""
+    selection = om2.MSelectionList()
+    added = []
+    for name in node_names:
+        try:
+            selection.add(name)
+        except RuntimeError:
+            # 존재하지 않거나 이름이 중복된 노드
+            continue
+        added.append(name)
+
+    return {name: selection.getDependNode(i) for i, name in enumerate(added)}
+
+
+class BindPoseEngine:
+    """원본 조인트 -> 네임스페이스 조인트 바인드 포즈 일괄 복사
+
+    플러그 정보(존재, 잠금)는 노드별로 한 번만 조회해 캐시합니다.
+    단계별 처리 시간은 timings에 기록됩니다.
+    """
+
+    def __init__(self, prefix, channels=BIND_POSE_CHANNELS):
+        self.prefix = prefix
+        self.channels = channels
+        self.timings = {phase: 0.0 for phase in PHASES}
+        self.missing = []  # 원본 또는 타겟에 없는 채널
+        self.locked = []   # 타겟에서 잠긴 채널
+        self._plug_cache = {}
+
+    def _timed(self, phase, start):
+        self.timings[phase] += time.time() - start
+
+    def _node_plugs(self, node_name, mobject):
+        """노드의 채널별 MPlug를 캐시에서 가져옵니다. 없는 채널은 None입니다."""
+        plugs = self._plug_cache.get(node_name)
+        if plugs is None:
+            fn_node = om2.MFnDependencyNode(mobject)
+            plugs = {}
+            for short_name, long_name, _ in self.channels:
+                plugs[short_name] = fn_node.findPlug(long_name, False) if fn_node.hasAttribute(long_name) else None
+            self._plug_cache[node_name] = plugs
+        return plugs
+
+    def resolve(self, joints):
+        """(원본 플러그, 타겟 플러그, 채널 정보) 작업 목록을 만듭니다."""
+        start = time.time()
+        joints = [jnt for jnt in joints if jnt not in SKIP_JOINTS]
+        targets = {jnt: f'{self.prefix}:{jnt}' for jnt in joints}
+        nodes = _get_dependency_nodes(joints + list(targets.values()))
+
+        tasks = []
+        for jnt in joints:
+            target = targets[jnt]
+            if target not in nodes:
+                continue
+            if jnt not in nodes:
+                self.missing.extend(f'{jnt}.{ch[0]}' for ch in self.channels)
+                continue
+
+            source_plugs = self._node_plugs(jnt, nodes[jnt])
+            target_plugs = self._node_plugs(target, nodes[target])
+            for channel in self.channels:
+                short_name = channel[0]
+                source_plug = source_plugs[short_name]
+                target_plug = target_plugs[short_name]
+                if source_plug is None or target_plug is None:
+                    self.missing.append(f'{target}.{short_name}')
+                elif target_plug.isLocked:
+                    self.locked.append(f'{target}.{short_name}')
+                else:
+                    tasks.append((source_plug, target_plug, channel, f'{target}.{short_name}'))
+
+        self._timed('resolve', start)
+        return tasks
+
+    def read(self, tasks):
+        """원본 채널 값을 한 번에 읽습니다. (내부 단위 MDistance / MAngle / float)"""
+        start = time.time()
+        values = []
+        for source_plug, _, channel, _ in tasks:
+            value_type = channel[2]
+            if value_type == 'distance':
+                values.append(source_plug.asMDistance())
+            elif value_type == 'angle':
+                values.append(source_plug.asMAngle())
+            else:
+                values.append(source_plug.asDouble())
+        self._timed('read', start)
+        return values
+
+    def write(self, tasks, values, undoable=True):
+        """타겟 채널에 값을 씁니다.
+
+        undoable=True: setAttr 루프 (Undo 가능, 대화형 도구용)
+        undoable=False: MDGModifier 한 번 (Undo 불가, 배치 작업용)
+        """
+        start = time.time()
+        if undoable:
+            distance_unit = om2.MDistance.uiUnit()
+            angle_unit = om2.MAngle.uiUnit()
+            for (_, _, channel, plug_name), value in zip(tasks, values):
+                value_type = channel[2]
+                if value_type == 'distance':
+                    value = value.asUnits(distance_unit)
+                elif value_type == 'angle':
+                    value = value.asUnits(angle_unit)
+                cmds.setAttr(plug_name, value)
+        else:
+            modifier = om2.MDGModifier()
+            for (_, target_plug, channel, _), value in zip(tasks, values):
+                value_type = channel[2]
+                if value_type == 'distance':
+                    modifier.newPlugValueMDistance(target_plug, value)
+                elif value_type == 'angle':
+                    modifier.newPlugValueMAngle(target_plug, value)
+                else:
+                    modifier.newPlugValueDouble(target_plug, value)
+            modifier.doIt()
+        self._timed('write', start)
+
+    def key(self, tasks):
+        """모든 타겟 채널에 현재 프레임 키를 한 번에 설정합니다."""
+        start = time.time()
+        plug_names = [task[3] for task in tasks]
+        if plug_names:
+            cmds.setKeyframe(plug_names)
+        self._timed('key', start)
+
+    def apply(self, joints, undoable=True):
+        """바인드 포즈를 복사하고 키를 설정합니다. 처리한 채널 수를 반환합니다."""
+        tasks = self.resolve(joints)
+        values = self.read(tasks)
+        self.write(tasks, values, undoable=undoable)
+        self.key(tasks)
+        return len(tasks)
+
+
+def apply_bind_pose(joints, prefix, frame=BIND_POSE_FRAME, undoable=True):
+    """타임라인을 바인드 포즈 프레임으로 옮기고 네임스페이스 조인트에 바인드 포즈 키를 설정합니다.
+
+    Args:
+        joints (list): Skeleton_Set 조인트 이름 리스트 (네임스페이스 없음)
+        prefix (str): FBX 네임스페이스
+        frame (int): 바인드 포즈 키 프레임
+        undoable (bool): False면 MDGModifier로 한 번에 기록 (Undo 불가)
+
+    Returns:
+        dict: channels(처리 채널 수), missing, locked, timings(단계별 초)
+    """
+    cmds.playbackOptions(min=frame)
+    cmds.currentTime(frame)
+
+    engine = BindPoseEngine(prefix)
+    channel_count = engine.apply(joints, undoable=undoable)
+    return {
+        'channels': channel_count,
+        'missing': engine.missing,
+        'locked': engine.locked,
+        'timings': engine.timings,
+    }
+
+
+def format_bind_pose_result(result):
+    """apply_bind_pose 결과를 한 줄 문자열로 만듭니다."""
+    timings = ', '.join(f"{phase} {result['timings'][phase]:.3f}초" for phase in PHASES)
+    return (f"바인드 포즈 채널 {result['channels']}개 (없음 {len(result['missing'])}, "
+            f"잠김 {len(result['locked'])}) - {timings}")
@@ -0,0 +1,177 @@
+'''
+FBX -> Maya 배치 변환 빌드 캐시
+저장 폴더마다 .r8_batch_manifest.json 매니페스트를 두고, 변환에 성공한 파일의 입력 정보를 기록합니다.
+
+기록 항목: FBX 내용 해시 + 수정 시간 + 크기, 리그 파일 해시, frontX 옵션, 변환 스크립트 버전, 출력 파일 크기
+입력이 모두 같고 출력 파일이 그대로 있으면 다시 변환하지 않습니다.
+
+Qt나 Maya에 의존하지 않습니다.
+'''
+import os
+import json
+import hashlib
+
+MANIFEST_FILE_NAME = '.r8_batch_manifest.json'
+MANIFEST_VERSION = 1
+
+# 변환 스크립트 버전은 작업 모듈과 작업 모듈이 임포트하는 모듈 소스의 해시로 정합니다. (변환 로직이 바뀌면 전체 재변환)
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+WORKER_MODULE_PATH = os.path.join(MODULE_DIR, 'R8_ani_batch_worker.py')
+WORKER_DEPENDENCY_PATHS = [
+    os.path.join(MODULE_DIR, 'R8_ani_bindpose.py'),
+    os.path.join(MODULE_DIR, 'R8_ani_scene_snapshot.py'),
+    os.path.join(MODULE_DIR, 'R8_ani_bake_engine.py'),
+    os.path.join(MODULE_DIR, 'R8_ani_reference_remove.py'),
+    os.path.join(MODULE_DIR, 'R8_log.py'),
+]
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# 다시 변환해야 하는 이유
+REASON_NEW = '기록 없음'
+REASON_OUTPUT_MISSING = '출력 파일 없음/변경됨'
+REASON_FBX_CHANGED = 'FBX 변경'
+REASON_RIG_CHANGED = '리그 변경'
+REASON_FRONTX_CHANGED = 'FrontX 옵션 변경'
+REASON_SCRIPT_CHANGED = '변환 스크립트 변경'
+
+# (경로, 수정 시간, 크기) -> 해시 (세션 내 재사용)
+_hash_cache = {}
+
+
+def hash_file(file_path):
+    """파일 내용의 SHA1 해시를 반환합니다. 수정 시간과 크기가 같으면 세션 캐시를 사용합니다."""
+    stat = os.stat(file_path)
+    key = (os.path.normcase(os.path.abspath(file_path)), stat.st_mtime, stat.st_size)
+    cached = _hash_cache.get(key)
+    if cached:
+        return cached
+
+    sha1 = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            sha1.update(chunk)
+    file_hash = sha1.hexdigest()
+    _hash_cache[key] = file_hash
+    return file_hash
+
+
+def get_script_version():
+    """변환 스크립트(R8_ani_batch_worker) 버전 문자열을 반환합니다."""
+    try:
+        module_hashes = [hash_file(path) for path in [WORKER_MODULE_PATH] + WORKER_DEPENDENCY_PATHS]
+    except OSError:
+        return 'unknown'
+    return hashlib.sha1('|'.join(module_hashes).encode('utf-8')).hexdigest()[:12]
+
+
+def get_output_file(save_folder, fbx_file):
+    """FBX 파일의 변환 결과 Maya 파일 경로를 반환합니다."""
+    return os.path.join(save_folder, f"{os.path.splitext(fbx_file)[0]}.ma")
+
+
+class BuildManifest:
+    """저장 폴더 하나의 변환 기록 매니페스트"""
+
+    def __init__(self, save_folder):
+        self.save_folder = save_folder
+        self.manifest_path = os.path.join(save_folder, MANIFEST_FILE_NAME)
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """매니페스트 파일을 읽습니다. 없거나 손상된 경우 빈 기록으로 시작합니다."""
+        self.entries = {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError):
+            pass
+        self.dirty = False
+
+    def save(self):
+        """변경된 경우에만 매니페스트 파일을 저장합니다."""
+        if not self.dirty:
+            return
+
+        temp_path = self.manifest_path + '.tmp'
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': MANIFEST_VERSION, 'files': self.entries}, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.manifest_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"빌드 매니페스트 저장 실패: {self.manifest_path} ({e})")
+
+    def _fbx_unchanged(self, entry, fbx_path):
+        stat = os.stat(fbx_path)
+        if entry.get('fbx_mtime') == stat.st_mtime and entry.get('fbx_size') == stat.st_size:
+            return True
+        # 수정 시간만 바뀐 경우(복사, 체크아웃 등)는 내용 해시로 확인
+        return entry.get('fbx_size') == stat.st_size and entry.get('fbx_hash') == hash_file(fbx_path)
+
+    def get_rebuild_reason(self, fbx_file, fbx_path, rig_hash, frontX_v, script_version):
+        """다시 변환해야 하는 이유를 반환합니다. 최신 상태면 None을 반환합니다."""
+        entry = self.entries.get(fbx_file)
+        if not entry:
+            return REASON_NEW
+
+        output_file = get_output_file(self.save_folder, fbx_file)
+        if not os.path.exists(output_file) or os.path.getsize(output_file) != entry.get('output_size'):
+            return REASON_OUTPUT_MISSING
+        if entry.get('script_version') != script_version:
+            return REASON_SCRIPT_CHANGED
+        if entry.get('rig_hash') != rig_hash:
+            return REASON_RIG_CHANGED
+        if entry.get('frontX') != bool(frontX_v):
+            return REASON_FRONTX_CHANGED
+        if not self._fbx_unchanged(entry, fbx_path):
+            return REASON_FBX_CHANGED
+        return None
+
+    def record(self, fbx_file, fbx_path, rig_hash, frontX_v, script_version):
+        """변환에 성공한 파일의 입력 정보를 기록합니다."""
+        stat = os.stat(fbx_path)
+        output_file = get_output_file(self.save_folder, fbx_file)
+        self.entries[fbx_file] = {
+            'fbx_hash': hash_file(fbx_path),
+            'fbx_mtime': stat.st_mtime,
+            'fbx_size': stat.st_size,
+            'rig_hash': rig_hash,
+            'frontX': bool(frontX_v),
+            'script_version': script_version,
+            'output_size': os.path.getsize(output_file) if os.path.exists(output_file) else None
+        }
+        self.dirty = True
+
+    def forget(self, fbx_file):
+        """변환에 실패한 파일의 기록을 지웁니다."""
+        if self.entries.pop(fbx_file, None) is not None:
+            self.dirty = True
+
+
+def plan_batch(rig_file, fbx_files, fbx_folder, save_folder, frontX_v):
+    """변환 대상과 건너뛸 대상을 나눕니다.
+
+    Returns:
+        tuple: ([(fbx_file, 이유), ...] 다시 변환할 목록, [fbx_file, ...] 최신 상태라 건너뛸 목록)
+    """
+    manifest = BuildManifest(save_folder)
+    rig_hash = hash_file(rig_file)
+    script_version = get_script_version()
+
+    rebuild, skipped = [], []
+    for fbx_file in fbx_files:
+        fbx_path = os.path.join(fbx_folder, fbx_file)
+        try:
+            reason = manifest.get_rebuild_reason(fbx_file, fbx_path, rig_hash, frontX_v, script_version)
+        except OSError as e:
+            reason = f"확인 실패: {e}"
+        if reason is None:
+            skipped.append(fbx_file)
+        else:
+            rebuild.append((fbx_file, reason))
+    return rebuild, skipped
@@ -378,6 +378,17 @@ class FbxImporterUI(QtWidgets.QDialog):
         self.frontX_checkbox = QtWidgets.QCheckBox(' FrontX ')
         self.frontZ_checkbox = QtWidgets.QCheckBox(' FrontZ ')
         
+        # 배치 처리 동시 워커 수 위젯
+        self.worker_count_label = QtWidgets.QLabel('Workers :')
+        self.worker_count_spinbox = QtWidgets.QSpinBox()
+        self.worker_count_spinbox.setRange(1, max(1, os.cpu_count() or 1))
+        self.worker_count_spinbox.setValue(1)
+        self.worker_count_spinbox.setToolTip('동시에 실행할 mayapy 프로세스 수 (권장: 코어 수의 절반 이하)')
+        self.warm_worker_checkbox = QtWidgets.QCheckBox(' Warm ')
+        self.warm_worker_checkbox.setToolTip('워커 mayapy를 유지하고 리그를 열어둔 채 여러 파일을 처리합니다 (시작/리그 로드 시간 절약)')
+        self.skip_unchanged_checkbox = QtWidgets.QCheckBox(' Skip Unchanged ')
+        self.skip_unchanged_checkbox.setToolTip('FBX, 리그, FrontX 옵션, 변환 스크립트가 지난 변환과 같으면 건너뜁니다 (저장 폴더의 매니페스트 사용)')
+        
         # Collapse 버튼 추가
         self.collapse_button = QtWidgets.QPushButton('▼ Process Steps')
         self.collapse_button.setFixedHeight(30)
@@ -423,6 +434,10 @@ class FbxImporterUI(QtWidgets.QDialog):
         self.batch_button = QtWidgets.QPushButton('Batch Process')
         self.batch_button.setFixedHeight(40)
         self.batch_button.setStyleSheet('background-color: lightyellow; color: black; font-weight: bold;')
+        self.dry_run_button = QtWidgets.QPushButton('Dry Run')
+        self.dry_run_button.setFixedSize(80, 40)
+        self.dry_run_button.setStyleSheet('background-color: #666; color: #eee; font-weight: bold;')
+        self.dry_run_button.setToolTip('실제 변환 없이 다시 변환될 파일 목록을 로그에 표시합니다')
         
         for button in [self.match_button, self.bake_button, self.maya_save_button]:
             button.setFixedHeight(30)
@@ -495,6 +510,11 @@ class FbxImporterUI(QtWidgets.QDialog):
         checkbox_layout = QtWidgets.QHBoxLayout()
         checkbox_layout.addWidget(self.frontX_checkbox)
         checkbox_layout.addWidget(self.frontZ_checkbox)
+        checkbox_layout.addStretch()
+        checkbox_layout.addWidget(self.worker_count_label)
+        checkbox_layout.addWidget(self.worker_count_spinbox)
+        checkbox_layout.addWidget(self.warm_worker_checkbox)
+        checkbox_layout.addWidget(self.skip_unchanged_checkbox)
         main_layout.addLayout(checkbox_layout)  
      
         # Collapse 버튼 레이아웃
@@ -552,7 +572,10 @@ class FbxImporterUI(QtWidgets.QDialog):
         file_select_layout = QtWidgets.QVBoxLayout()
         file_select_layout.addWidget(self.file_select_label)
         file_select_layout.addWidget(self.file_select_label2)
-        file_select_layout.addWidget(self.batch_button)
+        batch_button_layout = QtWidgets.QHBoxLayout()
+        batch_button_layout.addWidget(self.batch_button)
+        batch_button_layout.addWidget(self.dry_run_button)
+        file_select_layout.addLayout(batch_button_layout)
         main_layout.addLayout(file_select_layout)
         
         # 구분선 추가
@@ -584,6 +607,7 @@ class FbxImporterUI(QtWidgets.QDialog):
         self.maya_save_button.clicked.connect(self.maya_file_save_func)
         self.delete_constraint_button.clicked.connect(self.delete_constraint_func)
         self.batch_button.clicked.connect(self.batch_process)
+        self.dry_run_button.clicked.connect(self.batch_dry_run)
         self.collapse_button.clicked.connect(self.toggle_process_group)
         
         # 로그 클리어 버튼 연결 추가
@@ -935,6 +959,12 @@ class FbxImporterUI(QtWidgets.QDialog):
                         self.save_path_line_edit.setText(data['save_folder'])
                     if 'rig_file' in data:
                         self.rig_line_edit.setText(data['rig_file'])
+                    if 'batch_workers' in data:
+                        self.worker_count_spinbox.setValue(int(data['batch_workers']))
+                    if 'batch_warm_workers' in data:
+                        self.warm_worker_checkbox.setChecked(bool(data['batch_warm_workers']))
+                    if 'batch_skip_unchanged' in data:
+                        self.skip_unchanged_checkbox.setChecked(bool(data['batch_skip_unchanged']))
             elif os.name == 'nt':
                 self.path_line_edit.setText(DEFAULT_FOLDER_PATH)
         except (json.JSONDecodeError, IOError, KeyError) as e:
@@ -975,13 +1005,27 @@ class FbxImporterUI(QtWidgets.QDialog):
         except Exception as e:
             self.log_message(f"예상치 못한 오류 발생: {e}")
     
-    def batch_process(self):
-        """선택된 파일들을 백그라운드에서 순차적으로 처리합니다."""
-        # 기존 프로그레스 다이얼로그가 있으면 먼저 정리
-        self._cleanup_progress_dialog()
-        
-        self.log_message("배치 처리를 준비 중입니다...")
-        
+    def save_json_setting(self, key, value):
+        """단일 설정 값을 JSON 파일에 저장합니다."""
+        try:
+            data = {}
+            if os.path.exists(JSON_FILE_PATH):
+                try:
+                    with open(JSON_FILE_PATH, 'r', encoding='utf-8') as file:
+                        data = json.load(file)
+                except (json.JSONDecodeError, IOError):
+                    data = {}
+            
+            data[key] = value
+            
+            with open(JSON_FILE_PATH, 'w', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False, indent=2)
+                
+        except Exception as e:
+            self.log_message(f"JSON 설정 파일 저장 중 오류: {e}")
+    
+    def _get_batch_target_files(self):
+        """배치 처리 대상 파일 목록을 반환합니다. 선택된 파일이 없으면 리스트의 모든 파일을 반환합니다."""
         selected_items = self.file_list_widget.selectedItems()
         
         # 선택된 아이템이 없으면 모든 아이템을 대상으로 함
@@ -995,7 +1039,7 @@ class FbxImporterUI(QtWidgets.QDialog):
             if not all_files:
                 QtWidgets.QMessageBox.warning(self, "경고", "처리할 파일이 리스트에 없습니다.")
                 self.log_message("경고: 처리할 파일이 리스트에 없습니다.")
-                return
+                return []
             
             # 모든 파일을 선택된 파일로 설정
             selected_files = all_files
@@ -1013,6 +1057,47 @@ class FbxImporterUI(QtWidgets.QDialog):
             
             self.log_message(f"선택된 {len(selected_files)}개 파일을 처리합니다.")
         
+        return selected_files
+    
+    def batch_dry_run(self):
+        """실제 변환 없이 다시 변환될 파일과 건너뛸 파일을 로그에 표시합니다."""
+        selected_files = self._get_batch_target_files()
+        if not selected_files:
+            return
+        
+        validation_errors = self._validate_paths_for_batch_process()
+        if validation_errors:
+            for error in validation_errors:
+                self.log_message(f"검증 오류: {error}")
+            QtWidgets.QMessageBox.warning(self, "검증 오류", "\n".join([f"• {error}" for error in validation_errors]))
+            return
+        
+        rig_file = self.rig_line_edit.text().strip()
+        save_folder = self.save_path_line_edit.text().strip()
+        fbx_folder = self.path_line_edit.text().strip()
+        frontX_v = self.frontX_checkbox.isChecked()
+        
+        rebuild, skipped = R8_ani_batch_process.get_rebuild_plan(rig_file, selected_files, fbx_folder, save_folder, frontX_v)
+        
+        self.log_message("=" * 50)
+        self.log_message(f"Dry Run: 변환 {len(rebuild)}개 / 건너뜀 {len(skipped)}개")
+        for fbx_file, reason in rebuild:
+            self.log_message(f"  ▶ {fbx_file} ({reason})")
+        for fbx_file in skipped:
+            self.log_message(f"  = {fbx_file} (최신 상태)")
+        self.log_message("=" * 50)
+    
+    def batch_process(self):
+        """선택된 파일들을 백그라운드에서 순차적으로 처리합니다."""
+        # 기존 프로그레스 다이얼로그가 있으면 먼저 정리
+        self._cleanup_progress_dialog()
+        
+        self.log_message("배치 처리를 준비 중입니다...")
+        
+        selected_files = self._get_batch_target_files()
+        if not selected_files:
+            return
+        
         # 경로 검증
         validation_errors = self._validate_paths_for_batch_process()
         if validation_errors:
@@ -1030,22 +1115,46 @@ class FbxImporterUI(QtWidgets.QDialog):
         # 선택된 파일 목록 준비
         fbx_files = selected_files
         frontX_v = self.frontX_checkbox.isChecked()
+        max_workers = self.worker_count_spinbox.value()
+        persistent_workers = self.warm_worker_checkbox.isChecked()
+        skip_unchanged = self.skip_unchanged_checkbox.isChecked()
+        self.save_json_setting('batch_workers', max_workers)
+        self.save_json_setting('batch_warm_workers', persistent_workers)
+        self.save_json_setting('batch_skip_unchanged', skip_unchanged)
+        
+        # 변경되지 않은 파일 제외 (저장 폴더의 빌드 매니페스트 기준)
+        skipped_files = []
+        if skip_unchanged:
+            rebuild, skipped_files = R8_ani_batch_process.get_rebuild_plan(rig_file, fbx_files, fbx_folder, save_folder, frontX_v)
+            fbx_files = [fbx_file for fbx_file, _ in rebuild]
+            for fbx_file in skipped_files:
+                self.log_message(f"  = 건너뜀 (최신 상태): {fbx_file}")
+            
+            if not fbx_files:
+                QtWidgets.QMessageBox.information(self, "배치 처리", f"모든 파일이 최신 상태입니다. ({len(skipped_files)}개 건너뜀)")
+                self.log_message(f"모든 파일이 최신 상태입니다. ({len(skipped_files)}개 건너뜀)")
+                return
         
         # 배치 처리 정보 로그에 기록
         selection_info = "선택된 파일들" if len(fbx_files) < self.file_list_widget.rowCount() else "전체 파일들"
         self.log_message(f"배치 처리 설정:")
         self.log_message(f"  - 처리할 파일: {len(fbx_files)}개 ({selection_info})")
+        if skip_unchanged:
+            self.log_message(f"  - 건너뛴 파일: {len(skipped_files)}개 (최신 상태)")
         self.log_message(f"  - 리그 파일: {os.path.basename(rig_file)}")
         self.log_message(f"  - 저장 폴더: {save_folder}")
         self.log_message(f"  - 방향 설정: {'FrontX' if frontX_v else 'FrontZ'}")
+        self.log_message(f"  - 동시 워커 수: {max_workers} ({'웜 워커' if persistent_workers else '파일별 프로세스'})")
         
         # 사용자에게 배치 처리 정보 확인
+        skip_info = f"\n건너뛸 파일: {len(skipped_files)}개 (최신 상태)" if skip_unchanged else ""
         info_msg = f"""배치 처리를 시작합니다.
 
-처리할 파일: {len(fbx_files)}개 ({selection_info})
+처리할 파일: {len(fbx_files)}개 ({selection_info}){skip_info}
 리그 파일: {os.path.basename(rig_file)}
 저장 폴더: {save_folder}
 방향 설정: {'FrontX' if frontX_v else 'FrontZ'}
+동시 워커 수: {max_workers} ({'웜 워커' if persistent_workers else '파일별 프로세스'})
 
 각 FBX 파일마다:
 1. 새로운 씬에서 리그 파일 로드
@@ -1189,7 +1298,9 @@ class FbxImporterUI(QtWidgets.QDialog):
                 save_folder=save_folder,
                 frontX_v=frontX_v,
                 progress_callback=progress_callback,
-                file_result_callback=file_result_callback
+                file_result_callback=file_result_callback,
+                max_workers=max_workers,
+                persistent_workers=persistent_workers
             )
             
             self.log_message(f"백그라운드 배치 처리가 시작되었습니다: {len(fbx_files)}개 파일 ({selection_info})")
@@ -1,99 +1,240 @@
 from maya import cmds, mel
 from typing import List, Tuple, Optional
+from contextlib import contextmanager
 import os
+import time
 
+try:
+    from . import R8_log
+except ImportError:
+    import R8_log
 
-def remove_all_animation_references() -> None:
+log = R8_log.get_logger(__name__)
+
+
+# 삭제하지 않는 기본 노드 / 네임스페이스
+DEFAULT_SHADING_NODES = ['lambert1', 'particleCloud1', 'initialShadingGroup', 'initialParticleSE']
+DEFAULT_NAMESPACES = ['UI', 'shared']
+SYSTEM_REFERENCE_NODES = ['sharedReferenceNode', '_UNKNOWN_REF_NODE_']
+
+# 연결이 없으면 삭제하는 셰이딩 노드 타입
+SHADER_TYPES = ['lambert', 'blinn', 'phong', 'surfaceShader', 'file', 'place2dTexture']
+
+# 정리 단계 (run_scene_cleanup steps 인자)
+STEP_REFERENCES = 'references'
+STEP_NAMESPACES = 'namespaces'
+STEP_UNUSED = 'unused'
+STEP_FOSTER_PARENTS = 'foster_parents'
+STEP_UNKNOWN_NODES = 'unknown_nodes'
+STEP_EXTRA_NODES = 'extra_nodes'
+
+DEFAULT_CLEANUP_STEPS = (STEP_REFERENCES, STEP_NAMESPACES, STEP_UNUSED,
+                         STEP_FOSTER_PARENTS, STEP_UNKNOWN_NODES, STEP_EXTRA_NODES)
+
+
+@contextmanager
+def undo_disabled():
+    """Undo 기록을 끈 상태로 실행합니다. (기존 Undo 큐는 유지)"""
+    undo_state = cmds.undoInfo(query=True, stateWithoutFlush=True)
+    if undo_state:
+        cmds.undoInfo(stateWithoutFlush=False)
+    try:
+        yield
+    finally:
+        if undo_state:
+            cmds.undoInfo(stateWithoutFlush=True)
+
+
+class SceneCleanupEngine:
+    """
+    레퍼런스 제거와 씬 정리를 일괄 처리합니다.
+    
+    항목마다 일괄 조회로 대상을 모으고 cmds.delete 한 번으로 삭제하며,
+    노드별 출력 대신 report(개수, 처리 시간, 실패 목록)에 결과를 기록합니다.
+    """
+    
+    def __init__(self):
+        self.report = {'counts': {}, 'timings': {}, 'failures': []}
+    
+    def _add_failure(self, step, target, error):
+        self.report['failures'].append({'step': step, 'target': target, 'error': str(error)})
+    
+    def _delete_nodes(self, step, nodes):
+        """노드들을 한 번에 삭제합니다. 실패하면 노드별로 다시 시도해 실패한 노드만 기록합니다."""
+        nodes = [node for node in nodes if node]
+        if not nodes:
+            return 0
+        try:
+            cmds.delete(nodes)
+            return len(nodes)
+        except Exception:
+            pass
+        
+        deleted = 0
+        for node in nodes:
+            try:
+                if cmds.objExists(node):
+                    cmds.delete(node)
+                    deleted += 1
+            except Exception as e:
+                self._add_failure(step, node, e)
+        return deleted
+    
+    def remove_references(self):
+        """최상위 레퍼런스를 모두 제거합니다. (중첩 레퍼런스는 함께 제거, 언로드된 레퍼런스 포함)"""
+        reference_files = cmds.file(query=True, reference=True) or []
+        removed = 0
+        # 레퍼런스 제거는 역순으로 진행 (의존성 문제 방지)
+        for ref_file in reversed(reference_files):
+            try:
+                ref_node = cmds.referenceQuery(ref_file, referenceNode=True)
+                if ref_node in SYSTEM_REFERENCE_NODES:
+                    continue
+                cmds.file(ref_file, removeReference=True)
+                removed += 1
+            except Exception as e:
+                self._add_failure(STEP_REFERENCES, ref_file, e)
+        return removed
+    
+    def cleanup_namespaces(self):
+        """노드가 없는 네임스페이스를 자식부터 제거합니다."""
+        try:
+            all_namespaces = cmds.namespaceInfo(':', listOnlyNamespaces=True, recurse=True) or []
+        except Exception as e:
+            self._add_failure(STEP_NAMESPACES, ':', e)
+            return 0
+        
+        # 노드가 있는 네임스페이스와 그 상위 네임스페이스 (cmds.ls 한 번)
+        occupied = set()
+        for node in cmds.ls() or []:
+            parts = node.rsplit('|', 1)[-1].split(':')[:-1]
+            for depth in range(1, len(parts) + 1):
+                occupied.add(':'.join(parts[:depth]))
+        
+        namespaces_to_remove = [ns for ns in all_namespaces
+                                if ns not in DEFAULT_NAMESPACES and ns not in occupied]
+        namespaces_to_remove.sort(key=lambda x: x.count(':'), reverse=True)
+        
+        removed = 0
+        for namespace in namespaces_to_remove:
+            try:
+                cmds.namespace(removeNamespace=namespace)
+                removed += 1
+            except Exception as e:
+                self._add_failure(STEP_NAMESPACES, namespace, e)
+        return removed
+    
+    def delete_unused_materials(self):
+        """연결이 없는 셰이딩 노드를 삭제합니다."""
+        nodes = cmds.ls(type=SHADER_TYPES) or []
+        nodes = [node for node in nodes if node not in DEFAULT_SHADING_NODES]
+        if not nodes:
+            return 0
+        
+        # [노드 플러그, 연결 노드, ...] 쌍을 한 번에 조회해 연결이 있는 노드를 찾음
+        pairs = cmds.listConnections(nodes, connections=True) or []
+        connected = {plug.split('.', 1)[0] for plug in pairs[0::2]}
+        return self._delete_nodes(STEP_UNUSED, [node for node in nodes if node not in connected])
+    
+    def delete_unused(self):
+        """사용하지 않는 노드를 삭제합니다. MLdeleteUnused가 실패하면 셰이딩 노드만 직접 정리합니다."""
+        try:
+            node_count = len(cmds.ls() or [])
+            mel.eval('MLdeleteUnused;')
+            return max(node_count - len(cmds.ls() or []), 0)
+        except Exception as e:
+            self._add_failure(STEP_UNUSED, 'MLdeleteUnused', e)
+            return self.delete_unused_materials()
+    
+    def delete_nodes_of_type(self, step, node_type):
+        return self._delete_nodes(step, cmds.ls(type=node_type) or [])
+    
+    def delete_extra_nodes(self, names):
+        if not names:
+            return 0
+        return self._delete_nodes(STEP_EXTRA_NODES, cmds.ls(list(names)) or [])
+    
+    def run(self, steps=DEFAULT_CLEANUP_STEPS, extra_nodes=('root_grp',)):
+        """지정한 정리 단계를 Undo 기록 없이 순서대로 실행하고 report를 반환합니다."""
+        actions = {
+            STEP_REFERENCES: self.remove_references,
+            STEP_NAMESPACES: self.cleanup_namespaces,
+            STEP_UNUSED: self.delete_unused,
+            STEP_FOSTER_PARENTS: lambda: self.delete_nodes_of_type(STEP_FOSTER_PARENTS, 'fosterParent'),
+            STEP_UNKNOWN_NODES: lambda: self.delete_nodes_of_type(STEP_UNKNOWN_NODES, 'unknown'),
+            STEP_EXTRA_NODES: lambda: self.delete_extra_nodes(extra_nodes),
+        }
+        
+        total_start = time.time()
+        with undo_disabled():
+            for step in steps:
+                start = time.time()
+                try:
+                    self.report['counts'][step] = actions[step]()
+                except Exception as e:
+                    self.report['counts'][step] = 0
+                    self._add_failure(step, None, e)
+                self.report['timings'][step] = time.time() - start
+        self.report['total_time'] = time.time() - total_start
+        return self.report
+
+
+def run_scene_cleanup(steps=DEFAULT_CLEANUP_STEPS, extra_nodes=('root_grp',)) -> dict:
+    """
+    레퍼런스 제거와 씬 정리를 일괄 실행합니다.
+    
+    Args:
+        steps (tuple): 실행할 정리 단계 (DEFAULT_CLEANUP_STEPS 참고)
+        extra_nodes (tuple): STEP_EXTRA_NODES 단계에서 삭제할 노드 이름
+        
+    Returns:
+        dict: counts(단계별 처리 개수), timings(단계별 초), failures([{step, target, error}]), total_time
+    """
+    return SceneCleanupEngine().run(steps, extra_nodes)
+
+
+def format_cleanup_report(report) -> str:
+    """run_scene_cleanup 결과를 여러 줄 문자열로 만듭니다."""
+    lines = [f"씬 정리 완료 ({report.get('total_time', 0.0):.2f}초)"]
+    for step, count in report['counts'].items():
+        lines.append(f"- {step}: {count}개 ({report['timings'].get(step, 0.0):.3f}초)")
+    if report['failures']:
+        lines.append(f"실패 {len(report['failures'])}개:")
+        for failure in report['failures']:
+            lines.append(f"  - [{failure['step']}] {failure['target']}: {failure['error']}")
+    return '\n'.join(lines)
+
+
+def remove_all_animation_references() -> dict:
     """
     마야 씬에서 모든 애니메이션 레퍼런스 노드들을 제거하는 함수입니다.
     
     이 함수는 다음과 같은 작업을 수행합니다:
-    1. 씬의 모든 레퍼런스 노드를 검색
+    1. 씬의 최상위 레퍼런스를 일괄 조회
     2. 시스템 레퍼런스(sharedReferenceNode)는 제외
-    3. 로드된 레퍼런스들을 안전하게 제거
-    4. 제거 결과를 콘솔에 출력
+    3. 로드/언로드된 레퍼런스들을 제거
+    4. 네임스페이스, 사용하지 않는 노드, fosterParent, unknown 노드 정리
+    5. 정리 결과 요약을 콘솔에 출력
     
     Returns:
-        None
+        dict: 정리 결과 (run_scene_cleanup 참고)
         
     Raises:
         Exception: 레퍼런스 제거 중 오류 발생 시
         
     Examples:
         >>> remove_all_animation_references()
-        레퍼런스 제거 중: C:/path/to/animation.fbx
-        성공적으로 제거됨: C:/path/to/animation.fbx
-        === 레퍼런스 제거 완료 ===
-        총 제거된 레퍼런스: 1개
+        씬 정리 완료 (0.42초)
+        - references: 1개 (0.310초)
+        ...
     """
     try:
-        # 모든 레퍼런스 노드 가져오기
-        reference_nodes = cmds.ls(type='reference')
-        
-        if not reference_nodes:
-            print("씬에 레퍼런스 노드가 없습니다.")
-            return
-        
-        removed_count = 0
-        failed_references = []
-        
-        # 레퍼런스 제거는 역순으로 진행 (의존성 문제 방지)
-        for ref_node in reversed(reference_nodes):
-            try:
-                # 'sharedReferenceNode'는 기본 시스템 레퍼런스이므로 제외
-                if ref_node == 'sharedReferenceNode':
-                    continue
-                
-                # 레퍼런스 노드가 여전히 존재하는지 확인
-                if not cmds.objExists(ref_node):
-                    continue
-                
-                # 레퍼런스 파일 경로 가져오기 (먼저 시도)
-                try:
-                    ref_file = cmds.referenceQuery(ref_node, filename=True)
-                except:
-                    print(f"레퍼런스 파일 경로를 가져올 수 없음: {ref_node}")
-                    continue
-                
-                # 레퍼런스가 로드되어 있는지 확인
-                is_loaded = cmds.referenceQuery(ref_node, isLoaded=True)
-                
-                if is_loaded:
-                    print(f"레퍼런스 제거 중: {ref_file}")
-                    
-                    # 레퍼런스 제거
-                    cmds.file(ref_file, removeReference=True)
-                    removed_count += 1
-                    print(f"성공적으로 제거됨: {ref_file}")
-                    
-                else:
-                    # 언로드된 레퍼런스도 제거 시도
-                    print(f"언로드된 레퍼런스 제거 중: {ref_file}")
-                    cmds.file(ref_file, removeReference=True)
-                    removed_count += 1
-                    print(f"성공적으로 제거됨: {ref_file}")
-                    
-            except Exception as e:
-                error_msg = f"레퍼런스 제거 실패 - {ref_node}: {str(e)}"
-                print(error_msg)
-                failed_references.append((ref_node, str(e)))
-                continue
-        
-        # 결과 출력
-        print(f"\n=== 레퍼런스 제거 완료 ===")
-        print(f"총 제거된 레퍼런스: {removed_count}개")
-        
-        if failed_references:
-            print(f"제거 실패한 레퍼런스: {len(failed_references)}개")
-            for ref_node, error in failed_references:
-                print(f"  - {ref_node}: {error}")
-        
-        # 씬 정리
-        cleanup_scene()
-        cleanup_unused_nodes()
+        report = run_scene_cleanup()
+        log.summary(format_cleanup_report(report))
+        return report
         
     except Exception as e:
-        print(f"스크립트 실행 중 오류 발생: {str(e)}")
+        log.error(f"스크립트 실행 중 오류 발생: {str(e)}")
         raise
 
 
@@ -111,24 +252,11 @@ def cleanup_scene() -> None:
         Exception: 씬 정리 중 오류 발생 시
     """
     try:
-        print("\n씬 정리 중...")
-        
-        # 네임스페이스 정리 (먼저 수행)
-        cleanup_namespaces()
-        
-        # 사용하지 않는 노드들 삭제
-        try:
-            mel.eval('MLdeleteUnused;')
-            print("사용하지 않는 노드들이 삭제되었습니다.")
-        except Exception as e:
-            print(f"MLdeleteUnused 실행 실패: {str(e)}")
-            # 대안으로 직접 사용하지 않는 노드 정리
-            cleanup_unused_materials()
-        
-        print("씬 정리 완료")
+        report = run_scene_cleanup(steps=(STEP_NAMESPACES, STEP_UNUSED))
+        log.summary(format_cleanup_report(report))
         
     except Exception as e:
-        print(f"씬 정리 중 오류 발생: {str(e)}")
+        log.error(f"씬 정리 중 오류 발생: {str(e)}")
         raise
 
 
@@ -140,38 +268,13 @@ def cleanup_unused_materials() -> None:
         None
     """
     try:
-        print("사용하지 않는 머티리얼 정리 중...")
-        
-        # 사용하지 않는 셰이딩 노드들 삭제
-        unused_shaders = []
-        
-        # 모든 셰이딩 노드 타입들
-        shader_types = ['lambert', 'blinn', 'phong', 'surfaceShader', 'file', 'place2dTexture']
-        
-        for shader_type in shader_types:
-            nodes = cmds.ls(type=shader_type)
-            for node in nodes:
-                # 기본 머티리얼은 제외
-                if node in ['lambert1', 'particleCloud1', 'initialShadingGroup', 'initialParticleSE']:
-                    continue
-                
-                # 연결이 없는 노드들 찾기
-                connections = cmds.listConnections(node)
-                if not connections:
-                    unused_shaders.append(node)
-        
-        # 사용하지 않는 셰이더 삭제
-        if unused_shaders:
-            for shader in unused_shaders:
-                try:
-                    if cmds.objExists(shader):
-                        cmds.delete(shader)
-                        print(f"사용하지 않는 셰이더 삭제됨: {shader}")
-                except Exception as e:
-                    print(f"셰이더 삭제 실패 - {shader}: {str(e)}")
+        engine = SceneCleanupEngine()
+        with undo_disabled():
+            deleted = engine.delete_unused_materials()
+        log.summary(f"사용하지 않는 셰이더 {deleted}개 삭제됨")
         
     except Exception as e:
-        print(f"머티리얼 정리 중 오류 발생: {str(e)}")
+        log.error(f"머티리얼 정리 중 오류 발생: {str(e)}")
 
 
 def cleanup_unused_nodes() -> None:
@@ -185,42 +288,11 @@ def cleanup_unused_nodes() -> None:
         Exception: 노드 정리 중 오류 발생 시
     """
     try:
-        print("사용하지 않는 노드들 정리 중...")
-        
-        # fosterParent 노드들 삭제
-        foster_parents = cmds.ls(type="fosterParent")
-        if foster_parents:
-            for foster_parent in foster_parents:
-                try:
-                    if cmds.objExists(foster_parent):
-                        cmds.delete(foster_parent)
-                        print(f"fosterParent 노드 삭제됨: {foster_parent}")
-                except Exception as e:
-                    print(f"fosterParent 노드 삭제 실패 - {foster_parent}: {str(e)}")
-        
-        # unknown 노드들 삭제
-        unknown_nodes = cmds.ls(type="unknown")
-        if unknown_nodes:
-            for unknown_node in unknown_nodes:
-                try:
-                    if cmds.objExists(unknown_node):
-                        cmds.delete(unknown_node)
-                        print(f"unknown 노드 삭제됨: {unknown_node}")
-                except Exception as e:
-                    print(f"unknown 노드 삭제 실패 - {unknown_node}: {str(e)}")
-        
-        # root_grp 노드 삭제
-        if cmds.objExists("root_grp"):
-            try:
-                cmds.delete("root_grp")
-                print("root_grp 노드 삭제됨")
-            except Exception as e:
-                print(f"root_grp 노드 삭제 실패: {str(e)}")
-        
-        print("사용하지 않는 노드들 정리 완료")
+        report = run_scene_cleanup(steps=(STEP_FOSTER_PARENTS, STEP_UNKNOWN_NODES, STEP_EXTRA_NODES))
+        log.summary(format_cleanup_report(report))
         
     except Exception as e:
-        print(f"사용하지 않는 노드들 정리 중 오류 발생: {str(e)}")
+        log.error(f"사용하지 않는 노드들 정리 중 오류 발생: {str(e)}")
         raise
 
 
@@ -235,58 +307,11 @@ def cleanup_namespaces() -> None:
         Exception: 네임스페이스 정리 중 오류 발생 시
     """
     try:
-        print("네임스페이스 정리 중...")
-        
-        # 모든 네임스페이스 가져오기 (기본 네임스페이스 제외)
-        try:
-            all_namespaces = cmds.namespaceInfo(listOnlyNamespaces=True, recurse=True)
-        except:
-            print("네임스페이스 정보를 가져올 수 없습니다.")
-            return
-        
-        if not all_namespaces:
-            print("정리할 네임스페이스가 없습니다.")
-            return
-        
-        # 기본 네임스페이스들 제외
-        default_namespaces = ['UI', 'shared']
-        namespaces_to_remove = [ns for ns in all_namespaces if ns not in default_namespaces]
-        
-        removed_ns_count = 0
-        
-        # 네임스페이스는 계층 구조를 고려하여 자식부터 제거
-        namespaces_to_remove.sort(key=lambda x: x.count(':'), reverse=True)
-        
-        for namespace in namespaces_to_remove:
-            try:
-                # 네임스페이스가 존재하는지 확인
-                if not cmds.namespace(exists=namespace):
-                    continue
-                
-                # 네임스페이스가 비어있는지 확인
-                try:
-                    namespace_contents = cmds.namespaceInfo(namespace, listNamespace=True)
-                except:
-                    namespace_contents = None
-                
-                if not namespace_contents:
-                    cmds.namespace(removeNamespace=namespace)
-                    print(f"빈 네임스페이스 제거됨: {namespace}")
-                    removed_ns_count += 1
-                else:
-                    print(f"네임스페이스에 내용이 있어 제거하지 않음: {namespace}")
-                    
-            except Exception as e:
-                print(f"네임스페이스 제거 실패 - {namespace}: {str(e)}")
-                continue
-        
-        if removed_ns_count > 0:
-            print(f"총 {removed_ns_count}개의 빈 네임스페이스가 제거되었습니다.")
-        else:
-            print("제거된 네임스페이스가 없습니다.")
+        report = run_scene_cleanup(steps=(STEP_NAMESPACES,))
+        log.summary(format_cleanup_report(report))
             
     except Exception as e:
-        print(f"네임스페이스 정리 중 오류 발생: {str(e)}")
+        log.error(f"네임스페이스 정리 중 오류 발생: {str(e)}")
         raise
 
 
@@ -0,0 +1,188 @@
+'''
+R8 Scene Snapshot
+skeleton_control_match가 반복해서 조회하는 씬 정보를 한 번에 수집해 딕셔너리로 색인합니다.
+
+기존 방식은 cmds.ls() 전체 이름 분할, 모든 transform에 대한 attributeQuery,
+조인트마다 listConnections / listRelatives / nodeType 호출을 반복했습니다.
+스냅샷은 항목마다 한 번의 일괄 조회로 다음 정보를 만들고, 이후 조회는 딕셔너리 조회로 끝납니다.
+- 네임스페이스 프리픽스, 노드 존재 여부
+- FKIKBlend 등 지정 속성을 가진 transform
+- transform 부모 (짧은 이름 기준)
+- 로케이터 shape을 가진 transform
+- parentConstraint 연결 노드 / 타겟 리스트
+- 컨스트레인 타겟의 rotate 연결
+
+스냅샷은 생성 시점의 씬을 기준으로 합니다. 매칭 중 새로 만들거나 부모를 바꾸는 노드는 조회하지 마세요.
+Qt에 의존하지 않으며, 패키지 __init__을 거치지 않고 mayapy 작업 모듈에서도 직접 임포트할 수 있습니다.
+'''
+import re
+import time
+
+from maya import cmds
+
+# 스냅샷에 색인할 속성
+SNAPSHOT_ATTRIBUTES = ('FKIKBlend',)
+
+ROTATE_ATTRIBUTES = ('rotate', 'rotateX', 'rotateY', 'rotateZ')
+
+# parentConstraint.target[0].targetParentMatrix -> 0
+TARGET_PLUG_PATTERN = re.compile(r'\.target\[(\d+)\]\.targetParentMatrix$')
+
+
+def _leaf_name(long_name):
+    return long_name.rsplit('|', 1)[-1]
+
+
+def _plug_node(plug):
+    return plug.split('.', 1)[0]
+
+
+def _plug_attribute(plug):
+    return plug.split('.', 1)[1] if '.' in plug else ''
+
+
+class SceneSnapshot:
+    """스켈레톤 매칭용 씬 그래프 스냅샷"""
+
+    def __init__(self, attributes=SNAPSHOT_ATTRIBUTES):
+        self.attributes = attributes
+        self.nodes = set()
+        self.transforms = set()
+        self.prefixes = []
+        self.attribute_nodes = {}    # 속성 이름 -> [transform]
+        self.parents = {}            # transform -> 부모 transform (None: 월드, 이름 중복 시 키 없음)
+        self.locator_transforms = set()
+        self.node_constraints = {}   # 노드 -> [연결된 parentConstraint]
+        self.constraint_targets = {} # parentConstraint -> [타겟] (target 인덱스 순)
+        self.rotate_connections = {} # 타겟 -> [rotate 연결 노드]
+        self.build_time = 0.0
+
+    def build(self):
+        """씬 정보를 일괄 조회해 색인을 만듭니다."""
+        start = time.time()
+
+        all_nodes = cmds.ls() or []
+        self.nodes = set(all_nodes)
+        self.prefixes = sorted({name.split(':', 1)[0] for name in all_nodes if ':' in name})
+
+        self._index_transforms()
+        self._index_attributes()
+        self._index_constraints()
+
+        self.build_time = time.time() - start
+        return self
+
+    def _index_transforms(self):
+        duplicated = set()
+        for long_name in cmds.ls(type='transform', long=True) or []:
+            parts = long_name.strip('|').split('|')
+            name = parts[-1]
+            self.transforms.add(name)
+            if name in self.parents or name in duplicated:
+                # 짧은 이름이 중복되면 부모를 단정할 수 없으므로 parent_of()에서 직접 조회
+                self.parents.pop(name, None)
+                duplicated.add(name)
+                continue
+            self.parents[name] = parts[-2] if len(parts) > 1 else None
+
+        for long_name in cmds.ls(type='locator', long=True) or []:
+            parts = long_name.strip('|').split('|')
+            if len(parts) > 1:
+                self.locator_transforms.add(parts[-2])
+
+    def _index_attributes(self):
+        for attr_name in self.attributes:
+            nodes = cmds.ls(f'*.{attr_name}', objectsOnly=True, recursive=True) or []
+            self.attribute_nodes[attr_name] = [node for node in nodes if _leaf_name(node) in self.transforms]
+
+    def _index_constraints(self):
+        constraints = cmds.ls(type='parentConstraint') or []
+        if not constraints:
+            return
+        constraint_set = set(constraints)
+
+        # [컨스트레인 플러그, 연결 노드, ...] 쌍을 한 번에 조회
+        pairs = cmds.listConnections(constraints, connections=True, plugs=False) or []
+        indexed_targets = {}
+        for plug, other in zip(pairs[0::2], pairs[1::2]):
+            constraint = _plug_node(plug)
+            if other == constraint or other in constraint_set:
+                continue
+
+            linked = self.node_constraints.setdefault(other, [])
+            if constraint not in linked:
+                linked.append(constraint)
+
+            match = TARGET_PLUG_PATTERN.search(plug)
+            if match:
+                indexed_targets.setdefault(constraint, {})[int(match.group(1))] = other
+
+        targets = set()
+        for constraint, by_index in indexed_targets.items():
+            self.constraint_targets[constraint] = [by_index[i] for i in sorted(by_index)]
+            targets.update(by_index.values())
+
+        if not targets:
+            return
+        pairs = cmds.listConnections(list(targets), connections=True, plugs=False) or []
+        for plug, other in zip(pairs[0::2], pairs[1::2]):
+            if _plug_attribute(plug) not in ROTATE_ATTRIBUTES:
+                continue
+            connected = self.rotate_connections.setdefault(_plug_node(plug), [])
+            if other not in connected:
+                connected.append(other)
+
+    # -------------------------------------------------------------------------
+    # 조회
+    # -------------------------------------------------------------------------
+
+    def exists(self, name):
+        return name in self.nodes
+
+    def nodes_with_attribute(self, attr_name):
+        nodes = self.attribute_nodes.get(attr_name)
+        if nodes is None:
+            # 색인하지 않은 속성은 직접 조회
+            nodes = cmds.ls(f'*.{attr_name}', objectsOnly=True, recursive=True, type='transform') or []
+            self.attribute_nodes[attr_name] = nodes
+        return list(nodes)
+
+    def parent_of(self, name):
+        if name in self.parents:
+            return self.parents[name]
+        parents = cmds.listRelatives(name, parent=True) if cmds.objExists(name) else None
+        return parents[0] if parents else None
+
+    def is_locator_transform(self, name):
+        return name in self.locator_transforms
+
+    def parent_constraints(self, name):
+        return self.node_constraints.get(name, [])
+
+    def constraint_target_list(self, constraint):
+        return self.constraint_targets.get(constraint, [])
+
+    def rotate_connected(self, name):
+        return self.rotate_connections.get(name, [])
+
+    def find_rotate_locator(self, joint):
+        """조인트 parentConstraint의 첫 타겟 rotate에 연결된 로케이터를 반환합니다."""
+        constraints = self.parent_constraints(joint)
+        if not constraints:
+            return None
+        targets = self.constraint_target_list(constraints[0])
+        if not targets:
+            return None
+        for node in self.rotate_connected(targets[0]):
+            if self.is_locator_transform(node):
+                return node
+        return None
+
+    def summary(self):
+        return (f"씬 스냅샷: 노드 {len(self.nodes)}개, 네임스페이스 {len(self.prefixes)}개, "
+                f"parentConstraint {len(self.constraint_targets)}개 ({self.build_time:.3f}초)")
+
+
+def build_scene_snapshot(attributes=SNAPSHOT_ATTRIBUTES):
+    """현재 씬의 스냅샷을 만들어 반환합니다."""
+    return SceneSnapshot(attributes).build()
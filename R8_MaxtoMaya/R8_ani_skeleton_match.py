@@ -1,6 +1,15 @@
 from maya import cmds
 import logging
 
+try:
+    from . import R8_ani_bindpose
+    from . import R8_ani_scene_snapshot
+    from . import R8_ani_bake_engine
+except ImportError:
+    import R8_ani_bindpose
+    import R8_ani_scene_snapshot
+    import R8_ani_bake_engine
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
@@ -9,6 +18,9 @@ SKEL_SET = 'Skeleton_Set'
 BAKE_CTRL_SET = 'Bake_Control_Set'
 contList = []  # 전역 변수 초기화
 
+# 대화형 도구는 Undo가 가능한 bakeResults를 기본으로 사용 (api 엔진은 Undo 불가)
+DEFAULT_BAKE_ENGINE = R8_ani_bake_engine.BAKE_ENGINE_BAKE_RESULTS
+
 
 def joint_segment_scale(root_joint, val=1):
     try:    
@@ -23,43 +35,43 @@ def joint_segment_scale(root_joint, val=1):
 def skeleton_bindpose(selectObjects, prefix):
     """
     선택된 객체들을 바인드 포즈로 설정합니다.
+    원본 TRS 값을 한 번에 읽어 네임스페이스 조인트에 쓰고 키를 한 번에 설정합니다. (R8_ani_bindpose)
     
     Args:
         selectObjects (list): 설정할 객체 리스트
         prefix (str): 네임스페이스 프리픽스
+        
+    Returns:
+        dict: 처리 채널 수와 단계별 처리 시간 (실패 시 None)
     """
     if not selectObjects or not prefix:
         logger.warning("객체 리스트 또는 프리픽스가 비어있습니다.")
-        return
+        return None
         
-    cmds.playbackOptions(min=-10)
-    cmds.currentTime(-10)        
-    for obj in selectObjects:
-        target_obj = f'{prefix}:{obj}'
-        if cmds.objExists(target_obj):
-            if obj == 'Root':
-                continue
-            
-            for ax in ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz']:
-                try:
-                    # 원본 객체의 속성값 가져오기
-                    if cmds.objExists(obj) and cmds.attributeQuery(ax, node=obj, exists=True):
-                        tv = cmds.getAttr(f'{obj}.{ax}')
-                        # 타겟 객체에 속성이 존재하고 설정 가능한지 확인
-                        if cmds.attributeQuery(ax, node=target_obj, exists=True) and not cmds.getAttr(f'{target_obj}.{ax}', lock=True):
-                            cmds.setAttr(f'{target_obj}.{ax}', tv)
-                            cmds.setKeyframe(f'{target_obj}.{ax}')
-                except Exception as e:
-                    logger.error(f"속성 {obj}.{ax} 처리 중 오류: {e}")
-                    continue
+    try:
+        result = R8_ani_bindpose.apply_bind_pose(selectObjects, prefix, undoable=True)
+    except Exception as e:
+        logger.error(f"바인드 포즈 설정 중 오류: {e}")
+        return None
+        
+    logger.info(R8_ani_bindpose.format_bind_pose_result(result))
+    for plug_name in result['locked']:
+        logger.debug(f"잠긴 속성 건너뜀: {plug_name}")
+    return result
     
-def get_colon_prefixes():
+def get_colon_prefixes(snapshot=None):
     """
     씬 안에 있는 모든 콜론(:) 프리픽스 네임스페이스를 반환합니다.
     
+    Args:
+        snapshot (SceneSnapshot): 씬 스냅샷 (있으면 씬을 다시 조회하지 않음)
+        
     Returns:
         list: 프리픽스 리스트
     """
+    if snapshot is not None:
+        return list(snapshot.prefixes)
+        
     try:
         all_objects = cmds.ls()
         prefixes = set()
@@ -74,7 +86,7 @@ def get_colon_prefixes():
         logger.error(f"프리픽스 가져오기 중 오류: {e}")
         return []
 
-def bake_animation(controls, startFrame, endFrame):
+def bake_animation(controls, startFrame, endFrame, engine=None):
     """
     지정된 컨트롤들에 애니메이션을 베이킹합니다.
     
@@ -82,6 +94,7 @@ def bake_animation(controls, startFrame, endFrame):
         controls (list): 베이킹할 컨트롤 리스트
         startFrame (int): 시작 프레임
         endFrame (int): 끝 프레임
+        engine (str): 베이킹 엔진 ('auto', 'api', 'bakeResults', None이면 DEFAULT_BAKE_ENGINE)
     """
     if not controls:
         logger.warning("베이킹할 컨트롤이 없습니다.")
@@ -100,12 +113,9 @@ def bake_animation(controls, startFrame, endFrame):
             
         logger.info(f"베이킹 실행: 컨트롤 {len(valid_controls)}개, 프레임 {startFrame}-{endFrame}")
         
-        cmds.bakeResults(valid_controls, simulation=True, t=(startFrame, endFrame),
-                         sampleBy=1, oversamplingRate=1, disableImplicitControl=True,
-                         preserveOutsideKeys=True, sparseAnimCurveBake=False, 
-                         removeBakedAttributeFromLayer=False,
-                         removeBakedAnimFromLayer=False, bakeOnOverrideLayer=False, 
-                         minimizeRotation=True, controlPoints=False, shape=True)
+        result = R8_ani_bake_engine.bake_controls(valid_controls, startFrame, endFrame,
+                                                  engine=engine or DEFAULT_BAKE_ENGINE)
+        logger.info(R8_ani_bake_engine.format_bake_result(result))
         
         logger.info("베이킹 완료")
         
@@ -113,13 +123,14 @@ def bake_animation(controls, startFrame, endFrame):
         logger.error(f"베이킹 중 오류 발생: {e}")
         raise
 
-def joint_exists(joints, prefix):
+def joint_exists(joints, prefix, snapshot=None):
     """
     주어진 프리픽스를 가진 조인트들이 존재하는지 확인합니다.
     
     Args:
         joints (list): 확인할 조인트 리스트
         prefix (str): 프리픽스
+        snapshot (SceneSnapshot): 씬 스냅샷 (있으면 objExists 대신 사용)
         
     Returns:
         list: 존재하는 조인트 리스트
@@ -128,17 +139,19 @@ def joint_exists(joints, prefix):
     if not joints or not prefix:
         return joint_list
         
+    exists = snapshot.exists if snapshot is not None else cmds.objExists
     for jnt in joints:
         full_joint_name = f'{prefix}:{jnt}'
-        if cmds.objExists(full_joint_name):
+        if exists(full_joint_name):
             joint_list.append(jnt)
     return joint_list
 
-def ik_fk_control_blend(attrName='FKIKBlend'):
+def ik_fk_control_blend(attrName='FKIKBlend', snapshot=None):
     """
     마야 씬에서 FKIKBlend 속성을 가진 컨트롤러들을 찾습니다.
     Args:
         attrName (str): 찾을 속성 이름 (기본값: 'FKIKBlend')
+        snapshot (SceneSnapshot): 씬 스냅샷 (있으면 색인된 결과 사용)
         
     Returns:
         list: FKIKBlend 속성을 가진 컨트롤러 리스트
@@ -146,13 +159,9 @@ def ik_fk_control_blend(attrName='FKIKBlend'):
     controllers_with_fkik = []
     
     try:
-        # 씬의 모든 객체를 검색
-        all_objects = cmds.ls(type='transform')
-        
-        for obj in all_objects:
-            # 객체에 지정된 속성이 존재하는지 확인
-            if cmds.attributeQuery(attrName, node=obj, exists=True):
-                controllers_with_fkik.append(obj)
+        if snapshot is None:
+            snapshot = R8_ani_scene_snapshot.SceneSnapshot(attributes=())
+        controllers_with_fkik = snapshot.nodes_with_attribute(attrName)
         
         if controllers_with_fkik:
             logger.info(f"{attrName} 속성을 가진 컨트롤러들: {controllers_with_fkik}")
@@ -201,13 +210,16 @@ def skeleton_control_match(frontAxis='frontX'):
     current_end_frame = cmds.playbackOptions(query=True, maxTime=True)
     
     try:
+        # 네임스페이스, FKIKBlend, 컨스트레인 연결을 한 번에 조회
+        snapshot = R8_ani_scene_snapshot.build_scene_snapshot()
+        logger.info(snapshot.summary())
+        
         # IK/FK 컨트롤 설정
-        ik_fk_controls = ik_fk_control_blend()
+        ik_fk_controls = ik_fk_control_blend(snapshot=snapshot)
         if ik_fk_controls:
             logger.info(f"IK/FK 컨트롤러들: {ik_fk_controls}")
             for cont in ik_fk_controls:
-                if cmds.objExists(cont) and cmds.attributeQuery('FKIKBlend', node=cont, exists=True):
-                    cmds.setAttr(cont + '.FKIKBlend', 0)
+                cmds.setAttr(cont + '.FKIKBlend', 0)
         else:
             logger.info("IK/FK 컨트롤러를 찾을 수 없습니다.")
         
@@ -215,7 +227,7 @@ def skeleton_control_match(frontAxis='frontX'):
         contList = []  # 함수 시작 시 초기화
         
         # 모든 콜론 프리픽스를 가져옵니다.
-        prefixes = get_colon_prefixes()
+        prefixes = get_colon_prefixes(snapshot)
         if not prefixes:
             logger.error("프리픽스가 있는 객체를 찾을 수 없습니다.")
             return False
@@ -236,7 +248,7 @@ def skeleton_control_match(frontAxis='frontX'):
                 logger.error(f"셋 '{set_node}'이 비어있습니다.")
                 return False
                 
-            selectObjects = joint_exists(members, prefix)
+            selectObjects = joint_exists(members, prefix, snapshot)
             if not selectObjects:
                 logger.error("매칭되는 조인트를 찾을 수 없습니다.")
                 return False
@@ -273,46 +285,20 @@ def skeleton_control_match(frontAxis='frontX'):
 
         aniJointList = []
 
+        # 조인트 -> parentConstraint -> 타겟 rotate 로케이터 -> 컨트롤 그룹 (스냅샷 조회)
         for obj in selectObjects:
             try:
-                if cmds.objExists(obj):
-                    parent_constraints = cmds.listConnections(obj, type='parentConstraint')
-                    if not parent_constraints:
-                        continue
-                    
-                    logger.info(f"처리 중인 제약: {parent_constraints[0]}")
-                    target_loc = cmds.parentConstraint(parent_constraints[0], query=True, targetList=True)
-                    
-                    if target_loc:
-                        # Check if the rotate attribute is connected
-                        try:
-                            rotate_connections = cmds.listConnections(target_loc[0] + '.rotate')
-                            rotate_locator = None  # 초기화
-                            
-                            if rotate_connections:
-                                for cont in rotate_connections:
-                                    if cmds.objExists(cont):
-                                        cont_shape = cmds.listRelatives(cont, children=True)
-                                        if cont_shape:
-                                            # cont_shape가 리스트일 수 있으므로 첫 번째 요소 확인
-                                            shape_node = cont_shape[0] if isinstance(cont_shape, list) else cont_shape
-                                            if cmds.nodeType(shape_node) == 'locator':
-                                                rotate_locator = cont
-                                                break  # 찾으면 루프 종료
-            
-                                if rotate_locator:
-                                    aniJoint = f'{prefix}:{obj}'
-                                    if cmds.objExists(aniJoint):
-                                        aniJointList.append(aniJoint)    
-                                    locCon = rotate_locator
-                                    grp_name = f'{locCon}_grp'
-                                    if cmds.objExists(grp_name):
-                                        parent_grp = cmds.listRelatives(grp_name, parent=True)
-                                        if parent_grp:
-                                            contList.append(parent_grp[0])
-                        except Exception as e:
-                            logger.error(f"객체 {obj}의 rotate 연결 확인 중 오류: {e}")
-                            continue
+                if snapshot.exists(obj):
+                    rotate_locator = snapshot.find_rotate_locator(obj)
+                    if rotate_locator:
+                        aniJoint = f'{prefix}:{obj}'
+                        if snapshot.exists(aniJoint):
+                            aniJointList.append(aniJoint)    
+                        grp_name = f'{rotate_locator}_grp'
+                        if snapshot.exists(grp_name):
+                            parent_grp = snapshot.parent_of(grp_name)
+                            if parent_grp:
+                                contList.append(parent_grp)
             except Exception as e:
                 logger.error(f"객체 {obj} 처리 중 오류: {e}")
                 continue
@@ -408,10 +394,13 @@ def skeleton_control_match(frontAxis='frontX'):
         cmds.undoInfo(closeChunk=True)
         return True
 
-def control_bake():
+def control_bake(engine=None):
     """
     Bake_Control_Set에 있는 컨트롤들에 애니메이션을 베이킹합니다.
     
+    Args:
+        engine (str): 베이킹 엔진 ('auto', 'api', 'bakeResults', None이면 DEFAULT_BAKE_ENGINE)
+        
     Returns:
         bool: 성공시 True, 실패시 False
     """
@@ -438,7 +427,7 @@ def control_bake():
         startFrame = cmds.playbackOptions(q=True, minTime=True)
         endFrame = cmds.playbackOptions(q=True, maxTime=True)
         
-        bake_animation(contList, startFrame, endFrame)
+        bake_animation(contList, startFrame, endFrame, engine=engine)
         return True
         
     except Exception as e:
@@ -0,0 +1,147 @@
+'''
+R8 Job Policy
+배치 작업의 예상 처리 시간, 작업별 제한 시간, 재시도, 처리 순서를 정합니다.
+
+기존 배치는 파일 크기와 관계없이 고정 제한 시간(300초 / 600초)을 사용해 긴 클립은 중간에 종료되고
+멈춘 짧은 작업은 제한 시간까지 기다렸습니다. 여기서는
+- DurationModel: R8_job_profiler 기록(성공한 작업의 입력 파일 크기 -> 처리 시간)으로 선형 회귀해 처리 시간 예측
+- timeout_for(): 예측 시간 x TIMEOUT_FACTOR + TIMEOUT_MARGIN (MIN_TIMEOUT ~ MAX_TIMEOUT), 기록이 없으면 기본값
+- 재시도: 크래시 / 타임아웃 / 시작 실패 같은 일시적 실패만 새 프로세스로 최대 MAX_RETRIES회 (대기 시간 지수 증가)
+         작업 스크립트가 보낸 오류 이벤트는 같은 입력으로 다시 실패하므로 재시도하지 않음
+- assign_longest_first(): 예상 시간이 긴 작업부터 가장 한가한 워커에 배정 (LPT)
+
+    model = R8_job_policy.DurationModel.from_history('ani_batch_process', warm=False)
+    timeout = R8_job_policy.timeout_for(model.predict(os.path.getsize(fbx_path)))
+
+Qt나 Maya에 의존하지 않습니다.
+'''
+import heapq
+import sqlite3
+from contextlib import closing
+
+try:
+    from . import R8_job_profiler
+except ImportError:
+    import R8_job_profiler
+
+# 작업별 제한 시간 (초)
+DEFAULT_TIMEOUT = 300
+TIMEOUT_FACTOR = 3.0
+TIMEOUT_MARGIN = 60
+MIN_TIMEOUT = 120
+MAX_TIMEOUT = 4 * 3600
+
+# 새로 시작한 웜 워커의 초기화(mayapy + 플러그인) / 첫 리그 로드에 허용하는 시간 (초, 작업 제한 시간과 별도)
+STARTUP_TIMEOUT = 900
+
+# 예측에 사용할 최근 기록 수 / 회귀에 필요한 최소 기록 수
+HISTORY_SAMPLES = 500
+MIN_FIT_SAMPLES = 3
+
+# 재시도
+MAX_RETRIES = 2
+RETRY_BACKOFF = 5.0
+RETRY_BACKOFF_MAX = 60.0
+
+# 일시적 실패 사유 (재시도 대상)
+FAILURE_CRASH = 'crash'            # 결과 이벤트 없이 프로세스 종료
+FAILURE_TIMEOUT = 'timeout'
+FAILURE_START = 'start_failed'
+FAILURE_JOB_ERROR = 'job_error'    # 작업 스크립트가 보낸 오류 이벤트
+TRANSIENT_FAILURES = (FAILURE_CRASH, FAILURE_TIMEOUT, FAILURE_START)
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2.0
+
+
+class DurationModel:
+    """입력 파일 크기로 처리 시간을 예측합니다. (시간 = intercept + slope x 바이트)
+
+    크기가 기록된 작업이 MIN_FIT_SAMPLES개 이상이면 최소제곱 회귀, 부족하면 처리 시간 중앙값을 사용합니다.
+    기록이 없으면 predict()가 None을 반환하므로 호출하는 쪽의 기본값이 쓰입니다.
+    """
+
+    def __init__(self, samples):
+        # samples: [(입력 크기 또는 None, 처리 시간(초))]
+        self.sample_count = len(samples)
+        self.intercept = None
+        self.slope = 0.0
+        if not samples:
+            return
+
+        self.intercept = _median([seconds for _, seconds in samples])
+        sized = [(size, seconds) for size, seconds in samples if size]
+        if len(sized) < MIN_FIT_SAMPLES:
+            return
+
+        mean_size = sum(size for size, _ in sized) / float(len(sized))
+        mean_time = sum(seconds for _, seconds in sized) / float(len(sized))
+        variance = sum((size - mean_size) ** 2 for size, _ in sized)
+        if variance <= 0:
+            return
+        slope = sum((size - mean_size) * (seconds - mean_time) for size, seconds in sized) / variance
+        if slope <= 0:
+            # 크기와 무관한 작업이면 중앙값 유지
+            return
+        self.slope = slope
+        self.intercept = max(mean_time - slope * mean_size, 0.0)
+
+    @classmethod
+    def from_history(cls, tool, db_path=None, limit=HISTORY_SAMPLES, **match):
+        """프로파일 기록으로 모델을 만듭니다. match의 항목(warm=False 등)이 같은 기록만 사용합니다."""
+        try:
+            with closing(R8_job_profiler.connect(db_path)) as conn:
+                rows = R8_job_profiler.duration_samples(conn, tool, limit)
+        except (sqlite3.Error, OSError) as e:
+            print(f"처리 시간 기록 조회 실패: {e}")
+            rows = []
+        samples = [(extra.get('input_size'), seconds) for seconds, extra in rows
+                   if all(extra.get(key) == value for key, value in match.items())]
+        return cls(samples)
+
+    def predict(self, input_size=None):
+        """예상 처리 시간(초). 기록이 없으면 None"""
+        if self.intercept is None:
+            return None
+        return self.intercept + self.slope * (input_size or 0)
+
+    def cost(self, input_size=None):
+        """정렬 / 배정용 비용. 기록이 없으면 입력 크기를 그대로 사용합니다."""
+        predicted = self.predict(input_size)
+        return float(input_size or 0) if predicted is None else predicted
+
+
+def timeout_for(predicted, default=DEFAULT_TIMEOUT):
+    """예상 처리 시간으로 작업 제한 시간(초)을 정합니다. 예측이 없으면 default"""
+    if predicted is None:
+        return default
+    return min(max(predicted * TIMEOUT_FACTOR + TIMEOUT_MARGIN, MIN_TIMEOUT), MAX_TIMEOUT)
+
+
+def should_retry(reason, attempt, max_retries=MAX_RETRIES):
+    """attempt번째 재시도를 할지 정합니다. (attempt는 1부터)"""
+    return reason in TRANSIENT_FAILURES and attempt <= max_retries
+
+
+def retry_delay(attempt):
+    """attempt번째 재시도 전 대기 시간(초)"""
+    return min(RETRY_BACKOFF * (2 ** (attempt - 1)), RETRY_BACKOFF_MAX)
+
+
+def order_longest_first(items, cost):
+    """예상 비용이 큰 순서로 정렬합니다."""
+    return sorted(items, key=cost, reverse=True)
+
+
+def assign_longest_first(items, cost, worker_count):
+    """예상 비용이 큰 작업부터 누적 비용이 가장 적은 워커에 배정합니다. (LPT) 워커별 목록을 반환합니다."""
+    assignments = [[] for _ in range(max(1, worker_count))]
+    loads = [(0.0, index) for index in range(len(assignments))]
+    for item in order_longest_first(items, cost):
+        load, index = heapq.heappop(loads)
+        assignments[index].append(item)
+        heapq.heappush(loads, (load + max(cost(item), 0.0), index))
+    return assignments
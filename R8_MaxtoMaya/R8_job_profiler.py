@@ -0,0 +1,344 @@
+'''
+R8 Job Profiler
+배치 작업의 파일별 / 단계별 처리 시간을 로컬 SQLite 데이터베이스에 기록하고 분석합니다.
+
+기록 항목 (작업 하나 = 파일 하나):
+- 전체 시간(elapsed: started 이벤트부터), 프로세스 시간(wall_time: mayapy 실행부터)
+- 단계별 시간과 단계 종료 시점의 최대 메모리 (open_rig, reference_fbx, skeleton_match, bind_pose, ...)
+- standalone_init: 1회성 프로세스의 mayapy 실행 ~ 작업 시작 시간 (wall_time - elapsed)
+- 자식 프로세스 최대 메모리(peak_rss), 출력 파일 크기
+
+배치 UI는 실행마다 begin_run() / end_run()으로 실행(run)을 만들고, 종료 이벤트마다 record_job()을 호출합니다.
+record_job()은 기존 job_history.jsonl에도 함께 기록하며, 예전 jsonl 기록은 import_history()로 가져올 수 있습니다.
+
+보고서 (Maya 밖에서도 실행 가능):
+    python R8_job_profiler.py report [--tool ani_batch_process] [--runs 10]
+    python R8_job_profiler.py import [job_history.jsonl]
+
+Qt나 Maya에 의존하지 않습니다.
+'''
+import os
+import sys
+import json
+import time
+import sqlite3
+import argparse
+from contextlib import closing
+
+try:
+    from . import R8_job_runner
+except ImportError:
+    import R8_job_runner
+
+PROFILE_DB_FILE = os.path.join(R8_job_runner.JOB_HISTORY_DIR, 'job_profile.sqlite')
+
+# wall_time - elapsed로 계산하는 초기화 단계 이름
+INIT_STEP = 'standalone_init'
+
+# 실행 간 단계 평균 시간이 이 비율 이상 늘면 회귀로 표시
+REGRESSION_THRESHOLD = 0.2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    tool TEXT,
+    started REAL,
+    finished REAL,
+    settings TEXT
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT,
+    tool TEXT,
+    job_id TEXT,
+    label TEXT,
+    status TEXT,
+    finished REAL,
+    elapsed REAL,
+    wall_time REAL,
+    peak_rss INTEGER,
+    output_size INTEGER,
+    error TEXT,
+    extra TEXT,
+    UNIQUE (job_id, label, finished)
+);
+CREATE TABLE IF NOT EXISTS steps (
+    job INTEGER REFERENCES jobs(id) ON DELETE CASCADE,
+    seq INTEGER,
+    name TEXT,
+    elapsed REAL,
+    peak_rss INTEGER
+);
+CREATE INDEX IF NOT EXISTS jobs_run ON jobs(run_id);
+CREATE INDEX IF NOT EXISTS steps_name ON steps(name);
+'''
+
+# jobs 테이블 컬럼으로 저장하는 기록 항목 (나머지는 extra JSON)
+_RECORD_COLUMNS = ('job_id', 'label', 'status', 'finished', 'elapsed', 'wall_time', 'peak_rss', 'output_size', 'error')
+
+
+def connect(db_path=None):
+    """데이터베이스를 열고 스키마를 준비합니다."""
+    db_path = db_path or PROFILE_DB_FILE
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def new_run_id(tool):
+    return f"{tool}-{time.strftime('%Y%m%d-%H%M%S')}-{int(time.time() * 1000) % 1000:03d}"
+
+
+def begin_run(tool, db_path=None, **settings):
+    """배치 실행을 등록하고 run_id를 반환합니다. 기록에 실패해도 run_id는 반환합니다."""
+    run_id = new_run_id(tool)
+    try:
+        with closing(connect(db_path)) as conn, conn:
+            conn.execute('INSERT OR REPLACE INTO runs (run_id, tool, started, settings) VALUES (?, ?, ?, ?)',
+                         (run_id, tool, time.time(), json.dumps(settings, ensure_ascii=False, default=str)))
+    except sqlite3.Error as e:
+        print(f"프로파일 실행 기록 실패: {e}")
+    return run_id
+
+
+def end_run(run_id, db_path=None):
+    """배치 실행 종료 시간을 기록합니다."""
+    if not run_id:
+        return
+    try:
+        with closing(connect(db_path)) as conn, conn:
+            conn.execute('UPDATE runs SET finished = ? WHERE run_id = ?', (time.time(), run_id))
+    except sqlite3.Error as e:
+        print(f"프로파일 실행 기록 실패: {e}")
+
+
+def _insert_record(conn, record, run_id=None):
+    """build_job_record() 형식의 기록 하나를 저장합니다. 이미 있는 기록이면 False"""
+    run_id = run_id or record.get('run_id')
+    if not run_id:
+        # run_id가 없는 예전 기록은 도구 / 날짜별 실행으로 묶음
+        day = time.strftime('%Y%m%d', time.localtime(record.get('finished') or 0))
+        run_id = f"{record.get('tool', 'unknown')}-{day}-imported"
+        conn.execute('INSERT OR IGNORE INTO runs (run_id, tool, settings) VALUES (?, ?, ?)',
+                     (run_id, record.get('tool'), '{}'))
+
+    extra = {key: value for key, value in record.items()
+             if key not in _RECORD_COLUMNS and key not in ('steps', 'run_id', 'tool')}
+    values = [record.get(key) for key in _RECORD_COLUMNS]
+    cursor = conn.execute(
+        f"INSERT OR IGNORE INTO jobs (run_id, tool, {', '.join(_RECORD_COLUMNS)}, extra) "
+        f"VALUES (?, ?, {', '.join('?' * len(_RECORD_COLUMNS))}, ?)",
+        [run_id, record.get('tool')] + values + [json.dumps(extra, ensure_ascii=False, default=str)])
+    if not cursor.rowcount:
+        return False
+
+    job = cursor.lastrowid
+    steps = [(step.get('name'), step.get('elapsed'), step.get('peak_rss')) for step in record.get('steps') or []]
+    wall_time, elapsed = record.get('wall_time'), record.get('elapsed')
+    if wall_time is not None and elapsed is not None and wall_time > elapsed:
+        steps.insert(0, (INIT_STEP, wall_time - elapsed, None))
+    conn.executemany('INSERT INTO steps (job, seq, name, elapsed, peak_rss) VALUES (?, ?, ?, ?, ?)',
+                     [(job, seq,) + step for seq, step in enumerate(steps)])
+    return True
+
+
+def record_job(record, run_id=None, db_path=None):
+    """작업 기록을 job_history.jsonl과 프로파일 데이터베이스에 저장합니다.
+
+    기록 실패는 출력만 하고 배치 처리를 멈추지 않습니다.
+    """
+    if run_id:
+        record = dict(record, run_id=run_id)
+    R8_job_runner.record_job_timing(record)
+    try:
+        with closing(connect(db_path)) as conn, conn:
+            _insert_record(conn, record)
+    except sqlite3.Error as e:
+        print(f"프로파일 기록 실패: {e}")
+
+
+def import_history(history_file=None, db_path=None):
+    """job_history.jsonl 기록을 데이터베이스로 가져옵니다. 가져온 기록 수를 반환합니다. (중복은 건너뜀)"""
+    history_file = history_file or R8_job_runner.JOB_HISTORY_FILE
+    imported = 0
+    with closing(connect(db_path)) as conn, conn:
+        with open(history_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict) and _insert_record(conn, record):
+                    imported += 1
+    return imported
+
+
+# =============================================================================
+# 분석
+# =============================================================================
+
+def _tool_filter(tool, column='jobs.tool'):
+    return (f" AND {column} = ?", (tool,)) if tool else ('', ())
+
+
+def slowest_steps(conn, tool=None, limit=10):
+    """단계별 평균 / 최대 시간 (평균이 큰 순서)"""
+    where, params = _tool_filter(tool)
+    return conn.execute(
+        'SELECT steps.name AS name, COUNT(*) AS count, AVG(steps.elapsed) AS avg, MAX(steps.elapsed) AS max, '
+        'SUM(steps.elapsed) AS total, MAX(steps.peak_rss) AS peak_rss '
+        f'FROM steps JOIN jobs ON steps.job = jobs.id WHERE 1 = 1{where} '
+        'GROUP BY steps.name ORDER BY avg DESC LIMIT ?', params + (limit,)).fetchall()
+
+
+def slowest_jobs(conn, tool=None, limit=10):
+    """처리 시간이 가장 긴 파일"""
+    where, params = _tool_filter(tool)
+    return conn.execute(
+        'SELECT run_id, label, status, COALESCE(wall_time, elapsed) AS time, peak_rss, output_size '
+        f'FROM jobs WHERE 1 = 1{where} ORDER BY time DESC LIMIT ?', params + (limit,)).fetchall()
+
+
+def run_summaries(conn, tool=None, limit=10):
+    """최근 실행별 파일 수, 성공 수, 시간당 처리량 (최신 순)"""
+    where, params = _tool_filter(tool, 'runs.tool')
+    rows = conn.execute(
+        'SELECT runs.run_id AS run_id, runs.tool AS tool, runs.started AS started, runs.finished AS finished, '
+        'COUNT(jobs.id) AS files, SUM(jobs.status = \'success\') AS succeeded, '
+        'MIN(jobs.finished - COALESCE(jobs.wall_time, jobs.elapsed, 0)) AS first_start, '
+        'MAX(jobs.finished) AS last_finish, MAX(jobs.peak_rss) AS peak_rss '
+        f'FROM runs LEFT JOIN jobs ON jobs.run_id = runs.run_id WHERE 1 = 1{where} '
+        'GROUP BY runs.run_id ORDER BY COALESCE(runs.started, MIN(jobs.finished)) DESC LIMIT ?',
+        params + (limit,)).fetchall()
+
+    summaries = []
+    for row in rows:
+        summary = dict(row)
+        start = row['started'] or row['first_start']
+        end = row['finished'] or row['last_finish']
+        summary['duration'] = (end - start) if start and end and end > start else None
+        summary['files_per_hour'] = (row['files'] * 3600.0 / summary['duration']
+                                     if summary['duration'] and row['files'] else None)
+        summaries.append(summary)
+    return summaries
+
+
+def step_averages(conn, run_id):
+    """실행 하나의 단계별 평균 시간 {단계: (평균, 개수)}"""
+    rows = conn.execute(
+        'SELECT steps.name AS name, AVG(steps.elapsed) AS avg, COUNT(*) AS count '
+        'FROM steps JOIN jobs ON steps.job = jobs.id WHERE jobs.run_id = ? AND jobs.status = \'success\' '
+        'GROUP BY steps.name', (run_id,)).fetchall()
+    return {row['name']: (row['avg'], row['count']) for row in rows}
+
+
+def find_regressions(conn, base_run, run, threshold=REGRESSION_THRESHOLD):
+    """base_run 대비 run에서 평균 시간이 threshold 비율 이상 늘어난 단계 목록 (증가율 큰 순서)"""
+    base = step_averages(conn, base_run)
+    current = step_averages(conn, run)
+    regressions = []
+    for name, (avg, count) in current.items():
+        if name not in base or not base[name][0]:
+            continue
+        base_avg = base[name][0]
+        change = (avg - base_avg) / base_avg
+        if change >= threshold:
+            regressions.append({'name': name, 'base': base_avg, 'current': avg, 'change': change, 'count': count})
+    return sorted(regressions, key=lambda item: item['change'], reverse=True)
+
+
+def duration_samples(conn, tool, limit=500):
+    """성공한 작업의 처리 시간과 추가 항목 목록 [(초, extra dict)] (최신 순, R8_job_policy 예측용)"""
+    rows = conn.execute(
+        'SELECT COALESCE(wall_time, elapsed) AS time, extra FROM jobs '
+        'WHERE tool = ? AND status = \'success\' AND COALESCE(wall_time, elapsed) IS NOT NULL '
+        'ORDER BY finished DESC LIMIT ?', (tool, limit)).fetchall()
+    samples = []
+    for row in rows:
+        try:
+            extra = json.loads(row['extra'] or '{}')
+        except ValueError:
+            extra = {}
+        samples.append((row['time'], extra))
+    return samples
+
+
+def _format_size(size):
+    if size is None:
+        return '-'
+    return f"{size / (1024 * 1024):.0f}MB"
+
+
+def format_report(conn, tool=None, runs=10, limit=10, threshold=REGRESSION_THRESHOLD):
+    """느린 단계, 느린 파일, 실행별 처리량, 최근 두 실행 간 회귀를 여러 줄 문자열로 만듭니다."""
+    lines = [f"=== 배치 프로파일 ({tool or '전체 도구'}) ==="]
+
+    lines.append("\n[느린 단계] 평균 / 최대 / 횟수 / 최대 메모리")
+    for row in slowest_steps(conn, tool, limit):
+        lines.append(f"  {row['name']:<20} {row['avg']:8.2f}초 {row['max']:8.2f}초 {row['count']:6d}회 "
+                     f"{_format_size(row['peak_rss']):>8}")
+
+    lines.append("\n[느린 파일]")
+    for row in slowest_jobs(conn, tool, limit):
+        lines.append(f"  {row['time'] or 0:8.2f}초 {row['status']:<8} {_format_size(row['peak_rss']):>8} "
+                     f"{row['label']} ({row['run_id']})")
+
+    summaries = run_summaries(conn, tool, runs)
+    lines.append("\n[실행별 처리량]")
+    for summary in summaries:
+        throughput = f"{summary['files_per_hour']:.1f}개/시간" if summary['files_per_hour'] else '-'
+        duration = f"{summary['duration']:.0f}초" if summary['duration'] else '-'
+        lines.append(f"  {summary['run_id']}: 파일 {summary['files']}개 (성공 {summary['succeeded'] or 0}), "
+                     f"{duration}, {throughput}, 최대 메모리 {_format_size(summary['peak_rss'])}")
+
+    # 같은 도구의 최근 두 실행 비교
+    runs_with_jobs = [summary for summary in summaries if summary['files']]
+    if len(runs_with_jobs) >= 2 and (tool or runs_with_jobs[0]['tool'] == runs_with_jobs[1]['tool']):
+        current, base = runs_with_jobs[0]['run_id'], runs_with_jobs[1]['run_id']
+        regressions = find_regressions(conn, base, current, threshold)
+        lines.append(f"\n[회귀] {base} -> {current} (평균 {threshold:.0%} 이상 증가)")
+        if not regressions:
+            lines.append("  없음")
+        for item in regressions:
+            lines.append(f"  {item['name']:<20} {item['base']:.2f}초 -> {item['current']:.2f}초 (+{item['change']:.0%})")
+
+    return '\n'.join(lines)
+
+
+def print_report(tool=None, runs=10, db_path=None):
+    """Maya Script Editor에서 보고서를 출력합니다."""
+    with closing(connect(db_path)) as conn:
+        print(format_report(conn, tool, runs))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="R8 배치 작업 프로파일 보고서")
+    parser.add_argument('--db', default=PROFILE_DB_FILE, help="프로파일 데이터베이스 경로")
+    subparsers = parser.add_subparsers(dest='command')
+
+    report_parser = subparsers.add_parser('report', help="느린 단계, 실행 간 회귀, 시간당 처리량 출력")
+    report_parser.add_argument('--tool', help="도구 이름 (ani_batch_process, maya_standalone_process)")
+    report_parser.add_argument('--runs', type=int, default=10, help="비교할 최근 실행 수")
+    report_parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD, help="회귀 기준 증가율")
+
+    import_parser = subparsers.add_parser('import', help="job_history.jsonl 기록 가져오기")
+    import_parser.add_argument('history_file', nargs='?', default=R8_job_runner.JOB_HISTORY_FILE)
+
+    args = parser.parse_args(argv)
+    if args.command == 'import':
+        print(f"가져온 기록: {import_history(args.history_file, args.db)}개")
+    elif args.command == 'report':
+        with closing(connect(args.db)) as conn:
+            print(format_report(conn, args.tool, args.runs, threshold=args.threshold))
+    else:
+        parser.print_help()
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,434 @@
+'''
+R8 Job Runner
+mayapy 자식 프로세스와 부모(Maya UI) 사이의 작업 이벤트 프로토콜입니다.
+
+자식 프로세스는 stdout에 'R8JOB:' 접두사가 붙은 한 줄 JSON 이벤트를 출력하고,
+부모 프로세스는 리더 스레드로 stdout을 읽어 이벤트 큐에 넣은 뒤 메인 스레드에서 소비합니다.
+상태 파일이나 출력 파일 크기를 폴링하지 않으므로 지연이 없고, 저장 도중의 파일을 성공으로 오인하지 않습니다.
+
+이벤트 종류:
+- ready:    웜 워커가 작업을 받을 준비가 됨
+- started:  작업 시작
+- step:     단계 시작(state='begin') / 종료(state='end', elapsed)
+- progress: 진행률 (percent, message)
+- warning:  경고 메시지
+- success:  작업 성공 (출력 파일 통계, 단계별 시간 포함)
+- error:    작업 실패 (오류 메시지, traceback, 단계별 시간 포함)
+
+자식 프로세스는 단계 종료 / 작업 종료 이벤트에 그때까지의 최대 메모리 사용량(peak_rss, 바이트)을 함께 보냅니다.
+부모는 종료 이벤트로 build_job_record()를 만들어 R8_job_profiler.record_job()으로 기록합니다.
+
+JobSupervisor는 여러 자식 프로세스를 동시 실행 수 제한 안에서 실행하고, 타임아웃 / 취소를 처리합니다.
+poll()은 블로킹하지 않으므로 UI에서는 타이머로 주기적으로 호출합니다.
+
+Qt나 Maya에 의존하지 않으므로 mayapy 자식 스크립트와 Maya UI 양쪽에서 임포트할 수 있습니다.
+'''
+import os
+import sys
+import json
+import time
+import queue
+import threading
+import subprocess
+import traceback
+from collections import deque
+
+# 이벤트 라인 접두사 (Maya 자체 출력과 구분)
+EVENT_PREFIX = 'R8JOB:'
+
+# 작업 종료 이벤트
+TERMINAL_EVENTS = ('success', 'error')
+
+# 단계별 처리 시간 기록 파일 (이후 분석용)
+JOB_HISTORY_DIR = os.path.join(os.path.expanduser('~'), '.r8_job_runner')
+JOB_HISTORY_FILE = os.path.join(JOB_HISTORY_DIR, 'job_history.jsonl')
+
+# =============================================================================
+# 자식 프로세스 측 (mayapy)
+# =============================================================================
+
+def peak_rss():
+    """현재 프로세스의 최대 상주 메모리(바이트)를 반환합니다. 측정할 수 없으면 None"""
+    try:
+        if os.name == 'nt':
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [('cb', wintypes.DWORD), ('PageFaultCount', wintypes.DWORD),
+                            ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                            ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            get_memory_info = ctypes.windll.psapi.GetProcessMemoryInfo
+            get_memory_info.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+            if get_memory_info(ctypes.windll.kernel32.GetCurrentProcess(), ctypes.byref(counters), counters.cb):
+                return int(counters.PeakWorkingSetSize)
+            return None
+
+        import resource
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        return int(usage) if sys.platform == 'darwin' else int(usage) * 1024
+    except (ImportError, AttributeError, OSError, ValueError):
+        return None
+
+
+def emit_event(event, job_id=None, **data):
+    """이벤트를 한 줄의 JSON으로 stdout에 출력합니다."""
+    message = {'event': event, 'job_id': job_id, 'time': time.time()}
+    message.update(data)
+    sys.stdout.write(EVENT_PREFIX + json.dumps(message, ensure_ascii=False, default=str) + '\n')
+    sys.stdout.flush()
+
+
+class JobReporter:
+    """작업 하나의 진행 이벤트를 출력하고 단계별 처리 시간을 측정합니다.
+
+    단계는 begin_step()으로 시작하며, 다음 begin_step()이나 success()/error() 호출 시 자동으로 종료됩니다.
+    """
+
+    def __init__(self, job_id=None):
+        self.job_id = job_id
+        self.start_time = time.time()
+        self.steps = []
+        self._step_name = None
+        self._step_start = None
+
+    def emit(self, event, **data):
+        emit_event(event, self.job_id, **data)
+
+    def started(self, **info):
+        """작업 시작 이벤트를 출력합니다."""
+        self.start_time = time.time()
+        self.steps = []
+        self.emit('started', pid=os.getpid(), **info)
+
+    def begin_step(self, name, message='', percent=None):
+        """새 단계를 시작합니다. 진행 중인 단계는 종료 처리합니다."""
+        self.end_step()
+        self._step_name = name
+        self._step_start = time.time()
+        self.emit('step', name=name, state='begin', message=message)
+        if percent is not None:
+            self.progress(percent, message)
+
+    def end_step(self):
+        """진행 중인 단계를 종료하고 처리 시간을 기록합니다."""
+        if self._step_name is None:
+            return
+        elapsed = time.time() - self._step_start
+        memory = peak_rss()
+        self.steps.append({'name': self._step_name, 'elapsed': elapsed, 'peak_rss': memory})
+        self.emit('step', name=self._step_name, state='end', elapsed=elapsed, peak_rss=memory)
+        self._step_name = None
+        self._step_start = None
+
+    def progress(self, percent, message=''):
+        """진행률 이벤트를 출력합니다."""
+        self.emit('progress', percent=percent, message=message)
+
+    def warning(self, message):
+        """경고 이벤트를 출력합니다."""
+        self.emit('warning', message=message)
+
+    def success(self, **stats):
+        """작업 성공 이벤트를 출력합니다. stats에는 출력 파일 경로, 크기 등을 넣습니다."""
+        self.end_step()
+        self.emit('success', elapsed=time.time() - self.start_time, steps=self.steps, peak_rss=peak_rss(), **stats)
+
+    def error(self, message, error_traceback=None):
+        """작업 실패 이벤트를 출력합니다. except 블록 안에서 호출하면 traceback을 자동으로 포함합니다."""
+        self.end_step()
+        if error_traceback is None:
+            error_traceback = traceback.format_exc() if sys.exc_info()[0] else ''
+        self.emit('error', message=str(message), traceback=error_traceback,
+                  elapsed=time.time() - self.start_time, steps=self.steps, peak_rss=peak_rss())
+
+
+# =============================================================================
+# 부모 프로세스 측 (Maya UI)
+# =============================================================================
+
+def parse_event_line(line):
+    """출력 라인이 작업 이벤트면 dict를, 아니면 None을 반환합니다."""
+    if not line.startswith(EVENT_PREFIX):
+        return None
+    try:
+        event = json.loads(line[len(EVENT_PREFIX):])
+    except ValueError:
+        return None
+    return event if isinstance(event, dict) and 'event' in event else None
+
+
+class JobProcess:
+    """작업 이벤트를 출력하는 자식 프로세스를 실행하고 이벤트를 수집합니다.
+
+    리더 스레드는 stdout 라인을 ('event', dict) / ('log', str) / ('exit', returncode) 형태로
+    큐에 넣기만 하고, Qt/Maya 호출은 poll_events() / wait_event()를 부르는 메인 스레드에서 처리합니다.
+    """
+
+    def __init__(self, command, use_stdin=False, cwd=None, env=None, startupinfo=None, creationflags=0,
+                 log_tail_size=50):
+        self.spawn_time = time.time()
+        self.events = queue.Queue()
+        self.log_tail = deque(maxlen=log_tail_size)  # 실패 진단용 최근 출력
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE if use_stdin else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            cwd=cwd,
+            env=env,
+            startupinfo=startupinfo,
+            creationflags=creationflags
+        )
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    def _read_output(self):
+        for line in self.process.stdout:
+            line = line.rstrip('\n')
+            event = parse_event_line(line)
+            if event is not None:
+                self.events.put(('event', event))
+            else:
+                self.events.put(('log', line))
+        self.events.put(('exit', self.process.wait()))
+
+    def _track(self, item):
+        if item[0] == 'log':
+            self.log_tail.append(item[1])
+        return item
+
+    def poll_events(self):
+        """지금까지 도착한 이벤트를 모두 꺼내 반환합니다. (블로킹 없음)"""
+        items = []
+        while True:
+            try:
+                items.append(self._track(self.events.get_nowait()))
+            except queue.Empty:
+                return items
+
+    def wait_event(self, timeout=None):
+        """다음 이벤트를 기다려 반환합니다. 타임아웃 시 None을 반환합니다."""
+        try:
+            return self._track(self.events.get(timeout=timeout))
+        except queue.Empty:
+            return None
+
+    def is_running(self):
+        return self.process.poll() is None
+
+    def send(self, message):
+        """stdin으로 JSON 한 줄을 보냅니다. (use_stdin=True로 실행한 경우)"""
+        self.process.stdin.write(json.dumps(message, ensure_ascii=False) + '\n')
+        self.process.stdin.flush()
+
+    def close_stdin(self):
+        try:
+            if self.process.stdin:
+                self.process.stdin.close()
+        except (OSError, ValueError):
+            pass
+
+    def kill(self):
+        """프로세스를 종료합니다. Windows에서는 프로세스 트리 전체를 종료합니다."""
+        if not self.is_running():
+            return
+        try:
+            if os.name == 'nt':
+                subprocess.run(['taskkill', '/F', '/T', '/PID', str(self.process.pid)],
+                               capture_output=True, text=True, timeout=10)
+            else:
+                self.process.kill()
+        except Exception as e:
+            print(f"프로세스 종료 중 오류: {e}")
+
+
+# 작업 종료 사유 (JobSupervisor)
+FINISH_EXITED = 'exited'
+FINISH_TIMEOUT = 'timeout'
+FINISH_CANCELLED = 'cancelled'
+FINISH_START_FAILED = 'start_failed'
+
+
+class SupervisedJob:
+    """JobSupervisor가 관리하는 작업 하나"""
+
+    def __init__(self, key, command, cleanup=None, process_kwargs=None, timeout=None, start_after=None):
+        self.key = key
+        self.command = command
+        self.cleanup = cleanup                 # 종료 후 호출 (임시 파일 정리 등)
+        self.timeout = timeout                 # 작업별 제한 시간(초), None이면 JobSupervisor.timeout
+        self.start_after = start_after         # 이 시각 전에는 시작하지 않음 (재시도 대기)
+        self.process_kwargs = process_kwargs or {}
+        self.process = None                    # JobProcess
+        self.start_time = None
+        self.result_event = None               # 마지막 종료 이벤트 (success/error)
+        self.exit_code = None
+        self.reason = None                     # FINISH_*
+
+    @property
+    def success(self):
+        return self.result_event is not None and self.result_event.get('event') == 'success'
+
+    @property
+    def elapsed(self):
+        return time.time() - self.start_time if self.start_time else 0.0
+
+
+class JobSupervisor:
+    """자식 프로세스들을 최대 max_parallel개까지 동시에 실행하고 이벤트를 콜백으로 전달합니다.
+
+    poll()은 도착한 출력만 꺼내 처리하고 바로 반환하므로 메인 스레드(UI 타이머)에서 호출합니다.
+    콜백은 모두 poll() / cancel()을 호출한 스레드에서 실행됩니다.
+    - on_start(job):          프로세스 시작
+    - on_event(job, event):   작업 이벤트 (R8JOB: 라인)
+    - on_output(job, line):   그 외 출력 한 줄
+    - on_finish(job):         종료 (job.reason, job.result_event, job.exit_code)
+    """
+
+    def __init__(self, max_parallel=1, timeout=None, on_start=None, on_event=None, on_output=None, on_finish=None):
+        self.max_parallel = max(1, int(max_parallel or 1))
+        self.timeout = timeout                 # 작업당 최대 실행 시간(초), None이면 제한 없음
+        self.on_start = on_start
+        self.on_event = on_event
+        self.on_output = on_output
+        self.on_finish = on_finish
+        self.pending = deque()
+        self.running = []
+        self.finished = []
+
+    def submit(self, key, command, cleanup=None, timeout=None, delay=0, **process_kwargs):
+        """작업을 대기열에 추가합니다. process_kwargs는 JobProcess에 그대로 전달됩니다.
+        
+        timeout을 주면 이 작업에만 기본 제한 시간 대신 사용합니다. (여러 파일을 처리하는 작업 등)
+        delay를 주면 그 시간(초)이 지난 뒤에 시작합니다. (재시도 대기)
+        """
+        start_after = time.time() + delay if delay else None
+        job = SupervisedJob(key, command, cleanup, process_kwargs, timeout, start_after)
+        self.pending.append(job)
+        return job
+
+    def is_idle(self):
+        return not self.pending and not self.running
+
+    def _start_pending(self):
+        now = time.time()
+        waiting = deque()
+        while self.pending and len(self.running) < self.max_parallel:
+            job = self.pending.popleft()
+            if job.start_after and job.start_after > now:
+                waiting.append(job)
+                continue
+            job.start_time = time.time()
+            try:
+                job.process = JobProcess(job.command, **job.process_kwargs)
+            except (OSError, ValueError) as e:
+                job.result_event = {'event': 'error', 'message': f"프로세스 시작 실패: {e}"}
+                self._finish(job, FINISH_START_FAILED)
+                continue
+            self.running.append(job)
+            if self.on_start:
+                self.on_start(job)
+        # 대기 시간이 남은 작업은 순서를 유지한 채 대기열 앞으로
+        self.pending.extendleft(reversed(waiting))
+
+    def _finish(self, job, reason):
+        job.reason = reason
+        if job in self.running:
+            self.running.remove(job)
+        if job.cleanup:
+            try:
+                job.cleanup()
+            except OSError as e:
+                print(f"작업 정리 중 오류: {job.key} ({e})")
+        self.finished.append(job)
+        if self.on_finish:
+            self.on_finish(job)
+
+    def poll(self):
+        """대기 작업을 시작하고 실행 중인 작업의 출력을 처리합니다. 남은 작업이 있으면 True"""
+        self._start_pending()
+
+        for job in list(self.running):
+            exited = False
+            for kind, payload in job.process.poll_events():
+                if kind == 'event':
+                    if payload.get('event') in TERMINAL_EVENTS:
+                        job.result_event = payload
+                    if self.on_event:
+                        self.on_event(job, payload)
+                elif kind == 'log':
+                    if self.on_output:
+                        self.on_output(job, payload)
+                elif kind == 'exit':
+                    job.exit_code = payload
+                    exited = True
+                    break
+
+            timeout = job.timeout or self.timeout
+            if exited:
+                self._finish(job, FINISH_EXITED)
+            elif timeout and job.elapsed > timeout:
+                job.process.kill()
+                self._finish(job, FINISH_TIMEOUT)
+
+        # 끝난 작업의 슬롯을 바로 채움
+        self._start_pending()
+        return not self.is_idle()
+
+    def cancel(self):
+        """대기 작업을 버리고 실행 중인 프로세스를 종료합니다."""
+        while self.pending:
+            self._finish(self.pending.popleft(), FINISH_CANCELLED)
+        for job in list(self.running):
+            job.process.kill()
+            self._finish(job, FINISH_CANCELLED)
+
+
+def build_job_record(job_id, label, event, spawn_time=None, **extra):
+    """종료 이벤트(success/error)로 처리 시간 기록을 만듭니다."""
+    record = {
+        'job_id': job_id,
+        'label': label,
+        'status': event.get('event'),
+        'finished': event.get('time', time.time()),
+        'elapsed': event.get('elapsed'),
+        'steps': event.get('steps', []),
+        'peak_rss': event.get('peak_rss'),
+        'output_size': event.get('file_size'),
+    }
+    if spawn_time is not None:
+        # 프로세스 실행부터 종료 이벤트까지의 전체 시간 (mayapy 초기화 포함)
+        record['wall_time'] = record['finished'] - spawn_time
+    if event.get('event') == 'error':
+        record['error'] = event.get('message')
+    record.update(extra)
+    return record
+
+
+def record_job_timing(record):
+    """작업 처리 시간 기록을 히스토리 파일에 한 줄 추가합니다."""
+    try:
+        os.makedirs(JOB_HISTORY_DIR, exist_ok=True)
+        with open(JOB_HISTORY_FILE, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+    except OSError as e:
+        print(f"작업 기록 저장 실패: {e}")
+
+
+def format_step_timings(steps):
+    """단계별 처리 시간을 한 줄 문자열로 만듭니다."""
+    return ', '.join(f"{step['name']} {step['elapsed']:.2f}초" for step in steps)
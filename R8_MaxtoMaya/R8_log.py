@@ -0,0 +1,274 @@
+'''
+R8 Log
+R8 도구 공용 로그 모듈입니다. 조인트, 매핑, 노드마다 출력하던 메시지를 레벨로 구분하고
+버퍼에 모아 한 번에 출력합니다. Script Editor는 print 한 줄마다 갱신되므로 수천 줄을 출력하는
+배치 작업에서는 출력 자체가 처리 시간의 상당 부분을 차지합니다.
+
+레벨:
+- DEBUG / DETAIL: 항목별 메시지 (조인트, 매핑, 노드 하나) - 버퍼에 모아 출력, 초당 출력 수 제한
+- INFO:           단계 진행 메시지
+- WARNING/ERROR:  경고, 오류
+- SUMMARY:        요약, 처리 시간 (조용한 모드에서도 출력)
+INFO 이상은 버퍼에 쌓인 항목별 메시지와 함께 바로 출력하므로 print와 섞여도 순서가 크게 어긋나지 않습니다.
+
+조용한(quiet/perf) 모드에서는 WARNING 이상과 SUMMARY만 출력합니다.
+배치 실행기는 자식 프로세스를 quiet_environment()로 실행하거나 quiet_mode() 안에서 작업합니다.
+환경 변수 R8_LOG_QUIET=1이면 임포트 시 조용한 모드로 시작합니다.
+
+    log = R8_log.get_logger(__name__)
+    for joint in joints:
+        log.detail(f"생성됨: {joint}")
+    log.timing("조인트 생성", elapsed)
+
+LogHistory는 UI 실행 로그용 모델입니다. 최근 줄만 링 버퍼에 보관하고 전체 기록은 회전 로그 파일에 저장하므로
+배치가 길어져도 메모리 사용량이 늘지 않습니다. (Qt 위젯은 R8_log_view.ExecutionLogView)
+
+Qt나 Maya에 의존하지 않으며, 패키지 __init__을 거치지 않고 mayapy 작업 모듈에서도 직접 임포트할 수 있습니다.
+'''
+import os
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+DEBUG = 10
+DETAIL = 15
+INFO = 20
+WARNING = 30
+ERROR = 40
+SUMMARY = 50
+
+QUIET_ENV = 'R8_LOG_QUIET'
+
+# 일반 모드 / 조용한 모드 출력 레벨
+NORMAL_LEVEL = DETAIL
+QUIET_LEVEL = WARNING
+
+# 버퍼 출력 조건
+FLUSH_LINES = 200
+FLUSH_INTERVAL = 0.5
+
+# 초당 출력할 수 있는 DEBUG/DETAIL 메시지 수 (초과분은 생략 개수만 출력)
+DETAIL_RATE_LIMIT = 100
+
+# LogHistory 기본값: 메모리에 보관할 줄 수, 로그 파일 크기 / 백업 파일 수
+HISTORY_LINES = 5000
+HISTORY_FILE_MAX_BYTES = 5 * 1024 * 1024
+HISTORY_FILE_BACKUPS = 3
+
+
+class BufferedSink:
+    """로그 줄을 모아 한 번의 write로 출력하고, 항목별 메시지의 초당 출력 수를 제한합니다."""
+
+    def __init__(self, stream=None, flush_lines=FLUSH_LINES, flush_interval=FLUSH_INTERVAL,
+                 rate_limit=DETAIL_RATE_LIMIT):
+        self.stream = stream
+        self.flush_lines = flush_lines
+        self.flush_interval = flush_interval
+        self.rate_limit = rate_limit
+        self._lines = []
+        self._last_flush = time.time()
+        self._window_start = time.time()
+        self._window_count = 0
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def _allow_detail(self, now):
+        if not self.rate_limit:
+            return True
+        if now - self._window_start >= 1.0:
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+        if self._window_count > self.rate_limit:
+            self._suppressed += 1
+            return False
+        return True
+
+    def write(self, level, text):
+        now = time.time()
+        with self._lock:
+            if level < INFO and not self._allow_detail(now):
+                return
+            self._append_suppressed()
+            self._lines.append(text)
+            if (level >= INFO or len(self._lines) >= self.flush_lines
+                    or now - self._last_flush >= self.flush_interval):
+                self._flush_locked(now)
+
+    def _append_suppressed(self):
+        if self._suppressed:
+            self._lines.append(f"... 항목별 메시지 {self._suppressed}개 생략 (초당 {self.rate_limit}개 제한)")
+            self._suppressed = 0
+
+    def _flush_locked(self, now=None):
+        self._append_suppressed()
+        if self._lines:
+            stream = self.stream or sys.stdout
+            try:
+                stream.write('\n'.join(self._lines) + '\n')
+                stream.flush()
+            except (OSError, ValueError):
+                pass
+            self._lines = []
+        self._last_flush = now or time.time()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+
+class LogHistory:
+    """최근 max_lines 줄을 링 버퍼에 보관하고, 전체 기록은 회전 로그 파일에 저장합니다.
+
+    append()는 메모리에만 추가하고 파일 쓰기는 flush()에서 한 번에 처리합니다.
+    파일이 max_bytes를 넘으면 log.txt -> log.txt.1 -> ... -> log.txt.N 순서로 밀어냅니다.
+    """
+
+    def __init__(self, max_lines=HISTORY_LINES, file_path=None, max_bytes=HISTORY_FILE_MAX_BYTES,
+                 backup_count=HISTORY_FILE_BACKUPS):
+        self.lines = deque(maxlen=max_lines)
+        self.file_path = file_path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.total = 0          # 지금까지 추가된 전체 줄 수 (링 버퍼에서 밀려난 줄 포함)
+        self._unsaved = []      # 파일에 아직 쓰지 않은 줄
+
+    def __len__(self):
+        return len(self.lines)
+
+    @property
+    def dropped(self):
+        """링 버퍼에서 밀려나 파일에만 남은 줄 수"""
+        return self.total - len(self.lines)
+
+    def append(self, line):
+        self.lines.append(line)
+        self.total += 1
+        if self.file_path:
+            self._unsaved.append(line)
+
+    def clear(self):
+        """메모리의 기록만 비웁니다. (파일 기록은 유지)"""
+        self.flush()
+        self.lines.clear()
+        self.total = 0
+
+    def flush(self):
+        """쌓인 줄을 로그 파일에 씁니다."""
+        if not self._unsaved:
+            return
+        text = '\n'.join(self._unsaved) + '\n'
+        self._unsaved = []
+        try:
+            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+            if os.path.exists(self.file_path) and os.path.getsize(self.file_path) >= self.max_bytes:
+                self._rotate()
+            with open(self.file_path, 'a', encoding='utf-8') as f:
+                f.write(text)
+        except OSError as e:
+            print(f"로그 파일 쓰기 실패: {self.file_path} ({e})")
+
+    def _rotate(self):
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.file_path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.file_path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.file_path, f"{self.file_path}.1")
+        else:
+            os.remove(self.file_path)
+
+
+_sink = BufferedSink()
+_level = QUIET_LEVEL if os.environ.get(QUIET_ENV) == '1' else NORMAL_LEVEL
+_loggers = {}
+
+
+class R8Logger:
+    """모듈별 로거. 출력 레벨과 싱크는 모든 로거가 공유합니다."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def log(self, level, message):
+        if level >= SUMMARY or level >= _level:
+            _sink.write(level, str(message))
+
+    def is_enabled(self, level):
+        """메시지를 만들기 전에 출력 여부를 확인할 때 사용합니다. (비싼 문자열 생성 회피)"""
+        return level >= SUMMARY or level >= _level
+
+    def debug(self, message):
+        self.log(DEBUG, message)
+
+    def detail(self, message):
+        self.log(DETAIL, message)
+
+    def info(self, message):
+        self.log(INFO, message)
+
+    def warning(self, message):
+        self.log(WARNING, message)
+
+    def error(self, message):
+        self.log(ERROR, message)
+
+    def summary(self, message):
+        self.log(SUMMARY, message)
+
+    def timing(self, label, elapsed, extra=''):
+        self.log(SUMMARY, f"{label}: {elapsed:.2f}초{(' ' + extra) if extra else ''}")
+
+
+def get_logger(name):
+    logger = _loggers.get(name)
+    if logger is None:
+        logger = _loggers[name] = R8Logger(name)
+    return logger
+
+
+def set_level(level):
+    global _level
+    _sink.flush()
+    _level = level
+
+
+def get_level():
+    return _level
+
+
+def set_quiet(quiet=True):
+    """조용한 모드를 켜거나 끕니다."""
+    set_level(QUIET_LEVEL if quiet else NORMAL_LEVEL)
+
+
+def is_quiet():
+    return _level >= QUIET_LEVEL
+
+
+@contextmanager
+def quiet_mode(quiet=True):
+    """블록 안에서만 조용한 모드로 실행합니다."""
+    previous = _level
+    set_quiet(quiet)
+    try:
+        yield
+    finally:
+        set_level(previous)
+
+
+def quiet_environment(env=None):
+    """자식 프로세스를 조용한 모드로 실행하기 위한 환경 변수 딕셔너리를 반환합니다."""
+    env = dict(os.environ if env is None else env)
+    env[QUIET_ENV] = '1'
+    return env
+
+
+def flush():
+    _sink.flush()
+
+
+atexit.register(flush)
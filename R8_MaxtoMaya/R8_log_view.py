@@ -0,0 +1,74 @@
+'''
+R8 Log View
+배치 UI용 실행 로그 창입니다.
+
+기존 실행 로그는 줄을 추가할 때마다 전체 기록을 하나의 문자열로 다시 만들어 setPlainText로 교체했기 때문에
+배치가 길어질수록 추가 한 번의 비용이 늘어났습니다. ExecutionLogView는
+- append_line()으로 들어온 줄을 대기 목록에만 쌓고, 타이머가 refresh_interval마다 appendPlainText 한 번으로 반영
+- 위젯(maximumBlockCount)과 메모리(R8_log.LogHistory 링 버퍼)에는 최근 max_lines 줄만 유지
+- 전체 기록은 회전 로그 파일에 저장
+하므로 배치 길이와 관계없이 메모리와 화면 갱신 비용이 일정합니다.
+
+    self.log_view = R8_log_view.ExecutionLogView(max_lines=5000, log_file=path)
+    self.log_view.append_line("[12:00:00] INFO: 처리 시작")
+'''
+from R8_MaxtoMaya import R8_log
+
+# Maya 버전에 따른 PySide 모듈 임포트
+try:
+    from PySide6 import QtWidgets, QtCore
+except ImportError:
+    from PySide2 import QtWidgets, QtCore
+
+# 화면 갱신 주기 (ms)
+REFRESH_INTERVAL = 100
+
+
+class ExecutionLogView(QtWidgets.QPlainTextEdit):
+    """최근 로그만 표시하고 추가된 줄을 모아서 갱신하는 읽기 전용 로그 창"""
+
+    def __init__(self, max_lines=R8_log.HISTORY_LINES, log_file=None, refresh_interval=REFRESH_INTERVAL, parent=None):
+        super(ExecutionLogView, self).__init__(parent)
+        self.max_lines = max_lines
+        self.history = R8_log.LogHistory(max_lines, log_file)
+        self._pending = []
+
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_lines)
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(refresh_interval)
+        self._refresh_timer.timeout.connect(self.flush)
+
+    @property
+    def log_file(self):
+        return self.history.file_path
+
+    def is_empty(self):
+        return not self.history and not self._pending
+
+    def append_line(self, line):
+        """줄을 추가합니다. 화면에는 다음 갱신 때 한 번에 반영됩니다."""
+        self.history.append(line)
+        self._pending.append(line)
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def flush(self):
+        """대기 중인 줄을 화면과 로그 파일에 반영합니다."""
+        self._refresh_timer.stop()
+        if self._pending:
+            # 한 번에 max_lines보다 많이 쌓였으면 어차피 잘릴 앞부분은 건너뜀
+            lines = self._pending[-self.max_lines:]
+            self._pending = []
+            self.appendPlainText('\n'.join(lines))
+        self.history.flush()
+
+    def clear_log(self):
+        """화면과 메모리 기록을 지웁니다. (로그 파일 기록은 유지)"""
+        self._refresh_timer.stop()
+        self._pending = []
+        self.history.clear()
+        self.clear()
@@ -1,5 +1,12 @@
 import maya.cmds as cmds
 
+try:
+    from . import R8_log
+except ImportError:
+    import R8_log
+
+log = R8_log.get_logger(__name__)
+
 advance_to_mannequin_mapping = {'Root_M': 'pelvis',
                                 'Spine1_M': 'spine_01',
                                 'Spine2_M': 'spine_02',
@@ -196,7 +203,7 @@ def create_manequin_skeleton_from_selected(selected_joints=None):
         # 생성된 조인트들을 저장할 리스트
         created_joints = []
         
-        print("\n=== 언리얼 스켈레톤 조인트 생성 시작 ===")
+        log.info("\n=== 언리얼 스켈레톤 조인트 생성 시작 ===")
         
         # 각 조인트 정보에 대해 처리
         for joint_info in selected_joints:
@@ -213,10 +220,10 @@ def create_manequin_skeleton_from_selected(selected_joints=None):
                     
                     created_joints.append(new_joint)
                     
-                    print(f"생성됨: {joint_info['original_locator']} -> {new_joint}")
+                    log.detail(f"생성됨: {joint_info['original_locator']} -> {new_joint}")
                     
                 except Exception as e:
-                    print(f"조인트 생성 실패 ({joint_name}): {e}")
+                    log.warning(f"조인트 생성 실패 ({joint_name}): {e}")
             else:
                 # 이전 버전 호환성을 위해 문자열 형태도 처리
                 joint = joint_info
@@ -229,16 +236,16 @@ def create_manequin_skeleton_from_selected(selected_joints=None):
                     cmds.xform(new_joint, worldSpace=True, rotation=world_rot)
                     
                     created_joints.append(new_joint)
-                    print(f"생성됨: {joint} -> {new_joint}")
+                    log.detail(f"생성됨: {joint} -> {new_joint}")
                     
                 except Exception as e:
-                    print(f"조인트 생성 실패 ({joint}): {e}")
+                    log.warning(f"조인트 생성 실패 ({joint}): {e}")
         
         # 생성된 조인트들 선택
         if created_joints:
             cmds.select(created_joints, replace=True)
             cmds.makeIdentity(created_joints, apply=True, t=True, r=True, s=True, n=False, pn=False)
-            print("생성된 조인트들이 선택되었습니다.")
+            log.info("생성된 조인트들이 선택되었습니다.")
         
         return created_joints
         
@@ -257,24 +264,24 @@ def recreate_hierarchy(original_joints, joint_mapping):
         original_joints (list): 원본 조인트 리스트
         joint_mapping (dict): 원본 -> 새로운 조인트 매핑
     """
-    print(f"계층 구조 재생성 시작: {len(original_joints)}개 조인트 처리")
+    log.info(f"계층 구조 재생성 시작: {len(original_joints)}개 조인트 처리")
     
     # 계층 구조 재생성을 위해 조인트들을 정렬 (루트부터 처리)
     hierarchy_success_count = 0
     
     for original_joint in original_joints:
         if not cmds.objExists(original_joint):
-            print(f"원본 조인트가 존재하지 않음: {original_joint}")
+            log.warning(f"원본 조인트가 존재하지 않음: {original_joint}")
             continue
             
         if original_joint not in joint_mapping:
-            print(f"매핑에서 조인트를 찾을 수 없음: {original_joint}")
+            log.warning(f"매핑에서 조인트를 찾을 수 없음: {original_joint}")
             continue
             
         new_joint = joint_mapping[original_joint]
         
         if not cmds.objExists(new_joint):
-            print(f"새로운 조인트가 존재하지 않음: {new_joint}")
+            log.warning(f"새로운 조인트가 존재하지 않음: {new_joint}")
             continue
         
         # 원본 조인트의 부모 찾기
@@ -289,25 +296,25 @@ def recreate_hierarchy(original_joints, joint_mapping):
                     # 이미 올바른 부모를 가지고 있는지 확인
                     current_parent = cmds.listRelatives(new_joint, parent=True)
                     if current_parent and current_parent[0] == parent_new_joint:
-                        print(f"이미 올바른 계층 구조: {new_joint} -> {parent_new_joint}")
+                        log.detail(f"이미 올바른 계층 구조: {new_joint} -> {parent_new_joint}")
                         continue
                     
                     # 새로운 조인트를 해당 부모 하위로 이동
                     cmds.parent(new_joint, parent_new_joint)
                     hierarchy_success_count += 1
-                    print(f"계층 구조 설정 성공: {new_joint} -> {parent_new_joint}")
+                    log.detail(f"계층 구조 설정 성공: {new_joint} -> {parent_new_joint}")
                     
                 except Exception as e:
-                    print(f"계층 구조 설정 실패 ({new_joint} -> {parent_new_joint}): {e}")
+                    log.warning(f"계층 구조 설정 실패 ({new_joint} -> {parent_new_joint}): {e}")
             else:
-                print(f"부모 조인트가 존재하지 않음: {parent_new_joint}")
+                log.warning(f"부모 조인트가 존재하지 않음: {parent_new_joint}")
         else:
             if parent:
-                print(f"부모 조인트가 매핑에 없음: {parent[0]} (자식: {original_joint})")
+                log.warning(f"부모 조인트가 매핑에 없음: {parent[0]} (자식: {original_joint})")
             else:
-                print(f"루트 조인트: {original_joint} -> {new_joint}")
+                log.detail(f"루트 조인트: {original_joint} -> {new_joint}")
     
-    print(f"계층 구조 재생성 완료: {hierarchy_success_count}개 성공")
+    log.summary(f"계층 구조 재생성 완료: {hierarchy_success_count}개 성공")
 
 def process_advanced_joints(bip_joints):
     """
@@ -364,10 +371,10 @@ def process_advanced_joints(bip_joints):
                             'original_joint': jnt  # 원본 바이패드 조인트 추가
                         }
                         advance_joints.append(joint_info)
-                        print(f"로케이터 발견: {locator_name} -> 조인트 이름: {joint_name} (원본: {jnt})")
+                        log.detail(f"로케이터 발견: {locator_name} -> 조인트 이름: {joint_name} (원본: {jnt})")
                     
             except Exception as e:
-                print(f"오류 발생 ({jnt}): {e}")
+                log.warning(f"오류 발생 ({jnt}): {e}")
                 
     return advance_joints
     
@@ -404,7 +411,7 @@ def process_bip001_joints(select_mesh=None):
     
     print("최종 조인트 리스트:")
     for i, joint in enumerate(advanced_joints, 1):
-        print(f"  {i}. {joint}")
+        log.detail(f"  {i}. {joint}")
     
     return advanced_joints
 
@@ -440,7 +447,7 @@ def connect_locators_to_mannequin_joints(advanced_joints):
     Args:
         advanced_joints (list): 어드밴스드 조인트 정보 리스트 (딕셔너리 형태)
     """
-    print("\n=== 로케이터-마네퀸 조인트 컨스트레인트 연결 시작 ===")
+    log.info("\n=== 로케이터-마네퀸 조인트 컨스트레인트 연결 시작 ===")
     
     parent_constraint_count = 0
     scale_constraint_count = 0
@@ -455,12 +462,12 @@ def connect_locators_to_mannequin_joints(advanced_joints):
         
         # 로케이터와 조인트가 모두 존재하는지 확인
         if not cmds.objExists(locator_name):
-            print(f"로케이터가 존재하지 않음: {locator_name}")
+            log.warning(f"로케이터가 존재하지 않음: {locator_name}")
             failed_connections.append((locator_name, joint_name, "로케이터 없음"))
             continue
             
         if not cmds.objExists(joint_name):
-            print(f"마네퀸 조인트가 존재하지 않음: {joint_name}")
+            log.warning(f"마네퀸 조인트가 존재하지 않음: {joint_name}")
             failed_connections.append((locator_name, joint_name, "조인트 없음"))
             continue
         
@@ -468,25 +475,25 @@ def connect_locators_to_mannequin_joints(advanced_joints):
             # 패런트 컨스트레인트 연결 (로케이터가 조인트를 제어)
             cmds.parentConstraint(locator_name, joint_name, maintainOffset=False)
             parent_constraint_count += 1
-            print(f"패런트 컨스트레인트 연결: {locator_name} -> {joint_name}")
+            log.detail(f"패런트 컨스트레인트 연결: {locator_name} -> {joint_name}")
             
             # 스케일 컨스트레인트 연결 (로케이터가 조인트를 제어)
             cmds.scaleConstraint(locator_name, joint_name, maintainOffset=False)
             scale_constraint_count += 1
-            print(f"스케일 컨스트레인트 연결: {locator_name} -> {joint_name}")
+            log.detail(f"스케일 컨스트레인트 연결: {locator_name} -> {joint_name}")
             
         except Exception as e:
-            print(f"컨스트레인트 연결 실패 ({locator_name} -> {joint_name}): {e}")
+            log.warning(f"컨스트레인트 연결 실패 ({locator_name} -> {joint_name}): {e}")
             failed_connections.append((locator_name, joint_name, str(e)))
     
-    print(f"\n=== 컨스트레인트 연결 완료 ===")
-    print(f"패런트 컨스트레인트 성공: {parent_constraint_count}개")
-    print(f"스케일 컨스트레인트 성공: {scale_constraint_count}개")
+    log.summary(f"\n=== 컨스트레인트 연결 완료 ===")
+    log.summary(f"패런트 컨스트레인트 성공: {parent_constraint_count}개")
+    log.summary(f"스케일 컨스트레인트 성공: {scale_constraint_count}개")
     
     if failed_connections:
-        print(f"연결 실패: {len(failed_connections)}개")
+        log.summary(f"연결 실패: {len(failed_connections)}개")
         for locator, joint, reason in failed_connections:
-            print(f"  실패: {locator} -> {joint} ({reason})")
+            log.warning(f"  실패: {locator} -> {joint} ({reason})")
     
     return parent_constraint_count, scale_constraint_count
 
@@ -525,8 +532,8 @@ def create_mannequin_skeleton(select_mesh=None):
                     original_to_mannequin_mapping[advance_joint_name] = mannequin_joint
                     advance_to_mannequin_mapping[advance_joint_name] = mannequin_joint
         
-        print(f"\n=== 계층 구조 재생성 시작 ===")
-        print(f"매핑된 조인트 수: {len(original_to_mannequin_mapping)}")
+        log.info(f"\n=== 계층 구조 재생성 시작 ===")
+        log.info(f"매핑된 조인트 수: {len(original_to_mannequin_mapping)}")
         
         # 원본 바이패드 조인트의 계층 구조를 기반으로 마네퀸 조인트 계층 구조 재생성
         recreate_hierarchy(original_to_mannequin_mapping.keys(), original_to_mannequin_mapping)
@@ -560,10 +567,10 @@ def connect_to_base_mannequin_skeleton(original_to_mannequin_mapping):
     Args:
         original_to_mannequin_mapping (dict): 원본 바이패드 조인트 -> 새로 생성된 마네퀸 조인트 매핑
     """
-    print(f"\n=== 추가 마네퀸 조인트 계층 구조 및 기본 본 연결 시작 ===")
+    log.info(f"\n=== 추가 마네퀸 조인트 계층 구조 및 기본 본 연결 시작 ===")
     
     # 1단계: 추가 마네퀸 조인트들끼리 계층 구조 형성 (이미 recreate_hierarchy에서 처리됨)
-    print("1단계: 추가 마네퀸 조인트 계층 구조는 이미 형성되었습니다.")
+    log.info("1단계: 추가 마네퀸 조인트 계층 구조는 이미 형성되었습니다.")
     
     # 2단계: 최상위 추가 마네퀸 조인트들 찾기
     root_additional_joints = []
@@ -585,9 +592,9 @@ def connect_to_base_mannequin_skeleton(original_to_mannequin_mapping):
         
         if is_root_additional:
             root_additional_joints.append((original_joint, new_mannequin_joint))
-            print(f"최상위 추가 조인트 발견: {new_mannequin_joint}")
+            log.detail(f"최상위 추가 조인트 발견: {new_mannequin_joint}")
     
-    print(f"총 {len(root_additional_joints)}개의 최상위 추가 조인트를 찾았습니다.")
+    log.summary(f"총 {len(root_additional_joints)}개의 최상위 추가 조인트를 찾았습니다.")
     
     # 3단계: 최상위 추가 조인트들만 기본 마네퀸 본에 연결
     connection_success_count = 0
@@ -603,14 +610,14 @@ def connect_to_base_mannequin_skeleton(original_to_mannequin_mapping):
                 if target_list:
                     locator_name = target_list[0]
             except Exception as e:
-                print(f"로케이터를 찾을 수 없음: {original_joint}")
+                log.warning(f"로케이터를 찾을 수 없음: {original_joint}")
                 continue
         
         if not locator_name or not cmds.objExists(locator_name):
-            print(f"로케이터를 찾을 수 없음: {original_joint}")
+            log.warning(f"로케이터를 찾을 수 없음: {original_joint}")
             continue
             
-        print(f"최상위 조인트 처리 중: {new_mannequin_joint} (로케이터: {locator_name})")
+        log.detail(f"최상위 조인트 처리 중: {new_mannequin_joint} (로케이터: {locator_name})")
         
         # 로케이터의 상위 그룹들을 탐색하여 어드밴스드 스켈레톤 조인트 찾기
         base_mannequin_parent = None
@@ -625,14 +632,14 @@ def connect_to_base_mannequin_skeleton(original_to_mannequin_mapping):
                 break
                 
             parent_obj = parents[0]
-            print(f"  상위 그룹 확인: {parent_obj}")
+            log.detail(f"  상위 그룹 확인: {parent_obj}")
             
             # 부모가 조인트인지 확인
             if cmds.objectType(parent_obj) == 'joint':
                 # 이 조인트가 advance_to_mannequin_mapping 에 있는지 확인
                 if parent_obj in advance_to_mannequin_mapping:
                     base_mannequin_parent = advance_to_mannequin_mapping[parent_obj]
-                    print(f"  어드밴스드 스켈레톤 조인트 발견: {parent_obj} -> 마네퀸 조인트: {base_mannequin_parent}")
+                    log.detail(f"  어드밴스드 스켈레톤 조인트 발견: {parent_obj} -> 마네퀸 조인트: {base_mannequin_parent}")
                     break
             
             # 다음 상위로 이동
@@ -649,16 +656,16 @@ def connect_to_base_mannequin_skeleton(original_to_mannequin_mapping):
                 if not current_parent or current_parent[0] != base_mannequin_parent:
                     cmds.parent(new_mannequin_joint, base_mannequin_parent)
                     connection_success_count += 1
-                    print(f"  기본 마네퀸 본 연결 성공: {new_mannequin_joint} -> {base_mannequin_parent}")
+                    log.detail(f"  기본 마네퀸 본 연결 성공: {new_mannequin_joint} -> {base_mannequin_parent}")
                 else:
-                    print(f"  이미 연결됨: {new_mannequin_joint} -> {base_mannequin_parent}")
+                    log.detail(f"  이미 연결됨: {new_mannequin_joint} -> {base_mannequin_parent}")
                     
             except Exception as e:
-                print(f"  기본 마네퀸 본 연결 실패 ({new_mannequin_joint} -> {base_mannequin_parent}): {e}")
+                log.warning(f"  기본 마네퀸 본 연결 실패 ({new_mannequin_joint} -> {base_mannequin_parent}): {e}")
         else:
             # 기본 마네퀸 본을 찾지 못한 경우
-            print(f"  기본 마네퀸 본을 찾을 수 없음: {original_joint} (추가 조인트: {new_mannequin_joint})")
-            print(f"  로케이터 {locator_name}의 상위 그룹에서 어드밴스드 스켈레톤 조인트를 찾지 못했습니다.")
+            log.warning(f"  기본 마네퀸 본을 찾을 수 없음: {original_joint} (추가 조인트: {new_mannequin_joint})")
+            log.warning(f"  로케이터 {locator_name}의 상위 그룹에서 어드밴스드 스켈레톤 조인트를 찾지 못했습니다.")
             
             # pelvis가 존재하면 pelvis에 연결 시도 (폴백)
             if cmds.objExists('pelvis'):
@@ -667,13 +674,13 @@ def connect_to_base_mannequin_skeleton(original_to_mannequin_mapping):
                     if not current_parent:  # 부모가 없는 경우에만
                         cmds.parent(new_mannequin_joint, 'pelvis')
                         connection_success_count += 1
-                        print(f"  폴백으로 pelvis에 연결: {new_mannequin_joint} -> pelvis")
+                        log.detail(f"  폴백으로 pelvis에 연결: {new_mannequin_joint} -> pelvis")
                 except Exception as e:
-                    print(f"  pelvis 연결 실패 ({new_mannequin_joint}): {e}")
+                    log.warning(f"  pelvis 연결 실패 ({new_mannequin_joint}): {e}")
     
-    print(f"\n기본 마네퀸 본 연결 완료:")
-    print(f"- 최상위 추가 조인트: {len(root_additional_joints)}개")
-    print(f"- 기본 본 연결 성공: {connection_success_count}개")
+    log.summary(f"\n기본 마네퀸 본 연결 완료:")
+    log.summary(f"- 최상위 추가 조인트: {len(root_additional_joints)}개")
+    log.summary(f"- 기본 본 연결 성공: {connection_success_count}개")
     print("- 추가 조인트들의 내부 계층 구조는 유지됩니다")
 
 # 실행 예시
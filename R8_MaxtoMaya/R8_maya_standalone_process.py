@@ -17,6 +17,12 @@ import time
 import tempfile
 import maya.OpenMayaUI as omui
 
+from R8_MaxtoMaya import R8_job_runner
+from R8_MaxtoMaya import R8_job_profiler
+from R8_MaxtoMaya import R8_job_policy
+from R8_MaxtoMaya import R8_log
+from R8_MaxtoMaya import R8_log_view
+
 # Maya 버전에 따른 PySide 모듈 임포트
 try:
     from PySide6 import QtWidgets, QtCore, QtGui
@@ -38,6 +44,24 @@ if not os.path.exists(CONFIG_DIR):
     os.makedirs(CONFIG_DIR, exist_ok=True)
 CONFIG_FILE_PATH = os.path.join(CONFIG_DIR, 'processor_config.json')
 
+# 동시에 실행할 mayapy 프로세스 수 (기본값: 코어 수의 절반, 최대 4)
+DEFAULT_MAX_PARALLEL_JOBS = max(1, min(4, (os.cpu_count() or 2) // 2))
+MAX_PARALLEL_JOBS_LIMIT = max(1, os.cpu_count() or 1)
+
+# 파일당 처리 시간 제한 (분)
+DEFAULT_JOB_TIMEOUT_MINUTES = 10
+
+# mayapy 프로세스 하나가 처리할 파일 수 (1이면 파일마다 프로세스 실행)
+DEFAULT_FILES_PER_PROCESS = 1
+MAX_FILES_PER_PROCESS = 200
+
+# 작업 출력 확인 주기 (ms)
+JOB_POLL_INTERVAL = 100
+
+# 실행 로그: 화면/메모리에 유지할 줄 수, 전체 기록 파일 (회전)
+EXECUTION_LOG_MAX_LINES = 5000
+EXECUTION_LOG_FILE = os.path.join(CONFIG_DIR, 'execution_log.txt')
+
 # =============================================================================
 # 유틸리티 함수
 # =============================================================================
@@ -70,7 +94,17 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         self.selected_python_file = None
         self.selected_function = None
         self.available_functions = []
-        self.execution_logs = []  # 실행 로그 저장
+        self.job_supervisor = None  # 실행 중인 mayapy 작업 관리 (R8_job_runner.JobSupervisor)
+        self.job_timer = None       # 작업 출력을 UI 스레드에서 처리하는 타이머
+        self._polling = False       # poll_jobs 재진입 방지 (완료 메시지 박스 표시 중)
+        self.job_files = {}         # 작업 키 -> 그 작업이 처리하는 파일 이름 목록
+        self.completed_files = set()  # 결과가 반영된 파일 이름
+        self.run_id = None          # 프로파일 데이터베이스의 실행 ID (R8_job_profiler)
+        self.maya_executable = None # 재시도 작업 등록에 사용
+        self.file_types = {}        # 파일 이름 -> 파일 타입 (재시도 작업 등록에 사용)
+        self.input_sizes = {}       # 파일 이름 -> 입력 파일 크기 (바이트)
+        self.file_timeouts = {}     # 파일 이름 -> 제한 시간(초)
+        self.retry_counts = {}      # 파일 이름 -> 재시도 횟수
         
         # UI 구성
         self.create_widgets()
@@ -172,13 +206,40 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         self.process_all_button.setFixedHeight(40)
         self.process_all_button.setEnabled(False)  # 초기에는 비활성화
         
-        # 실행 로그 텍스트 창
-        self.execution_log_text = QtWidgets.QTextEdit()
+        # 동시 실행 수 / 파일당 제한 시간
+        self.parallel_jobs_label = QtWidgets.QLabel("동시 실행:")
+        self.parallel_jobs_spin = QtWidgets.QSpinBox()
+        self.parallel_jobs_spin.setRange(1, MAX_PARALLEL_JOBS_LIMIT)
+        self.parallel_jobs_spin.setValue(DEFAULT_MAX_PARALLEL_JOBS)
+        self.parallel_jobs_spin.setToolTip("동시에 실행할 Maya Standalone 프로세스 수 (프로세스당 메모리 사용량 고려)")
+        
+        self.job_timeout_label = QtWidgets.QLabel("파일당 제한 시간(분):")
+        self.job_timeout_spin = QtWidgets.QSpinBox()
+        self.job_timeout_spin.setRange(1, 600)
+        self.job_timeout_spin.setValue(DEFAULT_JOB_TIMEOUT_MINUTES)
+        self.job_timeout_spin.setToolTip("이 시간을 넘기면 해당 파일의 프로세스를 종료하고 실패로 처리합니다.\n"
+                                         "(여러 파일을 한 프로세스에서 처리하면 파일 수만큼 늘어납니다)")
+        
+        self.files_per_process_label = QtWidgets.QLabel("프로세스당 파일 수:")
+        self.files_per_process_spin = QtWidgets.QSpinBox()
+        self.files_per_process_spin.setRange(1, MAX_FILES_PER_PROCESS)
+        self.files_per_process_spin.setValue(DEFAULT_FILES_PER_PROCESS)
+        self.files_per_process_spin.setToolTip("mayapy 하나가 Maya 초기화와 모듈 임포트를 한 번만 하고 여러 파일을 연속으로 처리합니다.\n"
+                                               "1이면 파일마다 새 프로세스를 실행합니다. (파일 간 상태가 완전히 분리됨)")
+        
+        self.adaptive_timeout_check = QtWidgets.QCheckBox("기록 기반 제한 시간")
+        self.adaptive_timeout_check.setChecked(True)
+        self.adaptive_timeout_check.setToolTip("이전 처리 기록(파일 크기 -> 처리 시간)으로 파일마다 제한 시간을 정합니다.\n"
+                                               "기록이 없는 함수는 파일당 제한 시간을 사용합니다.")
+        
+        # 실행 로그 텍스트 창 (최근 로그만 유지, 전체 기록은 EXECUTION_LOG_FILE)
+        self.execution_log_text = R8_log_view.ExecutionLogView(max_lines=EXECUTION_LOG_MAX_LINES,
+                                                               log_file=EXECUTION_LOG_FILE)
         self.execution_log_text.setMinimumHeight(150)
         self.execution_log_text.setMaximumHeight(200)
         self.execution_log_text.setReadOnly(True)
         self.execution_log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 background-color: #2b2b2b;
                 color: #ffffff;
                 border: 1px solid #555555;
@@ -291,6 +352,20 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         self.output_folder_group.setLayout(output_folder_layout)
         main_layout.addWidget(self.output_folder_group)
         
+        # 동시 실행 수 / 파일당 제한 시간
+        job_option_layout = QtWidgets.QHBoxLayout()
+        job_option_layout.addWidget(self.parallel_jobs_label)
+        job_option_layout.addWidget(self.parallel_jobs_spin)
+        job_option_layout.addSpacing(20)
+        job_option_layout.addWidget(self.job_timeout_label)
+        job_option_layout.addWidget(self.job_timeout_spin)
+        job_option_layout.addWidget(self.adaptive_timeout_check)
+        job_option_layout.addSpacing(20)
+        job_option_layout.addWidget(self.files_per_process_label)
+        job_option_layout.addWidget(self.files_per_process_spin)
+        job_option_layout.addStretch()
+        main_layout.addLayout(job_option_layout)
+        
         # 처리 버튼들
         button_layout = QtWidgets.QHBoxLayout()
         button_layout.addWidget(self.process_selected_button)
@@ -306,8 +381,12 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         self.clear_log_button = QtWidgets.QPushButton("Clear Log")
         self.clear_log_button.clicked.connect(self.clear_execution_logs)
         
+        self.open_log_file_button = QtWidgets.QPushButton("Open Log File")
+        self.open_log_file_button.setToolTip(f"전체 실행 로그 파일 열기\n{EXECUTION_LOG_FILE}")
+        self.open_log_file_button.clicked.connect(self.open_execution_log_file)
         
         log_button_layout.addWidget(self.clear_log_button)
+        log_button_layout.addWidget(self.open_log_file_button)
         log_button_layout.addStretch()
         
         execution_log_layout.addLayout(log_button_layout)
@@ -777,7 +856,7 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         self.progress_dialog.setWindowTitle(dialog_title)
         self.progress_dialog.setMinimumDuration(0)
         self.progress_dialog.setMinimumSize(400, 120)
-        self.progress_dialog.setCancelButton(None)
+        self.progress_dialog.setCancelButtonText("취소")
         
         # 취소 플래그 초기화
         self.processing_cancelled = False
@@ -788,7 +867,6 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         self.current_index = 0
         self.progress_callback = None
         self.file_result_callback = None
-        self.current_process = None
         
         # 취소 버튼 클릭 시 처리 취소
         def on_cancel_clicked():
@@ -902,9 +980,9 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
             self.progress_callback = progress_callback
             self.file_result_callback = file_result_callback
             
-            # 백그라운드 처리 시작
+            # 백그라운드 처리 시작 (UI 스레드를 막지 않고 타이머로 작업 출력을 처리)
             self.add_execution_log("INFO", f"Maya Standalone {processing_type} 처리가 시작되었습니다: {len(files_to_process)}개 파일")
-            QtCore.QTimer.singleShot(500, self.process_next_file)
+            self.start_job_supervisor(files_to_process)
             
         except Exception as e:
             self.add_execution_log("ERROR", f"처리 시작 중 오류가 발생했습니다: {str(e)}")
@@ -913,9 +991,6 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         
         # 처리 완료 후 버튼 상태 업데이트
         self.update_button_states()
-        
-        # 실행 로그 업데이트
-        self.update_execution_log_display()
     
     
     
@@ -1008,8 +1083,8 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
         os.makedirs(log_dir, exist_ok=True)
         log_file_path = os.path.join(log_dir, f"{filename}_{int(time.time())}.log").replace('\\', '/')
         
-        # 진행 상황 파일 경로
-        progress_file_path = os.path.join(log_dir, f"{filename}_progress.json").replace('\\', '/')
+        # 진행 이벤트 출력용 R8_job_runner 위치 (패키지 __init__을 거치지 않도록 폴더를 직접 추가)
+        job_runner_dir = os.path.dirname(os.path.abspath(R8_job_runner.__file__)).replace('\\', '/')
         
         # 스크립트 내용을 개별 변수로 구성하여 f-string 문제 해결
         script_parts = {
@@ -1020,7 +1095,7 @@ class MayaStandaloneProcessorUI(QtWidgets.QDialog):
             'safe_function_name': safe_function_name,
             'safe_output_folder': safe_output_folder,
             'log_file_path': log_file_path,
-            'progress_file_path': progress_file_path
+            'job_runner_dir': job_runner_dir
         }
         
         script_content = '''#!/usr/bin/env python
@@ -1035,7 +1110,6 @@ Python 파일: ''' + script_parts['python_file_name'] + '''
 
 import sys
 import os
-import json
 import traceback
 import time
 from datetime import datetime
@@ -1048,7 +1122,17 @@ FUNCTION_NAME = "''' + script_parts['safe_function_name'] + '''"
 FILE_PATH = r"''' + script_parts['safe_file_path'] + '''"
 OUTPUT_FOLDER = r"''' + script_parts['safe_output_folder'] + '''"
 LOG_FILE = r"''' + script_parts['log_file_path'] + '''"
-PROGRESS_FILE = r"''' + script_parts['progress_file_path'] + '''"
+JOB_RUNNER_DIR = r"''' + script_parts['job_runner_dir'] + '''"
+
+# 진행 상황은 stdout 작업 이벤트로 부모 프로세스에 전달
+if JOB_RUNNER_DIR not in sys.path:
+    sys.path.insert(0, JOB_RUNNER_DIR)
+from R8_job_runner import JobReporter
+
+REPORTER = JobReporter(FILENAME)
+
+# 시간을 측정할 처리 단계 (그 외 상태는 진행률만 보고)
+STEP_STATUSES = ('starting', 'initializing', 'loading', 'importing', 'opening', 'processing', 'saving')
 
 def write_log(message, log_type="INFO"):
     """로그 파일과 콘솔에 메시지 기록"""
@@ -1066,22 +1150,14 @@ def write_log(message, log_type="INFO"):
         print(f"로그 파일 쓰기 실패: {e}")
 
 def update_progress(status, message="", progress=0, error_msg=""):
-    """진행 상황 업데이트"""
-    progress_data = {
-        'status': status,
-        'message': message,
-        'progress': progress,
-        'error_msg': error_msg,
-        'timestamp': datetime.now().isoformat(),
-        'filename': FILENAME
-    }
-    
-    try:
-        with open(PROGRESS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(progress_data, f, ensure_ascii=False, indent=2)
-        write_log(f"진행 상황 업데이트: {status} - {message} ({progress}%)")
-    except Exception as e:
-        write_log(f"진행 상황 업데이트 실패: {e}", "ERROR")
+    """진행 상황을 작업 이벤트로 출력"""
+    if status == "error":
+        REPORTER.error(error_msg or message)
+    elif status in STEP_STATUSES:
+        REPORTER.begin_step(status, message, progress)
+    else:
+        REPORTER.progress(progress, message)
+    write_log(f"진행 상황 업데이트: {status} - {message} ({progress}%)")
 
 def main():
     """메인 처리 함수"""
@@ -1091,6 +1167,7 @@ def main():
     write_log(f"실행할 함수: {FUNCTION_NAME}")
     write_log(f"출력 폴더: {OUTPUT_FOLDER}")
     
+    REPORTER.started(file_path=FILE_PATH, function=FUNCTION_NAME)
     update_progress("starting", "Maya Standalone 초기화 준비 중...", 5)
     
     try:
@@ -1267,14 +1344,18 @@ def main():
                 cmds.file(rename=output_path)
                 cmds.file(save=True, force=True)
                 write_log(f"파일 저장 완료: {output_path}")
+                saved_path = output_path
                 
             else:
                 # 원본 위치에 저장
                 write_log(f"원본 위치에 저장: {FILE_PATH}")
                 cmds.file(save=True, force=True)
                 write_log(f"파일 저장 완료: {FILENAME}")
+                saved_path = FILE_PATH
             
-            update_progress("completed", "처리 완료", 100)
+            # 저장이 끝난 뒤에만 성공 이벤트 출력
+            REPORTER.progress(100, "처리 완료")
+            REPORTER.success(output_file=saved_path, file_size=os.path.getsize(saved_path))
             
         except Exception as save_error:
             error_msg = f"파일 저장 실패: {save_error}"
@@ -1321,106 +1402,218 @@ if __name__ == "__main__":
         sys.exit(1)
 '''
         
-        return script_content, log_file_path, progress_file_path
+        return script_content, log_file_path
     
-    def generate_maya_standalone_script_for_files(self, files_to_process):
-        """여러 파일을 처리하는 Maya Standalone용 스크립트 생성"""
-        # 파일 경로들을 안전하게 처리
-        safe_file_paths = []
-        for filename, file_type in files_to_process:
-            file_path = os.path.join(self.file_folder, filename)
-            if os.path.exists(file_path):
-                safe_file_path = file_path.replace('\\', '\\\\')
-                safe_file_paths.append((safe_file_path, filename, file_type))
-        
-        if not safe_file_paths:
-            return ""
-        
-        # 선택된 Python 파일과 함수 정보 (필수)
-        python_file_dir = os.path.dirname(self.selected_python_file)
-        safe_python_file_dir = python_file_dir.replace('\\', '\\\\')
-        python_file_name = os.path.splitext(os.path.basename(self.selected_python_file))[0]
-        safe_python_file_name = python_file_name.replace('\\', '\\\\')
-        safe_function_name = self.selected_function.replace('\\', '\\\\')
-        
-        # 파일 처리 루프 생성
-        file_processing_loop = ""
-        for i, (safe_file_path, filename, file_type) in enumerate(safe_file_paths):
-            file_processing_loop += f'''
-    # 파일 {i+1}/{len(safe_file_paths)}: {filename}
-    filename = "{filename}"
-    try:
-        file_path = r"{safe_file_path}"
-        print(f"파일 열기: {{file_path}}")
-        cmds.file(file_path, open=True, force=True)
+    def generate_maya_standalone_script_for_files(self, files_to_process, chunk_label):
+        """여러 파일을 한 프로세스에서 처리하는 Maya Standalone용 스크립트 생성 (청크 모드)
         
-        # 선택된 함수 실행
-        if hasattr(custom_func, '{safe_function_name}'):
-            func = getattr(custom_func, '{safe_function_name}')
-            print(f"함수 {safe_function_name} 실행 중... ({{filename}})")
-            func()
-            print(f"함수 {safe_function_name} 실행 완료 ({{filename}})")
-        else:
-            print(f"함수 {safe_function_name}을 찾을 수 없습니다.")
+        Maya 초기화와 모듈 임포트는 한 번만 하고, 파일마다 열기 -> 함수 실행 -> 저장을 반복합니다.
+        파일마다 job_id가 파일 이름인 작업 이벤트(started/step/success/error)를 따로 출력하므로
+        부모 프로세스는 단일 파일 모드와 같은 방식으로 파일별 결과를 받습니다.
+        """
+        # 처리할 파일 목록 ([경로, 파일 이름], Unix 스타일 경로)
+        chunk_files = [[os.path.join(self.file_folder, filename).replace('\\', '/'), filename]
+                       for filename, file_type in files_to_process]
         
-        # 파일 저장
-        print(f"파일 저장: {{file_path}}")
-        cmds.file(save=True, force=True)
-        print(f"파일 저장 완료: {{filename}}")
+        # Python 파일 정보 처리
+        python_file_abs_path = os.path.abspath(self.selected_python_file)
+        python_file_dir = os.path.dirname(python_file_abs_path).replace('\\', '/')
+        python_file_name = os.path.splitext(os.path.basename(python_file_abs_path))[0]
         
-    except Exception as file_error:
-        print(f"파일 처리 중 오류: {{filename}} - {{file_error}}")
-        import traceback
-        print(traceback.format_exc())
-'''
+        # 출력 폴더 처리
+        output_folder = self.output_folder or ''
+        safe_output_folder = output_folder.replace('\\', '/') if output_folder else ''
+        
+        # 로그 파일 경로 생성 (청크당 하나)
+        log_dir = os.path.join(tempfile.gettempdir(), 'maya_standalone_logs')
+        os.makedirs(log_dir, exist_ok=True)
+        safe_label = ''.join(ch if ch.isalnum() else '_' for ch in chunk_label)
+        log_file_path = os.path.join(log_dir, f"{safe_label}_{int(time.time())}.log").replace('\\', '/')
         
-        script_content = f'''"""
-Maya Standalone 스크립트 - 여러 파일 처리
-총 {len(safe_file_paths)}개 파일 처리
-Python 파일: {safe_python_file_name}
-함수: {safe_function_name}
+        # 진행 이벤트 출력용 R8_job_runner 위치 (패키지 __init__을 거치지 않도록 폴더를 직접 추가)
+        job_runner_dir = os.path.dirname(os.path.abspath(R8_job_runner.__file__)).replace('\\', '/')
+        
+        script_parts = {
+            'chunk_label': chunk_label,
+            'chunk_files': repr(chunk_files),
+            'python_file_dir': python_file_dir,
+            'python_file_name': python_file_name,
+            'safe_function_name': self.selected_function,
+            'safe_output_folder': safe_output_folder,
+            'log_file_path': log_file_path,
+            'job_runner_dir': job_runner_dir
+        }
+        
+        script_content = '''#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Maya Standalone 백그라운드 처리 스크립트 (청크 모드)
+청크: ''' + script_parts['chunk_label'] + '''
+파일 수: ''' + str(len(chunk_files)) + '''
+Python 파일: ''' + script_parts['python_file_name'] + '''
+함수: ''' + script_parts['safe_function_name'] + '''
+로그 파일: ''' + script_parts['log_file_path'] + '''
 """
 
 import sys
 import os
+import traceback
+import time
+from datetime import datetime
+
+# 전역 변수 설정
+CHUNK_LABEL = "''' + script_parts['chunk_label'] + '''"
+CHUNK_FILES = ''' + script_parts['chunk_files'] + '''
+PYTHON_FILE_DIR = r"''' + script_parts['python_file_dir'] + '''"
+PYTHON_FILE_NAME = "''' + script_parts['python_file_name'] + '''"
+FUNCTION_NAME = "''' + script_parts['safe_function_name'] + '''"
+OUTPUT_FOLDER = r"''' + script_parts['safe_output_folder'] + '''"
+LOG_FILE = r"''' + script_parts['log_file_path'] + '''"
+JOB_RUNNER_DIR = r"''' + script_parts['job_runner_dir'] + '''"
 
-# 선택된 Python 파일의 디렉토리를 Python 경로에 추가
-python_file_dir = r"{safe_python_file_dir}"
-if python_file_dir not in sys.path:
-    sys.path.insert(0, python_file_dir)
+# 진행 상황은 stdout 작업 이벤트로 부모 프로세스에 전달 (job_id = 파일 이름)
+if JOB_RUNNER_DIR not in sys.path:
+    sys.path.insert(0, JOB_RUNNER_DIR)
+from R8_job_runner import JobReporter
 
-# Maya 모듈 초기화
-import maya.standalone
-maya.standalone.initialize()
+def write_log(message, log_type="INFO"):
+    """로그 파일과 콘솔에 메시지 기록"""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_message = f"[{timestamp}] {log_type}: {message}"
+    
+    # 콘솔 출력
+    print(log_message)
+    
+    # 파일 출력
+    try:
+        with open(LOG_FILE, 'a', encoding='utf-8') as f:
+            f.write(log_message + "\\n")
+    except Exception as e:
+        print(f"로그 파일 쓰기 실패: {e}")
 
-try:
-    from maya import cmds
+def fail_all(files, message):
+    """아직 처리하지 않은 파일 모두에 실패 이벤트를 출력"""
+    write_log(message, "ERROR")
+    for file_path, filename in files:
+        reporter = JobReporter(filename)
+        reporter.started(file_path=file_path, function=FUNCTION_NAME, chunk=CHUNK_LABEL)
+        reporter.error(message)
+
+def setup_chunk():
+    """Maya 초기화와 모듈 임포트를 한 번만 수행하고 실행할 함수를 반환합니다."""
+    if not os.path.exists(PYTHON_FILE_DIR):
+        raise RuntimeError(f"Python 파일 디렉토리가 존재하지 않습니다: {PYTHON_FILE_DIR}")
+    if PYTHON_FILE_DIR not in sys.path:
+        sys.path.insert(0, PYTHON_FILE_DIR)
+    
+    start_time = time.time()
+    import maya.standalone
+    maya.standalone.initialize(name='python')
+    write_log(f"Maya Standalone 초기화 완료 ({time.time() - start_time:.2f}초)")
+    
+    start_time = time.time()
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(
+        PYTHON_FILE_NAME,
+        os.path.join(PYTHON_FILE_DIR, PYTHON_FILE_NAME + '.py')
+    )
+    if spec is None:
+        raise RuntimeError(f"모듈 스펙을 찾을 수 없습니다: {PYTHON_FILE_NAME}")
+    custom_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(custom_module)
+    write_log(f"모듈 임포트 완료: {PYTHON_FILE_NAME} ({time.time() - start_time:.2f}초)")
+    
+    if not hasattr(custom_module, FUNCTION_NAME):
+        available_funcs = [attr for attr in dir(custom_module)
+                           if not attr.startswith('_') and callable(getattr(custom_module, attr))]
+        raise RuntimeError(f"함수 '{FUNCTION_NAME}'을 찾을 수 없습니다. 사용 가능한 함수: {available_funcs}")
+    return getattr(custom_module, FUNCTION_NAME)
+
+def save_scene(cmds, file_path):
+    """단일 파일 모드와 같은 규칙으로 저장하고 저장 경로를 반환합니다."""
+    if OUTPUT_FOLDER and os.path.exists(os.path.dirname(OUTPUT_FOLDER)):
+        if not os.path.exists(OUTPUT_FOLDER):
+            os.makedirs(OUTPUT_FOLDER, exist_ok=True)
+        output_path = os.path.join(OUTPUT_FOLDER, os.path.basename(file_path))
+        cmds.file(rename=output_path)
+        cmds.file(save=True, force=True)
+        return output_path
+    
+    cmds.file(save=True, force=True)
+    return file_path
+
+def process_file(cmds, target_function, file_path, filename, index):
+    """파일 하나를 열기 -> 함수 실행 -> 저장합니다. 성공하면 True"""
+    reporter = JobReporter(filename)
+    reporter.started(file_path=file_path, function=FUNCTION_NAME, chunk=CHUNK_LABEL)
+    write_log(f"[{index}/{len(CHUNK_FILES)}] 처리 시작: {file_path}")
+    
+    try:
+        if not os.path.exists(file_path):
+            raise RuntimeError(f"처리할 파일이 존재하지 않습니다: {file_path}")
+        
+        reporter.begin_step('opening', "Maya 파일 열기 중...", 20)
+        cmds.file(new=True, force=True)
+        cmds.file(file_path, open=True, force=True)
+        
+        reporter.begin_step('processing', f"함수 실행 중: {FUNCTION_NAME}", 50)
+        target_function()
+        
+        reporter.begin_step('saving', "파일 저장 중...", 90)
+        saved_path = save_scene(cmds, file_path)
+        
+        reporter.progress(100, "처리 완료")
+        reporter.success(output_file=saved_path, file_size=os.path.getsize(saved_path))
+        write_log(f"[{index}/{len(CHUNK_FILES)}] 처리 완료: {filename}")
+        return True
+        
+    except Exception as file_error:
+        write_log(f"[{index}/{len(CHUNK_FILES)}] 처리 실패: {filename} - {file_error}", "ERROR")
+        write_log(traceback.format_exc(), "ERROR")
+        reporter.error(f"파일 처리 실패: {file_error}")
+        return False
+
+def main():
+    """메인 처리 함수"""
+    write_log(f"=== Maya Standalone 청크 처리 시작: {CHUNK_LABEL} ({len(CHUNK_FILES)}개 파일) ===")
+    chunk_start_time = time.time()
     
-    # 선택된 Python 모듈에서 함수 임포트
     try:
-        import {safe_python_file_name} as custom_func
-        print(f"{safe_python_file_name} 모듈 임포트 성공")
-        
-    except ImportError as import_error:
-        print(f"모듈 임포트 실패: {{import_error}}")
-        custom_func = None
-    
-    # 각 파일 처리
-    print(f"총 {len(safe_file_paths)}개 파일 처리 시작...")
-    {file_processing_loop}
-    
-    print("모든 파일 처리 완료!")
-    
-except Exception as e:
-    print(f"스크립트 실행 중 오류: {{e}}")
-    import traceback
-    print(traceback.format_exc())
-finally:
-    # Maya 종료
-    maya.standalone.uninitialize()
+        target_function = setup_chunk()
+        from maya import cmds
+    except Exception as setup_error:
+        write_log(traceback.format_exc(), "ERROR")
+        fail_all(CHUNK_FILES, f"청크 초기화 실패: {setup_error}")
+        return False
+    
+    setup_time = time.time() - chunk_start_time
+    success_count = 0
+    try:
+        for index, (file_path, filename) in enumerate(CHUNK_FILES, 1):
+            if process_file(cmds, target_function, file_path, filename, index):
+                success_count += 1
+    finally:
+        try:
+            import maya.standalone
+            maya.standalone.uninitialize()
+        except Exception as uninit_error:
+            write_log(f"Maya 종료 중 오류: {uninit_error}", "WARNING")
+    
+    write_log(f"=== 청크 처리 완료: 성공 {success_count}/{len(CHUNK_FILES)}, "
+              f"초기화 {setup_time:.2f}초, 전체 {time.time() - chunk_start_time:.2f}초 ===")
+    return success_count == len(CHUNK_FILES)
+
+# 메인 실행
+if __name__ == "__main__":
+    try:
+        sys.exit(0 if main() else 1)
+    except Exception as script_error:
+        write_log(f"스크립트 실행 중 치명적 오류: {script_error}", "ERROR")
+        write_log(traceback.format_exc(), "ERROR")
+        sys.exit(1)
 '''
         
-        return script_content
+        return script_content, log_file_path
     
     def get_current_maya_version(self):
         """현재 실행 중인 Maya 버전을 반환"""
@@ -1493,6 +1686,10 @@ finally:
                 self.output_folder = config.get('output_folder', '')
                 self.selected_python_file = config.get('selected_python_file', '')
                 self.selected_function = config.get('selected_function', '')
+                self.parallel_jobs_spin.setValue(config.get('max_parallel_jobs', DEFAULT_MAX_PARALLEL_JOBS))
+                self.job_timeout_spin.setValue(config.get('job_timeout_minutes', DEFAULT_JOB_TIMEOUT_MINUTES))
+                self.files_per_process_spin.setValue(config.get('files_per_process', DEFAULT_FILES_PER_PROCESS))
+                self.adaptive_timeout_check.setChecked(config.get('adaptive_timeout', True))
                 
                 if self.file_folder:
                     self.file_folder_line_edit.setText(self.file_folder)
@@ -1524,7 +1721,11 @@ finally:
                 'rig_folder': self.rig_folder or '',
                 'output_folder': self.output_folder or '',
                 'selected_python_file': self.selected_python_file or '',
-                'selected_function': self.selected_function or ''
+                'selected_function': self.selected_function or '',
+                'max_parallel_jobs': self.parallel_jobs_spin.value(),
+                'job_timeout_minutes': self.job_timeout_spin.value(),
+                'files_per_process': self.files_per_process_spin.value(),
+                'adaptive_timeout': self.adaptive_timeout_check.isChecked()
             }
             
             with open(CONFIG_FILE_PATH, 'w', encoding='utf-8') as f:
@@ -1533,51 +1734,21 @@ finally:
         except Exception as e:
             print(f"설정 저장 중 오류: {e}")
     
-    def update_execution_log_display(self):
-        """실행 로그 텍스트 창 업데이트"""
-        if not self.execution_logs:
-            self.execution_log_text.clear()
-            self.execution_log_text.setPlaceholderText("실행 로그가 여기에 표시됩니다...")
-            return
-        
-        # 실행 로그를 텍스트로 변환
-        log_text = ""
-        for log in self.execution_logs:
-            timestamp = log['timestamp']
-            log_type = log['log_type']
-            message = log['message']
-            
-            # 로그 타입에 따른 색상 구분 (텍스트로)
-            if log_type == "ERROR":
-                log_text += f"[{timestamp}] ERROR: {message}\n"
-            elif log_type == "WARNING":
-                log_text += f"[{timestamp}] WARNING: {message}\n"
-            elif log_type == "SUCCESS":
-                log_text += f"[{timestamp}] SUCCESS: {message}\n"
-            else:  # INFO
-                log_text += f"[{timestamp}] INFO: {message}\n"
-        
-        self.execution_log_text.setPlainText(log_text)
-        
-        # 스크롤을 맨 아래로 이동
-        cursor = self.execution_log_text.textCursor()
-        try:
-            # PySide6
-            cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
-        except AttributeError:
-            # PySide2
-            cursor.movePosition(cursor.End)
-        self.execution_log_text.setTextCursor(cursor)
+    def format_execution_log(self, log_type, message):
+        """실행 로그 한 줄을 만듭니다."""
+        timestamp = QtCore.QDateTime.currentDateTime().toString('hh:mm:ss')
+        
+        # 로그 타입에 따른 구분 (텍스트로)
+        if log_type in ("ERROR", "WARNING", "SUCCESS"):
+            return f"[{timestamp}] {log_type}: {message}"
+        elif log_type == "OUTPUT":
+            return f"[{timestamp}]   {message}"
+        else:  # INFO
+            return f"[{timestamp}] INFO: {message}"
     
     def add_execution_log(self, log_type, message):
-        """실행 로그 추가"""
-        execution_log = {
-            'log_type': log_type,
-            'message': message,
-            'timestamp': QtCore.QDateTime.currentDateTime().toString('hh:mm:ss')
-        }
-        self.execution_logs.append(execution_log)
-        self.update_execution_log_display()
+        """실행 로그 추가 (화면에는 로그 창의 타이머가 모아서 반영)"""
+        self.execution_log_text.append_line(self.format_execution_log(log_type, message))
     
     def add_execution_log_with_duration(self, log_type, message, start_time=None):
         """실행 로그 추가 (처리 시간 포함)"""
@@ -1601,40 +1772,135 @@ finally:
             
         self.add_execution_log(log_type, message_with_duration)
     
-    def process_next_file(self):
-        """다음 파일을 처리합니다. (개선된 백그라운드 처리 방식)"""
-        # 취소 상태 확인
-        if self.is_cancelled:
-            print("Maya Standalone 처리가 취소되어 중단됩니다.")
+    def start_job_supervisor(self, files_to_process):
+        """파일별 mayapy 작업을 JobSupervisor에 등록하고 타이머로 진행합니다.
+        
+        UI 스레드는 타이머마다 도착한 출력만 처리하므로 처리 중에도 Maya가 멈추지 않습니다.
+        동시 실행 수와 파일당 제한 시간은 UI 설정을 따르고, 기록 기반 제한 시간을 켜면
+        R8_job_policy로 파일마다 제한 시간을 정합니다. 예상 시간이 긴 파일부터 등록합니다.
+        """
+        self.save_config()
+        self.job_supervisor = R8_job_runner.JobSupervisor(
+            max_parallel=self.parallel_jobs_spin.value(),
+            timeout=self.job_timeout_spin.value() * 60,
+            on_start=self._on_job_started,
+            on_event=self._on_job_event,
+            on_output=self._on_job_output,
+            on_finish=self._on_job_finished
+        )
+        self.job_files = {}
+        self.completed_files = set()
+        files_per_process = self.files_per_process_spin.value()
+        self.run_id = R8_job_profiler.begin_run('maya_standalone_process', file_count=len(files_to_process),
+                                                function=self.selected_function, max_parallel=self.job_supervisor.max_parallel,
+                                                files_per_process=files_per_process)
+        self.add_execution_log("INFO", f"동시 실행: {self.job_supervisor.max_parallel}개, "
+                                       f"파일당 제한 시간: {self.job_timeout_spin.value()}분, "
+                                       f"프로세스당 파일 수: {files_per_process}개")
+        
+        # Maya 실행 파일 확인
+        maya_executable = self.get_current_maya_standalone()
+        if not maya_executable:
+            self.add_execution_log("ERROR", "Maya Standalone 실행 파일을 찾을 수 없습니다.")
+            self.job_supervisor = None
+            for filename, file_type in files_to_process:
+                self._complete_file(filename, False)
             return
-            
-        if self.current_index >= len(self.file_queue):
-            # 모든 파일 처리 완료
-            if self.progress_callback:
-                self.progress_callback("모든 파일 처리 완료", len(self.file_queue), len(self.file_queue))
+        self.maya_executable = maya_executable
+        
+        # 기록으로 파일별 처리 시간을 예측해 제한 시간과 처리 순서를 정함
+        self.file_types = dict(files_to_process)
+        self.input_sizes = {filename: self._input_size(filename) for filename, file_type in files_to_process}
+        self.retry_counts = {}
+        duration_model = R8_job_policy.DurationModel.from_history('maya_standalone_process', function=self.selected_function)
+        default_timeout = self.job_timeout_spin.value() * 60
+        self.file_timeouts = {}
+        for filename, file_type in files_to_process:
+            predicted = duration_model.predict(self.input_sizes[filename])
+            self.file_timeouts[filename] = (R8_job_policy.timeout_for(predicted, default=default_timeout)
+                                            if self.adaptive_timeout_check.isChecked() else default_timeout)
+        files_to_process = R8_job_policy.order_longest_first(
+            files_to_process, lambda item: duration_model.cost(self.input_sizes[item[0]]))
+        if duration_model.sample_count:
+            self.add_execution_log("INFO", f"처리 시간 예측 기록: {duration_model.sample_count}개 (예상 시간이 긴 파일부터 처리)")
+        
+        submitted = 0
+        if files_per_process <= 1:
+            for filename, file_type in files_to_process:
+                if self.background_process_single_file(filename, file_type, maya_executable):
+                    submitted += 1
+                else:
+                    self._complete_file(filename, False)
+        else:
+            # 청크 모드: 파일 목록을 나눠 청크마다 mayapy 하나로 처리
+            chunks = [files_to_process[i:i + files_per_process]
+                      for i in range(0, len(files_to_process), files_per_process)]
+            for chunk_index, chunk in enumerate(chunks, 1):
+                chunk_label = f"청크 {chunk_index}/{len(chunks)}"
+                submitted_files = self.background_process_file_chunk(chunk, chunk_label, maya_executable)
+                submitted += len(submitted_files)
+                for filename, file_type in chunk:
+                    if filename not in submitted_files:
+                        self._complete_file(filename, False)
+        
+        if not submitted:
+            self.job_supervisor = None
             return
         
-        # 현재 처리할 파일
-        current_file = self.file_queue[self.current_index]
-        filename, file_type = current_file
-        
-        # 진행 상황 업데이트
-        if self.progress_callback:
-            self.progress_callback(f"처리 중: {filename}", self.current_index, len(self.file_queue))
-        
-        # 백그라운드 프로세스 시작 (동기 처리)
-        success = self.background_process_single_file(filename, file_type)
+        self.job_timer = QtCore.QTimer(self)
+        self.job_timer.timeout.connect(self.poll_jobs)
+        self.job_timer.start(JOB_POLL_INTERVAL)
+        self.poll_jobs()
+    
+    def poll_jobs(self):
+        """실행 중인 작업의 출력을 처리합니다. (타이머에서 호출, 블로킹 없음)"""
+        if self.job_supervisor is None or self.is_cancelled:
+            self._stop_job_timer()
+            return
+        if self._polling:
+            return
         
-        # 결과 처리
+        supervisor = self.job_supervisor
+        self._polling = True
+        try:
+            running = supervisor.poll()
+        finally:
+            self._polling = False
+        if not running and self.job_supervisor is supervisor:
+            self._stop_job_timer()
+            self.job_supervisor = None
+    
+    def _stop_job_timer(self):
+        """작업 확인 타이머를 멈춥니다."""
+        if self.job_timer is not None:
+            self.job_timer.stop()
+            self.job_timer.deleteLater()
+            self.job_timer = None
+    
+    def _complete_file(self, filename, success):
+        """파일 하나의 처리 결과를 반영하고 진행 상황을 갱신합니다."""
         if self.file_result_callback:
             self.file_result_callback(filename, success)
         
-        # 다음 파일 처리
         self.current_index += 1
-        QtCore.QTimer.singleShot(100, self.process_next_file)  # 짧은 지연 후 다음 파일 처리
+        total = len(self.file_queue)
+        if self.current_index >= total:
+            R8_job_profiler.end_run(self.run_id)
+            self.run_id = None
+            if self.progress_callback:
+                self.progress_callback("모든 파일 처리 완료", total, total)
+        elif self.progress_callback:
+            running = len(self.job_supervisor.running) if self.job_supervisor else 0
+            self.progress_callback(f"처리 중... (실행 중 {running}개)", self.current_index, total)
+    
+    def _input_size(self, filename):
+        try:
+            return os.path.getsize(os.path.join(self.file_folder, filename))
+        except OSError:
+            return 0
     
-    def background_process_single_file(self, filename, file_type):
-        """백그라운드에서 단일 파일 처리 (개선된 버전)"""
+    def background_process_single_file(self, filename, file_type, maya_executable, delay=0):
+        """단일 파일의 처리 스크립트를 만들고 작업 대기열에 등록합니다. 등록하지 못하면 False를 반환합니다."""
         if self.is_cancelled:
             return False
             
@@ -1646,112 +1912,189 @@ finally:
                 return False
             
             # 스크립트 생성
-            self.add_execution_log("INFO", f"백그라운드 스크립트 생성: {filename}")
-            script_content, log_file, progress_file = self.generate_maya_standalone_script_for_single_file(file_path, filename)
-            
-            # 임시 스크립트 파일 생성
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as temp_script:
-                temp_script.write(script_content)
-                temp_script_path = temp_script.name
-            
-            self.add_execution_log("INFO", f"임시 스크립트 생성: {temp_script_path}")
-            
-            # Maya 실행 파일 확인
-            maya_executable = self.get_current_maya_standalone()
-            if not maya_executable:
-                self.add_execution_log("ERROR", "Maya Standalone 실행 파일을 찾을 수 없습니다.")
-                os.unlink(temp_script_path)
-                return False
+            script_content, log_file = self.generate_maya_standalone_script_for_single_file(file_path, filename)
+            self.submit_standalone_script(filename, [filename], script_content, maya_executable, delay=delay)
+            return True
             
-            # 실행 명령어 구성
-            if maya_executable.endswith('mayapy.exe'):
-                cmd = [maya_executable, temp_script_path]
+        except Exception as e:
+            self.add_execution_log("ERROR", f"백그라운드 처리 설정 오류: {filename} - {e}")
+            return False
+    
+    def background_process_file_chunk(self, chunk, chunk_label, maya_executable):
+        """여러 파일을 한 mayapy에서 처리하는 작업을 등록합니다. 등록한 파일 이름 목록을 반환합니다."""
+        if self.is_cancelled:
+            return []
+        
+        existing_files = []
+        for filename, file_type in chunk:
+            file_path = os.path.join(self.file_folder, filename)
+            if os.path.exists(file_path):
+                existing_files.append((filename, file_type))
             else:
-                cmd = [maya_executable, '-batch', '-command', f'python("exec(open(r\\"{temp_script_path}\\").read())")']
-            
-            self.add_execution_log("INFO", f"실행 명령어: {' '.join(cmd)}")
-            
-            # 완전 백그라운드 실행 설정
-            creationflags = 0
-            if platform.system() == "Windows":
-                creationflags = (
-                    subprocess.CREATE_NO_WINDOW |
-                    subprocess.CREATE_NEW_PROCESS_GROUP |
-                    subprocess.DETACHED_PROCESS
-                )
-            
-            # 프로세스 시작
-            start_time = time.time()
-            self.add_execution_log("INFO", f"백그라운드 프로세스 시작: {filename}")
-            
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                stdin=subprocess.DEVNULL,
-                text=True,
-                creationflags=creationflags,
-                cwd=tempfile.gettempdir()
-            )
-            
-            self.add_execution_log("INFO", f"프로세스 시작됨 - PID: {process.pid}")
-            
-            # 프로세스 완료 대기 (타임아웃: 10분)
-            try:
-                stdout, stderr = process.communicate(timeout=600)
-                end_time = time.time()
-                elapsed_time = end_time - start_time
-                
-                # 결과 처리
-                if process.returncode == 0:
-                    self.add_execution_log("SUCCESS", f"백그라운드 처리 완료: {filename} ({elapsed_time:.1f}초)")
-                    
-                    # 로그 파일에서 중요 정보 추출
-                    if os.path.exists(log_file):
-                        try:
-                            with open(log_file, 'r', encoding='utf-8') as f:
-                                log_content = f.read()
-                                # 성공/에러 라인만 추출
-                                for line in log_content.split('\n'):
-                                    if any(keyword in line for keyword in ['완료', '성공', '실패', 'ERROR', 'SUCCESS']):
-                                        if line.strip():
-                                            self.add_execution_log("INFO", f"Maya Log: {line.strip()}")
-                        except Exception:
-                            pass
-                    
-                    success = True
-                else:
-                    self.add_execution_log("ERROR", f"백그라운드 처리 실패: {filename} (코드: {process.returncode}, {elapsed_time:.1f}초)")
-                    
-                    # 에러 정보 로깅
-                    if stderr:
-                        self.add_execution_log("ERROR", f"Maya 에러: {stderr.strip()}")
-                    if stdout:
-                        self.add_execution_log("INFO", f"Maya 출력: {stdout.strip()}")
-                    
-                    success = False
-                    
-            except subprocess.TimeoutExpired:
-                self.add_execution_log("ERROR", f"백그라운드 처리 타임아웃: {filename}")
-                process.kill()
-                try:
-                    process.communicate(timeout=5)
-                except subprocess.TimeoutExpired:
-                    pass
-                success = False
-            
-            # 임시 파일 정리
-            try:
-                if os.path.exists(temp_script_path):
-                    os.unlink(temp_script_path)
-            except Exception as e:
-                self.add_execution_log("WARNING", f"임시 파일 삭제 실패: {e}")
-            
-            return success
+                self.add_execution_log("ERROR", f"파일이 존재하지 않습니다: {file_path}")
+        if not existing_files:
+            return []
+        
+        try:
+            script_content, log_file = self.generate_maya_standalone_script_for_files(existing_files, chunk_label)
+            filenames = [filename for filename, file_type in existing_files]
+            self.submit_standalone_script(chunk_label, filenames, script_content, maya_executable)
+            return filenames
             
         except Exception as e:
-            self.add_execution_log("ERROR", f"백그라운드 처리 설정 오류: {filename} - {e}")
+            self.add_execution_log("ERROR", f"백그라운드 처리 설정 오류: {chunk_label} - {e}")
+            return []
+    
+    def submit_standalone_script(self, key, filenames, script_content, maya_executable, delay=0):
+        """스크립트를 임시 파일로 저장하고 mayapy 작업으로 등록합니다. delay(초)가 지난 뒤 시작합니다."""
+        # 임시 스크립트 파일 생성
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, encoding='utf-8') as temp_script:
+            temp_script.write(script_content)
+            temp_script_path = temp_script.name
+        
+        # 실행 명령어 구성 (-u: 이벤트가 버퍼링 없이 바로 전달되도록)
+        if maya_executable.endswith('mayapy.exe'):
+            cmd = [maya_executable, '-u', temp_script_path]
+        else:
+            cmd = [maya_executable, '-batch', '-command', f'python("exec(open(r\\"{temp_script_path}\\").read())")']
+        
+        # 완전 백그라운드 실행 설정
+        creationflags = 0
+        if platform.system() == "Windows":
+            creationflags = (
+                subprocess.CREATE_NO_WINDOW |
+                subprocess.CREATE_NEW_PROCESS_GROUP |
+                subprocess.DETACHED_PROCESS
+            )
+        
+        # 종료 후 임시 스크립트 정리
+        def cleanup():
+            if os.path.exists(temp_script_path):
+                os.unlink(temp_script_path)
+        
+        # 제한 시간은 작업이 처리하는 파일들의 제한 시간 합
+        default_timeout = self.job_timeout_spin.value() * 60
+        timeout = sum(self.file_timeouts.get(filename, default_timeout) for filename in filenames)
+        
+        # R8 모듈의 항목별 로그는 생략하고 요약/시간만 출력 (R8_log 조용한 모드)
+        self.job_supervisor.submit(key, cmd, cleanup=cleanup, timeout=timeout, delay=delay, creationflags=creationflags,
+                                   cwd=tempfile.gettempdir(), env=R8_log.quiet_environment())
+        self.job_files[key] = filenames
+        if len(filenames) > 1:
+            self.add_execution_log("INFO", f"작업 등록: {key} - {len(filenames)}개 파일 ({temp_script_path})")
+        else:
+            self.add_execution_log("INFO", f"작업 등록: {key} ({temp_script_path})")
+    
+    def _on_job_started(self, job):
+        self.add_execution_log("INFO", f"백그라운드 프로세스 시작: {job.key} (PID: {job.process.pid})")
+        if self.progress_callback:
+            self.progress_callback(f"처리 중: {job.key}", self.current_index, len(self.file_queue))
+    
+    def _on_job_event(self, job, event):
+        # 청크 모드에서는 이벤트의 job_id(파일 이름)로 파일을 구분
+        files = self.job_files.get(job.key, [job.key])
+        filename = event.get('job_id') or job.key
+        terminal_event = self._handle_job_event(filename, job.process, event, files_per_process=len(files))
+        
+        if terminal_event is None or filename not in files or filename in self.completed_files:
+            return
+        success = terminal_event.get('event') == 'success'
+        elapsed_time = terminal_event.get('elapsed') or 0.0
+        if success:
+            self.add_execution_log("SUCCESS", f"백그라운드 처리 완료: {filename} ({elapsed_time:.1f}초)")
+        else:
+            self.add_execution_log("ERROR", f"백그라운드 처리 실패: {filename} ({elapsed_time:.1f}초)")
+        self.completed_files.add(filename)
+        self._complete_file(filename, success)
+    
+    def _on_job_output(self, job, line):
+        # 자식 프로세스 출력을 한 줄씩 실행 로그에 추가
+        if line.strip():
+            self.add_execution_log("OUTPUT", f"[{job.key}] {line}")
+    
+    def _on_job_finished(self, job):
+        """작업(프로세스) 하나가 끝났을 때 결과를 받지 못한 파일을 처리합니다.
+        
+        타임아웃, 시작 실패, 크래시처럼 일시적인 실패는 파일마다 새 프로세스로 다시 등록하고 (R8_job_policy)
+        재시도 횟수를 넘기면 실패로 처리합니다.
+        """
+        files = self.job_files.pop(job.key, [job.key])
+        elapsed_time = job.elapsed
+        
+        if job.reason == R8_job_runner.FINISH_CANCELLED:
+            self.add_execution_log("WARNING", f"처리 취소됨: {job.key}")
+            return
+        
+        if len(files) > 1:
+            self.add_execution_log("INFO", f"{job.key} 프로세스 종료 ({len(files)}개 파일, {elapsed_time:.1f}초)")
+        
+        if job.reason == R8_job_runner.FINISH_TIMEOUT:
+            failure = R8_job_policy.FAILURE_TIMEOUT
+            reason = f"타임아웃 ({elapsed_time:.1f}초)"
+        elif job.reason == R8_job_runner.FINISH_START_FAILED:
+            failure = R8_job_policy.FAILURE_START
+            reason = job.result_event.get('message')
+        else:
+            failure = R8_job_policy.FAILURE_CRASH
+            reason = f"결과 이벤트 없이 종료, 코드: {job.exit_code}, {elapsed_time:.1f}초"
+        
+        for filename in files:
+            if filename in self.completed_files:
+                continue
+            if self._retry_file(filename, failure, reason):
+                continue
+            self.add_execution_log("ERROR", f"백그라운드 처리 실패: {filename} ({reason})")
+            self.completed_files.add(filename)
+            self._complete_file(filename, False)
+    
+    def _retry_file(self, filename, failure, reason):
+        """일시적 실패면 대기 후 새 프로세스로 다시 등록합니다. 등록했으면 True"""
+        attempt = self.retry_counts.get(filename, 0) + 1
+        if self.is_cancelled or self.job_supervisor is None or not R8_job_policy.should_retry(failure, attempt):
             return False
+        
+        self.retry_counts[filename] = attempt
+        delay = R8_job_policy.retry_delay(attempt)
+        self.add_execution_log("WARNING", f"재시도 예약: {filename} ({reason}) - {delay:.0f}초 후 "
+                                          f"({attempt}/{R8_job_policy.MAX_RETRIES})")
+        return self.background_process_single_file(filename, self.file_types.get(filename), self.maya_executable, delay=delay)
+    
+    def _handle_job_event(self, filename, job, event, files_per_process=1):
+        """자식 프로세스의 작업 이벤트 하나를 처리합니다. 종료 이벤트(success/error)면 그 이벤트를 반환합니다."""
+        event_type = event.get('event')
+        
+        if event_type == 'progress':
+            if hasattr(self, 'progress_dialog') and self.progress_dialog:
+                detailed_message = f"처리 중: {filename}\n상태: {event.get('message', '')}\n진행률: {event.get('percent', 0)}%"
+                self.progress_dialog.setLabelText(detailed_message)
+        
+        elif event_type == 'step' and event.get('state') == 'end':
+            self.add_execution_log("INFO", f"  {filename} - {event.get('name')}: {event.get('elapsed', 0):.2f}초")
+        
+        elif event_type == 'warning':
+            self.add_execution_log("WARNING", f"{filename}: {event.get('message')}")
+        
+        elif event_type in R8_job_runner.TERMINAL_EVENTS:
+            if event_type == 'success':
+                self.add_execution_log("SUCCESS", f"저장 완료: {event.get('output_file')} ({event.get('file_size', 0)} 바이트)")
+            else:
+                self.add_execution_log("ERROR", f"Maya 에러: {event.get('message')}")
+                if event.get('traceback'):
+                    self.add_execution_log("ERROR", event['traceback'].strip())
+            
+            if event.get('steps'):
+                self.add_execution_log("INFO", f"단계별 시간: {R8_job_runner.format_step_timings(event['steps'])}")
+            
+            # 청크 모드에서는 프로세스 실행 시각이 두 번째 파일부터 맞지 않으므로 파일 처리 시간만 기록
+            spawn_time = job.spawn_time if files_per_process == 1 else None
+            R8_job_profiler.record_job(R8_job_runner.build_job_record(
+                event.get('job_id'), filename, event, spawn_time,
+                tool='maya_standalone_process', function=self.selected_function,
+                files_per_process=files_per_process, input_size=self.input_sizes.get(filename),
+                retries=self.retry_counts.get(filename, 0)), run_id=self.run_id)
+            return event
+        
+        return None
     
     
     def cancel_processing(self):
@@ -1760,34 +2103,14 @@ finally:
         self.is_cancelled = True
         self.processing_cancelled = True
         
-        # 타이머 중지
-        if hasattr(self, 'check_process_timer') and self.check_process_timer:
-            self.check_process_timer.stop()
-            self.check_process_timer = None
-            print("프로세스 모니터링 타이머 중지됨")
-        
-        # 현재 실행 중인 프로세스 종료
-        if hasattr(self, 'current_process') and self.current_process:
-            try:
-                self.current_process.terminate()
-                self.current_process.wait(timeout=5)
-            except Exception:
-                try:
-                    self.current_process.kill()
-                except Exception:
-                    pass
-            self.current_process = None
-            print("현재 실행 중인 프로세스 종료됨")
-        
-        # 임시 파일 정리
-        if hasattr(self, 'current_file_info') and self.current_file_info:
-            temp_script = self.current_file_info.get('temp_script')
-            if temp_script and os.path.exists(temp_script):
-                try:
-                    os.unlink(temp_script)
-                except Exception as e:
-                    print(f"임시 파일 삭제 오류: {e}")
-            self.current_file_info = None
+        # 대기 중인 작업을 버리고 실행 중인 프로세스 종료 (임시 스크립트는 작업 정리 콜백에서 삭제)
+        self._stop_job_timer()
+        R8_job_profiler.end_run(self.run_id)
+        self.run_id = None
+        if self.job_supervisor is not None:
+            supervisor, self.job_supervisor = self.job_supervisor, None
+            supervisor.cancel()
+            print("실행 중인 프로세스 종료됨")
         
         # 취소 콜백 호출
         if hasattr(self, 'progress_callback') and self.progress_callback:
@@ -1827,59 +2150,38 @@ finally:
                 # 참조 제거
                 self.progress_dialog = None
     
-    
-    def monitor_background_progress(self):
-        """백그라운드 처리 진행 상황 실시간 모니터링"""
-        if not hasattr(self, 'active_progress_files'):
-            self.active_progress_files = {}
-        
-        # 활성 진행 파일들 확인
-        for filename, progress_file in list(self.active_progress_files.items()):
-            try:
-                if os.path.exists(progress_file):
-                    with open(progress_file, 'r', encoding='utf-8') as f:
-                        progress_data = json.load(f)
-                    
-                    status = progress_data.get('status', 'unknown')
-                    message = progress_data.get('message', '')
-                    progress_percent = progress_data.get('progress', 0)
-                    
-                    # UI 업데이트
-                    if hasattr(self, 'progress_dialog') and self.progress_dialog:
-                        detailed_message = f"처리 중: {filename}\n상태: {message}\n진행률: {progress_percent}%"
-                        self.progress_dialog.setLabelText(detailed_message)
-                    
-                    # 완료 또는 에러 시 정리
-                    if status in ['completed', 'error']:
-                        if status == 'completed':
-                            self.add_execution_log("SUCCESS", f"백그라운드 완료 확인: {filename}")
-                        else:
-                            error_msg = progress_data.get('error_msg', '알 수 없는 오류')
-                            self.add_execution_log("ERROR", f"백그라운드 에러 확인: {filename} - {error_msg}")
-                        
-                        del self.active_progress_files[filename]
-                        
-            except Exception as e:
-                self.add_execution_log("WARNING", f"진행 상황 모니터링 오류: {filename} - {e}")
+    def closeEvent(self, event):
+        """창을 닫으면 실행 중인 작업을 종료합니다."""
+        if self.job_supervisor is not None:
+            self.cancel_processing()
+        self.execution_log_text.flush()
+        super(MayaStandaloneProcessorUI, self).closeEvent(event)
     
     def clear_execution_logs(self):
         """실행 로그 지우기"""
-        if not self.execution_logs:
+        if self.execution_log_text.is_empty():
             QtWidgets.QMessageBox.information(self, "Clear Log", "지울 실행 로그가 없습니다.")
             return
         
         reply = QtWidgets.QMessageBox.question(
             self, "Clear Log", 
-            "모든 실행 로그를 지우시겠습니까?",
+            "모든 실행 로그를 지우시겠습니까?\n(로그 파일의 기록은 유지됩니다)",
             QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
             QtWidgets.QMessageBox.No
         )
         
         if reply == QtWidgets.QMessageBox.Yes:
-            self.execution_logs.clear()
-            self.update_execution_log_display()
+            self.execution_log_text.clear_log()
             QtWidgets.QMessageBox.information(self, "완료", "실행 로그가 지워졌습니다.")
     
+    def open_execution_log_file(self):
+        """전체 실행 로그 파일을 기본 프로그램으로 엽니다."""
+        self.execution_log_text.flush()
+        if not os.path.exists(EXECUTION_LOG_FILE):
+            QtWidgets.QMessageBox.information(self, "Open Log File", "아직 기록된 실행 로그 파일이 없습니다.")
+            return
+        QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(EXECUTION_LOG_FILE))
+    
 
 # =============================================================================
 # UI 생성 및 표시 함수
@@ -0,0 +1,451 @@
+'''
+R8 Weight Compressed
+양자화 + 압축 스킨 웨이트 포맷(.skwz)입니다.
+
+WeightIO 폴더는 들여쓰기된 JSON(버텍스마다 조인트 이름 반복)과 str(weight) 속성의 XML로 빠르게 커집니다.
+.skwz는 0이 아닌 웨이트만 저장하며
+- 웨이트를 16비트 정수로 양자화하고 (오차 약 0.00003 이하, 정규화된 버텍스는 양자화 후에도 합이 정확히 1)
+- 인플루언스 인덱스를 16비트로 줄이고
+- 버텍스별 개수 / 인덱스 / 웨이트 배열을 zlib(gzip과 같은 deflate) 또는 zstd로 압축합니다.
+
+델타 모드에서는 같은 메시의 이전 .skwz(전체 저장 파일)를 기준으로 바뀐 버텍스만 저장합니다.
+기준 파일은 델타 파일 폴더 기준 상대 경로와 기준 페이로드 CRC로 기록하며,
+불러올 때 기준 파일을 읽어 전체 웨이트를 복원합니다. 델타가 전체 저장보다 크면 전체 저장합니다.
+
+[헤더][이름 테이블][압축 페이로드]
+- 이름 테이블: [uint16 길이][UTF-8] 반복 (메시, 스킨 클러스터, 인플루언스..., 델타 기준 경로)
+- 전체 페이로드: 개수 uint16 x V, 인덱스 uint16(또는 uint32) x N, 웨이트 uint16 x N
+- 델타 페이로드: 변경 비트맵 ceil(V/8)바이트, 이후 바뀐 버텍스만 전체 페이로드와 같은 배열
+모든 값은 리틀 엔디언입니다.
+
+    write_compressed_weights(path, mesh, skin_cluster, influences, vertex_count, offsets, indices, values,
+                             base_path=find_delta_base(weightio_folder, mesh, vertex_count, path))
+    data = read_compressed_weights(path)   # offsets / indices / values (CSR)
+
+Qt나 Maya에 의존하지 않으며, 패키지 __init__을 거치지 않고 mayapy 작업 모듈에서도 직접 임포트할 수 있습니다.
+'''
+import os
+import sys
+import zlib
+import struct
+from array import array
+
+# zstd는 설치된 경우에만 사용 (Maya 기본 Python에는 없음)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SKWZ_EXTENSION = '.skwz'
+SKWZ_MAGIC = b'SKWZ'
+SKWZ_VERSION = 1
+# magic, version, flags, codec, quant_bits, reserved,
+# vertex_count, influence_count, nnz, name_table_size, payload_size, base_crc
+SKWZ_HEADER_FORMAT = '<4sHHBBHIIIIII'
+SKWZ_HEADER_SIZE = struct.calcsize(SKWZ_HEADER_FORMAT)
+
+FLAG_DELTA = 0x1
+FLAG_WIDE_INDICES = 0x2   # 인플루언스가 65535개를 넘으면 인덱스를 uint32로 저장
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+CODEC_NAMES = {CODEC_ZLIB: 'zlib', CODEC_ZSTD: 'zstd'}
+
+# 다른 PC(zstandard 미설치)에서도 읽을 수 있도록 기본은 zlib
+DEFAULT_CODEC = CODEC_ZLIB
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+
+QUANT_BITS = 16
+QUANT_SCALE = (1 << QUANT_BITS) - 1
+
+# 버텍스 웨이트 합이 1에서 이 값 이내면 정규화된 것으로 보고 양자화 후에도 합을 맞춤
+NORMALIZED_TOLERANCE = 0.001
+
+SKIN_WEIGHTS_SUFFIX = '_skinWeights'
+
+
+# -----------------------------------------------------------------------------
+# 압축 / 양자화
+# -----------------------------------------------------------------------------
+
+def _compress(data, codec):
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstandard 모듈이 설치되어 있지 않습니다.")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, ZLIB_LEVEL)
+
+
+def _decompress(data, codec, raw_size):
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd로 압축된 파일입니다. zstandard 모듈이 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(data, max_output_size=raw_size or 0)
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data)
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {codec}")
+
+
+def _little_endian_bytes(arr):
+    if sys.byteorder != 'little':
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _read_array(typecode, data, offset, count):
+    arr = array(typecode)
+    size = arr.itemsize * count
+    arr.frombytes(data[offset:offset + size])
+    if len(arr) != count:
+        raise ValueError("압축 웨이트 데이터가 손상되었습니다.")
+    if sys.byteorder != 'little':
+        arr.byteswap()
+    return arr, offset + size
+
+
+def quantize_rows(offsets, values):
+    """CSR 웨이트를 16비트 정수로 양자화합니다.
+
+    합이 1인(정규화된) 버텍스는 가장 큰 웨이트에서 반올림 오차를 보정해 양자화 합이 정확히 QUANT_SCALE이 되게 합니다.
+    """
+    quantized = array('H')
+    for row in range(len(offsets) - 1):
+        row_start, row_end = offsets[row], offsets[row + 1]
+        if row_start == row_end:
+            continue
+        row_values = values[row_start:row_end]
+        row_q = [min(QUANT_SCALE, max(1, int(value * QUANT_SCALE + 0.5))) for value in row_values]
+        if abs(sum(row_values) - 1.0) <= NORMALIZED_TOLERANCE:
+            largest = max(range(len(row_q)), key=row_q.__getitem__)
+            row_q[largest] = min(QUANT_SCALE, max(1, row_q[largest] + QUANT_SCALE - sum(row_q)))
+        quantized.extend(row_q)
+    return quantized
+
+
+def _row_counts(offsets):
+    counts = array('H')
+    for row in range(len(offsets) - 1):
+        count = offsets[row + 1] - offsets[row]
+        if count > 0xFFFF:
+            raise ValueError(f"버텍스 {row}의 인플루언스가 너무 많습니다: {count}")
+        counts.append(count)
+    return counts
+
+
+# -----------------------------------------------------------------------------
+# 헤더 / 이름 테이블
+# -----------------------------------------------------------------------------
+
+def _pack_names(names):
+    name_table = bytearray()
+    for name in names:
+        encoded = name.encode('utf-8')
+        name_table += struct.pack('<H', len(encoded)) + encoded
+    return bytes(name_table)
+
+
+def _unpack_names(name_table, count):
+    names = []
+    offset = 0
+    for _ in range(count):
+        (name_length,) = struct.unpack_from('<H', name_table, offset)
+        offset += 2
+        names.append(name_table[offset:offset + name_length].decode('utf-8'))
+        offset += name_length
+    return names
+
+
+def read_compressed_header(file_path):
+    """.skwz 파일의 헤더와 이름 테이블만 읽어 반환합니다."""
+    with open(file_path, 'rb') as f:
+        header = f.read(SKWZ_HEADER_SIZE)
+        if len(header) < SKWZ_HEADER_SIZE:
+            raise ValueError(f"올바른 SKWZ 파일이 아닙니다: {file_path}")
+
+        (magic, version, flags, codec, quant_bits, _reserved, vertex_count, influence_count,
+         nnz, name_table_size, payload_size, base_crc) = struct.unpack(SKWZ_HEADER_FORMAT, header)
+        if magic != SKWZ_MAGIC:
+            raise ValueError(f"올바른 SKWZ 파일이 아닙니다: {file_path}")
+        if version > SKWZ_VERSION:
+            raise ValueError(f"지원하지 않는 SKWZ 버전입니다: {version}")
+        if quant_bits != QUANT_BITS:
+            raise ValueError(f"지원하지 않는 양자화 비트 수입니다: {quant_bits}")
+
+        name_table = f.read(name_table_size)
+
+    is_delta = bool(flags & FLAG_DELTA)
+    names = _unpack_names(name_table, influence_count + 2 + (1 if is_delta else 0))
+    return {
+        'version': version,
+        'flags': flags,
+        'codec': codec,
+        'quant_bits': quant_bits,
+        'mesh_name': names[0],
+        'skin_cluster': names[1],
+        'influences': names[2:influence_count + 2],
+        'delta_base': names[-1] if is_delta else None,
+        'base_crc': base_crc,
+        'vertex_count': vertex_count,
+        'influence_count': influence_count,
+        'nnz': nnz,
+        'payload_offset': SKWZ_HEADER_SIZE + name_table_size,
+        'payload_size': payload_size
+    }
+
+
+def _read_payload(file_path, header):
+    with open(file_path, 'rb') as f:
+        f.seek(header['payload_offset'])
+        payload = f.read(header['payload_size'])
+    if len(payload) != header['payload_size']:
+        raise ValueError(f"압축 웨이트 데이터가 잘렸습니다: {file_path}")
+    return payload
+
+
+def resolve_delta_base(file_path, header):
+    """델타 파일의 기준 파일 절대 경로를 반환합니다."""
+    base_path = header['delta_base'].replace('/', os.sep)
+    if not os.path.isabs(base_path):
+        base_path = os.path.join(os.path.dirname(os.path.abspath(file_path)), base_path)
+    return os.path.normpath(base_path)
+
+
+# -----------------------------------------------------------------------------
+# 읽기
+# -----------------------------------------------------------------------------
+
+def _decode_rows(raw, offset, row_count, wide_indices):
+    counts, offset = _read_array('H', raw, offset, row_count)
+    nnz = sum(counts)
+    indices, offset = _read_array('I' if wide_indices else 'H', raw, offset, nnz)
+    quantized, offset = _read_array('H', raw, offset, nnz)
+    if not wide_indices:
+        indices = array('I', indices)
+    return counts, indices, quantized
+
+
+def _read_quantized(file_path, header=None):
+    """(header, counts, indices, quantized) - 델타 파일이면 기준 파일을 읽어 전체 버텍스로 복원합니다."""
+    header = header or read_compressed_header(file_path)
+    payload = _read_payload(file_path, header)
+    raw = _decompress(payload, header['codec'], 0)
+    wide_indices = bool(header['flags'] & FLAG_WIDE_INDICES)
+    vertex_count = header['vertex_count']
+
+    if not header['flags'] & FLAG_DELTA:
+        counts, indices, quantized = _decode_rows(raw, 0, vertex_count, wide_indices)
+        return header, counts, indices, quantized
+
+    base_path = resolve_delta_base(file_path, header)
+    if not os.path.exists(base_path):
+        raise ValueError(f"델타 기준 파일을 찾을 수 없습니다: {base_path}")
+    base_header = read_compressed_header(base_path)
+    if base_header['flags'] & FLAG_DELTA:
+        raise ValueError(f"델타 기준 파일이 전체 저장 파일이 아닙니다: {base_path}")
+    if zlib.crc32(_read_payload(base_path, base_header)) != header['base_crc']:
+        raise ValueError(f"델타 기준 파일이 내보낸 뒤 변경되었습니다: {base_path}")
+    if base_header['vertex_count'] != vertex_count:
+        raise ValueError(f"델타 기준 파일의 버텍스 수가 다릅니다: {base_path}")
+    _, base_counts, base_indices, base_quantized = _read_quantized(base_path, base_header)
+
+    bitmap_size = (vertex_count + 7) // 8
+    changed = raw[:bitmap_size]
+    changed_count = sum(bin(byte).count('1') for byte in changed)
+    delta_counts, delta_indices, delta_quantized = _decode_rows(raw, bitmap_size, changed_count, wide_indices)
+
+    # 기준 파일 인플루언스 인덱스 -> 현재 파일 인플루언스 인덱스
+    influence_lookup = {name: i for i, name in enumerate(header['influences'])}
+    base_map = [influence_lookup.get(name, -1) for name in base_header['influences']]
+
+    counts = array('H')
+    indices = array('I')
+    quantized = array('H')
+    base_pos = 0
+    delta_row = 0
+    delta_pos = 0
+    for vertex_id in range(vertex_count):
+        base_count = base_counts[vertex_id]
+        if changed[vertex_id >> 3] & (1 << (vertex_id & 7)):
+            count = delta_counts[delta_row]
+            indices.extend(delta_indices[delta_pos:delta_pos + count])
+            quantized.extend(delta_quantized[delta_pos:delta_pos + count])
+            delta_row += 1
+            delta_pos += count
+        else:
+            count = base_count
+            for k in range(base_pos, base_pos + count):
+                mapped = base_map[base_indices[k]]
+                if mapped < 0:
+                    raise ValueError(f"델타 기준 파일의 인플루언스가 현재 파일에 없습니다: {base_path}")
+                indices.append(mapped)
+            quantized.extend(base_quantized[base_pos:base_pos + count])
+        counts.append(count)
+        base_pos += base_count
+    return header, counts, indices, quantized
+
+
+def read_compressed_weights(file_path):
+    """.skwz 파일을 읽어 CSR 웨이트로 복원합니다. (델타 파일은 기준 파일을 함께 읽음)
+
+    Returns:
+        dict: read_compressed_header() 항목 + offsets(uint32 x V+1), indices(uint32), values(double)
+    """
+    header, counts, indices, quantized = _read_quantized(file_path)
+
+    offsets = array('I', [0]) * (len(counts) + 1)
+    total = 0
+    for row, count in enumerate(counts):
+        total += count
+        offsets[row + 1] = total
+
+    scale = 1.0 / QUANT_SCALE
+    data = dict(header)
+    data['offsets'] = offsets
+    data['indices'] = indices
+    data['values'] = array('d', [value * scale for value in quantized])
+    return data
+
+
+# -----------------------------------------------------------------------------
+# 쓰기
+# -----------------------------------------------------------------------------
+
+def _encode_rows(counts, indices, quantized, wide_indices):
+    index_array = array('I' if wide_indices else 'H', indices)
+    return _little_endian_bytes(counts) + _little_endian_bytes(index_array) + _little_endian_bytes(quantized)
+
+
+def _encode_delta(counts, indices, quantized, influences, base_path, wide_indices):
+    """기준 파일과 다른 버텍스만 담은 페이로드(압축 전)를 만듭니다. 기준 파일을 쓸 수 없으면 None"""
+    base_header = read_compressed_header(base_path)
+    if base_header['flags'] & FLAG_DELTA or base_header['vertex_count'] != len(counts):
+        return None, 0
+    base_crc = zlib.crc32(_read_payload(base_path, base_header))
+    _, base_counts, base_indices, base_quantized = _read_quantized(base_path, base_header)
+
+    # 인플루언스 이름 기준으로 비교 (인플루언스 순서가 바뀌어도 같은 버텍스는 그대로 재사용)
+    influence_lookup = {name: i for i, name in enumerate(influences)}
+    base_map = [influence_lookup.get(name, -1) for name in base_header['influences']]
+
+    vertex_count = len(counts)
+    changed = bytearray((vertex_count + 7) // 8)
+    delta_counts = array('H')
+    delta_indices = array('I')
+    delta_quantized = array('H')
+    pos = 0
+    base_pos = 0
+    for vertex_id in range(vertex_count):
+        count = counts[vertex_id]
+        base_count = base_counts[vertex_id]
+        same = count == base_count
+        if same and count:
+            row = sorted(zip(indices[pos:pos + count], quantized[pos:pos + count]))
+            base_row = sorted((base_map[base_indices[k]], base_quantized[k])
+                              for k in range(base_pos, base_pos + base_count))
+            same = row == base_row
+        if not same:
+            changed[vertex_id >> 3] |= 1 << (vertex_id & 7)
+            delta_counts.append(count)
+            delta_indices.extend(indices[pos:pos + count])
+            delta_quantized.extend(quantized[pos:pos + count])
+        pos += count
+        base_pos += base_count
+
+    raw = bytes(changed) + _encode_rows(delta_counts, delta_indices, delta_quantized, wide_indices)
+    return raw, base_crc
+
+
+def write_compressed_weights(file_path, mesh_name, skin_cluster, influences, vertex_count,
+                             offsets, indices, values, base_path=None, codec=DEFAULT_CODEC):
+    """CSR 웨이트를 .skwz 파일로 저장합니다.
+
+    Args:
+        offsets / indices / values: 버텍스 v의 웨이트는 indices / values[offsets[v]:offsets[v + 1]]
+        base_path (str): 델타 기준 .skwz (None이면 전체 저장, 델타가 더 크면 전체 저장)
+        codec (int): CODEC_ZLIB 또는 CODEC_ZSTD
+
+    Returns:
+        dict: path, delta, base_path, changed(델타 버텍스 수), raw_size, file_size
+    """
+    influences = list(influences)
+    wide_indices = len(influences) > 0xFFFF
+    counts = _row_counts(offsets)
+    quantized = quantize_rows(offsets, values)
+
+    raw = _encode_rows(counts, indices, quantized, wide_indices)
+    payload = _compress(raw, codec)
+    names = [mesh_name, skin_cluster] + influences
+    flags = FLAG_WIDE_INDICES if wide_indices else 0
+    base_crc = 0
+    changed = None
+
+    if base_path and os.path.normpath(os.path.abspath(base_path)) != os.path.normpath(os.path.abspath(file_path)):
+        delta_raw, delta_crc = _encode_delta(counts, indices, quantized, influences, base_path, wide_indices)
+        if delta_raw is not None:
+            delta_payload = _compress(delta_raw, codec)
+            if len(delta_payload) < len(payload):
+                payload = delta_payload
+                raw = delta_raw
+                flags |= FLAG_DELTA
+                base_crc = delta_crc
+                changed = sum(bin(byte).count('1') for byte in delta_raw[:(vertex_count + 7) // 8])
+                # 폴더째 복사해도 찾을 수 있도록 델타 파일 폴더 기준 상대 경로로 기록
+                relative = os.path.relpath(os.path.abspath(base_path), os.path.dirname(os.path.abspath(file_path)))
+                names.append(relative.replace(os.sep, '/'))
+
+    name_table = _pack_names(names)
+    header = struct.pack(SKWZ_HEADER_FORMAT, SKWZ_MAGIC, SKWZ_VERSION, flags, codec, QUANT_BITS, 0,
+                         vertex_count, len(influences), len(quantized), len(name_table), len(payload), base_crc)
+
+    # 네트워크 공유 폴더에서 쓰다 끊겨도 기존 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체
+    temp_path = file_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(header)
+        f.write(name_table)
+        f.write(payload)
+    os.replace(temp_path, file_path)
+
+    return {
+        'path': file_path,
+        'delta': bool(flags & FLAG_DELTA),
+        'base_path': base_path if flags & FLAG_DELTA else None,
+        'changed': changed,
+        'raw_size': len(raw),
+        'file_size': len(header) + len(name_table) + len(payload)
+    }
+
+
+def find_delta_base(weightio_folder, mesh_name, vertex_count, exclude_path=None):
+    """WeightIO 폴더(와 하위 폴더)에서 같은 메시의 가장 최근 전체 저장 .skwz를 찾습니다. 없으면 None
+
+    델타 파일은 기준으로 쓰지 않으므로 델타가 다른 델타를 따라 연쇄되지 않습니다.
+    """
+    filename = f"{mesh_name}{SKIN_WEIGHTS_SUFFIX}{SKWZ_EXTENSION}"
+    exclude = os.path.normcase(os.path.abspath(exclude_path)) if exclude_path else None
+
+    candidates = [os.path.join(weightio_folder, filename)]
+    try:
+        for entry in os.listdir(weightio_folder):
+            folder = os.path.join(weightio_folder, entry)
+            if os.path.isdir(folder):
+                candidates.append(os.path.join(folder, filename))
+    except OSError:
+        return None
+
+    best_path = None
+    best_mtime = None
+    for path in candidates:
+        if exclude and os.path.normcase(os.path.abspath(path)) == exclude:
+            continue
+        try:
+            mtime = os.path.getmtime(path)
+            header = read_compressed_header(path)
+        except (OSError, ValueError, struct.error):
+            continue
+        if header['flags'] & FLAG_DELTA or header['vertex_count'] != vertex_count:
+            continue
+        if best_mtime is None or mtime > best_mtime:
+            best_path, best_mtime = path, mtime
+    return best_path
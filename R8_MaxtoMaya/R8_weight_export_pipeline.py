@@ -0,0 +1,412 @@
+'''
+R8 Weight Export Pipeline
+여러 메시의 스킨 웨이트를 한 번에 내보내는 배치 엔진입니다.
+
+기존 Export 탭은 메시마다 cmds.select() 후 export_weights_to_* 를 호출해
+선택을 다시 읽고, 언도를 켜고 끄고, 가장 오래 걸리는 직렬화(XML / JSON 생성, 압축)를 메인 스레드에서 실행했습니다.
+이 엔진은
+- 선택을 바꾸지 않고 메시 이름 목록을 받아
+- 언도 / 평가 모드 / 뷰포트 갱신을 배치 전체에서 한 번만 전환하고
+- 메인 스레드에서 스킨 컨텍스트로 웨이트 버퍼만 읽은 뒤 (read)
+- 직렬화 / 압축 / 파일 쓰기는 스레드 풀에서 처리합니다. (serialize, 다음 메시 읽기와 겹쳐 실행)
+스레드가 실제로 겹쳐 실행되는 것은 파일 쓰기와 zlib 압축(.skwz)처럼 GIL을 놓는 구간뿐입니다.
+XML / JSON 생성은 순수 Python이라 GIL을 잡고 있으므로 병렬로 실행되지 않고 메인 스레드의 read와 번갈아 실행됩니다.
+(Maya 안에서는 sys.executable이 maya.exe라 ProcessPoolExecutor를 쓰지 않습니다)
+직렬화 함수는 SkinWeightIOCore.export_weights_to_* 와 공유하므로 결과 파일은 순차 내보내기와 바이트 단위로 같습니다.
+
+    report = BatchWeightExport(meshes, export_folder, '.json').run()
+    print(format_batch_export_report(report))
+'''
+import io
+import os
+import sys
+import json
+import time
+import struct
+import xml.etree.ElementTree as ET
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import maya.cmds as cmds
+
+from . import R8_log
+from . import R8_weight_skin_context
+from . import R8_weight_compressed
+from .R8_weight_file_index import SKWB_MAGIC, SKWB_VERSION, SKWB_HEADER_FORMAT
+from .R8_weight_import_pipeline import WeightImportSession
+
+log = R8_log.get_logger(__name__)
+
+# NumPy가 있으면 CSR 배열을 벡터 연산으로 생성 (없으면 Python 필터로 폴백)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# 무시하는 작은 웨이트 (모든 형식 공통)
+WEIGHT_EPSILON = 0.0001
+
+SKIN_WEIGHTS_SUFFIX = '_skinWeights'
+
+DEFAULT_EXPORT_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# 작업 스레드 한 개당 메모리에 올려 둘 수 있는 웨이트 버퍼 수 (고밀도 메시 여러 개를 한꺼번에 읽지 않도록)
+BUFFERS_PER_WORKER = 2
+
+# 단계별 시간 (serialize는 작업 스레드 시간 합계라 다른 단계와 겹침)
+STAGES = ('setup', 'read', 'serialize', 'wait', 'restore')
+
+
+class MeshWeightData:
+    """메인 스레드에서 읽은 메시 하나의 전체 웨이트 버퍼 (버텍스 x 인플루언스)
+
+    OpenMaya 객체를 갖지 않으므로 작업 스레드에서 직렬화할 수 있습니다.
+    """
+
+    def __init__(self, mesh, skin_cluster, influences, vertex_count, influence_count, weights):
+        self.mesh = mesh
+        self.skin_cluster = skin_cluster
+        self.influences = list(influences)
+        self.vertex_count = vertex_count
+        self.influence_count = influence_count
+        self.weights = weights
+        self.read_time = 0.0
+
+
+def read_mesh_weights(mesh, skin_cluster=None):
+    """선택을 바꾸지 않고 메시의 웨이트 버퍼를 읽습니다. 메인 스레드에서 호출해야 합니다."""
+    start = time.time()
+    if skin_cluster is None:
+        shapes = cmds.listRelatives(mesh, shapes=True, type="mesh")
+        if not shapes:
+            raise ValueError(f"{mesh}는 메시가 아닙니다.")
+        skin_cluster = R8_weight_skin_context.find_skin_cluster(shapes[0])
+        if not skin_cluster:
+            raise ValueError(f"{shapes[0]}에 스킨 클러스터가 없습니다.")
+
+    context = R8_weight_skin_context.get_skin_context(mesh, skin_cluster)
+    weights, influence_count = context.get_weights()
+    # MDoubleArray는 작업 스레드에서 쓰지 않도록 Python 버퍼로 복사
+    data = MeshWeightData(mesh, skin_cluster, context.influence_names, context.vertex_count,
+                          influence_count, array('d', weights))
+    data.read_time = time.time() - start
+    return data
+
+
+def build_csr_weights(weights, vertex_count, influence_count, value_type='f'):
+    """전체 웨이트 버퍼에서 0이 아닌 값만 CSR 배열(offsets, indices, values)로 압축합니다."""
+    flat_weights = weights if isinstance(weights, array) else array('d', weights)
+    offsets, indices, values = array('I'), array('I'), array(value_type)
+
+    if NUMPY_AVAILABLE:
+        # (V, I) 행렬에서 한 번에 마스크를 만들어 행 우선 순서로 추출
+        matrix = np.frombuffer(flat_weights, dtype=np.float64).reshape(vertex_count, influence_count)
+        mask = matrix > WEIGHT_EPSILON  # 매우 작은 값 무시
+        row_offsets = np.zeros(vertex_count + 1, dtype=np.uint32)
+        row_offsets[1:] = np.cumsum(np.count_nonzero(mask, axis=1))
+        offsets.frombytes(row_offsets.tobytes())
+        indices.frombytes(np.nonzero(mask)[1].astype(np.uint32).tobytes())
+        values.frombytes(matrix[mask].astype(np.dtype(value_type)).tobytes())
+        return offsets, indices, values
+
+    # 전체 버퍼를 한 번 훑어 0이 아닌 위치만 모은 뒤 인덱스 / 값 / 행 오프셋을 만듦
+    nonzero = [i for i, weight in enumerate(flat_weights) if weight > WEIGHT_EPSILON]
+    indices.extend(i % influence_count for i in nonzero)
+    values.extend(flat_weights[i] for i in nonzero)
+    offsets.extend(bisect_left(nonzero, vertex_id * influence_count) for vertex_id in range(vertex_count + 1))
+    return offsets, indices, values
+
+
+# -----------------------------------------------------------------------------
+# 직렬화 (작업 스레드에서 호출해도 안전)
+# -----------------------------------------------------------------------------
+
+def serialize_xml(data, progress_callback=None):
+    """XML 파일 내용(bytes)을 만듭니다."""
+    root = ET.Element("SkinWeights")
+    root.set("mesh", data.mesh)
+    root.set("skinCluster", data.skin_cluster)
+    root.set("vertexCount", str(data.vertex_count))
+
+    influences_elem = ET.SubElement(root, "Influences")
+    for i, influence in enumerate(data.influences):
+        inf_elem = ET.SubElement(influences_elem, "Influence")
+        inf_elem.set("index", str(i))
+        inf_elem.set("name", influence)
+
+    weights_elem = ET.SubElement(root, "Weights")
+    weights = data.weights
+    vertex_count = data.vertex_count
+    influence_per_vertex = len(data.influences)
+
+    for vertex_id in range(vertex_count):
+        if progress_callback and vertex_id % 500 == 0:
+            percent = 40 + int((vertex_id / vertex_count) * 50)
+            progress_callback(percent, f"XML 웨이트 데이터 생성 중... ({vertex_id}/{vertex_count})")
+
+        start_idx = vertex_id * influence_per_vertex
+        vertex_elem = None
+        for inf_idx, weight in enumerate(weights[start_idx:start_idx + influence_per_vertex]):
+            if weight > WEIGHT_EPSILON:  # 매우 작은 값 무시
+                # 웨이트가 없는 버텍스는 요소를 만들지 않음
+                if vertex_elem is None:
+                    vertex_elem = ET.SubElement(weights_elem, "Vertex")
+                    vertex_elem.set("id", str(vertex_id))
+                weight_elem = ET.SubElement(vertex_elem, "Weight")
+                weight_elem.set("influence", str(inf_idx))
+                weight_elem.set("value", str(weight))
+
+    buffer = io.BytesIO()
+    ET.ElementTree(root).write(buffer, encoding='utf-8', xml_declaration=True)
+    return buffer.getvalue()
+
+
+def serialize_json(data, progress_callback=None):
+    """JSON 파일 내용(str)을 만듭니다."""
+    weight_data = {
+        "mesh_name": data.mesh,
+        "skin_cluster": data.skin_cluster,
+        "influences": data.influences,
+        "weights": {}
+    }
+
+    weights = data.weights
+    vertex_count = data.vertex_count
+    influence_names = data.influences
+    influence_per_vertex = len(influence_names)
+
+    for vertex_id in range(vertex_count):
+        if progress_callback and vertex_id % 500 == 0:
+            percent = 40 + int((vertex_id / vertex_count) * 50)
+            progress_callback(percent, f"JSON 웨이트 데이터 생성 중... ({vertex_id}/{vertex_count})")
+
+        start_idx = vertex_id * influence_per_vertex
+        vertex_weight_dict = {}
+        for inf_idx, weight in enumerate(weights[start_idx:start_idx + influence_per_vertex]):
+            if weight > WEIGHT_EPSILON:  # 매우 작은 값 무시
+                vertex_weight_dict[influence_names[inf_idx]] = weight
+
+        if vertex_weight_dict:
+            weight_data["weights"][vertex_id] = vertex_weight_dict
+
+    return json.dumps(weight_data, indent=2, ensure_ascii=False)
+
+
+def serialize_binary(data):
+    """바이너리(.skwb) 파일 내용(bytes)을 만듭니다."""
+    offsets, indices, values = build_csr_weights(data.weights, data.vertex_count, data.influence_count)
+
+    # 이름 테이블 생성 (메시, 스킨 클러스터, 인플루언스 순서)
+    name_table = bytearray()
+    for name in [data.mesh, data.skin_cluster] + data.influences:
+        encoded = name.encode('utf-8')
+        name_table += struct.pack('<H', len(encoded)) + encoded
+    name_table += b'\0' * (-len(name_table) % 4)  # 배열 구간 4바이트 정렬
+
+    header = struct.pack(SKWB_HEADER_FORMAT, SKWB_MAGIC, SKWB_VERSION, 0,
+                         data.vertex_count, data.influence_count, len(indices), len(name_table))
+
+    # 파일은 항상 리틀 엔디언으로 저장
+    if sys.byteorder != 'little':
+        offsets.byteswap()
+        indices.byteswap()
+        values.byteswap()
+
+    return b''.join((header, bytes(name_table), offsets.tobytes(), indices.tobytes(), values.tobytes()))
+
+
+def write_serialized(export_path, content):
+    """직렬화 결과를 저장합니다. (str은 UTF-8 텍스트 모드, bytes는 그대로)"""
+    if isinstance(content, str):
+        with open(export_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+    else:
+        with open(export_path, 'wb') as f:
+            f.write(content)
+
+
+def write_compressed(data, export_path, delta=False, weightio_folder=None,
+                     codec=R8_weight_compressed.DEFAULT_CODEC):
+    """압축(.skwz) 파일을 저장합니다. delta가 True이면 weightio_folder에서 기준 파일을 찾습니다."""
+    offsets, indices, values = build_csr_weights(data.weights, data.vertex_count, data.influence_count, 'd')
+    base_path = None
+    if delta and weightio_folder:
+        # 기준 파일은 BatchWeightExport.export_path와 같이 짧은 메시 이름으로 찾음
+        base_path = R8_weight_compressed.find_delta_base(weightio_folder, data.mesh.split('|')[-1],
+                                                         data.vertex_count, export_path)
+    return R8_weight_compressed.write_compressed_weights(
+        export_path, data.mesh, data.skin_cluster, data.influences, data.vertex_count,
+        offsets, indices, values, base_path=base_path, codec=codec
+    )
+
+
+def export_weight_data(data, export_path, delta=False, weightio_folder=None):
+    """확장자에 맞는 형식으로 웨이트 버퍼를 저장합니다. 작업 스레드에서 호출해도 안전합니다.
+
+    Returns:
+        (dict, float): 결과 정보(path, size, delta), 처리 시간
+    """
+    start = time.time()
+    extension = os.path.splitext(export_path)[1].lower()
+    result = {'path': export_path, 'delta': False}
+
+    if extension == '.skwz':
+        compressed = write_compressed(data, export_path, delta, weightio_folder)
+        result['delta'] = compressed['delta']
+    elif extension == '.xml':
+        write_serialized(export_path, serialize_xml(data))
+    elif extension == '.json':
+        write_serialized(export_path, serialize_json(data))
+    elif extension == '.skwb':
+        write_serialized(export_path, serialize_binary(data))
+    else:
+        raise ValueError(f"지원하지 않는 웨이트 파일 형식입니다: {export_path}")
+
+    result['size'] = os.path.getsize(export_path)
+    return result, time.time() - start
+
+
+class BatchWeightExport:
+    """메시 목록의 웨이트를 메인 스레드에서 읽고 작업 스레드에서 직렬화해 저장합니다.
+
+    메시를 읽는 동안 앞 메시들의 직렬화가 계속되며, 아직 저장하지 못한 버퍼가
+    작업 스레드 수 x BUFFERS_PER_WORKER개에 이르면 하나가 끝날 때까지 다음 메시를 읽지 않습니다.
+    작업 스레드는 파일 쓰기와 압축만 다른 작업과 겹치고, XML / JSON 생성은 GIL 때문에 한 번에 하나씩 실행됩니다.
+    """
+
+    def __init__(self, meshes, export_folder, extension, delta=False, max_workers=DEFAULT_EXPORT_WORKERS,
+                 progress_callback=None, weightio_folder=None):
+        self.meshes = list(meshes)
+        self.export_folder = export_folder
+        self.extension = extension.lower()
+        self.delta = delta
+        self.max_workers = max(1, int(max_workers or 1))
+        self.progress_callback = progress_callback
+        # 델타 기준 파일을 찾을 WeightIO 폴더 (None이면 내보내기 폴더의 상위 폴더)
+        self.weightio_folder = weightio_folder or os.path.dirname(os.path.normpath(export_folder))
+
+        self.timings = {stage: 0.0 for stage in STAGES}
+        self.succeeded = []      # (메시, 파일 경로)
+        self.failed = []         # "메시 (사유)"
+        self.delta_count = 0
+        self.total_size = 0
+
+    def _progress(self, value, message):
+        if self.progress_callback:
+            self.progress_callback(int(value), message)
+
+    def export_path(self, mesh):
+        # DAG 경로(grp|mesh)는 짧은 이름으로 저장 (파일명에 | 사용 불가, 불러올 때 파일명으로 메시를 찾음)
+        short_name = mesh.split('|')[-1]
+        return os.path.join(self.export_folder, f"{short_name}{SKIN_WEIGHTS_SUFFIX}{self.extension}")
+
+    def _plan_export_paths(self):
+        """메시별 저장 경로를 정합니다.
+
+        같은 파일에 저장될 메시(다른 그룹의 같은 이름 메시 등)는 작업 스레드가 동시에 덮어쓰지 않도록
+        처음 메시만 저장하고 나머지는 실패로 처리합니다. [(메시, 경로)]를 반환합니다.
+        """
+        planned = []
+        owners = {}  # 정규화한 경로 -> 그 경로에 저장할 메시
+        for mesh in self.meshes:
+            path = self.export_path(mesh)
+            key = os.path.normcase(os.path.normpath(path))
+            if key in owners:
+                self.failed.append(f"{mesh} (파일명 중복: {os.path.basename(path)} - {owners[key]})")
+                log.warning(f"내보내기 실패: {mesh} - {owners[key]}와 파일명이 같습니다 ({os.path.basename(path)})")
+                continue
+            owners[key] = mesh
+            planned.append((mesh, path))
+        return planned
+
+    def _collect(self, futures, return_when=FIRST_COMPLETED):
+        """끝난 직렬화 작업의 결과를 정리합니다."""
+        wait_start = time.time()
+        finished, _ = wait(list(futures), return_when=return_when)
+        self.timings['wait'] += time.time() - wait_start
+
+        for future in finished:
+            mesh = futures.pop(future)
+            try:
+                result, serialize_time = future.result()
+                self.timings['serialize'] += serialize_time
+                self.succeeded.append((mesh, result['path']))
+                self.total_size += result['size']
+                if result['delta']:
+                    self.delta_count += 1
+                log.detail(f"저장됨: {result['path']} ({result['size']} bytes)")
+            except Exception as e:
+                self.failed.append(f"{mesh} (오류: {str(e)})")
+                log.warning(f"내보내기 실패: {mesh} - {e}")
+
+        done = len(self.succeeded) + len(self.failed)
+        self._progress(50 + done * 50 / len(self.meshes), f"저장 중... ({done}/{len(self.meshes)})")
+
+    def run(self):
+        """모든 메시를 내보내고 리포트를 반환합니다."""
+        start_time = time.time()
+        total = len(self.meshes)
+        max_buffers = self.max_workers * BUFFERS_PER_WORKER
+        futures = {}
+        planned = self._plan_export_paths()
+
+        setup_start = time.time()
+        session = WeightImportSession()
+        session.begin()
+        self.timings['setup'] += time.time() - setup_start
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for i, (mesh, export_path) in enumerate(planned):
+                if len(futures) >= max_buffers:
+                    self._collect(futures)
+
+                self._progress(i * 50 / total, f"웨이트 읽는 중... ({i + 1}/{total}) - {mesh}")
+                try:
+                    data = read_mesh_weights(mesh)
+                except Exception as e:
+                    self.failed.append(f"{mesh} (오류: {str(e)})")
+                    log.warning(f"내보내기 실패: {mesh} - {e}")
+                    continue
+                self.timings['read'] += data.read_time
+
+                future = executor.submit(export_weight_data, data, export_path,
+                                         self.delta, self.weightio_folder)
+                futures[future] = mesh
+
+            # 메인 스레드가 더 할 일이 없으므로 Maya 상태를 먼저 복원하고 나머지 저장을 기다림
+            restore_start = time.time()
+            session.end()
+            self.timings['restore'] += time.time() - restore_start
+
+            while futures:
+                self._collect(futures)
+        finally:
+            session.end()
+            executor.shutdown(wait=True)
+
+        # 순서를 메시 목록 순서로 정렬
+        order = {mesh: i for i, mesh in enumerate(self.meshes)}
+        self.succeeded.sort(key=lambda item: order.get(item[0], 0))
+
+        return {
+            'total': total,
+            'succeeded': list(self.succeeded),
+            'failed': list(self.failed),
+            'delta': self.delta_count,
+            'total_size': self.total_size,
+            'timings': dict(self.timings),
+            'total_time': time.time() - start_time,
+        }
+
+
+def format_batch_export_report(report):
+    """배치 내보내기 리포트를 문자열로 만듭니다."""
+    timings = ', '.join(f"{stage} {report['timings'].get(stage, 0.0):.2f}초" for stage in STAGES)
+    delta_info = f", 델타 {report['delta']}" if report.get('delta') else ""
+    return (f"배치 내보내기: 성공 {len(report['succeeded'])}/{report['total']}, "
+            f"실패 {len(report['failed'])}{delta_info}, {report['total_size']} bytes - "
+            f"총 {report['total_time']:.2f}초\n단계별 시간: {timings} (serialize는 작업 스레드 합계)")
@@ -16,6 +16,11 @@ except ImportError:
 
 import maya.OpenMayaUI as omui
 
+from . import R8_log
+from . import R8_weight_export_pipeline
+
+log = R8_log.get_logger(__name__)
+
 
 def get_maya_main_window():
     """Maya 메인 윈도우를 반환합니다."""
@@ -60,8 +65,15 @@ class SkinWeightExportUI(QtWidgets.QWidget):
         self.export_format_group = QtWidgets.QGroupBox("파일 형식")
         self.export_json_radio = QtWidgets.QRadioButton("JSON")
         self.export_xml_radio = QtWidgets.QRadioButton("XML")
+        self.export_binary_radio = QtWidgets.QRadioButton("Binary")
+        self.export_compressed_radio = QtWidgets.QRadioButton("Compressed")
         self.export_json_radio.setChecked(True)  # 기본값은 JSON
         
+        # 압축 형식 전용: 이전 내보내기 대비 바뀐 버텍스만 저장
+        self.export_delta_check = QtWidgets.QCheckBox("이전 내보내기 대비 델타 저장")
+        self.export_delta_check.setToolTip("WeightIO 폴더에서 같은 메시의 가장 최근 .skwz 전체 저장 파일을 기준으로 바뀐 버텍스만 저장합니다.")
+        self.export_delta_check.setEnabled(False)
+        
         # 폴더명 지정 그룹
         self.export_folder_group = QtWidgets.QGroupBox("저장 폴더 이름")
         self.export_folder_label = QtWidgets.QLabel("폴더 이름:")
@@ -93,6 +105,9 @@ class SkinWeightExportUI(QtWidgets.QWidget):
         export_format_layout = QtWidgets.QHBoxLayout(self.export_format_group)
         export_format_layout.addWidget(self.export_json_radio)
         export_format_layout.addWidget(self.export_xml_radio)
+        export_format_layout.addWidget(self.export_binary_radio)
+        export_format_layout.addWidget(self.export_compressed_radio)
+        export_format_layout.addWidget(self.export_delta_check)
         export_format_layout.addStretch()
         
         # 폴더명 지정 레이아웃
@@ -120,6 +135,7 @@ class SkinWeightExportUI(QtWidgets.QWidget):
         self.export_select_all_btn.clicked.connect(self.select_all_export_meshes)
         self.export_select_none_btn.clicked.connect(self.select_none_export_meshes)
         self.export_btn.clicked.connect(self.export_weights)
+        self.export_compressed_radio.toggled.connect(self.export_delta_check.setEnabled)
         self.export_help_btn.clicked.connect(self.show_export_help)
     
     def refresh_export_mesh(self):
@@ -214,6 +230,10 @@ class SkinWeightExportUI(QtWidgets.QWidget):
             # 파일 형식에 따른 확장자 설정
             if self.export_xml_radio.isChecked():
                 extension = ".xml"
+            elif self.export_binary_radio.isChecked():
+                extension = ".skwb"
+            elif self.export_compressed_radio.isChecked():
+                extension = ".skwz"
             else:
                 extension = ".json"
             
@@ -226,41 +246,18 @@ class SkinWeightExportUI(QtWidgets.QWidget):
                 os.makedirs(export_folder)
                 print(f"폴더가 생성되었습니다: {export_folder}")
             
-            success_count = 0
-            failed_meshes = []
+            # 선택을 바꾸지 않고 메인 스레드에서 웨이트를 읽고, 직렬화 / 저장은 작업 스레드에서 처리
+            batch_export = R8_weight_export_pipeline.BatchWeightExport(
+                selected_meshes, export_folder, extension,
+                delta=self.export_compressed_radio.isChecked() and self.export_delta_check.isChecked(),
+                progress_callback=update_progress,
+                weightio_folder=weightio_folder
+            )
+            report = batch_export.run()
+            log.summary(R8_weight_export_pipeline.format_batch_export_report(report))
             
-            # 각 선택된 메시에 대해 순차적으로 내보내기 실행 (테이블 순서대로)
-            for i, mesh_name in enumerate(selected_meshes):
-                try:
-                    # 진행 상황 표시
-                    progress = int((i / len(selected_meshes)) * 100)
-                    update_progress(progress, f"내보내기 중... ({i+1}/{len(selected_meshes)}) - {mesh_name}")
-                    
-                    # 메시 이름 기반으로 파일명 자동 생성 (접미사 "_skinWeights" 추가)
-                    filename = f"{mesh_name}_skinWeights{extension}"
-                    export_path = os.path.join(export_folder, filename)
-                    
-                    # 임시로 메시 선택 (내보내기 함수에서 필요)
-                    cmds.select(mesh_name, replace=True)
-                    
-                    # 파일 형식에 따른 내보내기 실행
-                    if self.export_xml_radio.isChecked():
-                        result_path = self.core.export_weights_to_xml(
-                            mesh_name, export_path, None  # 개별 진행표시 비활성화
-                        )
-                    else:
-                        result_path = self.core.export_weights_to_json(
-                            mesh_name, export_path, None  # 개별 진행표시 비활성화
-                        )
-                    
-                    if result_path:
-                        success_count += 1
-                        print(f"저장됨: {result_path}")
-                    else:
-                        failed_meshes.append(mesh_name)
-                        
-                except Exception as e:
-                    failed_meshes.append(f"{mesh_name} (오류: {str(e)})")
+            success_count = len(report['succeeded'])
+            failed_meshes = report['failed']
             
             # 최종 결과 표시
             update_progress(100, "내보내기 완료!")
@@ -326,6 +323,10 @@ class SkinWeightExportUI(QtWidgets.QWidget):
 <h4>3. 파일 형식 선택</h4>
 • <b>JSON</b>: JSON 형식 (빠른 처리 속도, Python 친화적)<br>
 • <b>XML</b>: 표준 XML 형식 (Maya 호환성 좋음)<br>
+• <b>Binary</b>: .skwb 바이너리 형식 (고밀도 메시 불러오기 최적화)<br>
+• <b>Compressed</b>: .skwz 16비트 양자화 + 압축 형식 (가장 작은 파일 크기, 네트워크 복사에 유리)<br>
+• <b>이전 내보내기 대비 델타 저장</b>: WeightIO 폴더의 같은 메시 .skwz(전체 저장)를 기준으로 바뀐 버텍스만 저장합니다.
+  불러올 때 기준 파일이 필요하므로 기준 폴더를 지우거나 덮어쓰지 마세요<br>
 
 <h4>4. 폴더명 지정</h4>
 • 저장할 폴더 이름을 입력하세요<br>
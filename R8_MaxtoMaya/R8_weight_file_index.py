@@ -0,0 +1,214 @@
+"""
+WeightIO 폴더별 웨이트 파일 메타데이터 인덱스
+각 폴더에 .weightio_index.json 사이드카 파일을 두고
+메시명, 버텍스 수, 인플루언스 목록, 형식, 크기를 저장합니다.
+항목은 파일명 + 수정 시간 + 크기로 검증되며, 파일이 바뀌면 자동으로 다시 읽습니다.
+"""
+
+import os
+import json
+import struct
+import xml.etree.ElementTree as ET
+
+from . import R8_weight_compressed
+
+INDEX_FILE_NAME = ".weightio_index.json"
+INDEX_VERSION = 1
+WEIGHT_FILE_EXTENSIONS = ('.xml', '.json', '.skwb', '.skwz')
+
+# 바이너리 스킨 웨이트 포맷 (.skwb)
+# [헤더][이름 테이블][버텍스 오프셋 uint32 x (V+1)][인플루언스 인덱스 uint32 x N][웨이트 float32 x N]
+# 모든 값은 리틀 엔디언, 각 배열 구간은 4바이트 정렬
+SKWB_MAGIC = b'SKWB'
+SKWB_VERSION = 1
+SKWB_HEADER_FORMAT = '<4sHHIIII'  # magic, version, flags, vertex_count, influence_count, nnz, name_table_size
+SKWB_HEADER_SIZE = struct.calcsize(SKWB_HEADER_FORMAT)
+
+# 폴더 경로 -> WeightFileIndex (세션 내 재사용)
+_folder_indexes = {}
+
+
+def is_skinweight_file(filename):
+    """_skinWeights 웨이트 파일인지 확인합니다."""
+    lower_name = filename.lower()
+    return "_skinweight" in lower_name and lower_name.endswith(WEIGHT_FILE_EXTENSIONS)
+
+
+def read_skwb_header(file_path):
+    """바이너리(.skwb) 파일의 헤더와 이름 테이블만 읽어 반환합니다."""
+    with open(file_path, 'rb') as f:
+        header = f.read(SKWB_HEADER_SIZE)
+        if len(header) < SKWB_HEADER_SIZE:
+            raise ValueError(f"올바른 SKWB 파일이 아닙니다: {file_path}")
+
+        magic, version, flags, vertex_count, influence_count, nnz, name_table_size = struct.unpack(SKWB_HEADER_FORMAT, header)
+        if magic != SKWB_MAGIC:
+            raise ValueError(f"올바른 SKWB 파일이 아닙니다: {file_path}")
+        if version > SKWB_VERSION:
+            raise ValueError(f"지원하지 않는 SKWB 버전입니다: {version}")
+
+        name_table = f.read(name_table_size)
+
+    # 이름 테이블: [uint16 길이][UTF-8 바이트] 반복 (메시, 스킨 클러스터, 인플루언스...)
+    names = []
+    offset = 0
+    for _ in range(influence_count + 2):
+        (name_length,) = struct.unpack_from('<H', name_table, offset)
+        offset += 2
+        names.append(name_table[offset:offset + name_length].decode('utf-8'))
+        offset += name_length
+
+    data_offset = SKWB_HEADER_SIZE + name_table_size
+    return {
+        'version': version,
+        'flags': flags,
+        'mesh_name': names[0],
+        'skin_cluster': names[1],
+        'influences': names[2:],
+        'vertex_count': vertex_count,
+        'influence_count': influence_count,
+        'nnz': nnz,
+        'offsets_offset': data_offset,
+        'indices_offset': data_offset + (vertex_count + 1) * 4,
+        'weights_offset': data_offset + (vertex_count + 1) * 4 + nnz * 4
+    }
+
+
+def read_weight_file_metadata(file_path):
+    """웨이트 파일에서 메타데이터만 읽어 반환합니다."""
+    file_ext = os.path.splitext(file_path)[1].lower()
+    metadata = {
+        'format': file_ext[1:].upper(),
+        'mesh_name': None,
+        'skin_cluster': None,
+        'vertex_count': 0,
+        'influences': []
+    }
+
+    if file_ext == '.xml':
+        # <Influences>까지만 스트리밍으로 읽고 <Weights>는 파싱하지 않음
+        for event, elem in ET.iterparse(file_path, events=("start", "end")):
+            if event == "start":
+                if elem.tag == "SkinWeights":
+                    metadata['mesh_name'] = elem.get("mesh")
+                    metadata['skin_cluster'] = elem.get("skinCluster")
+                    metadata['vertex_count'] = int(elem.get("vertexCount", 0))
+                elif elem.tag == "Weights":
+                    break
+            elif elem.tag == "Influences":
+                metadata['influences'] = [inf_elem.get("name") for inf_elem in elem.findall("Influence") if inf_elem.get("name")]
+                break
+
+    elif file_ext == '.json':
+        with open(file_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        metadata['mesh_name'] = data.get('mesh_name')
+        metadata['skin_cluster'] = data.get('skin_cluster')
+        metadata['influences'] = list(data.get('influences', []))
+        # JSON에는 버텍스 수가 없으므로 웨이트가 있는 최대 버텍스 ID로 추정
+        weights = data.get('weights', {})
+        metadata['vertex_count'] = max((int(vertex_id) for vertex_id in weights), default=-1) + 1
+
+    elif file_ext == '.skwb':
+        header = read_skwb_header(file_path)
+        metadata['mesh_name'] = header['mesh_name']
+        metadata['skin_cluster'] = header['skin_cluster']
+        metadata['vertex_count'] = header['vertex_count']
+        metadata['influences'] = header['influences']
+
+    elif file_ext == '.skwz':
+        header = R8_weight_compressed.read_compressed_header(file_path)
+        metadata['mesh_name'] = header['mesh_name']
+        metadata['skin_cluster'] = header['skin_cluster']
+        metadata['vertex_count'] = header['vertex_count']
+        metadata['influences'] = header['influences']
+        metadata['delta_base'] = header['delta_base']
+
+    return metadata
+
+
+class WeightFileIndex:
+    """폴더 하나의 웨이트 파일 메타데이터 인덱스"""
+
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        self.index_path = os.path.join(folder_path, INDEX_FILE_NAME)
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """사이드카 인덱스 파일을 읽습니다. 없거나 손상된 경우 빈 인덱스로 시작합니다."""
+        self.entries = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError):
+            pass
+        self.dirty = False
+
+    def save(self):
+        """변경된 경우에만 인덱스 파일을 저장합니다."""
+        if not self.dirty:
+            return
+
+        temp_path = self.index_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'files': self.entries}, f, ensure_ascii=False)
+            os.replace(temp_path, self.index_path)
+            self.dirty = False
+        except OSError as e:
+            print(f"웨이트 인덱스 저장 실패: {self.index_path} ({str(e)})")
+
+    def list_files(self):
+        """폴더의 _skinWeights 파일 목록을 반환하고 삭제된 파일의 항목을 정리합니다."""
+        try:
+            filenames = [filename for filename in os.listdir(self.folder_path) if is_skinweight_file(filename)]
+        except OSError as e:
+            print(f"WeightIO 폴더 읽기 오류: {str(e)}")
+            return []
+
+        stale_names = set(self.entries) - set(filenames)
+        for filename in stale_names:
+            del self.entries[filename]
+        if stale_names:
+            self.dirty = True
+
+        return filenames
+
+    def get_metadata(self, filename):
+        """파일 메타데이터를 반환합니다. 수정 시간이나 크기가 바뀐 경우 파일을 다시 읽습니다."""
+        file_path = os.path.join(self.folder_path, filename)
+        stat = os.stat(file_path)
+
+        entry = self.entries.get(filename)
+        if entry and entry.get('mtime') == stat.st_mtime and entry.get('size') == stat.st_size:
+            return entry
+
+        entry = read_weight_file_metadata(file_path)
+        entry['mtime'] = stat.st_mtime
+        entry['size'] = stat.st_size
+        self.entries[filename] = entry
+        self.dirty = True
+        return entry
+
+
+def get_folder_index(folder_path):
+    """폴더의 WeightFileIndex를 반환합니다. (세션 내 캐시)"""
+    folder_path = os.path.normpath(folder_path)
+    index = _folder_indexes.get(folder_path)
+    if index is None:
+        index = WeightFileIndex(folder_path)
+        _folder_indexes[folder_path] = index
+    return index
+
+
+def get_file_metadata(file_path):
+    """파일 경로로 메타데이터를 조회하고 인덱스를 저장합니다."""
+    index = get_folder_index(os.path.dirname(file_path))
+    metadata = index.get_metadata(os.path.basename(file_path))
+    index.save()
+    return metadata
@@ -0,0 +1,616 @@
+'''
+R8 Weight Import Pipeline
+WeightIO 폴더의 _skinWeights 파일을 한 번에 불러오는 파이프라인입니다.
+
+기존 폴더 불러오기는 파일마다 import_weights_from_* 를 호출해 언도 / 평가 모드를 켜고 끄고,
+forceNormalizeWeights를 항상 실행했습니다. 이 파이프라인은
+- 모든 파일을 스레드 풀에서 미리 파싱하고 (순수 Python, Maya API 사용 안 함)
+- 메인 스레드에서 스킨 클러스터 / 인플루언스 매핑만 확인한 뒤 (resolve)
+- 전체 웨이트 배열 구성도 작업 스레드에서 처리하고 (decode)
+- 메인 스레드는 완성된 배열로 setWeights만 호출하며 (다음 파일 파싱과 겹쳐 실행)
+- 언도 / 평가 모드 / 뷰포트 갱신은 폴더 전체에서 한 번만 전환하고
+- 원본 웨이트가 이미 정규화되어 있고 모든 버텍스를 덮으면 forceNormalizeWeights를 생략합니다.
+끝나면 단계별 처리 시간(format_folder_import_report)을 출력합니다.
+
+    report = FolderWeightImport(folder_path, filenames, joint_remap_dict).run()
+    print(format_folder_import_report(report))
+
+UI에서는 start() 후 타이머에서 ready()인 동안 step(block=False)를 호출하면 메인 스레드가
+멈추지 않으므로 진행 표시와 취소가 그대로 동작합니다.
+'''
+import os
+import sys
+import json
+import time
+import xml.etree.ElementTree as ET
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import maya.cmds as cmds
+
+from . import R8_log
+from . import R8_weight_skin_context
+from . import R8_weight_compressed
+from . import R8_weight_file_index
+
+log = R8_log.get_logger(__name__)
+
+# 버텍스 웨이트 합이 1에서 이 값 이내면 정규화된 것으로 봄
+NORMALIZED_TOLERANCE = 0.001
+
+# 무시하는 작은 웨이트 (내보내기와 동일)
+WEIGHT_EPSILON = 0.0001
+
+SKIN_WEIGHTS_SUFFIX = '_skinWeights'
+
+DEFAULT_PARSE_WORKERS = max(1, min(4, os.cpu_count() or 1))
+
+# 단계별 시간 (parse / decode는 작업 스레드 시간 합계라 다른 단계와 겹침)
+STAGES = ('setup', 'parse', 'wait', 'resolve', 'decode', 'apply', 'normalize', 'restore')
+
+# 파일별 처리 단계
+ITEM_PARSE = 'parse'
+ITEM_DECODE = 'decode'
+ITEM_DONE = 'done'
+
+
+def mesh_name_from_filename(filename):
+    """메시명_skinWeights.확장자 파일명에서 메시 이름을 추출합니다."""
+    base_name = os.path.splitext(os.path.basename(filename))[0]
+    if base_name.endswith(SKIN_WEIGHTS_SUFFIX):
+        return base_name[:-len(SKIN_WEIGHTS_SUFFIX)]
+    return base_name
+
+
+class ParsedWeights:
+    """파싱된 웨이트 파일 (버텍스별 0이 아닌 웨이트를 CSR 배열로 보관)
+
+    vertex_ids[row]의 웨이트는 indices / values[offsets[row]:offsets[row + 1]] 입니다.
+    indices는 influences 리스트의 인덱스입니다.
+    """
+
+    def __init__(self, path, file_format):
+        self.path = path
+        self.format = file_format
+        self.mesh_name = None
+        self.skin_cluster = None
+        self.influences = []
+        self.vertex_ids = array('I')
+        self.offsets = array('I', [0])
+        self.indices = array('I')
+        self.values = array('d')
+        self.normalized = True
+        self.parse_time = 0.0
+
+    def add_vertex(self, vertex_id, weights):
+        """버텍스 하나의 [(인플루언스 인덱스, 웨이트), ...]를 추가합니다."""
+        total = 0.0
+        for influence_index, value in weights:
+            self.indices.append(influence_index)
+            self.values.append(value)
+            total += value
+        self.vertex_ids.append(vertex_id)
+        self.offsets.append(len(self.indices))
+        if weights and abs(total - 1.0) > NORMALIZED_TOLERANCE:
+            self.normalized = False
+
+    @property
+    def vertex_count(self):
+        return len(self.vertex_ids)
+
+
+def parse_xml_weights(path):
+    """XML 웨이트 파일을 스트리밍으로 파싱합니다."""
+    parsed = ParsedWeights(path, 'xml')
+    weights_elem = None
+    for event, elem in ET.iterparse(path, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "SkinWeights":
+                parsed.mesh_name = elem.get("mesh")
+                parsed.skin_cluster = elem.get("skinCluster")
+            elif elem.tag == "Weights":
+                weights_elem = elem
+            continue
+
+        if elem.tag == "Vertex":
+            parsed.add_vertex(int(elem.get("id")), [
+                (int(weight_elem.get("influence")), float(weight_elem.get("value")))
+                for weight_elem in elem.iter("Weight")
+            ])
+            # 처리한 버텍스 요소 해제
+            if weights_elem is not None:
+                weights_elem.clear()
+        elif elem.tag == "Influences":
+            # XML 인덱스 순서대로 인플루언스 리스트 구성
+            by_index = {int(inf_elem.get("index")): inf_elem.get("name") for inf_elem in elem.findall("Influence")}
+            parsed.influences = [by_index.get(i) for i in range(max(by_index) + 1)] if by_index else []
+            elem.clear()
+    return parsed
+
+
+def parse_json_weights(path):
+    """JSON 웨이트 파일을 파싱합니다."""
+    parsed = ParsedWeights(path, 'json')
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    parsed.mesh_name = data.get("mesh_name")
+    parsed.skin_cluster = data.get("skin_cluster")
+    parsed.influences = list(data.get("influences", []))
+    influence_lookup = {name: i for i, name in enumerate(parsed.influences)}
+
+    for vertex_id in sorted(data.get("weights", {}), key=int):
+        vertex_weights = data["weights"][vertex_id]
+        weights = []
+        for joint_name, value in vertex_weights.items():
+            influence_index = influence_lookup.get(joint_name)
+            if influence_index is None:
+                influence_index = influence_lookup[joint_name] = len(parsed.influences)
+                parsed.influences.append(joint_name)
+            weights.append((influence_index, float(value)))
+        parsed.add_vertex(int(vertex_id), weights)
+    return parsed
+
+
+def parse_binary_weights(path):
+    """바이너리(.skwb) 웨이트 파일을 읽습니다."""
+    header = R8_weight_file_index.read_skwb_header(path)
+
+    parsed = ParsedWeights(path, 'skwb')
+    parsed.mesh_name = header['mesh_name']
+    parsed.skin_cluster = header['skin_cluster']
+    parsed.influences = list(header['influences'])
+
+    vertex_count = header['vertex_count']
+    nnz = header['nnz']
+    offsets, indices, values = array('I'), array('I'), array('f')
+    with open(path, 'rb') as f:
+        f.seek(header['offsets_offset'])
+        offsets.fromfile(f, vertex_count + 1)
+        indices.fromfile(f, nnz)
+        values.fromfile(f, nnz)
+    if sys.byteorder != 'little':
+        for arr in (offsets, indices, values):
+            arr.byteswap()
+
+    parsed.vertex_ids = array('I', range(vertex_count))
+    parsed.offsets = offsets
+    parsed.indices = indices
+    parsed.values = array('d', values)
+
+    for vertex_id in range(vertex_count):
+        start, end = offsets[vertex_id], offsets[vertex_id + 1]
+        if start != end and abs(sum(values[start:end]) - 1.0) > NORMALIZED_TOLERANCE:
+            parsed.normalized = False
+            break
+    return parsed
+
+
+def parse_compressed_weights(path):
+    """압축(.skwz) 웨이트 파일을 읽습니다. 델타 파일은 기준 파일과 합쳐 복원합니다."""
+    data = R8_weight_compressed.read_compressed_weights(path)
+
+    parsed = ParsedWeights(path, 'skwz')
+    parsed.mesh_name = data['mesh_name']
+    parsed.skin_cluster = data['skin_cluster']
+    parsed.influences = list(data['influences'])
+
+    offsets, values = data['offsets'], data['values']
+    parsed.vertex_ids = array('I', range(data['vertex_count']))
+    parsed.offsets = offsets
+    parsed.indices = data['indices']
+    parsed.values = values
+
+    for vertex_id in range(data['vertex_count']):
+        start, end = offsets[vertex_id], offsets[vertex_id + 1]
+        if start != end and abs(sum(values[start:end]) - 1.0) > NORMALIZED_TOLERANCE:
+            parsed.normalized = False
+            break
+    return parsed
+
+
+WEIGHT_PARSERS = {
+    '.xml': parse_xml_weights,
+    '.json': parse_json_weights,
+    '.skwb': parse_binary_weights,
+    '.skwz': parse_compressed_weights,
+}
+
+
+def parse_weight_file(path):
+    """확장자에 맞는 파서로 웨이트 파일을 읽습니다. 작업 스레드에서 호출해도 안전합니다."""
+    start = time.time()
+    parser = WEIGHT_PARSERS.get(os.path.splitext(path)[1].lower())
+    if parser is None:
+        raise ValueError(f"지원하지 않는 웨이트 파일 형식입니다: {path}")
+    parsed = parser(path)
+    parsed.parse_time = time.time() - start
+    return parsed
+
+
+def ensure_skin_cluster(mesh, influence_names):
+    """메시의 스킨 클러스터를 반환합니다. 없으면 만들고, 있으면 빠진 인플루언스를 추가합니다."""
+    shapes = cmds.listRelatives(mesh, shapes=True, type="mesh")
+    if not shapes:
+        raise ValueError(f"{mesh}는 메시가 아닙니다.")
+
+    skin_cluster = R8_weight_skin_context.find_skin_cluster(shapes[0])
+    existing_joints = [joint for joint in influence_names if joint and cmds.objExists(joint)]
+
+    if not skin_cluster:
+        if not existing_joints:
+            raise ValueError("인플루언스 조인트를 찾을 수 없습니다.")
+        cmds.select(existing_joints + [mesh], r=True)
+        return cmds.skinCluster(
+            toSelectedBones=True,
+            bindMethod=0,
+            skinMethod=0,
+            normalizeWeights=1,
+            maximumInfluences=4,
+            dropoffRate=4.0
+        )[0]
+
+    current_influences = set(cmds.skinCluster(skin_cluster, query=True, influence=True) or [])
+    for joint in existing_joints:
+        if joint not in current_influences:
+            cmds.skinCluster(skin_cluster, edit=True, addInfluence=joint, weight=0)
+            current_influences.add(joint)
+    return skin_cluster
+
+
+def resolve_target(parsed, mesh_name=None, joint_remap_dict=None):
+    """스킨 클러스터와 인플루언스 매핑을 준비합니다. 메인 스레드에서 호출해야 합니다.
+
+    Returns:
+        (SkinContext, list): 스킨 컨텍스트, 파일 인플루언스 인덱스 -> 스킨 인플루언스 인덱스 (없으면 -1)
+    """
+    target_mesh = mesh_name or parsed.mesh_name
+    if not target_mesh or not cmds.objExists(target_mesh):
+        raise ValueError(f"메시 '{target_mesh}'를 찾을 수 없습니다.")
+
+    influences = parsed.influences
+    if joint_remap_dict:
+        influences = [joint_remap_dict.get(name, name) for name in influences]
+
+    skin_cluster = ensure_skin_cluster(target_mesh, influences)
+    context = R8_weight_skin_context.get_skin_context(target_mesh, skin_cluster)
+    influence_index_map = [context.influence_index.get(name, -1) for name in influences]
+    return context, influence_index_map
+
+
+def decode_weights(parsed, influence_index_map, vertex_count, influence_count):
+    """CSR 웨이트를 setWeights용 전체 배열(버텍스 x 인플루언스)로 펼칩니다. 작업 스레드에서 호출해도 안전합니다.
+
+    Returns:
+        (list, int, float): 웨이트 배열, 웨이트를 채운 버텍스 수, 처리 시간
+    """
+    start = time.time()
+    weights = [0.0] * (vertex_count * influence_count)
+
+    offsets, indices, values = parsed.offsets, parsed.indices, parsed.values
+    covered = 0
+    for row, vertex_id in enumerate(parsed.vertex_ids):
+        if vertex_id >= vertex_count:
+            continue
+        row_start, row_end = offsets[row], offsets[row + 1]
+        if row_start == row_end:
+            continue
+
+        # 리매핑으로 빠진 인플루언스를 제외한 합계로 정규화
+        total_weight = 0.0
+        for k in range(row_start, row_end):
+            if influence_index_map[indices[k]] >= 0:
+                total_weight += values[k]
+        if total_weight <= WEIGHT_EPSILON:
+            continue
+
+        row_base = vertex_id * influence_count
+        for k in range(row_start, row_end):
+            maya_index = influence_index_map[indices[k]]
+            if maya_index >= 0:
+                weights[row_base + maya_index] += values[k] / total_weight
+        covered += 1
+
+    return weights, covered, time.time() - start
+
+
+def write_weights(context, weights, normalize, timings):
+    """완성된 웨이트 배열을 setWeights 한 번으로 쓰고 필요할 때만 정규화합니다. 메인 스레드에서 호출해야 합니다."""
+    start = time.time()
+    skin_cluster = context.skin_cluster
+    cmds.setAttr(f"{skin_cluster}.normalizeWeights", 0)
+    context.set_weights(weights, normalize=False)
+    cmds.setAttr(f"{skin_cluster}.normalizeWeights", 1)
+
+    applied = time.time()
+    timings['apply'] = timings.get('apply', 0.0) + applied - start
+
+    if normalize:
+        cmds.skinCluster(skin_cluster, edit=True, forceNormalizeWeights=True)
+    timings['normalize'] = timings.get('normalize', 0.0) + time.time() - applied
+
+
+def needs_normalize(parsed, covered, vertex_count):
+    """원본이 정규화되어 있지 않거나 웨이트가 없는 버텍스가 남으면 정규화가 필요합니다."""
+    return not (parsed.normalized and covered == vertex_count)
+
+
+def apply_parsed_weights(parsed, mesh_name=None, joint_remap_dict=None, normalize=None, timings=None):
+    """파싱된 웨이트를 메시에 적용합니다. 메인 스레드에서 호출해야 합니다.
+
+    Args:
+        parsed (ParsedWeights): parse_weight_file 결과
+        mesh_name (str): 대상 메시 (None이면 파일의 메시 이름)
+        joint_remap_dict (dict): 원본 조인트 -> 대상 조인트
+        normalize (bool): None이면 원본이 정규화되지 않았거나 덮지 못한 버텍스가 있을 때만 정규화
+        timings (dict): resolve / decode / apply / normalize 시간을 누적할 딕셔너리
+
+    Returns:
+        dict: mesh, skin_cluster, vertices(적용 버텍스 수), normalized(정규화 실행 여부)
+    """
+    timings = timings if timings is not None else {}
+    start = time.time()
+    context, influence_index_map = resolve_target(parsed, mesh_name, joint_remap_dict)
+    timings['resolve'] = timings.get('resolve', 0.0) + time.time() - start
+
+    weights, covered, decode_time = decode_weights(parsed, influence_index_map,
+                                                   context.vertex_count, context.influence_count)
+    timings['decode'] = timings.get('decode', 0.0) + decode_time
+
+    if normalize is None:
+        normalize = needs_normalize(parsed, covered, context.vertex_count)
+    write_weights(context, weights, normalize, timings)
+    return {'mesh': context.mesh, 'skin_cluster': context.skin_cluster, 'vertices': covered, 'normalized': normalize}
+
+
+class WeightImportSession:
+    """언도 / 평가 모드 / 뷰포트 갱신 / 자동 키를 한 번만 끄고 복원합니다.
+
+    evaluation=False면 평가 모드는 건드리지 않습니다.
+    """
+
+    def __init__(self, evaluation=True):
+        self.evaluation = evaluation
+        self.undo_state = None
+        self.maya_state = None
+
+    def begin(self):
+        # 순환 임포트 방지를 위해 지역 임포트
+        from R8_MaxtoMaya.R8_weight_skin_IO import SkinWeightIOCore
+        self.undo_state = cmds.undoInfo(query=True, state=True)
+        cmds.undoInfo(state=False)
+        self.maya_state = SkinWeightIOCore.optimize_maya_performance(evaluation=self.evaluation)
+
+    def end(self):
+        from R8_MaxtoMaya.R8_weight_skin_IO import SkinWeightIOCore
+        if self.maya_state is not None:
+            SkinWeightIOCore.restore_maya_performance(self.maya_state)
+            self.maya_state = None
+        if self.undo_state is not None:
+            cmds.undoInfo(state=self.undo_state)
+            self.undo_state = None
+
+    def __enter__(self):
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end()
+        return False
+
+
+class FolderWeightImport:
+    """폴더의 웨이트 파일을 작업 스레드에서 파싱 / 디코딩하고 메인 스레드에서 순서대로 적용합니다.
+
+    파일마다 parse(작업 스레드) -> resolve(메인) -> decode(작업 스레드) -> apply(메인) 순서로 진행되며,
+    앞 파일을 적용하는 동안 뒤 파일들의 파싱이 계속됩니다.
+    start() / step() / finish()로 나누어 호출할 수 있고, run()은 전체를 한 번에 실행합니다.
+
+    hold_session이 True면 start()부터 finish()까지 WeightImportSession을 유지합니다.
+    step() 사이에 Maya 이벤트 루프로 돌아가는 경우(타이머 진행)에는 False로 두고
+    호출하는 쪽이 step() 구간만 begin_session() / end_session()으로 감쌉니다.
+    이때도 평가 모드는 평가 그래프를 파일마다 다시 만들지 않도록 start()부터 finish()까지 꺼 둡니다.
+    """
+
+    def __init__(self, folder_path, filenames, joint_remap_dict=None, max_workers=DEFAULT_PARSE_WORKERS,
+                 progress_callback=None, mesh_names=None, hold_session=True):
+        self.folder_path = folder_path
+        self.filenames = list(filenames)
+        self.joint_remap_dict = joint_remap_dict or {}
+        self.max_workers = max(1, int(max_workers or 1))
+        self.progress_callback = progress_callback
+        self.mesh_names = mesh_names or {}  # 파일명 -> 대상 메시 (없으면 파일명에서 추출)
+        self.hold_session = hold_session
+
+        self.timings = {stage: 0.0 for stage in STAGES}
+        self.succeeded = []      # (파일명, 메시)
+        self.failed = []         # "파일명 (사유)"
+        self.normalize_skipped = 0
+        self.cancelled = False
+
+        self._items = []         # 파일별 상태 딕셔너리 (적용 대기열)
+        self._position = 0
+        self._executor = None
+        self._session = None
+        self._evaluation_mode = None  # hold_session=False일 때 작업 전체 동안 끈 평가 모드 (복원용)
+        self._start_time = None
+
+    def _progress(self, value, message):
+        if self.progress_callback:
+            self.progress_callback(int(value), message)
+
+    def start(self):
+        """파싱 작업을 제출하고 (hold_session이면) Maya 상태를 한 번 전환합니다."""
+        self._start_time = time.time()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        for filename in self.filenames:
+            mesh_name = self.mesh_names.get(filename) or mesh_name_from_filename(filename)
+            item = {'filename': filename, 'mesh': mesh_name, 'stage': ITEM_PARSE, 'future': None}
+            if cmds.objExists(mesh_name):
+                path = os.path.join(self.folder_path, filename)
+                item['future'] = self._executor.submit(parse_weight_file, path)
+            # 씬에 없는 메시는 파싱하지 않음 (future None)
+            self._items.append(item)
+
+        if self.hold_session:
+            self.begin_session()
+        else:
+            setup_start = time.time()
+            self._evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+            cmds.evaluationManager(mode='off')
+            self.timings['setup'] += time.time() - setup_start
+        self._progress(0, f"{len(self.filenames)}개 파일 파싱 시작 (작업 스레드 {self.max_workers}개)")
+        return self
+
+    def begin_session(self):
+        """언도 / 평가 모드 / 뷰포트 갱신을 끕니다. 이미 전환된 상태면 아무것도 하지 않습니다.
+
+        hold_session=False면 평가 모드는 작업 전체 동안 꺼져 있으므로 나머지만 전환합니다.
+        """
+        if self._session is not None:
+            return
+        setup_start = time.time()
+        self._session = WeightImportSession(evaluation=self.hold_session)
+        self._session.begin()
+        self.timings['setup'] += time.time() - setup_start
+
+    def end_session(self):
+        """begin_session()으로 바꾼 Maya 상태를 복원합니다."""
+        if self._session is None:
+            return
+        restore_start = time.time()
+        self._session.end()
+        self._session = None
+        self.timings['restore'] += time.time() - restore_start
+
+    @property
+    def total(self):
+        return len(self._items)
+
+    @property
+    def done(self):
+        return self.cancelled or self._position >= len(self._items)
+
+    def ready(self):
+        """다음 단계를 기다리지 않고 바로 진행할 수 있으면 True"""
+        if self.done:
+            return False
+        future = self._items[self._position]['future']
+        return future is None or future.done()
+
+    def step(self, block=True):
+        """대기열의 현재 파일을 진행합니다. 남은 파일이 있으면 True를 반환합니다.
+
+        block=True면 현재 파일 적용까지 끝내고, False면 준비된 단계 하나만 진행합니다.
+        (작업 스레드 결과가 아직 없으면 아무것도 하지 않음)
+        """
+        while not self.done:
+            item = self._items[self._position]
+            if not block and not self.ready():
+                return True
+            finished = self._advance(item)
+            if finished:
+                self._position += 1
+            if finished or not block:
+                break
+        return not self.done
+
+    def _advance(self, item):
+        """현재 파일을 한 단계 진행합니다. 파일 처리가 끝나면 True"""
+        index = self._position
+        total = len(self._items)
+        filename, mesh_name = item['filename'], item['mesh']
+
+        if item['future'] is None:
+            self.failed.append(f"{filename} (메시 '{mesh_name}' 없음)")
+            self._progress((index + 1) * 100 / total, f"건너뜀... ({index + 1}/{total}) - {filename} (메시 없음)")
+            return True
+
+        try:
+            wait_start = time.time()
+            result = item['future'].result()
+            self.timings['wait'] += time.time() - wait_start
+
+            if item['stage'] == ITEM_PARSE:
+                parsed = result
+                self.timings['parse'] += parsed.parse_time
+                self._progress((index + 0.3) * 100 / total, f"매핑 중... ({index + 1}/{total}) - {mesh_name}")
+
+                resolve_start = time.time()
+                context, influence_index_map = resolve_target(parsed, mesh_name, self.joint_remap_dict)
+                self.timings['resolve'] += time.time() - resolve_start
+
+                item.update(stage=ITEM_DECODE, parsed=parsed, context=context)
+                item['future'] = self._executor.submit(decode_weights, parsed, influence_index_map,
+                                                       context.vertex_count, context.influence_count)
+                return False
+
+            weights, covered, decode_time = result
+            self.timings['decode'] += decode_time
+            self._progress((index + 0.7) * 100 / total, f"적용 중... ({index + 1}/{total}) - {mesh_name}")
+
+            context = item['context']
+            normalize = needs_normalize(item['parsed'], covered, context.vertex_count)
+            write_weights(context, weights, normalize, self.timings)
+            if not normalize:
+                self.normalize_skipped += 1
+            self.succeeded.append((filename, mesh_name))
+            log.detail(f"적용됨: {filename} -> {mesh_name} (버텍스 {covered}개)")
+            self._progress((index + 1) * 100 / total, f"완료... ({index + 1}/{total}) - {mesh_name} ✓")
+        except Exception as e:
+            self.failed.append(f"{filename} (오류: {str(e)})")
+            log.warning(f"불러오기 실패: {filename} - {e}")
+            self._progress((index + 1) * 100 / total, f"오류... ({index + 1}/{total}) - {filename} ✗")
+
+        # 처리가 끝난 파일의 버퍼 해제
+        item.update(stage=ITEM_DONE, future=None, parsed=None, context=None)
+        return True
+
+    def cancel(self):
+        """남은 작업을 취소합니다. 이미 적용한 메시는 유지됩니다."""
+        self.cancelled = True
+        for item in self._items[self._position:]:
+            if item['future'] is not None:
+                item['future'].cancel()
+
+    def finish(self):
+        """Maya 상태를 복원하고 결과 리포트를 반환합니다."""
+        self.end_session()
+        if self._evaluation_mode is not None:
+            restore_start = time.time()
+            cmds.evaluationManager(mode=self._evaluation_mode)
+            self._evaluation_mode = None
+            self.timings['restore'] += time.time() - restore_start
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        return {
+            'total': len(self.filenames),
+            'succeeded': list(self.succeeded),
+            'failed': list(self.failed),
+            'normalize_skipped': self.normalize_skipped,
+            'cancelled': self.cancelled,
+            'timings': dict(self.timings),
+            'total_time': time.time() - (self._start_time or time.time()),
+        }
+
+    def run(self):
+        """모든 파일을 불러오고 리포트를 반환합니다."""
+        self.start()
+        try:
+            while self.step():
+                pass
+        finally:
+            report = self.finish()
+        return report
+
+
+def format_folder_import_report(report):
+    """폴더 불러오기 리포트를 문자열로 만듭니다."""
+    timings = ', '.join(f"{stage} {report['timings'].get(stage, 0.0):.2f}초" for stage in STAGES)
+    status = " (취소됨)" if report.get('cancelled') else ""
+    return (f"폴더 불러오기{status}: 성공 {len(report['succeeded'])}/{report['total']}, "
+            f"실패 {len(report['failed'])}, 정규화 생략 {report['normalize_skipped']} - "
+            f"총 {report['total_time']:.2f}초\n단계별 시간: {timings} (parse / decode는 작업 스레드 합계)")
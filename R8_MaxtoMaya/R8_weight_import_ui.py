@@ -6,7 +6,7 @@ import os
 import time
 import json
 import xml.etree.ElementTree as ET
-import maya.cmds as cmds
+from functools import partial
 import maya.mel as mel
 
 # PySide 임포트 (Maya 버전에 따라)
@@ -19,6 +19,11 @@ except ImportError:
 
 import maya.OpenMayaUI as omui
 
+from . import R8_log
+from . import R8_weight_import_pipeline
+
+log = R8_log.get_logger(__name__)
+
 
 def get_maya_main_window():
     """Maya 메인 윈도우를 반환합니다."""
@@ -26,6 +31,83 @@ def get_maya_main_window():
     return wrapInstance(int(main_window_ptr), QtWidgets.QWidget)
 
 
+class WeightImportRunner(QtCore.QObject):
+    """FolderWeightImport를 타이머로 진행합니다.
+    
+    파싱/디코딩은 작업 스레드에서 진행되고, 타이머는 결과가 준비된 파일만 메인 스레드에서
+    적용하므로 UI가 멈추지 않고 진행 표시와 취소가 그대로 동작합니다.
+    
+    언도 / 뷰포트 갱신 / 자동 키는 적용하는 틱 동안만 꺼지므로 (job은 hold_session=False로 생성)
+    불러오는 중에도 틱 사이에는 Maya를 평소처럼 사용할 수 있습니다.
+    평가 모드는 작업이 끝나거나 abandon()될 때까지 꺼 둡니다.
+    부모 위젯이 삭제되면 abandon()으로 남은 작업을 정리합니다.
+    """
+    
+    finished = QtCore.Signal(object)  # 리포트 딕셔너리
+    
+    TICK_INTERVAL = 10   # ms
+    TICK_BUDGET = 0.05   # 한 번의 타이머 호출에서 메인 스레드를 사용하는 최대 시간(초)
+    
+    def __init__(self, job, parent=None):
+        super(WeightImportRunner, self).__init__(parent)
+        self.job = job
+        self._busy = False
+        self._closed = False
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(self.TICK_INTERVAL)
+        self.timer.timeout.connect(self._tick)
+        if parent is not None:
+            # 타이머는 부모와 함께 삭제되므로 finish()가 호출되지 않은 작업을 여기서 정리
+            parent.destroyed.connect(partial(WeightImportRunner.abandon, self))
+    
+    def start(self):
+        self.job.start()
+        self.timer.start()
+    
+    def cancel(self):
+        self.job.cancel()
+    
+    def is_running(self):
+        return not self._closed and self.timer.isActive()
+    
+    def abandon(self):
+        """남은 작업을 취소하고 작업 스레드와 Maya 상태를 정리합니다. (창을 닫을 때, finished 시그널 없음)"""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.timer.stop()
+        except RuntimeError:
+            # 부모 위젯과 함께 타이머가 이미 삭제된 경우
+            pass
+        self.job.cancel()
+        self.job.finish()
+    
+    def _tick(self):
+        # 진행 콜백의 processEvents로 타이머가 다시 들어오는 경우 무시
+        if self._busy or self._closed:
+            return
+        if self.job.ready():
+            self._busy = True
+            try:
+                # 이번 틱에서 적용하는 동안만 언도 / 뷰포트 갱신 / 자동 키 전환 (평가 모드는 job이 유지)
+                self.job.begin_session()
+                tick_start = time.time()
+                while self.job.ready() and time.time() - tick_start < self.TICK_BUDGET:
+                    self.job.step(block=False)
+            except Exception as e:
+                log.error(f"웨이트 불러오기 진행 중 오류: {e}")
+                self.job.cancel()
+            finally:
+                self.job.end_session()
+                self._busy = False
+        
+        if self.job.done and not self._closed:
+            self._closed = True
+            self.timer.stop()
+            self.finished.emit(self.job.finish())
+
+
 class SkinWeightImportUI(QtWidgets.QWidget):
     """스킨 웨이트 임포트 UI 클래스"""
     
@@ -35,6 +117,9 @@ class SkinWeightImportUI(QtWidgets.QWidget):
         # 핵심 기능 클래스 참조
         self.core = core_instance
         
+        # 진행 중인 폴더 불러오기 (WeightImportRunner)
+        self.import_runner = None
+        
         # UI 구성
         self.create_widgets()
         self.create_layouts()
@@ -267,6 +352,12 @@ class SkinWeightImportUI(QtWidgets.QWidget):
     
     def import_weights(self):
         """선택된 폴더의 모든 _skinWeights 파일을 불러옵니다 (파일명 기반 자동 메시 매칭)."""
+        # 불러오기 진행 중이면 버튼은 취소로 동작
+        if self.import_runner is not None and self.import_runner.is_running():
+            self.import_runner.cancel()
+            self.import_btn.setEnabled(False)
+            return
+        
         selected_rows = self.import_files_table.selectionModel().selectedRows()
         if not selected_rows:
             self.show_error("오류", "불러올 폴더를 선택해주세요.")
@@ -290,180 +381,128 @@ class SkinWeightImportUI(QtWidgets.QWidget):
             return
         
         # 시작 시간 기록
-        import time
         start_time = time.time()
         
-        # 진행 상황 콜백 설정
-        def update_progress(value, message=""):
-            # 부모 UI에 진행 상황 전달
-            if hasattr(self.parent(), 'update_progress'):
-                self.parent().update_progress(value, message)
+        # 조인트 리매핑 딕셔너리 가져오기
+        joint_remap_dict = self.get_joint_remap_dict()
+        
+        folder_path = folder_data['path']
+        skinweight_files = folder_data['files']
+        
+        # 조인트 리매핑 정보 표시
+        remap_info = ""
+        if joint_remap_dict:
+            remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)"
+        
+        self.update_progress(0, f"폴더 '{folder_data['name']}'에서 {len(skinweight_files)}개 파일 처리 시작...{remap_info}")
+        
+        # 작업 스레드에서 파싱/디코딩하고 메인 스레드는 타이머에서 적용만 (언도/평가 모드는 폴더 전체에서 한 번만 전환)
+        job = R8_weight_import_pipeline.FolderWeightImport(
+            folder_path, skinweight_files, joint_remap_dict, progress_callback=self.update_progress,
+            hold_session=False
+        )
+        self.import_runner = WeightImportRunner(job, self)
+        self.import_runner.finished.connect(
+            lambda report: self.on_import_finished(report, folder_data, joint_remap_dict, start_time)
+        )
         
         try:
-            # 불러오기 버튼 비활성화
-            self.import_btn.setEnabled(False)
-            
-            # 조인트 리매핑 딕셔너리 가져오기
-            joint_remap_dict = self.get_joint_remap_dict()
-            
-            # 성능 옵션 기본값 설정 (UI에서 제거된 항목들)
-            use_high_performance = True  # 고성능 모드 활성화
-            use_batch_processing = False  # 배치 처리 비활성화
-            batch_size = 5000  # 배치 크기
-            
-            folder_path = folder_data['path']
-            skinweight_files = folder_data['files']
-            
-            success_count = 0
-            failed_files = []
-            
-            # 조인트 리매핑 정보 표시
-            remap_info = ""
-            if joint_remap_dict:
-                remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)"
-            
-            update_progress(0, f"폴더 '{folder_data['name']}'에서 {len(skinweight_files)}개 파일 처리 시작...{remap_info}")
-            
-            # 각 _skinWeights 파일을 순차적으로 처리
-            for i, filename in enumerate(skinweight_files):
-                try:
-                    file_path = os.path.join(folder_path, filename)
-                    file_ext = os.path.splitext(filename)[1].lower()
-                    
-                    # 파일명에서 메시명 추출 (메시명_skinWeights.확장자 형식)
-                    base_name = os.path.splitext(filename)[0]
-                    if base_name.endswith('_skinWeights'):
-                        mesh_name = base_name[:-12]  # '_skinWeights' 제거
-                    else:
-                        mesh_name = base_name
-                    
-                    # 파일 시작 진행률 계산 (각 파일에 대해 동일한 비중 할당)
-                    file_start_progress = (i / len(skinweight_files)) * 100
-                    file_end_progress = ((i + 1) / len(skinweight_files)) * 100
-                    
-                    # 파일 처리 시작 진행 상황 업데이트
-                    update_progress(int(file_start_progress), f"처리 중... ({i+1}/{len(skinweight_files)}) - {filename}")
-                    
-                    # 메시가 씬에 존재하는지 확인
-                    if not cmds.objExists(mesh_name):
-                        failed_files.append(f"{filename} (메시 '{mesh_name}' 없음)")
-                        # 실패한 파일도 진행률 업데이트
-                        update_progress(int(file_end_progress), f"건너뜀... ({i+1}/{len(skinweight_files)}) - {filename} (메시 없음)")
-                        continue
-                    
-                    # 파일 불러오기 중간 진행률 업데이트
-                    mid_progress = file_start_progress + (file_end_progress - file_start_progress) * 0.5
-                    update_progress(int(mid_progress), f"적용 중... ({i+1}/{len(skinweight_files)}) - {mesh_name}")
-                    
-                    # 파일 형식에 따른 불러오기 실행 (조인트 리매핑 포함)
-                    result = False
-                    if file_ext == '.xml':
-                        if use_high_performance and use_batch_processing:
-                            result = self.core.batch_import_weights_from_xml(
-                                file_path, mesh_name, None, batch_size, joint_remap_dict
-                            )
-                        elif use_high_performance:
-                            result = self.core.import_weights_from_xml(
-                                file_path, mesh_name, None, joint_remap_dict
-                            )
-                        else:
-                            result = self.core.import_weights_from_xml(
-                                file_path, mesh_name, None, joint_remap_dict
-                            )
-                    elif file_ext == '.json':
-                        if use_high_performance:
-                            result = self.core.import_weights_from_json(
-                                file_path, mesh_name, None, joint_remap_dict
-                            )
-                        else:
-                            result = self.core.import_weights_from_json(
-                                file_path, mesh_name, None, joint_remap_dict
-                            )
-                    
-                    # 파일 처리 완료 진행률 업데이트
-                    if result:
-                        success_count += 1
-                        update_progress(int(file_end_progress), f"완료... ({i+1}/{len(skinweight_files)}) - {mesh_name} ✓")
-                        print(f"적용됨: {filename} -> {mesh_name}")
-                    else:
-                        failed_files.append(f"{filename} (적용 실패)")
-                        update_progress(int(file_end_progress), f"실패... ({i+1}/{len(skinweight_files)}) - {filename} ✗")
-                        
-                except Exception as e:
-                    failed_files.append(f"{filename} (오류: {str(e)})")
-                    # 오류 발생 시에도 진행률 업데이트
-                    file_end_progress = ((i + 1) / len(skinweight_files)) * 100
-                    update_progress(int(file_end_progress), f"오류... ({i+1}/{len(skinweight_files)}) - {filename} ✗")
-            
-            # 소요 시간 계산
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            
-            # 시간 포맷팅 (초 단위)
-            if elapsed_time < 60:
-                time_str = f"{elapsed_time:.1f}초"
-            else:
-                minutes = int(elapsed_time // 60)
-                seconds = elapsed_time % 60
-                time_str = f"{minutes}분 {seconds:.1f}초"
-            
-            # 최종 결과 표시
-            update_progress(100, f"폴더 불러오기 완료! (소요 시간: {time_str})")
-            
-            # Maya 최적화 실행 (성공한 파일이 있을 때만)
-            if success_count > 0:
-                update_progress(100, f"Maya 최적화 실행 중... (소요 시간: {time_str})")
-                self.maya_optimize()
-                update_progress(100, f"모든 작업 완료! (소요 시간: {time_str})")
-            
-            # 결과에 따른 메시지 표시
-            if success_count == len(skinweight_files):
-                performance_info = " (고성능 모드)"  # 항상 고성능 모드
-                if joint_remap_dict:
-                    performance_info += f" (조인트 리매핑: {len(joint_remap_dict)}개)"
-                
-                self.show_info("불러오기 성공", 
-                             f"폴더 '{folder_data['name']}'의 모든 스킨 웨이트가 성공적으로 적용되었습니다.\n"
-                             f"성공: {success_count}개{performance_info}\n"
-                             f"소요 시간: {time_str}\n\n"
-                             f"파일명에서 자동으로 메시명을 추출하여 적용했습니다.\n"
-                             f"Maya 최적화가 완료되었습니다.")
-            elif success_count > 0:
-                error_msg = (f"폴더 '{folder_data['name']}'의 일부 파일만 적용되었습니다.\n"
-                           f"성공: {success_count}개\n"
-                           f"실패: {len(failed_files)}개\n"
-                           f"소요 시간: {time_str}\n"
-                           f"Maya 최적화가 완료되었습니다.")
-                if failed_files:
-                    error_msg += f"\n\n실패한 파일:\n" + "\n".join(failed_files[:5])
-                    if len(failed_files) > 5:
-                        error_msg += f"\n... 및 {len(failed_files) - 5}개 더"
-                self.show_info("부분 성공", error_msg)
-            else:
-                error_msg = (f"폴더 '{folder_data['name']}'의 모든 파일 적용이 실패했습니다.\n"
-                           f"소요 시간: {time_str}")
-                if failed_files:
-                    error_msg += f"\n\n실패한 파일:\n" + "\n".join(failed_files[:5])
-                    if len(failed_files) > 5:
-                        error_msg += f"\n... 및 {len(failed_files) - 5}개 더"
-                self.show_error("불러오기 실패", error_msg)
-            
+            self.import_runner.start()
+            self.import_btn.setText("Cancel Import")
         except Exception as e:
-            # 오류 발생 시에도 소요 시간 계산
-            end_time = time.time()
-            elapsed_time = end_time - start_time
-            if elapsed_time < 60:
-                time_str = f"{elapsed_time:.1f}초"
-            else:
-                minutes = int(elapsed_time // 60)
-                seconds = elapsed_time % 60
-                time_str = f"{minutes}분 {seconds:.1f}초"
-            
-            update_progress(0, f"오류 발생 (소요 시간: {time_str}): {str(e)}")
-            self.show_error("불러오기 오류", f"{str(e)}\n\n소요 시간: {time_str}")
-        finally:
-            # 불러오기 버튼 다시 활성화
-            self.import_btn.setEnabled(True)
+            job.finish()
+            self.import_runner = None
+            self.update_progress(0, f"오류 발생: {str(e)}")
+            self.show_error("불러오기 오류", str(e))
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 진행 중인 불러오기를 취소합니다."""
+        if self.import_runner is not None:
+            self.import_runner.abandon()
+            self.import_runner = None
+        super(SkinWeightImportUI, self).closeEvent(event)
+    
+    def update_progress(self, value, message=""):
+        """부모 UI에 진행 상황을 전달합니다."""
+        if hasattr(self.parent(), 'update_progress'):
+            self.parent().update_progress(value, message)
+    
+    def on_import_finished(self, report, folder_data, joint_remap_dict, start_time):
+        """폴더 불러오기가 끝나면 Maya 최적화를 실행하고 결과를 표시합니다."""
+        self.import_runner = None
+        self.import_btn.setText("Weight Import")
+        self.import_btn.setEnabled(True)
+        
+        skinweight_files = folder_data['files']
+        success_count = len(report['succeeded'])
+        failed_files = report['failed']
+        
+        # 소요 시간 계산
+        end_time = time.time()
+        elapsed_time = end_time - start_time
+        
+        # 시간 포맷팅 (초 단위)
+        if elapsed_time < 60:
+            time_str = f"{elapsed_time:.1f}초"
+        else:
+            minutes = int(elapsed_time // 60)
+            seconds = elapsed_time % 60
+            time_str = f"{minutes}분 {seconds:.1f}초"
+        
+        # 최종 결과 표시
+        if report['cancelled']:
+            self.update_progress(100, f"폴더 불러오기 취소됨 (소요 시간: {time_str})")
+        else:
+            self.update_progress(100, f"폴더 불러오기 완료! (소요 시간: {time_str})")
+        
+        # Maya 최적화 실행 (성공한 파일이 있을 때만)
+        if success_count > 0:
+            self.update_progress(100, f"Maya 최적화 실행 중... (소요 시간: {time_str})")
+            optimize_start = time.time()
+            self.maya_optimize()
+            report['timings']['optimize'] = time.time() - optimize_start
+            self.update_progress(100, f"모든 작업 완료! (소요 시간: {time_str})")
+        
+        log.summary(R8_weight_import_pipeline.format_folder_import_report(report))
+        if 'optimize' in report['timings']:
+            log.summary(f"Maya 최적화: {report['timings']['optimize']:.2f}초")
+        
+        # 결과에 따른 메시지 표시
+        if report['cancelled']:
+            self.show_info("불러오기 취소",
+                         f"폴더 '{folder_data['name']}' 불러오기가 취소되었습니다.\n"
+                         f"적용된 파일: {success_count}개 / {len(skinweight_files)}개\n"
+                         f"소요 시간: {time_str}")
+        elif success_count == len(skinweight_files):
+            performance_info = " (고성능 모드)"  # 항상 고성능 모드
+            if joint_remap_dict:
+                performance_info += f" (조인트 리매핑: {len(joint_remap_dict)}개)"
+            
+            self.show_info("불러오기 성공", 
+                         f"폴더 '{folder_data['name']}'의 모든 스킨 웨이트가 성공적으로 적용되었습니다.\n"
+                         f"성공: {success_count}개{performance_info}\n"
+                         f"소요 시간: {time_str}\n\n"
+                         f"파일명에서 자동으로 메시명을 추출하여 적용했습니다.\n"
+                         f"Maya 최적화가 완료되었습니다.")
+        elif success_count > 0:
+            error_msg = (f"폴더 '{folder_data['name']}'의 일부 파일만 적용되었습니다.\n"
+                       f"성공: {success_count}개\n"
+                       f"실패: {len(failed_files)}개\n"
+                       f"소요 시간: {time_str}\n"
+                       f"Maya 최적화가 완료되었습니다.")
+            if failed_files:
+                error_msg += f"\n\n실패한 파일:\n" + "\n".join(failed_files[:5])
+                if len(failed_files) > 5:
+                    error_msg += f"\n... 및 {len(failed_files) - 5}개 더"
+            self.show_info("부분 성공", error_msg)
+        else:
+            error_msg = (f"폴더 '{folder_data['name']}'의 모든 파일 적용이 실패했습니다.\n"
+                       f"소요 시간: {time_str}")
+            if failed_files:
+                error_msg += f"\n\n실패한 파일:\n" + "\n".join(failed_files[:5])
+                if len(failed_files) > 5:
+                    error_msg += f"\n... 및 {len(failed_files) - 5}개 더"
+            self.show_error("불러오기 실패", error_msg)
     
     def maya_optimize(self):
         """Maya 옵티마이즈 실행"""
@@ -737,7 +776,8 @@ class SkinWeightImportUI(QtWidgets.QWidget):
 
 <h4>1. 웨이트 파일 준비</h4>
 • WeightIO 폴더에 저장된 웨이트 파일을 사용합니다<br>
-• 파일명은 "{메시명}_skinWeights.xml" 또는 "{메시명}_skinWeights.json" 형식이어야 합니다<br>
+• 파일명은 "{메시명}_skinWeights.xml", "{메시명}_skinWeights.json", "{메시명}_skinWeights.skwb" 또는 "{메시명}_skinWeights.skwz" 형식이어야 합니다<br>
+• 델타로 저장된 .skwz 파일은 기준 파일과 합쳐 자동으로 복원됩니다<br>
 • 폴더 단위로 여러 메시의 웨이트를 일괄 적용할 수 있습니다
 
 <h4>2. 폴더 선택</h4>
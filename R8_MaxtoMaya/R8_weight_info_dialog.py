@@ -4,8 +4,6 @@
 
 import os
 import time
-import json
-import xml.etree.ElementTree as ET
 import maya.cmds as cmds
 
 # PySide 임포트 (Maya 버전에 따라)
@@ -29,6 +27,10 @@ except ImportError:
 
 import maya.OpenMayaUI as omui
 
+from R8_MaxtoMaya.R8_weight_file_index import get_folder_index, get_file_metadata
+from R8_MaxtoMaya import R8_weight_import_pipeline
+from R8_MaxtoMaya.R8_weight_import_ui import WeightImportRunner
+
 
 def get_maya_main_window():
     """Maya 메인 윈도우를 반환합니다."""
@@ -66,6 +68,7 @@ class WeightInfoDialog(QtWidgets.QDialog):
             
         self.folder_data = folder_data
         self.parent_ui = parent  # 부모 UI 참조를 별도로 저장
+        self.apply_runner = None  # 진행 중인 웨이트 적용 (WeightImportRunner)
         
         # 윈도우 설정
         self.setWindowTitle(f"웨이트 정보 - {folder_data['name']}")
@@ -284,29 +287,33 @@ class WeightInfoDialog(QtWidgets.QDialog):
             
             skinweight_files = []
             
+            # 폴더 인덱스 사용 (변경되지 않은 파일은 다시 파싱하지 않음)
+            folder_index = get_folder_index(folder_path)
+            
             try:
-                for filename in os.listdir(folder_path):
-                    if ("_skinweight" in filename.lower() and 
-                        filename.lower().endswith(('.xml', '.json'))):
-                        file_path = os.path.join(folder_path, filename)
+                for filename in folder_index.list_files():
+                    file_path = os.path.join(folder_path, filename)
+                    
+                    try:
+                        metadata = folder_index.get_metadata(filename)
                         
-                        try:
-                            # 파일 정보 수집
-                            file_info = {
-                                'name': filename,
-                                'path': file_path,
-                                'size': os.path.getsize(file_path),
-                                'modified': os.path.getmtime(file_path),
-                                'format': os.path.splitext(filename)[1].upper()[1:],
-                                'mesh_name': self.extract_mesh_name(filename),
-                                'joint_count': self.get_joint_count(file_path)
-                            }
-                            skinweight_files.append(file_info)
-                            print(f"파일 로드 성공: {filename}")
-                        except Exception as file_error:
-                            print(f"파일 '{filename}' 로드 실패: {str(file_error)}")
-                            # 파일 로드에 실패해도 계속 진행
-                            continue
+                        # 파일 정보 수집
+                        file_info = {
+                            'name': filename,
+                            'path': file_path,
+                            'size': metadata['size'],
+                            'modified': metadata['mtime'],
+                            'format': metadata['format'],
+                            'mesh_name': self.extract_mesh_name(filename),
+                            'joint_count': len(metadata['influences'])
+                        }
+                        skinweight_files.append(file_info)
+                    except Exception as file_error:
+                        print(f"파일 '{filename}' 로드 실패: {str(file_error)}")
+                        # 파일 로드에 실패해도 계속 진행
+                        continue
+                
+                folder_index.save()
                 
                 # 수정 시간 기준으로 내림차순 정렬
                 skinweight_files.sort(key=lambda x: x['modified'], reverse=True)
@@ -368,26 +375,7 @@ class WeightInfoDialog(QtWidgets.QDialog):
     
     def get_joint_count(self, file_path):
         """파일에서 조인트 개수를 추출합니다."""
-        try:
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            if file_ext == '.xml':
-                tree = ET.parse(file_path)
-                root = tree.getroot()
-                influences_elem = root.find("Influences")
-                if influences_elem:
-                    return len(influences_elem.findall("Influence"))
-                    
-            elif file_ext == '.json':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'influences' in data:
-                        return len(data['influences'])
-                        
-        except Exception as e:
-            print(f"조인트 개수 추출 오류: {str(e)}")
-        
-        return 0
+        return len(self.get_joint_list(file_path))
     
     def format_file_size(self, size_bytes):
         """파일 크기를 읽기 쉬운 형식으로 변환합니다."""
@@ -435,28 +423,9 @@ class WeightInfoDialog(QtWidgets.QDialog):
             self.joint_table.setItem(i, 1, target_item)
     
     def get_joint_list(self, file_path):
-        """파일에서 조인트 목록을 추출합니다."""
+        """파일에서 조인트 목록을 추출합니다. (폴더 인덱스 캐시 사용)"""
         try:
-            file_ext = os.path.splitext(file_path)[1].lower()
-            
-            if file_ext == '.xml':
-                tree = ET.parse(file_path)
-                root = tree.getroot()
-                influences_elem = root.find("Influences")
-                if influences_elem:
-                    joints = []
-                    for inf_elem in influences_elem.findall("Influence"):
-                        joint_name = inf_elem.get("name")
-                        if joint_name:
-                            joints.append(joint_name)
-                    return joints
-                    
-            elif file_ext == '.json':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if 'influences' in data:
-                        return list(data['influences'])
-                        
+            return list(get_file_metadata(file_path)['influences'])
         except Exception as e:
             print(f"조인트 목록 추출 오류: {str(e)}")
         
@@ -525,10 +494,11 @@ class WeightInfoDialog(QtWidgets.QDialog):
     
     def apply_weight_to_selected_mesh(self):
         """조인트 리매핑을 적용하여 선택한 메시에 웨이트 스킨을 바로 적용합니다."""
+        # 이미 적용 중이면 무시 (진행 다이얼로그에서 취소)
+        if self.apply_runner is not None and self.apply_runner.is_running():
+            return
+        
         try:
-            # Core 클래스 임포트
-            from R8_MaxtoMaya.R8_weight_skin_IO import SkinWeightIOCore
-            
             # 선택된 파일 정보 가져오기
             selected_rows = self.files_table.selectionModel().selectedRows()
             if not selected_rows:
@@ -571,43 +541,65 @@ class WeightInfoDialog(QtWidgets.QDialog):
             # 조인트 리매핑 딕셔너리 생성
             joint_remap_dict = self.get_joint_mapping_dict()
             
-            # 파일 확장자에 따라 적절한 불러오기 함수 호출
             file_path = file_info['path']
-            file_ext = os.path.splitext(file_path)[1].lower()
             
             # 진행 상황 표시를 위한 다이얼로그
             progress_dialog = QtWidgets.QProgressDialog("웨이트 적용 중...", "취소", 0, 100, self)
             progress_dialog.setWindowModality(QtCore.Qt.WindowModal)
+            progress_dialog.setAutoClose(False)
+            progress_dialog.setAutoReset(False)
             progress_dialog.show()
             
             def update_progress(value, message=""):
                 progress_dialog.setValue(value)
                 progress_dialog.setLabelText(message)
-                QtWidgets.QApplication.processEvents()
-            
-            success = False
-            if file_ext == '.xml':
-                success = SkinWeightIOCore.import_weights_from_xml(
-                    file_path, mesh_name, update_progress, joint_remap_dict
-                )
-            elif file_ext == '.json':
-                success = SkinWeightIOCore.import_weights_from_json(
-                    file_path, mesh_name, update_progress, joint_remap_dict
-                )
-            
-            progress_dialog.close()
-            
-            if success:
-                remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)" if joint_remap_dict else ""
-                QtWidgets.QMessageBox.information(self, "적용 완료", 
-                    f"웨이트가 성공적으로 적용되었습니다.\n"
-                    f"파일: {file_info['name']}\n"
-                    f"메시: {mesh_name}{remap_info}")
-            else:
-                QtWidgets.QMessageBox.critical(self, "적용 실패", "웨이트 적용에 실패했습니다.")
+            
+            # 작업 스레드에서 파일을 파싱/디코딩하고 메인 스레드는 setWeights만 호출
+            job = R8_weight_import_pipeline.FolderWeightImport(
+                os.path.dirname(file_path), [os.path.basename(file_path)], joint_remap_dict,
+                progress_callback=update_progress, mesh_names={os.path.basename(file_path): mesh_name},
+                hold_session=False
+            )
+            self.apply_runner = WeightImportRunner(job, self)
+            self.apply_runner.finished.connect(
+                lambda report: self.on_apply_finished(report, progress_dialog, file_info, mesh_name, joint_remap_dict)
+            )
+            progress_dialog.canceled.connect(self.apply_runner.cancel)
+            
+            try:
+                self.apply_runner.start()
+            except Exception:
+                job.finish()
+                self.apply_runner = None
+                progress_dialog.close()
+                raise
                 
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "오류", f"웨이트 적용 중 오류가 발생했습니다:\n{str(e)}")
+    
+    def closeEvent(self, event):
+        """다이얼로그를 닫을 때 진행 중인 웨이트 적용을 취소합니다."""
+        if self.apply_runner is not None:
+            self.apply_runner.abandon()
+            self.apply_runner = None
+        super(WeightInfoDialog, self).closeEvent(event)
+    
+    def on_apply_finished(self, report, progress_dialog, file_info, mesh_name, joint_remap_dict):
+        """웨이트 적용이 끝나면 진행 다이얼로그를 닫고 결과를 표시합니다."""
+        self.apply_runner = None
+        progress_dialog.close()
+        
+        if report['succeeded']:
+            remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)" if joint_remap_dict else ""
+            QtWidgets.QMessageBox.information(self, "적용 완료", 
+                f"웨이트가 성공적으로 적용되었습니다.\n"
+                f"파일: {file_info['name']}\n"
+                f"메시: {mesh_name}{remap_info}")
+        elif report['cancelled']:
+            QtWidgets.QMessageBox.information(self, "적용 취소", "웨이트 적용이 취소되었습니다.")
+        else:
+            reason = f"\n{report['failed'][0]}" if report['failed'] else ""
+            QtWidgets.QMessageBox.critical(self, "적용 실패", f"웨이트 적용에 실패했습니다.{reason}")
 
     def apply_mapping(self):
         """조인트 매핑을 메인 UI에 적용하고 다이얼로그를 닫습니다."""
@@ -1,5 +1,5 @@
 """
-마야 스킨 웨이트 저장/불러오기 도구 (XML 지원)
+마야 스킨 웨이트 저장/불러오기 도구 (XML/JSON/바이너리/압축 지원)
 OpenMaya2 API를 사용한 고성능 버전
 
 from R8_MaxtoMaya import R8_weight_skin_IO
@@ -9,13 +9,15 @@ R8_weight_skin_IO.show_ui()
 """
 
 import os
+import sys
 import json
+import mmap
 import xml.etree.ElementTree as ET
 import time
+from array import array
 import maya.cmds as cmds
 import maya.mel as mel
 import maya.api.OpenMaya as om2
-import maya.api.OpenMayaAnim as om2Anim
 
 # R8_weight_transfer_core에서 기능 가져오기
 try:
@@ -25,6 +27,25 @@ except ImportError:
     TRANSFER_CORE_AVAILABLE = False
     print("Warning: R8_weight_transfer_core를 사용할 수 없습니다. 기본 기능만 사용됩니다.")
 
+# NumPy가 있으면 바이너리 웨이트를 벡터 연산으로 펼침 (없으면 Python 루프로 폴백)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from . import R8_log
+from . import R8_weight_skin_context
+# 웨이트 파일 메타데이터 인덱스 (폴더별 사이드카 캐시)
+from . import R8_weight_file_index
+from . import R8_weight_compressed
+from . import R8_weight_import_pipeline
+from . import R8_weight_export_pipeline
+from .R8_weight_file_index import WEIGHT_FILE_EXTENSIONS
+
+log = R8_log.get_logger(__name__)
+
 # PySide 임포트 (Maya 버전에 따라)
 try:
     from PySide6 import QtWidgets, QtCore, QtGui
@@ -69,6 +90,77 @@ except ImportError as e:
     UI_MODULES_AVAILABLE = False
 
 
+def _scatter_skwb_numpy(buffer, header, influence_index_map, file_vertex_count, vertex_count, influence_count):
+    """메모리 맵의 CSR 구간을 복사 없이 읽어 정규화한 뒤, 0으로 미리 할당한 setWeights용 배열에
+    0이 아닌 위치만 기록합니다. (작업량은 버텍스 x 인플루언스가 아닌 0이 아닌 웨이트 수에 비례)"""
+    offsets = np.frombuffer(buffer, dtype='<u4', count=file_vertex_count + 1, offset=header['offsets_offset']).astype(np.intp)
+    nnz = int(offsets[-1])
+    indices = np.frombuffer(buffer, dtype='<u4', count=nnz, offset=header['indices_offset'])
+    values = np.frombuffer(buffer, dtype='<f4', count=nnz, offset=header['weights_offset']).astype(np.float64)
+    
+    # 버텍스 웨이트 합계로 정규화 (리매핑으로 누락된 인플루언스 제외)
+    rows = np.repeat(np.arange(file_vertex_count, dtype=np.intp), np.diff(offsets))
+    maya_indices = np.asarray(influence_index_map, dtype=np.intp)[indices]
+    valid = maya_indices >= 0
+    totals = np.bincount(rows[valid], weights=values[valid], minlength=file_vertex_count)
+    keep = valid & (totals[rows] > 0.0001)
+    
+    # 리매핑으로 같은 위치에 모이는 웨이트는 합산
+    positions = rows[keep] * influence_count + maya_indices[keep]
+    positions, inverse = np.unique(positions, return_inverse=True)
+    normalized = np.bincount(inverse, weights=values[keep] / totals[rows[keep]], minlength=len(positions))
+    
+    weights = om2.MDoubleArray(vertex_count * influence_count, 0.0)
+    for position, weight in zip(positions.tolist(), normalized.tolist()):
+        weights[position] = weight
+    return weights
+
+
+def _scatter_skwb_python(buffer, header, influence_index_map, file_vertex_count, vertex_count, influence_count,
+                         progress_callback=None):
+    """NumPy가 없을 때 사용하는 버텍스 단위 루프 (0이 아닌 웨이트마다 Python에서 처리)"""
+    # setWeights에 넘길 MDoubleArray를 0으로 미리 할당
+    weights = om2.MDoubleArray(vertex_count * influence_count, 0.0)
+    
+    offsets = buffer[header['offsets_offset']:header['indices_offset']].cast('I')
+    indices = buffer[header['indices_offset']:header['weights_offset']].cast('I')
+    values = buffer[header['weights_offset']:header['weights_offset'] + header['nnz'] * 4].cast('f')
+    try:
+        # 빅 엔디언 환경에서는 복사 후 바이트 순서 변환
+        if sys.byteorder != 'little':
+            offsets, indices, values = array('I', offsets), array('I', indices), array('f', values)
+            for arr in (offsets, indices, values):
+                arr.byteswap()
+        
+        for vertex_id in range(file_vertex_count):
+            if progress_callback and vertex_id % 10000 == 0:
+                percent = 30 + int((vertex_id / file_vertex_count) * 45)
+                progress_callback(percent, f"웨이트 데이터 적용 중... ({vertex_id}/{file_vertex_count})")
+            
+            start, end = offsets[vertex_id], offsets[vertex_id + 1]
+            if start == end:
+                continue
+            
+            # 버텍스 웨이트 합계로 정규화 (리매핑으로 누락된 인플루언스 제외)
+            total_weight = 0.0
+            for k in range(start, end):
+                if influence_index_map[indices[k]] >= 0:
+                    total_weight += values[k]
+            if total_weight <= 0.0001:
+                continue
+            
+            row_base = vertex_id * influence_count
+            for k in range(start, end):
+                maya_inf_index = influence_index_map[indices[k]]
+                if maya_inf_index >= 0:
+                    weights[row_base + maya_inf_index] += values[k] / total_weight
+    finally:
+        for view in (offsets, indices, values):
+            if isinstance(view, memoryview):
+                view.release()
+    return weights
+
+
 def get_maya_main_window():
     """Maya 메인 윈도우를 반환합니다."""
     main_window_ptr = omui.MQtUtil.mainWindow()
@@ -102,7 +194,7 @@ class SkinWeightIOCore:
         
         try:
             for filename in os.listdir(weightio_path):
-                if filename.lower().endswith(('.xml', '.json')):
+                if filename.lower().endswith(WEIGHT_FILE_EXTENSIONS):
                     file_path = os.path.join(weightio_path, filename)
                     file_size = os.path.getsize(file_path) / 1024  # KB
                     file_mtime = os.path.getmtime(file_path)
@@ -134,15 +226,10 @@ class SkinWeightIOCore:
                 
                 # 폴더인지 확인
                 if os.path.isdir(item_path):
-                    # 폴더 내 _skinWeights 파일 개수 확인
-                    skinweight_files = []
-                    try:
-                        for filename in os.listdir(item_path):
-                            if ("_skinweight" in filename.lower() and 
-                                filename.lower().endswith(('.xml', '.json'))):
-                                skinweight_files.append(filename)
-                    except Exception as e:
-                        print(f"WeightIO 폴더 읽기 오류: {str(e)}")
+                    # _skinWeights 파일 목록 (폴더 인덱스에서 삭제된 파일 항목 정리)
+                    folder_index = R8_weight_file_index.get_folder_index(item_path)
+                    skinweight_files = folder_index.list_files()
+                    folder_index.save()
 
                     # 폴더 수정 시간 가져오기
                     folder_mtime = os.path.getmtime(item_path)
@@ -189,8 +276,11 @@ class SkinWeightIOCore:
         return skin_clusters[0] if skin_clusters else None
     
     @staticmethod
-    def optimize_maya_performance():
-        """Maya 성능 최적화 설정을 적용합니다."""
+    def optimize_maya_performance(evaluation=True):
+        """Maya 성능 최적화 설정을 적용합니다.
+        
+        evaluation=False면 평가 모드는 바꾸지 않습니다. (호출하는 쪽이 평가 모드를 따로 유지할 때)
+        """
         # 뷰포트 업데이트 중지
         cmds.refresh(suspend=True)
         
@@ -199,8 +289,10 @@ class SkinWeightIOCore:
         cmds.autoKeyframe(state=False)
         
         # 평가 모드를 DG로 변경 (더 빠른 스킨 웨이트 처리)
-        evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
-        cmds.evaluationManager(mode='off')
+        evaluation_mode = None
+        if evaluation:
+            evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+            cmds.evaluationManager(mode='off')
         
         return {
             'auto_key_state': auto_key_state,
@@ -217,11 +309,17 @@ class SkinWeightIOCore:
         cmds.autoKeyframe(state=state_dict['auto_key_state'])
         
         # 평가 모드 복원
-        cmds.evaluationManager(mode=state_dict['evaluation_mode'])
+        if state_dict['evaluation_mode'] is not None:
+            cmds.evaluationManager(mode=state_dict['evaluation_mode'])
     
     @staticmethod
     def batch_import_weights_from_xml(xml_path=None, mesh_name=None, progress_callback=None, batch_size=5000, joint_remap_dict=None):
-        """배치 처리를 통한 고성능 XML 웨이트 불러오기"""
+        """배치 처리를 통한 고성능 XML 웨이트 불러오기 (iterparse 스트리밍)
+        
+        XML 전체를 메모리에 올리지 않고 <Influences>를 먼저 읽은 뒤
+        <Vertex> 요소를 batch_size 단위로 읽고 적용한 즉시 해제하므로
+        파일 크기와 관계없이 최대 메모리 사용량이 일정합니다.
+        """
         start_time = time.time()
         
         # Maya 성능 최적화
@@ -244,129 +342,132 @@ class SkinWeightIOCore:
                 xml_path = xml_path[0]
             
             if progress_callback:
-                progress_callback(5, "XML 파일 파싱 중...")
-            
-            # XML 파일 파싱
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
-            
-            # 메시 이름 확인
-            target_mesh = mesh_name if mesh_name else root.get("mesh")
-            if not cmds.objExists(target_mesh):
-                raise ValueError(f"메시 '{target_mesh}'를 찾을 수 없습니다.")
-            
-            # 메시의 shape 노드 가져오기
-            shapes = cmds.listRelatives(target_mesh, shapes=True, type="mesh")
-            if not shapes:
-                raise ValueError(f"{target_mesh}는 메시가 아닙니다.")
-            
-            mesh_shape = shapes[0]
-            
-            # 스킨 클러스터 확인
-            skin_cluster = SkinWeightIOCore.get_skin_cluster(mesh_shape)
-            if not skin_cluster:
-                raise ValueError(f"{mesh_shape}에 스킨 클러스터가 없습니다.")
-            
-            if progress_callback:
-                progress_callback(10, "OpenMaya2 API 초기화 중...")
-            
-            # OpenMaya2 API 설정
-            sel = om2.MSelectionList()
-            sel.add(target_mesh)
-            sel.add(skin_cluster)
-            
-            mesh_dag = sel.getDagPath(0)
-            skin_obj = sel.getDependNode(1)
-            skin_fn = om2Anim.MFnSkinCluster(skin_obj)
+                progress_callback(5, "XML 스트리밍 파싱 시작...")
             
-            # 인플루언스 정보 가져오기
-            current_influences = skin_fn.influenceObjects()
-            current_influence_names = [current_influences[i].partialPathName() for i in range(len(current_influences))]
+            file_size = max(os.path.getsize(xml_path), 1)
             
-            # XML 인플루언스 매핑 (조인트 리매핑 적용)
-            influences_elem = root.find("Influences")
+            context = None
+            skin_cluster = None
             influence_index_map = {}
-            for inf_elem in influences_elem.findall("Influence"):
-                xml_index = int(inf_elem.get("index"))
-                joint_name = inf_elem.get("name")
-                
-                # 조인트 리매핑 적용
-                if joint_remap_dict and joint_name in joint_remap_dict:
-                    joint_name = joint_remap_dict[joint_name]
-                
-                if joint_name in current_influence_names:
-                    maya_index = current_influence_names.index(joint_name)
-                    influence_index_map[xml_index] = maya_index
-            
-            # 메시 정보
-            vertex_count = cmds.polyEvaluate(target_mesh, vertex=True)
-            influence_count = len(current_influence_names)
-            
-            if progress_callback:
-                progress_callback(15, f"배치 처리 준비 중... (배치 크기: {batch_size})")
-            
-            # 정규화 일시 중지
-            cmds.setAttr(f"{skin_cluster}.normalizeWeights", 0)
+            influence_count = 0
+            vertex_count = 0
+            total_vertices = 0
+            batch_count = 0
             
-            # 웨이트 데이터 파싱
-            weights_elem = root.find("Weights")
-            vertex_elements = weights_elem.findall("Vertex")
-            total_vertices = len(vertex_elements)
+            weights_elem = None
+            batch_vertices = []  # [(vertex_id, [(xml_inf_index, weight_value), ...]), ...]
             
-            # 배치별로 처리
-            for batch_start in range(0, total_vertices, batch_size):
-                batch_end = min(batch_start + batch_size, total_vertices)
-                batch_vertices = vertex_elements[batch_start:batch_end]
-                
-                if progress_callback:
-                    percent = 15 + int((batch_start / total_vertices) * 70)
-                    progress_callback(percent, f"배치 {batch_start//batch_size + 1} 처리 중... ({batch_start}-{batch_end}/{total_vertices})")
-                
-                # 배치용 웨이트 배열 생성
-                batch_size_actual = len(batch_vertices)
+            def apply_batch():
+                """모아둔 버텍스 배치를 setWeights로 적용합니다."""
+                batch_weights = om2.MDoubleArray(len(batch_vertices) * influence_count, 0.0)
                 
-                # 배열 크기 미리 계산
-                total_batch_weights = batch_size_actual * influence_count
+                for local_idx, (vertex_id, vertex_weights) in enumerate(batch_vertices):
+                    row_base = local_idx * influence_count
+                    for xml_inf_index, weight_value in vertex_weights:
+                        maya_inf_index = influence_index_map.get(xml_inf_index)
+                        if maya_inf_index is not None:
+                            batch_weights[row_base + maya_inf_index] = weight_value
                 
-                # Python 리스트로 먼저 생성
-                batch_weights_list = [0.0] * total_batch_weights
-                
-                batch_vertex_ids = []
-                
-                # 배치 내 버텍스 처리
-                for local_idx, vertex_elem in enumerate(batch_vertices):
-                    vertex_id = int(vertex_elem.get("id"))
-                    batch_vertex_ids.append(vertex_id)
+                # 배치 컴포넌트는 addElements 한 번으로 생성
+                context.set_vertex_weights([vertex_id for vertex_id, _ in batch_vertices], batch_weights, normalize=False)
+            
+            with open(xml_path, 'rb') as xml_file:
+                for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+                    if event == "start":
+                        if elem.tag == "SkinWeights":
+                            # 메시 이름 확인
+                            target_mesh = mesh_name if mesh_name else elem.get("mesh")
+                            if not target_mesh or not cmds.objExists(target_mesh):
+                                raise ValueError(f"메시 '{target_mesh}'를 찾을 수 없습니다.")
+                            
+                            # 메시의 shape 노드 가져오기
+                            shapes = cmds.listRelatives(target_mesh, shapes=True, type="mesh")
+                            if not shapes:
+                                raise ValueError(f"{target_mesh}는 메시가 아닙니다.")
+                            
+                            # 스킨 클러스터 확인
+                            skin_cluster = SkinWeightIOCore.get_skin_cluster(shapes[0])
+                            if not skin_cluster:
+                                raise ValueError(f"{shapes[0]}에 스킨 클러스터가 없습니다.")
+                            
+                            if progress_callback:
+                                progress_callback(10, "OpenMaya2 API 초기화 중...")
+                            
+                            # 캐시된 스킨 컨텍스트
+                            context = R8_weight_skin_context.get_skin_context(target_mesh, skin_cluster)
+                            
+                            # 메시 정보
+                            vertex_count = context.vertex_count
+                        
+                        elif elem.tag == "Weights":
+                            if context is None or not influence_count:
+                                raise ValueError("XML에 <Influences> 정보가 <Weights>보다 먼저 있어야 합니다.")
+                            
+                            weights_elem = elem
+                            
+                            if progress_callback:
+                                progress_callback(15, f"배치 처리 준비 중... (배치 크기: {batch_size})")
+                            
+                            # 정규화 일시 중지
+                            cmds.setAttr(f"{skin_cluster}.normalizeWeights", 0)
+                        continue
                     
-                    # 웨이트 설정
-                    for weight_elem in vertex_elem.findall("Weight"):
-                        xml_inf_index = int(weight_elem.get("influence"))
-                        weight_value = float(weight_elem.get("value"))
+                    if elem.tag == "Vertex":
+                        if weights_elem is None:
+                            # 배치마다 해제할 부모가 없고 정규화도 중지되지 않은 상태
+                            raise ValueError("XML 형식 오류: <Vertex>는 <Weights> 안에 있어야 합니다.")
                         
-                        if xml_inf_index in influence_index_map:
-                            maya_inf_index = influence_index_map[xml_inf_index]
-                            if 0 <= maya_inf_index < influence_count:
-                                array_index = local_idx * influence_count + maya_inf_index
-                                if 0 <= array_index < total_batch_weights:
-                                    batch_weights_list[array_index] = weight_value
-                
-                # Python 리스트를 MDoubleArray로 변환
-                batch_weights = om2.MDoubleArray(batch_weights_list)
-                
-                # 배치 컴포넌트 생성
-                fn_comp = om2.MFnSingleIndexedComponent()
-                batch_comp = fn_comp.create(om2.MFn.kMeshVertComponent)
-                for vertex_id in batch_vertex_ids:
-                    fn_comp.addElement(vertex_id)
-                
-                # 배치 웨이트 적용
-                # 인플루언스 인덱스 배열 생성
-                influence_indices = om2.MIntArray()
-                for i in range(influence_count):
-                    influence_indices.append(i)
+                        vertex_id = int(elem.get("id"))
+                        if vertex_id < vertex_count:
+                            batch_vertices.append((vertex_id, [
+                                (int(weight_elem.get("influence")), float(weight_elem.get("value")))
+                                for weight_elem in elem.iter("Weight")
+                            ]))
+                        
+                        if len(batch_vertices) >= batch_size:
+                            apply_batch()
+                            total_vertices += len(batch_vertices)
+                            batch_count += 1
+                            batch_vertices = []
+                            
+                            # 처리한 버텍스 요소 해제 (트리에 누적되지 않도록)
+                            weights_elem.clear()
+                            
+                            if progress_callback:
+                                bytes_read = xml_file.tell()
+                                elapsed = max(time.time() - start_time, 1e-6)
+                                mb_per_sec = bytes_read / (1024 * 1024) / elapsed
+                                percent = 15 + int(min(bytes_read / file_size, 1.0) * 70)
+                                progress_callback(percent, f"배치 {batch_count} 처리 중... ({total_vertices}개 버텍스, {mb_per_sec:.1f} MB/s)")
+                    
+                    elif elem.tag == "Influences":
+                        # 현재 스킨 클러스터의 인플루언스 정보 가져오기
+                        current_index_lookup = context.influence_index
+                        influence_count = context.influence_count
+                        
+                        # XML 인플루언스 매핑 (조인트 리매핑 적용)
+                        for inf_elem in elem.findall("Influence"):
+                            xml_index = int(inf_elem.get("index"))
+                            joint_name = inf_elem.get("name")
+                            
+                            # 조인트 리매핑 적용
+                            if joint_remap_dict and joint_name in joint_remap_dict:
+                                joint_name = joint_remap_dict[joint_name]
+                            
+                            if joint_name in current_index_lookup:
+                                influence_index_map[xml_index] = current_index_lookup[joint_name]
+                        
+                        elem.clear()
                 
-                # 배치 웨이트 적용 - 올바른 매개변수 순서
-                skin_fn.setWeights(mesh_dag, batch_comp, influence_indices, batch_weights, False)
+                # 남은 버텍스 처리
+                if batch_vertices:
+                    apply_batch()
+                    total_vertices += len(batch_vertices)
+                    batch_count += 1
+                    batch_vertices = []
+            
+            if skin_cluster is None:
+                raise ValueError(f"올바른 스킨 웨이트 XML 파일이 아닙니다: {xml_path}")
             
             # 정규화 활성화
             if progress_callback:
@@ -375,14 +476,16 @@ class SkinWeightIOCore:
             cmds.setAttr(f"{skin_cluster}.normalizeWeights", 1)
             cmds.skinCluster(skin_cluster, edit=True, forceNormalizeWeights=True)
             
+            end_time = time.time()
+            mb_per_sec = file_size / (1024 * 1024) / max(end_time - start_time, 1e-6)
+            
             if progress_callback:
-                progress_callback(100, "배치 불러오기 완료!")
+                progress_callback(100, f"배치 불러오기 완료! ({mb_per_sec:.1f} MB/s)")
             
-            end_time = time.time()
             remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)" if joint_remap_dict else ""
-            print(f"고성능 배치 처리로 스킨 웨이트가 성공적으로 불러와졌습니다: {xml_path}{remap_info}")
-            print(f"실행 시간: {end_time - start_time:.2f}초")
-            print(f"배치 크기: {batch_size}, 총 배치 수: {(total_vertices + batch_size - 1) // batch_size}")
+            log.summary(f"고성능 배치 처리로 스킨 웨이트가 성공적으로 불러와졌습니다: {xml_path}{remap_info}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초 ({mb_per_sec:.1f} MB/s)")
+            log.detail(f"배치 크기: {batch_size}, 총 배치 수: {batch_count}, 총 버텍스 수: {total_vertices}")
             
             return True
             
@@ -414,84 +517,16 @@ class SkinWeightIOCore:
             if progress_callback:
                 progress_callback(5, "OpenMaya2 API 초기화 중...")
             
-            # Maya API 2.0 사용하여 효율적으로 데이터 추출
-            sel = om2.MSelectionList()
-            sel.add(mesh_transform)
-            sel.add(skin_cluster)
-            
-            mesh_dag = sel.getDagPath(0)
-            skin_obj = sel.getDependNode(1)
-            skin_fn = om2Anim.MFnSkinCluster(skin_obj)
-            
-            # 인플루언스 정보 가져오기
-            influences = skin_fn.influenceObjects()
-            influence_names = [influences[i].partialPathName() for i in range(len(influences))]
-            
-            if progress_callback:
-                progress_callback(15, f"인플루언스 {len(influence_names)}개 확인됨...")
-            
-            # 버텍스 개수 가져오기
-            vertex_count = cmds.polyEvaluate(mesh_transform, vertex=True)
-            
-            # 모든 버텍스에 대한 컴포넌트 생성
-            fn_comp = om2.MFnSingleIndexedComponent()
-            full_comp = fn_comp.create(om2.MFn.kMeshVertComponent)
-            for i in range(vertex_count):
-                fn_comp.addElement(i)
-            
+            # 캐시된 스킨 컨텍스트로 웨이트 버퍼 읽기 (배치 내보내기와 같은 직렬화 사용)
             if progress_callback:
-                progress_callback(25, f"버텍스 웨이트 데이터 로딩 중... (총 {vertex_count}개)")
+                progress_callback(25, "버텍스 웨이트 데이터 로딩 중...")
             
-            # 모든 웨이트 데이터를 한 번에 가져오기
-            weights, influence_count = skin_fn.getWeights(mesh_dag, full_comp)
+            data = R8_weight_export_pipeline.read_mesh_weights(mesh_transform, skin_cluster)
             
             if progress_callback:
                 progress_callback(40, "XML 구조 생성 중...")
             
-            # XML 루트 요소 생성
-            root = ET.Element("SkinWeights")
-            root.set("mesh", mesh_transform)
-            root.set("skinCluster", skin_cluster)
-            root.set("vertexCount", str(vertex_count))
-            
-            # 인플루언스 정보 추가
-            influences_elem = ET.SubElement(root, "Influences")
-            for i, influence in enumerate(influence_names):
-                inf_elem = ET.SubElement(influences_elem, "Influence")
-                inf_elem.set("index", str(i))
-                inf_elem.set("name", influence)
-            
-            # 웨이트 데이터 추가
-            weights_elem = ET.SubElement(root, "Weights")
-            
-            # 웨이트를 2차원 배열로 재구성
-            influence_per_vertex = len(influence_names)
-            
-            for vertex_id in range(vertex_count):
-                # 진행 상황 업데이트
-                if progress_callback and vertex_id % 500 == 0:
-                    percent = 40 + int((vertex_id / vertex_count) * 50)
-                    progress_callback(percent, f"XML 웨이트 데이터 생성 중... ({vertex_id}/{vertex_count})")
-                
-                # 해당 버텍스의 웨이트 추출
-                start_idx = vertex_id * influence_per_vertex
-                vertex_weights = weights[start_idx:start_idx + influence_per_vertex]
-                
-                # 0이 아닌 웨이트만 저장
-                vertex_elem = ET.SubElement(weights_elem, "Vertex")
-                vertex_elem.set("id", str(vertex_id))
-                
-                has_weights = False
-                for inf_idx, weight in enumerate(vertex_weights):
-                    if weight > 0.0001:  # 매우 작은 값 무시
-                        weight_elem = ET.SubElement(vertex_elem, "Weight")
-                        weight_elem.set("influence", str(inf_idx))
-                        weight_elem.set("value", str(weight))
-                        has_weights = True
-                
-                # 웨이트가 없는 버텍스는 제거
-                if not has_weights:
-                    weights_elem.remove(vertex_elem)
+            content = R8_weight_export_pipeline.serialize_xml(data, progress_callback)
             
             # 파일 경로 설정
             if not export_path:
@@ -502,15 +537,14 @@ class SkinWeightIOCore:
                 progress_callback(90, "XML 파일 저장 중...")
             
             # XML 파일로 저장
-            tree = ET.ElementTree(root)
-            tree.write(export_path, encoding='utf-8', xml_declaration=True)
+            R8_weight_export_pipeline.write_serialized(export_path, content)
             
             if progress_callback:
                 progress_callback(100, "내보내기 완료!")
             
             end_time = time.time()
-            print(f"스킨 웨이트가 성공적으로 저장되었습니다: {export_path}")
-            print(f"실행 시간: {end_time - start_time:.2f}초")
+            log.summary(f"스킨 웨이트가 성공적으로 저장되었습니다: {export_path}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초")
             
             return export_path
             
@@ -540,69 +574,16 @@ class SkinWeightIOCore:
             if progress_callback:
                 progress_callback(5, "OpenMaya2 API 초기화 중...")
             
-            # Maya API 2.0 사용
-            sel = om2.MSelectionList()
-            sel.add(mesh_transform)
-            sel.add(skin_cluster)
-            
-            mesh_dag = sel.getDagPath(0)
-            skin_obj = sel.getDependNode(1)
-            skin_fn = om2Anim.MFnSkinCluster(skin_obj)
-            
-            # 인플루언스 정보 가져오기
-            influences = skin_fn.influenceObjects()
-            influence_names = [influences[i].partialPathName() for i in range(len(influences))]
-            
-            if progress_callback:
-                progress_callback(15, f"인플루언스 {len(influence_names)}개 확인됨...")
-            
-            # 버텍스 개수 가져오기
-            vertex_count = cmds.polyEvaluate(mesh_transform, vertex=True)
-            
-            # 모든 버텍스에 대한 컴포넌트 생성
-            fn_comp = om2.MFnSingleIndexedComponent()
-            full_comp = fn_comp.create(om2.MFn.kMeshVertComponent)
-            for i in range(vertex_count):
-                fn_comp.addElement(i)
-            
+            # 캐시된 스킨 컨텍스트로 웨이트 버퍼 읽기 (배치 내보내기와 같은 직렬화 사용)
             if progress_callback:
-                progress_callback(25, f"버텍스 웨이트 데이터 로딩 중... (총 {vertex_count}개)")
+                progress_callback(25, "버텍스 웨이트 데이터 로딩 중...")
             
-            # 모든 웨이트 데이터를 한 번에 가져오기
-            weights, influence_count = skin_fn.getWeights(mesh_dag, full_comp)
+            data = R8_weight_export_pipeline.read_mesh_weights(mesh_transform, skin_cluster)
             
             if progress_callback:
                 progress_callback(40, "JSON 데이터 구조 생성 중...")
             
-            # JSON 데이터 구조 생성
-            weight_data = {
-                "mesh_name": mesh_transform,
-                "skin_cluster": skin_cluster,
-                "influences": influence_names,
-                "weights": {}
-            }
-            
-            # 웨이트를 2차원 배열로 재구성
-            influence_per_vertex = len(influence_names)
-            
-            for vertex_id in range(vertex_count):
-                # 진행 상황 업데이트
-                if progress_callback and vertex_id % 500 == 0:
-                    percent = 40 + int((vertex_id / vertex_count) * 50)
-                    progress_callback(percent, f"JSON 웨이트 데이터 생성 중... ({vertex_id}/{vertex_count})")
-                
-                # 해당 버텍스의 웨이트 추출
-                start_idx = vertex_id * influence_per_vertex
-                vertex_weights = weights[start_idx:start_idx + influence_per_vertex]
-                
-                # 0이 아닌 웨이트만 저장
-                vertex_weight_dict = {}
-                for inf_idx, weight in enumerate(vertex_weights):
-                    if weight > 0.0001:  # 매우 작은 값 무시
-                        vertex_weight_dict[influence_names[inf_idx]] = weight
-                
-                if vertex_weight_dict:
-                    weight_data["weights"][vertex_id] = vertex_weight_dict
+            content = R8_weight_export_pipeline.serialize_json(data, progress_callback)
             
             # 파일 경로 설정
             if not export_path:
@@ -613,15 +594,14 @@ class SkinWeightIOCore:
                 progress_callback(90, "JSON 파일 저장 중...")
             
             # JSON 파일로 저장
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(weight_data, f, indent=2, ensure_ascii=False)
+            R8_weight_export_pipeline.write_serialized(export_path, content)
             
             if progress_callback:
                 progress_callback(100, "내보내기 완료!")
             
             end_time = time.time()
-            print(f"스킨 웨이트가 성공적으로 저장되었습니다: {export_path}")
-            print(f"실행 시간: {end_time - start_time:.2f}초")
+            log.summary(f"스킨 웨이트가 성공적으로 저장되었습니다: {export_path}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초")
             
             return export_path
             
@@ -730,34 +710,23 @@ class SkinWeightIOCore:
             if progress_callback:
                 progress_callback(25, "OpenMaya2 API 초기화 중...")
             
-            # OpenMaya2 API 설정
-            sel = om2.MSelectionList()
-            sel.add(target_mesh)
-            sel.add(skin_cluster)
-            
-            mesh_dag = sel.getDagPath(0)
-            skin_obj = sel.getDependNode(1)
-            skin_fn = om2Anim.MFnSkinCluster(skin_obj)
-            
-            # 현재 스킨 클러스터의 인플루언스 정보 가져오기
-            current_influences = skin_fn.influenceObjects()
-            current_influence_names = [current_influences[i].partialPathName() for i in range(len(current_influences))]
+            # 캐시된 스킨 컨텍스트 (인플루언스를 추가했으면 다시 만들어짐)
+            context = R8_weight_skin_context.get_skin_context(target_mesh, skin_cluster)
             
             # 인플루언스 인덱스 매핑 생성
             influence_index_map = {}
             for xml_index, joint_name in influence_map.items():
-                if joint_name in current_influence_names:
-                    maya_index = current_influence_names.index(joint_name)
-                    influence_index_map[xml_index] = maya_index
+                if joint_name in context.influence_index:
+                    influence_index_map[xml_index] = context.influence_index[joint_name]
             
             # 메시의 버텍스 개수 확인
-            vertex_count = cmds.polyEvaluate(target_mesh, vertex=True)
+            vertex_count = context.vertex_count
             
             if progress_callback:
                 progress_callback(30, "웨이트 데이터 구조 준비 중...")
             
             # 웨이트 배열 초기화 (vertex_count x influence_count)
-            influence_count = len(current_influence_names)
+            influence_count = context.influence_count
             
             # MDoubleArray 생성 - 안전한 방법으로 초기화
             total_weights = vertex_count * influence_count
@@ -818,19 +787,8 @@ class SkinWeightIOCore:
             # 정규화 일시 중지
             cmds.setAttr(f"{skin_cluster}.normalizeWeights", 0)
             
-            # 모든 버텍스에 대한 컴포넌트 생성
-            fn_comp = om2.MFnSingleIndexedComponent()
-            full_comp = fn_comp.create(om2.MFn.kMeshVertComponent)
-            for i in range(vertex_count):
-                fn_comp.addElement(i)
-            
-            # 인플루언스 인덱스 배열 생성
-            influence_indices = om2.MIntArray()
-            for i in range(influence_count):
-                influence_indices.append(i)
-            
-            # OpenMaya2 API를 사용하여 모든 웨이트를 한 번에 설정 - 올바른 매개변수 순서
-            skin_fn.setWeights(mesh_dag, full_comp, influence_indices, om2.MDoubleArray(weights_list), False)
+            # 캐시된 전체 컴포넌트 / 인플루언스 인덱스로 모든 웨이트를 한 번에 설정
+            context.set_weights(weights_list, normalize=False)
             
             # 정규화 활성화
             if progress_callback:
@@ -844,8 +802,8 @@ class SkinWeightIOCore:
             
             end_time = time.time()
             remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)" if joint_remap_dict else ""
-            print(f"스킨 웨이트가 성공적으로 불러와졌습니다: {xml_path}{remap_info}")
-            print(f"실행 시간: {end_time - start_time:.2f}초")
+            log.summary(f"스킨 웨이트가 성공적으로 불러와졌습니다: {xml_path}{remap_info}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초")
             
             return True
             
@@ -951,27 +909,17 @@ class SkinWeightIOCore:
             if progress_callback:
                 progress_callback(25, "OpenMaya2 API 초기화 중...")
             
-            # OpenMaya2 API 설정
-            sel = om2.MSelectionList()
-            sel.add(target_mesh)
-            sel.add(skin_cluster)
-            
-            mesh_dag = sel.getDagPath(0)
-            skin_obj = sel.getDependNode(1)
-            skin_fn = om2Anim.MFnSkinCluster(skin_obj)
-            
-            # 현재 스킨 클러스터의 인플루언스 정보 가져오기
-            current_influences = skin_fn.influenceObjects()
-            current_influence_names = [current_influences[i].partialPathName() for i in range(len(current_influences))]
+            # 캐시된 스킨 컨텍스트 (인플루언스를 추가했으면 다시 만들어짐)
+            context = R8_weight_skin_context.get_skin_context(target_mesh, skin_cluster)
             
             # 메시의 버텍스 개수 확인
-            vertex_count = cmds.polyEvaluate(target_mesh, vertex=True)
+            vertex_count = context.vertex_count
             
             if progress_callback:
                 progress_callback(30, "웨이트 데이터 구조 준비 중...")
             
             # 웨이트 배열 초기화 (vertex_count x influence_count)
-            influence_count = len(current_influence_names)
+            influence_count = context.influence_count
             total_weights = vertex_count * influence_count
             
             # Python 리스트로 먼저 생성
@@ -1005,8 +953,8 @@ class SkinWeightIOCore:
                     if joint_remap_dict and joint_name in joint_remap_dict:
                         joint_name = joint_remap_dict[joint_name]
                     
-                    if joint_name in current_influence_names:
-                        maya_inf_index = current_influence_names.index(joint_name)
+                    maya_inf_index = context.influence_index.get(joint_name)
+                    if maya_inf_index is not None:
                         if 0 <= maya_inf_index < influence_count:
                             vertex_weight_values[maya_inf_index] = float(weight_value)
                             total_weight += float(weight_value)
@@ -1029,19 +977,218 @@ class SkinWeightIOCore:
             # 정규화 일시 중지
             cmds.setAttr(f"{skin_cluster}.normalizeWeights", 0)
             
-            # 모든 버텍스에 대한 컴포넌트 생성
-            fn_comp = om2.MFnSingleIndexedComponent()
-            full_comp = fn_comp.create(om2.MFn.kMeshVertComponent)
-            for i in range(vertex_count):
-                fn_comp.addElement(i)
+            # 캐시된 전체 컴포넌트 / 인플루언스 인덱스로 모든 웨이트를 한 번에 설정
+            context.set_weights(weights_list, normalize=False)
+            
+            # 정규화 활성화
+            if progress_callback:
+                progress_callback(95, "스킨 웨이트 정규화 중...")
+            
+            cmds.setAttr(f"{skin_cluster}.normalizeWeights", 1)
+            cmds.skinCluster(skin_cluster, edit=True, forceNormalizeWeights=True)
+            
+            if progress_callback:
+                progress_callback(100, "불러오기 완료!")
             
-            # 인플루언스 인덱스 배열 생성
-            influence_indices = om2.MIntArray()
-            for i in range(influence_count):
-                influence_indices.append(i)
+            end_time = time.time()
+            remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)" if joint_remap_dict else ""
+            log.summary(f"스킨 웨이트가 성공적으로 불러와졌습니다: {json_path}{remap_info}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초")
             
-            # OpenMaya2 API를 사용하여 모든 웨이트를 한 번에 설정
-            skin_fn.setWeights(mesh_dag, full_comp, influence_indices, om2.MDoubleArray(weights_list), False)
+            return True
+            
+        except Exception as e:
+            if progress_callback:
+                progress_callback(0, f"오류: {str(e)}")
+            raise e
+        finally:
+            cmds.evaluationManager(mode=evaluation_mode)
+            cmds.undoInfo(state=undo_state)
+
+    @staticmethod
+    def read_skwb_header(file_path):
+        """바이너리(.skwb) 파일의 헤더와 이름 테이블만 읽어 반환합니다."""
+        return R8_weight_file_index.read_skwb_header(file_path)
+    
+    @staticmethod
+    def export_weights_to_binary(mesh_name, export_path="", progress_callback=None):
+        """OpenMaya2 API를 사용하여 스킨 웨이트를 바이너리(.skwb) 파일로 저장합니다."""
+        start_time = time.time()
+        
+        # 언도 비활성화
+        undo_state = cmds.undoInfo(query=True, state=True)
+        cmds.undoInfo(state=False)
+        
+        try:
+            mesh_transform, mesh_shape = SkinWeightIOCore.get_selected_mesh()
+            skin_cluster = SkinWeightIOCore.get_skin_cluster(mesh_shape)
+            
+            if not skin_cluster:
+                raise ValueError(f"{mesh_shape}에 스킨 클러스터가 없습니다.")
+            
+            if progress_callback:
+                progress_callback(5, "OpenMaya2 API 초기화 중...")
+            
+            # 캐시된 스킨 컨텍스트로 웨이트 버퍼 읽기 (배치 내보내기와 같은 직렬화 사용)
+            if progress_callback:
+                progress_callback(25, "버텍스 웨이트 데이터 로딩 중...")
+            
+            data = R8_weight_export_pipeline.read_mesh_weights(mesh_transform, skin_cluster)
+            
+            if progress_callback:
+                progress_callback(40, "CSR 배열 생성 중...")
+            
+            content = R8_weight_export_pipeline.serialize_binary(data)
+            
+            # 파일 경로 설정
+            if not export_path:
+                weightio_folder = SkinWeightIOCore.get_weightio_folder()
+                export_path = os.path.join(weightio_folder, f"{mesh_transform}_skinWeights.skwb")
+            
+            if progress_callback:
+                progress_callback(90, "바이너리 파일 저장 중...")
+            
+            R8_weight_export_pipeline.write_serialized(export_path, content)
+            
+            if progress_callback:
+                progress_callback(100, "내보내기 완료!")
+            
+            end_time = time.time()
+            log.summary(f"스킨 웨이트가 성공적으로 저장되었습니다: {export_path}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초 ({len(content)} bytes)")
+            
+            return export_path
+            
+        except Exception as e:
+            if progress_callback:
+                progress_callback(0, f"오류: {str(e)}")
+            raise e
+        finally:
+            cmds.undoInfo(state=undo_state)
+    
+    @staticmethod
+    def import_weights_from_binary(skwb_path=None, mesh_name=None, progress_callback=None, joint_remap_dict=None):
+        """바이너리(.skwb) 파일을 메모리 맵으로 읽어 스킨 웨이트를 적용합니다. (OpenMaya2 최적화)"""
+        start_time = time.time()
+        
+        # 언도 비활성화
+        undo_state = cmds.undoInfo(query=True, state=True)
+        cmds.undoInfo(state=False)
+        
+        # 평가 모드 변경
+        evaluation_mode = cmds.evaluationManager(query=True, mode=True)[0]
+        cmds.evaluationManager(mode='off')
+        
+        try:
+            if progress_callback:
+                progress_callback(0, "바이너리 파일 불러오기 준비 중...")
+            
+            # 파일 경로가 지정되지 않은 경우 파일 선택 다이얼로그 열기
+            if not skwb_path:
+                file_filter = "Skin Weight Binary (*.skwb);;All Files (*.*)"
+                skwb_path = cmds.fileDialog2(fileFilter=file_filter, dialogStyle=2, fileMode=1)
+                if not skwb_path:
+                    return False
+                skwb_path = skwb_path[0]
+            
+            if progress_callback:
+                progress_callback(5, "바이너리 헤더 읽는 중...")
+            
+            header = SkinWeightIOCore.read_skwb_header(skwb_path)
+            
+            # 메시 이름 확인
+            target_mesh = mesh_name if mesh_name else header['mesh_name']
+            if not target_mesh or not cmds.objExists(target_mesh):
+                raise ValueError(f"메시 '{target_mesh}'를 찾을 수 없습니다.")
+            
+            # 메시의 shape 노드 가져오기
+            shapes = cmds.listRelatives(target_mesh, shapes=True, type="mesh")
+            if not shapes:
+                raise ValueError(f"{target_mesh}는 메시가 아닙니다.")
+            
+            mesh_shape = shapes[0]
+            
+            if progress_callback:
+                progress_callback(10, "인플루언스 정보 로딩 중...")
+            
+            # 인플루언스 정보 (조인트 리매핑 적용)
+            influence_names = header['influences']
+            if joint_remap_dict:
+                influence_names = [joint_remap_dict.get(name, name) for name in influence_names]
+            
+            if progress_callback:
+                progress_callback(15, "스킨 클러스터 확인 중...")
+            
+            # 스킨 클러스터 확인 또는 생성
+            skin_cluster = SkinWeightIOCore.get_skin_cluster(mesh_shape)
+            
+            if not skin_cluster:
+                # 스킨 클러스터가 없으면 생성
+                if progress_callback:
+                    progress_callback(20, "스킨 클러스터 생성 중...")
+                
+                existing_joints = [j for j in influence_names if cmds.objExists(j)]
+                
+                if not existing_joints:
+                    raise ValueError("인플루언스 조인트를 찾을 수 없습니다.")
+                
+                cmds.select(existing_joints + [target_mesh], r=True)
+                skin_cluster = cmds.skinCluster(
+                    toSelectedBones=True,
+                    bindMethod=0,
+                    skinMethod=0,
+                    normalizeWeights=1,
+                    maximumInfluences=4,
+                    dropoffRate=4.0
+                )[0]
+            else:
+                # 기존 스킨 클러스터에 필요한 조인트 추가
+                current_influences = cmds.skinCluster(skin_cluster, query=True, influence=True)
+                for joint in influence_names:
+                    if joint not in current_influences and cmds.objExists(joint):
+                        cmds.skinCluster(skin_cluster, edit=True, addInfluence=joint, weight=0)
+            
+            if progress_callback:
+                progress_callback(25, "OpenMaya2 API 초기화 중...")
+            
+            # 캐시된 스킨 컨텍스트 (인플루언스를 추가했으면 다시 만들어짐)
+            context = R8_weight_skin_context.get_skin_context(target_mesh, skin_cluster)
+            
+            # 파일 인플루언스 인덱스 -> Maya 인플루언스 인덱스 (없으면 -1)
+            influence_index_map = [context.influence_index.get(name, -1) for name in influence_names]
+            
+            # 메시의 버텍스 개수 확인
+            vertex_count = context.vertex_count
+            influence_count = context.influence_count
+            
+            if progress_callback:
+                progress_callback(30, f"메모리 맵 웨이트 적용 준비 중... (0이 아닌 웨이트 {header['nnz']}개)")
+            
+            file_vertex_count = min(header['vertex_count'], vertex_count)
+            
+            with open(skwb_path, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                buffer = memoryview(mm)
+                try:
+                    if NUMPY_AVAILABLE:
+                        weights = _scatter_skwb_numpy(buffer, header, influence_index_map, file_vertex_count,
+                                                      vertex_count, influence_count)
+                    else:
+                        weights = _scatter_skwb_python(buffer, header, influence_index_map, file_vertex_count,
+                                                       vertex_count, influence_count, progress_callback)
+                finally:
+                    # 메모리 맵을 닫기 전에 모든 뷰 해제
+                    buffer.release()
+                    mm.close()
+            
+            if progress_callback:
+                progress_callback(75, "OpenMaya2 API로 웨이트 적용 중...")
+            
+            # 정규화 일시 중지
+            cmds.setAttr(f"{skin_cluster}.normalizeWeights", 0)
+            
+            # 캐시된 전체 컴포넌트 / 인플루언스 인덱스로 모든 웨이트를 한 번에 설정
+            context.set_weights(weights, normalize=False)
             
             # 정규화 활성화
             if progress_callback:
@@ -1055,8 +1202,8 @@ class SkinWeightIOCore:
             
             end_time = time.time()
             remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)" if joint_remap_dict else ""
-            print(f"스킨 웨이트가 성공적으로 불러와졌습니다: {json_path}{remap_info}")
-            print(f"실행 시간: {end_time - start_time:.2f}초")
+            log.summary(f"스킨 웨이트가 성공적으로 불러와졌습니다: {skwb_path}{remap_info}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초")
             
             return True
             
@@ -1067,6 +1214,107 @@ class SkinWeightIOCore:
         finally:
             cmds.evaluationManager(mode=evaluation_mode)
             cmds.undoInfo(state=undo_state)
+    
+    @staticmethod
+    def export_weights_to_compressed(mesh_name, export_path="", progress_callback=None, delta=False,
+                                     codec=R8_weight_compressed.DEFAULT_CODEC):
+        """스킨 웨이트를 16비트 양자화 + 압축(.skwz) 파일로 저장합니다.
+        
+        delta가 True이면 WeightIO 폴더에서 같은 메시의 이전 전체 저장 .skwz를 찾아 바뀐 버텍스만 저장합니다.
+        """
+        start_time = time.time()
+        
+        # 언도 비활성화
+        undo_state = cmds.undoInfo(query=True, state=True)
+        cmds.undoInfo(state=False)
+        
+        try:
+            mesh_transform, mesh_shape = SkinWeightIOCore.get_selected_mesh()
+            skin_cluster = SkinWeightIOCore.get_skin_cluster(mesh_shape)
+            
+            if not skin_cluster:
+                raise ValueError(f"{mesh_shape}에 스킨 클러스터가 없습니다.")
+            
+            if progress_callback:
+                progress_callback(25, "버텍스 웨이트 데이터 로딩 중...")
+            
+            # 캐시된 스킨 컨텍스트로 웨이트 버퍼 읽기 (배치 내보내기와 같은 직렬화 사용)
+            data = R8_weight_export_pipeline.read_mesh_weights(mesh_transform, skin_cluster)
+            vertex_count = data.vertex_count
+            
+            # 파일 경로 설정
+            weightio_folder = SkinWeightIOCore.get_weightio_folder()
+            if not export_path:
+                export_path = os.path.join(weightio_folder, f"{mesh_transform}_skinWeights.skwz")
+            
+            if progress_callback:
+                progress_callback(40, "압축 파일 저장 중...")
+            
+            result = R8_weight_export_pipeline.write_compressed(data, export_path, delta, weightio_folder, codec)
+            
+            if progress_callback:
+                progress_callback(100, "내보내기 완료!")
+            
+            end_time = time.time()
+            if result['delta']:
+                storage_info = f"델타 (기준: {result['base_path']}, 변경 버텍스: {result['changed']}/{vertex_count}개)"
+            else:
+                storage_info = "전체 저장" + (" (델타 기준 파일이 없거나 델타가 더 큼)" if delta else "")
+            log.summary(f"스킨 웨이트가 성공적으로 저장되었습니다: {export_path}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초 ({storage_info}, "
+                        f"{R8_weight_compressed.CODEC_NAMES.get(codec, codec)}, {result['file_size']} bytes)")
+            
+            return export_path
+            
+        except Exception as e:
+            if progress_callback:
+                progress_callback(0, f"오류: {str(e)}")
+            raise e
+        finally:
+            cmds.undoInfo(state=undo_state)
+    
+    @staticmethod
+    def import_weights_from_compressed(skwz_path=None, mesh_name=None, progress_callback=None, joint_remap_dict=None):
+        """압축(.skwz) 파일의 스킨 웨이트를 적용합니다. 델타 파일은 기준 파일과 합쳐 복원합니다."""
+        start_time = time.time()
+        
+        try:
+            if progress_callback:
+                progress_callback(0, "압축 파일 불러오기 준비 중...")
+            
+            # 파일 경로가 지정되지 않은 경우 파일 선택 다이얼로그 열기
+            if not skwz_path:
+                file_filter = "Skin Weight Compressed (*.skwz);;All Files (*.*)"
+                skwz_path = cmds.fileDialog2(fileFilter=file_filter, dialogStyle=2, fileMode=1)
+                if not skwz_path:
+                    return False
+                skwz_path = skwz_path[0]
+            
+            if progress_callback:
+                progress_callback(10, "압축 웨이트 복원 중...")
+            
+            parsed = R8_weight_import_pipeline.parse_weight_file(skwz_path)
+            
+            if progress_callback:
+                progress_callback(50, "OpenMaya2 API로 웨이트 적용 중...")
+            
+            with R8_weight_import_pipeline.WeightImportSession():
+                R8_weight_import_pipeline.apply_parsed_weights(parsed, mesh_name, joint_remap_dict)
+            
+            if progress_callback:
+                progress_callback(100, "불러오기 완료!")
+            
+            end_time = time.time()
+            remap_info = f" (조인트 리매핑: {len(joint_remap_dict)}개)" if joint_remap_dict else ""
+            log.summary(f"스킨 웨이트가 성공적으로 불러와졌습니다: {skwz_path}{remap_info}")
+            log.summary(f"실행 시간: {end_time - start_time:.2f}초")
+            
+            return True
+            
+        except Exception as e:
+            if progress_callback:
+                progress_callback(0, f"오류: {str(e)}")
+            raise e
 
 
 class SkinWeightIOUI(QtWidgets.QDialog):
@@ -1263,6 +1511,28 @@ def quick_export_json(mesh_name=None):
         return None
 
 
+def quick_export_binary(mesh_name=None):
+    """빠른 바이너리(.skwb) 내보내기"""
+    try:
+        if not mesh_name:
+            mesh_name, _ = SkinWeightIOCore.get_selected_mesh()
+        return SkinWeightIOCore.export_weights_to_binary(mesh_name)
+    except Exception as e:
+        cmds.warning(f"바이너리 내보내기 오류: {str(e)}")
+        return None
+
+
+def quick_export_compressed(mesh_name=None, delta=False):
+    """빠른 압축(.skwz) 내보내기 (delta=True이면 이전 내보내기 대비 델타 저장)"""
+    try:
+        if not mesh_name:
+            mesh_name, _ = SkinWeightIOCore.get_selected_mesh()
+        return SkinWeightIOCore.export_weights_to_compressed(mesh_name, delta=delta)
+    except Exception as e:
+        cmds.warning(f"압축 내보내기 오류: {str(e)}")
+        return None
+
+
 def quick_import_xml(xml_path=None, mesh_name=None, use_batch=False, batch_size=5000):
     """빠른 XML 불러오기 (고성능 옵션 포함)"""
     try:
@@ -1284,6 +1554,24 @@ def quick_import_json(json_path=None, mesh_name=None):
         return False
 
 
+def quick_import_binary(skwb_path=None, mesh_name=None):
+    """빠른 바이너리(.skwb) 불러오기 (메모리 맵)"""
+    try:
+        return SkinWeightIOCore.import_weights_from_binary(skwb_path, mesh_name)
+    except Exception as e:
+        cmds.warning(f"바이너리 불러오기 오류: {str(e)}")
+        return False
+
+
+def quick_import_compressed(skwz_path=None, mesh_name=None):
+    """빠른 압축(.skwz) 불러오기 (델타 파일 자동 복원)"""
+    try:
+        return SkinWeightIOCore.import_weights_from_compressed(skwz_path, mesh_name)
+    except Exception as e:
+        cmds.warning(f"압축 불러오기 오류: {str(e)}")
+        return False
+
+
 def quick_batch_import_xml(xml_path=None, mesh_name=None, batch_size=5000):
     """빠른 배치 XML 불러오기"""
     try:
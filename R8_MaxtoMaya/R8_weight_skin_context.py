@@ -0,0 +1,167 @@
+'''
+R8 Weight Skin Context
+(메시, 스킨 클러스터) 쌍별 OpenMaya2 스킨 정보를 캐시합니다.
+
+기존 내보내기/불러오기/트랜스퍼는 작업마다 다음을 반복했습니다.
+- MSelectionList로 DAG 경로 / MFnSkinCluster 조회
+- 버텍스마다 addElement를 호출해 전체 버텍스 컴포넌트 생성 (20만 버텍스에서 수 초)
+- 인플루언스마다 append로 인덱스 MIntArray 생성
+
+SkinContext는 전체 컴포넌트를 setCompleteData로 한 번에 만들고, DAG 경로, 인플루언스 이름과
+인덱스 배열을 보관합니다. get_skin_context()는 캐시된 컨텍스트를 반환하기 전에 노드가 살아 있는지,
+토폴로지(버텍스/엣지/페이스 수)와 인플루언스 목록이 그대로인지 확인하고, 바뀌었으면 다시 만듭니다.
+
+    context = get_skin_context(mesh, skin_cluster)
+    weights, influence_count = context.get_weights()
+    context.set_weights(new_weights, normalize=True)
+
+Qt에 의존하지 않으며, 패키지 __init__을 거치지 않고 mayapy 작업 모듈에서도 직접 임포트할 수 있습니다.
+'''
+import time
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+import maya.api.OpenMayaAnim as om2Anim
+
+# (메시, 스킨 클러스터) -> SkinContext
+_contexts = {}
+
+
+def find_skin_cluster(mesh):
+    """메시 히스토리에서 첫 번째 스킨 클러스터를 찾습니다."""
+    history = cmds.listHistory(mesh, pruneDagObjects=True) or []
+    skin_clusters = cmds.ls(history, type='skinCluster')
+    return skin_clusters[0] if skin_clusters else None
+
+
+def complete_vertex_component(vertex_count):
+    """모든 버텍스를 가리키는 컴포넌트를 만듭니다. (버텍스별 addElement 없이)"""
+    fn_comp = om2.MFnSingleIndexedComponent()
+    component = fn_comp.create(om2.MFn.kMeshVertComponent)
+    fn_comp.setCompleteData(vertex_count)
+    return component
+
+
+def vertex_component(vertex_ids):
+    """지정한 버텍스 ID 목록의 컴포넌트를 한 번의 addElements로 만듭니다."""
+    fn_comp = om2.MFnSingleIndexedComponent()
+    component = fn_comp.create(om2.MFn.kMeshVertComponent)
+    fn_comp.addElements(vertex_ids)
+    return component
+
+
+class SkinContext:
+    """메시 / 스킨 클러스터의 OpenMaya2 객체와 인플루언스 정보"""
+
+    def __init__(self, mesh, skin_cluster):
+        self.mesh = mesh
+        self.skin_cluster = skin_cluster
+        self._full_component = None
+
+        start = time.time()
+        sel = om2.MSelectionList()
+        sel.add(mesh)
+        sel.add(skin_cluster)
+
+        self.mesh_dag = sel.getDagPath(0)
+        self.skin_obj = sel.getDependNode(1)
+        self._skin_handle = om2.MObjectHandle(self.skin_obj)
+        self.skin_fn = om2Anim.MFnSkinCluster(self.skin_obj)
+
+        self.topology = self._read_topology()
+        self.vertex_count = self.topology[0]
+
+        self.influence_names = self._read_influence_names()
+        self.influence_count = len(self.influence_names)
+        self.influence_index = {name: i for i, name in enumerate(self.influence_names)}
+        self.influence_indices = om2.MIntArray(list(range(self.influence_count)))
+        self.build_time = time.time() - start
+
+    def _read_topology(self):
+        """(버텍스 수, 엣지 수, 페이스 수)"""
+        try:
+            fn_mesh = om2.MFnMesh(self.mesh_dag)
+            return (fn_mesh.numVertices, fn_mesh.numEdges, fn_mesh.numPolygons)
+        except RuntimeError:
+            return (cmds.polyEvaluate(self.mesh, vertex=True),
+                    cmds.polyEvaluate(self.mesh, edge=True),
+                    cmds.polyEvaluate(self.mesh, face=True))
+
+    def _read_influence_names(self):
+        influences = self.skin_fn.influenceObjects()
+        return [influences[i].partialPathName() for i in range(len(influences))]
+
+    @property
+    def full_component(self):
+        """전체 버텍스 컴포넌트 (처음 사용할 때 생성)"""
+        if self._full_component is None:
+            self._full_component = complete_vertex_component(self.vertex_count)
+        return self._full_component
+
+    def is_valid(self):
+        """노드, 토폴로지, 인플루언스 목록이 캐시를 만들 때와 같은지 확인합니다."""
+        try:
+            if not (self._skin_handle.isValid() and self._skin_handle.isAlive() and self.mesh_dag.isValid()):
+                return False
+            if not cmds.objExists(self.mesh) or not cmds.objExists(self.skin_cluster):
+                return False
+            return (self._read_topology() == self.topology
+                    and self._read_influence_names() == self.influence_names)
+        except RuntimeError:
+            return False
+
+    def find_influence(self, joint_name):
+        """인플루언스 인덱스를 이름(부분 경로 또는 짧은 이름)으로 찾습니다. 없으면 None"""
+        index = self.influence_index.get(joint_name)
+        if index is None:
+            short_name = joint_name.split('|')[-1]
+            for i, name in enumerate(self.influence_names):
+                if name.split('|')[-1] == short_name:
+                    return i
+        return index
+
+    def get_weights(self):
+        """모든 버텍스 웨이트를 읽습니다. (weights, influence_count)"""
+        return self.skin_fn.getWeights(self.mesh_dag, self.full_component)
+
+    def set_weights(self, weights, normalize=False):
+        """모든 버텍스 x 모든 인플루언스 웨이트를 한 번에 씁니다."""
+        if not isinstance(weights, om2.MDoubleArray):
+            weights = om2.MDoubleArray(weights)
+        self.skin_fn.setWeights(self.mesh_dag, self.full_component, self.influence_indices, weights, normalize)
+
+    def set_vertex_weights(self, vertex_ids, weights, normalize=False):
+        """일부 버텍스 x 모든 인플루언스 웨이트를 씁니다. (배치 불러오기용)"""
+        if not isinstance(weights, om2.MDoubleArray):
+            weights = om2.MDoubleArray(weights)
+        self.skin_fn.setWeights(self.mesh_dag, vertex_component(vertex_ids), self.influence_indices, weights, normalize)
+
+
+def get_skin_context(mesh, skin_cluster=None):
+    """캐시된 스킨 컨텍스트를 반환합니다. 없거나 씬이 바뀌었으면 새로 만듭니다.
+
+    Args:
+        mesh (str): 메시 transform 또는 shape 이름
+        skin_cluster (str): 스킨 클러스터 이름 (None이면 메시 히스토리에서 찾음)
+    """
+    if skin_cluster is None:
+        skin_cluster = find_skin_cluster(mesh)
+        if not skin_cluster:
+            raise ValueError(f"{mesh}에 스킨 클러스터가 없습니다.")
+
+    key = (mesh, skin_cluster)
+    context = _contexts.get(key)
+    if context is None or not context.is_valid():
+        context = SkinContext(mesh, skin_cluster)
+        _contexts[key] = context
+    return context
+
+
+def invalidate_skin_context(mesh=None, skin_cluster=None):
+    """캐시를 비웁니다. 인자가 없으면 전체, 있으면 해당 메시 / 스킨 클러스터의 컨텍스트만 제거합니다."""
+    if mesh is None and skin_cluster is None:
+        _contexts.clear()
+        return
+    for key in list(_contexts):
+        if (mesh is None or key[0] == mesh) and (skin_cluster is None or key[1] == skin_cluster):
+            del _contexts[key]
@@ -3,10 +3,27 @@
 다른 UI에서 재활용할 수 있도록 분리된 모듈
 """
 
-import maya.api.OpenMaya as om2
-import maya.api.OpenMayaAnim as om2Anim
+import time
+
 import maya.cmds as cmds
 
+try:
+    from . import R8_log
+    from . import R8_weight_skin_context
+except ImportError:
+    import R8_log
+    import R8_weight_skin_context
+
+log = R8_log.get_logger(__name__)
+
+# NumPy가 있으면 벡터화된 웨이트 전송 사용 (없으면 기존 Python 루프로 폴백)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
 def get_skin_cluster(mesh):
     """메시의 스킨 클러스터를 찾아 반환"""
     history = cmds.listHistory(mesh, pruneDagObjects=True)
@@ -27,7 +44,7 @@ def add_joints_to_skin_cluster(mesh_name, new_joints):
         if skin_clusters:
             # 기존 스킨 클러스터에 조인트 추가
             skin_cluster = skin_clusters[0]
-            print(f"기존 스킨 클러스터 발견: {skin_cluster}")
+            log.info(f"기존 스킨 클러스터 발견: {skin_cluster}")
             
             # 이미 바인딩된 조인트들 확인
             existing_influences = cmds.skinCluster(skin_cluster, query=True, influence=True)
@@ -40,13 +57,14 @@ def add_joints_to_skin_cluster(mesh_name, new_joints):
             if joints_to_add:
                 cmds.select(joints_to_add, mesh_name, r=True)
                 cmds.skinCluster(skin_cluster, edit=True, addInfluence=joints_to_add, weight=0.0)
-                print(f"조인트 추가됨: {joints_to_add}")
+                log.info(f"조인트 {len(joints_to_add)}개 추가됨")
+                log.detail(f"추가된 조인트: {joints_to_add}")
             else:
-                print("모든 새 조인트가 이미 스킨 클러스터에 바인딩되어 있습니다.")
+                log.info("모든 새 조인트가 이미 스킨 클러스터에 바인딩되어 있습니다.")
             
         else:
             # 새 스킨 클러스터 생성
-            print("기존 스킨 클러스터가 없어 새로 생성합니다.")
+            log.info("기존 스킨 클러스터가 없어 새로 생성합니다.")
             cmds.select(new_joints, mesh_name, r=True)
             skin_cluster = cmds.skinCluster(
                 toSelectedBones=True,
@@ -56,44 +74,144 @@ def add_joints_to_skin_cluster(mesh_name, new_joints):
                 maximumInfluences=4,
                 dropoffRate=4.0
             )[0]
-            print(f"새 스킨 클러스터 생성됨: {skin_cluster}")
+            log.info(f"새 스킨 클러스터 생성됨: {skin_cluster}")
         
         cmds.select(clear=True)
         
     except Exception as e:
-        print(f"조인트 추가 중 오류: {str(e)}")
+        log.error(f"조인트 추가 중 오류: {str(e)}")
         raise e
 
+def _transfer_weights_numpy(weights, vertex_count, influence_count, index_mapping):
+    """
+    NumPy로 웨이트를 (V, I) 행렬로 재구성하여 매핑을 벡터 연산으로 적용
+    
+    Returns:
+        tuple: (1차원 웨이트 리스트, 전송 횟수)
+    """
+    weights_2d = np.fromiter(weights, dtype=np.float64, count=len(weights)).reshape(vertex_count, influence_count)
+    
+    # Python 루프와 같이 유효한 범위를 벗어난 인덱스 매핑은 건너뜀
+    index_mapping = {old_idx: new_idx for old_idx, new_idx in index_mapping.items()
+                     if old_idx < influence_count and new_idx < influence_count}
+    
+    old_indices = np.array(list(index_mapping.keys()), dtype=np.intp)
+    new_indices = np.array(list(index_mapping.values()), dtype=np.intp)
+    
+    transfer_count = 0
+    if not set(index_mapping.keys()) & set(index_mapping.values()):
+        # 기존/새 조인트가 겹치지 않으면 한 번의 scatter-add로 처리
+        old_weights = weights_2d[:, old_indices]
+        moved = np.where(old_weights > 0.0, old_weights, 0.0)
+        transfer_count = int(np.count_nonzero(moved))
+        
+        # 기존 조인트 웨이트 0으로 초기화 후 새 조인트에 누적 (같은 대상 조인트는 매핑 순서대로 더해짐)
+        weights_2d[:, old_indices] = old_weights - moved
+        np.add.at(weights_2d, (slice(None), new_indices), moved)
+    else:
+        # 체인 매핑(a->b, b->c)이 있으면 기존 루프와 같은 순서로 열 단위 처리
+        for old_idx, new_idx in index_mapping.items():
+            old_column = weights_2d[:, old_idx]
+            mask = old_column > 0.0
+            transfer_count += int(np.count_nonzero(mask))
+            weights_2d[:, new_idx] += np.where(mask, old_column, 0.0)
+            weights_2d[mask, old_idx] = 0.0
+    
+    return weights_2d.ravel().tolist(), transfer_count
+
+def _transfer_weights_python(weights, vertex_count, influence_per_vertex, index_mapping, progress_callback=None):
+    """
+    NumPy가 없을 때 사용하는 Python 루프 기반 웨이트 전송
+    
+    Returns:
+        tuple: (1차원 웨이트 리스트, 전송 횟수)
+    """
+    # 진행 상황 업데이트 (40%)
+    if progress_callback:
+        progress_callback(40, "웨이트 데이터 2차원 배열로 재구성 중...")
+    
+    # 1차원 웨이트 배열을 2차원 배열로 재구성 (버텍스별로 정리)
+    weights_2d = []
+    
+    # 각 버텍스의 웨이트를 개별 리스트로 분리
+    for i in range(0, len(weights), influence_per_vertex):
+        vertex_weights = weights[i:i + influence_per_vertex]
+        weights_2d.append(list(vertex_weights))
+    
+    # 실제로 웨이트 전송이 일어난 횟수를 카운트하는 변수
+    transfer_count = 0
+    
+    # 진행 상황 업데이트 (50%)
+    if progress_callback:
+        progress_callback(50, f"웨이트 전송 시작... ({len(index_mapping)}개 매핑 처리)")
+    
+    # 각 버텍스의 웨이트를 수정하여 매핑된 조인트로 전송
+    for vertex_idx in range(vertex_count):
+        vertex_weights = weights_2d[vertex_idx]  # 현재 버텍스의 웨이트 배열
+        
+        # 매핑된 각 조인트 쌍에 대해 웨이트 전송 수행
+        for old_idx, new_idx in index_mapping.items():
+            # 인덱스가 유효한 범위 내에 있는지 확인
+            if old_idx < len(vertex_weights) and new_idx < len(vertex_weights):
+                old_weight = vertex_weights[old_idx]  # 기존 조인트의 웨이트
+                if old_weight > 0.0:  # 실제로 웨이트가 있는 경우만 처리
+                    # 기존 조인트의 웨이트를 새 조인트의 웨이트에 더하기
+                    vertex_weights[new_idx] += old_weight
+                    # 기존 조인트의 웨이트를 0으로 초기화
+                    vertex_weights[old_idx] = 0.0
+                    transfer_count += 1  # 전송 횟수 증가
+        
+        # 수정된 웨이트를 다시 저장
+        weights_2d[vertex_idx] = vertex_weights
+        
+        # 더 자주 진행률 업데이트 (50~75% 구간을 더 세밀하게)
+        if progress_callback:
+            # 10% 단위로 업데이트하거나 최소 100개 버텍스마다 업데이트
+            update_interval = max(1, min(vertex_count // 10, 100))
+            if vertex_idx % update_interval == 0 or vertex_idx == vertex_count - 1:
+                progress = 50 + (vertex_idx * 25) // vertex_count
+                remaining_vertices = vertex_count - vertex_idx - 1
+                progress_callback(progress, f"웨이트 전송 중... ({vertex_idx + 1}/{vertex_count}, 남은 버텍스: {remaining_vertices})")
+    
+    # 진행 상황 업데이트 (80%)
+    if progress_callback:
+        progress_callback(80, f"웨이트 데이터 1차원 배열로 변환 중... (전송된 웨이트: {transfer_count}개)")
+    
+    # 2차원 웨이트 배열을 다시 1차원 배열로 변환 (Maya API에 전달하기 위해)
+    new_weights = []
+    for vertex_weights in weights_2d:
+        new_weights.extend(vertex_weights)  # 각 버텍스의 웨이트를 순서대로 추가
+    
+    return new_weights, transfer_count
+
 def transfer_weights_api(mesh, skin_cluster, joint_mapping, progress_callback=None):
-    """OpenMaya 2.0 API를 사용한 효율적인 웨이트 전송"""
+    """
+    OpenMaya 2.0 API를 사용한 효율적인 웨이트 전송
+    
+    Returns:
+        dict: {"transfer_count": 전송 횟수, "elapsed": 실행 시간(초), "method": "numpy" 또는 "python"}
+        유효한 매핑이 없으면 None
+    """
+    start_time = time.time()
     
     # 진행 상황 업데이트 (5%)
     if progress_callback:
         progress_callback(5, "메시 및 스킨 클러스터 정보 가져오는 중...")
     
-    # Maya API를 위한 Selection list 생성하여 메시와 스킨 클러스터 추가
-    sel = om2.MSelectionList()
-    sel.add(mesh)
-    sel.add(skin_cluster)
-    
-    # 메시의 DAG 경로와 스킨 클러스터 오브젝트 얻기
-    mesh_dag = sel.getDagPath(0)
-    skin_obj = sel.getDependNode(1)
-    
-    # 스킨 클러스터 함수 세트 생성
-    skin_fn = om2Anim.MFnSkinCluster(skin_obj)
+    # 캐시된 스킨 컨텍스트 (DAG 경로, 인플루언스, 전체 버텍스 컴포넌트)
+    # 같은 세션에서 반복 전송하면 토폴로지와 인플루언스가 그대로인 동안 재사용됩니다.
+    context = R8_weight_skin_context.get_skin_context(mesh, skin_cluster)
     
     # 진행 상황 업데이트 (10%)
     if progress_callback:
         progress_callback(10, "인플루언스 정보 분석 중...")
     
-    # 스킨 클러스터의 모든 인플루언스(조인트) 정보 가져오기
-    influences = skin_fn.influenceObjects()
-    influence_names = [influences[i].partialPathName() for i in range(len(influences))]
+    # 스킨 클러스터의 모든 인플루언스(조인트) 정보
+    influence_names = context.influence_names
     
     # 디버그 출력: 현재 스킨 클러스터의 조인트들과 요청된 매핑 출력
-    print(f"\nInfluences in skin cluster: {influence_names}")
-    print(f"Joint mapping requested: {joint_mapping}")
+    log.debug(f"Influences in skin cluster: {influence_names}")
+    log.debug(f"Joint mapping requested: {joint_mapping}")
     
     # 진행 상황 업데이트 (15%)
     if progress_callback:
@@ -133,13 +251,13 @@ def transfer_weights_api(mesh, skin_cluster, joint_mapping, progress_callback=No
         # 양쪽 조인트 모두 찾은 경우만 매핑에 추가
         if old_idx is not None and new_idx is not None:
             index_mapping[old_idx] = new_idx
-            print(f"Mapping: {old_joint}(idx:{old_idx}) -> {new_joint}(idx:{new_idx})")
+            log.detail(f"Mapping: {old_joint}(idx:{old_idx}) -> {new_joint}(idx:{new_idx})")
         else:
             # 찾지 못한 조인트에 대한 경고 출력
             if old_idx is None:
-                print(f"Warning: {old_joint} not found in influences")
+                log.warning(f"Warning: {old_joint} not found in influences")
             if new_idx is None:
-                print(f"Warning: {new_joint} not found in influences")
+                log.warning(f"Warning: {new_joint} not found in influences")
     
     # 유효한 매핑이 없는 경우 경고하고 종료
     if not index_mapping:
@@ -150,91 +268,29 @@ def transfer_weights_api(mesh, skin_cluster, joint_mapping, progress_callback=No
     if progress_callback:
         progress_callback(25, f"버텍스 정보 수집 중... (유효한 매핑: {len(index_mapping)}개)")
     
-    # 메시의 전체 버텍스 개수 가져오기
-    vertex_count = cmds.polyEvaluate(mesh, vertex=True)
-    
-    # 모든 버텍스에 대한 컴포넌트 생성
-    fn_comp = om2.MFnSingleIndexedComponent()
-    full_comp = fn_comp.create(om2.MFn.kMeshVertComponent)
-    # 모든 버텍스 인덱스를 컴포넌트에 추가
-    for i in range(vertex_count):
-        fn_comp.addElement(i)
+    # 메시의 전체 버텍스 개수
+    vertex_count = context.vertex_count
     
     # 진행 상황 업데이트 (30%)
     if progress_callback:
         progress_callback(30, f"버텍스 웨이트 데이터 로딩 중... (총 {vertex_count}개 버텍스)")
     
     # 스킨 클러스터에서 모든 버텍스의 웨이트 데이터를 한 번에 가져오기
-    weights, influence_count = skin_fn.getWeights(mesh_dag, full_comp)
-    
-    # 진행 상황 업데이트 (40%)
-    if progress_callback:
-        progress_callback(40, "웨이트 데이터 2차원 배열로 재구성 중...")
-    
-    # 1차원 웨이트 배열을 2차원 배열로 재구성 (버텍스별로 정리)
-    influence_per_vertex = len(influence_names)  # 버텍스당 인플루언스 개수
-    weights_2d = []
-    
-    # 각 버텍스의 웨이트를 개별 리스트로 분리
-    for i in range(0, len(weights), influence_per_vertex):
-        vertex_weights = weights[i:i + influence_per_vertex]
-        weights_2d.append(list(vertex_weights))
-    
-    # 실제로 웨이트 전송이 일어난 횟수를 카운트하는 변수
-    transfer_count = 0
+    weights, influence_count = context.get_weights()
     
-    # 진행 상황 업데이트 (50%)
-    if progress_callback:
-        progress_callback(50, f"웨이트 전송 시작... ({len(index_mapping)}개 매핑 처리)")
-    
-    # 각 버텍스의 웨이트를 수정하여 매핑된 조인트로 전송
-    for vertex_idx in range(vertex_count):
-        vertex_weights = weights_2d[vertex_idx]  # 현재 버텍스의 웨이트 배열
-        
-        # 매핑된 각 조인트 쌍에 대해 웨이트 전송 수행
-        for old_idx, new_idx in index_mapping.items():
-            # 인덱스가 유효한 범위 내에 있는지 확인
-            if old_idx < len(vertex_weights) and new_idx < len(vertex_weights):
-                old_weight = vertex_weights[old_idx]  # 기존 조인트의 웨이트
-                if old_weight > 0.0:  # 실제로 웨이트가 있는 경우만 처리
-                    # 기존 조인트의 웨이트를 새 조인트의 웨이트에 더하기
-                    vertex_weights[new_idx] += old_weight
-                    # 기존 조인트의 웨이트를 0으로 초기화
-                    vertex_weights[old_idx] = 0.0
-                    transfer_count += 1  # 전송 횟수 증가
-        
-        # 수정된 웨이트를 다시 저장
-        weights_2d[vertex_idx] = vertex_weights
-        
-        # 더 자주 진행률 업데이트 (50~75% 구간을 더 세밀하게)
+    if NUMPY_AVAILABLE:
+        # 진행 상황 업데이트 (50%)
         if progress_callback:
-            # 10% 단위로 업데이트하거나 최소 100개 버텍스마다 업데이트
-            update_interval = max(1, min(vertex_count // 10, 100))
-            if vertex_idx % update_interval == 0 or vertex_idx == vertex_count - 1:
-                progress = 50 + (vertex_idx * 25) // vertex_count
-                remaining_vertices = vertex_count - vertex_idx - 1
-                progress_callback(progress, f"웨이트 전송 중... ({vertex_idx + 1}/{vertex_count}, 남은 버텍스: {remaining_vertices})")
+            progress_callback(50, f"NumPy 웨이트 전송 중... ({len(index_mapping)}개 매핑 처리)")
+        
+        new_weights, transfer_count = _transfer_weights_numpy(weights, vertex_count, influence_count, index_mapping)
+        method = "numpy"
+    else:
+        new_weights, transfer_count = _transfer_weights_python(weights, vertex_count, len(influence_names), index_mapping, progress_callback)
+        method = "python"
     
     # 전송 완료 정보 출력
-    print(f"Transferred weights for {transfer_count} vertex-joint pairs")
-    
-    # 진행 상황 업데이트 (80%)
-    if progress_callback:
-        progress_callback(80, f"웨이트 데이터 1차원 배열로 변환 중... (전송된 웨이트: {transfer_count}개)")
-    
-    # 2차원 웨이트 배열을 다시 1차원 배열로 변환 (Maya API에 전달하기 위해)
-    new_weights = []
-    for vertex_weights in weights_2d:
-        new_weights.extend(vertex_weights)  # 각 버텍스의 웨이트를 순서대로 추가
-    
-    # 진행 상황 업데이트 (85%)
-    if progress_callback:
-        progress_callback(85, "인플루언스 인덱스 배열 생성 중...")
-    
-    # 모든 인플루언스의 인덱스 배열 생성
-    influence_indices = om2.MIntArray()
-    for i in range(len(influence_names)):
-        influence_indices.append(i)
+    log.info(f"Transferred weights for {transfer_count} vertex-joint pairs ({len(index_mapping)} mappings)")
     
     # 진행 상황 업데이트 (90%)
     if progress_callback:
@@ -242,17 +298,16 @@ def transfer_weights_api(mesh, skin_cluster, joint_mapping, progress_callback=No
     
     # 스킨 클러스터에 새로운 웨이트 데이터 설정
     # normalize=True로 설정하여 웨이트 합이 1이 되도록 자동 정규화
-    skin_fn.setWeights(
-        mesh_dag,
-        full_comp,
-        influence_indices,
-        om2.MDoubleArray(new_weights),
-        normalize=True
-    )
+    context.set_weights(new_weights, normalize=True)
+    
+    elapsed = time.time() - start_time
+    log.summary(f"Weight transfer time: {elapsed:.3f}s ({method})")
     
     # 최종 진행 상황 업데이트 (100%)
     if progress_callback:
-        progress_callback(100, f"웨이트 정규화 및 전송 완료! (총 {transfer_count}개 웨이트 전송됨)")
+        progress_callback(100, f"웨이트 정규화 및 전송 완료! (총 {transfer_count}개 웨이트 전송됨, {elapsed:.2f}초)")
+    
+    return {"transfer_count": transfer_count, "elapsed": elapsed, "method": method}
 
 def transfer_weights_to_mapped_joints(mesh, joint_mapping, progress_callback=None):
     """
@@ -289,29 +344,32 @@ def transfer_weights_to_mapped_joints(mesh, joint_mapping, progress_callback=Non
     
     # 현재 바인딩된 조인트 리스트 가져오기
     current_influences = cmds.skinCluster(skin_cluster, query=True, influence=True)
-    print(f"Current influences: {current_influences}")
+    log.debug(f"Current influences: {current_influences}")
     
     if progress_callback:
         progress_callback(20, "웨이트 데이터 처리 시작...")
     
     try:
         # OpenMaya 2.0 API를 사용한 웨이트 전송
-        transfer_weights_api(mesh, skin_cluster, joint_mapping, progress_callback)
+        transfer_info = transfer_weights_api(mesh, skin_cluster, joint_mapping, progress_callback) or {}
         
         if progress_callback:
             progress_callback(100, "웨이트 트랜스퍼 완료!")
         
-        print(f"Weight transfer completed for {mesh}")
+        log.summary(f"Weight transfer completed for {mesh}")
         return {
             "success": True, 
             "mesh": mesh,
             "skin_cluster": skin_cluster,
-            "mappings_processed": len(joint_mapping)
+            "mappings_processed": len(joint_mapping),
+            "transfer_count": transfer_info.get("transfer_count", 0),
+            "elapsed": transfer_info.get("elapsed", 0.0),
+            "method": transfer_info.get("method")
         }
         
     except Exception as e:
         error_msg = f"Weight transfer failed: {str(e)}"
-        print(error_msg)
+        log.error(error_msg)
         return {"success": False, "error": error_msg}
 
 def validate_joint_mapping(joint_mapping, mesh=None):
@@ -20,6 +20,13 @@ except ImportError:
         print(f"R8_weight_transfer_core 모듈을 찾을 수 없습니다: {e}")
         R8_weight_transfer_core = None
 
+try:
+    from R8_MaxtoMaya import R8_log
+except ImportError:
+    import R8_log
+
+log = R8_log.get_logger(__name__)
+
 def create_mapping_from_selection():
     """
     선택된 조인트들로부터 웨이트 트랜스퍼 매핑을 생성하는 편의 함수
@@ -123,7 +130,7 @@ def batch_transfer(mesh, joint_mappings_list, progress_callback=None):
             progress = int((i / total_mappings) * 100)
             progress_callback(progress, f"매핑 {i+1}/{total_mappings} 처리 중...")
         
-        print(f"Processing mapping {i+1}/{total_mappings}")
+        log.detail(f"Processing mapping {i+1}/{total_mappings}")
         result = R8_weight_transfer_core.transfer_weights_to_mapped_joints(mesh, mapping)
         results.append(result)
     
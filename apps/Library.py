@@ -1,8 +1,6 @@
-import sys
 import logging
 import os
 import re
-import threading
 import traceback
 
 
@@ -13,6 +11,8 @@ import pipeline.libs.nodes.elements as stages
 import pipeline.widgets.comboBox as comboBox
 import pipeline.widgets.inputs as inputs
 import pipeline.libs.config as cfg
+import pipeline.apps.project_index as project_index
+import pipeline.apps.scan_worker as scan_worker
 from pipeline.libs.Qt import QtWidgets, QtCore
 
 
@@ -158,6 +158,7 @@ class Library(QtWidgets.QWidget):
         self.project = None
 
         self.scan = None
+        self.populated_items = None
 
         #
         # self.search_line.set_suggestions_model(None)
@@ -188,16 +189,34 @@ class Library(QtWidgets.QWidget):
         self.library_view.setModel_(None)
 
 
+        self.populated_items = None
+
         if path:
             if os.path.exists(path):
                 self.root_path = path
+
+                # show the persisted index right away, the scan only refreshes what changed
+                index = project_index.get_project_index(self.root_path, self.project)
+                if self.project and index.ready:
+                    self.populate(index.public_components(self.root_path))
+
                 self.scan = Scan_masters_thread(path_to_dir=self.root_path, project=self.project)
-                self.scan.update.connect(self.populate)
+                self.scan.update.connect(self.scan_finished)
                 self.scan.percent.connect(self.progressBar.setValue)
                 self.scan.start()
                 self.show_loader()
                 # self.populate()
 
+    def scan_finished(self, items = None):
+
+        if items and items == self.populated_items:
+            self.hide_loader()
+            if self.scan: self.scan.kill()
+            self.scan = None
+            return
+
+        self.populate(items)
+
     def populate(self, items = None):
         # root = self.parent.project.path
 
@@ -205,6 +224,7 @@ class Library(QtWidgets.QWidget):
         self.comps = list()
         self.comp_hints = list()
         self.comps_model = None
+        self.populated_items = items
 
         self.search_line.set_suggestions_model(None)
         self.library_view.setModel_(None)
@@ -325,99 +345,21 @@ def remap( x, oMin, oMax, nMin, nMax ):
     return result
 
 
-class Scan_masters_thread(QtCore.QObject, threading.Thread):
-    update = QtCore.Signal(object)
-    percent = QtCore.Signal(int)
+class Scan_masters_thread(scan_worker.ScanWorker):
 
     def __init__(self, path_to_dir='.', project = None):
 
-        QtCore.QObject.__init__(self)
-        threading.Thread.__init__(self)
+        scan_worker.ScanWorker.__init__(self)
         self._path = path_to_dir
         self.project = project
-        self.daemon = True
-        self.killed = False
-
-    def run(self):
-        li = []
-        try:
-            li = self.createModel()
-        except SystemExit:
-            pass
-            # print 'system exit at in {}.thread.run():'.format(self.__class__.__name__)
-        except:
-            print ('exceptions in {}.thread.run():'.format(self.__class__.__name__))
-            print (traceback.print_exc())
-        finally:
-            self.update.emit(li)
-            return
-
-    def calculate_total(self):
-        total = 0
-        for root, subFolders, _files in os.walk(self._path):
-
-            for s in subFolders:
-                total += 1
-        return total
 
     def createModel(self):
         li = list()
-        index = 0
-        max = self.calculate_total()
 
         if not self.project: return li
 
-        for root, subFolders, _files in os.walk(self._path):
-
-            for s in subFolders:
-                index += 1
-                folder = os.path.join(root, s)
-
-                comp = folder if misc.component_dir(folder) else None
-
-                if comp:
-
-                    node = stages.ComponentNode(os.path.split(comp)[1], path=comp, project=self.project)
-                    if node.public:
-                        li.append({"name": os.path.split(comp)[1], "path": comp})
-
-                    del node
-                val = remap(index, 0, max, 0, 100)
-                self.percent.emit(val)
+        # incremental refresh of the shared project index, then an in memory query
+        index = project_index.get_project_index(self._path, self.project)
+        index.refresh(progress=self.set_percent, cancelled=self.cancel_token)
 
-        return li
-
-
-    def start(self):
-        """Start the thread."""
-        self.__run_backup = self.run
-        self.run = self.__run  # Force the Thread to
-
-        threading.Thread.start(self)
-
-    def __run(self):
-        """Hacked run function, which installs the
-    trace."""
-        sys.settrace(self.globaltrace)
-        self.__run_backup()
-        self.run = self.__run_backup
-
-    def globaltrace(self, frame, why, arg):
-        if why == 'call':
-            return self.localtrace
-        else:
-            return None
-
-    def localtrace(self, frame, why, arg):
-        if self.killed:
-            if why == 'line':
-                raise SystemExit()
-        return self.localtrace
-
-    def kill(self):
-        try:
-            self.update.disconnect()
-            self.percent.disconnect()
-        except:
-            pass
-        self.killed = True
+        return index.public_components(self._path)
@@ -1,9 +1,6 @@
-import sys
 import logging
 import os
-import re
 import functools
-import threading
 import traceback
 
 import pipeline.libs.config as cfg
@@ -16,6 +13,8 @@ import pipeline.widgets.comboBox as comboBox
 from pipeline.libs.Qt import QtWidgets, QtCore
 import pipeline.widgets.inputs  as inputs
 import pipeline.apps.preset_editor as preset_editor
+import pipeline.apps.project_index as project_index
+import pipeline.apps.scan_worker as scan_worker
 
 
 
@@ -876,6 +875,8 @@ class Navigator(QtWidgets.QWidget):
         self.rootFolder = None
         self.results_folder = None
 
+        self.index = None
+        self.index_thread = None
 
 
 
@@ -946,42 +947,29 @@ class Navigator(QtWidgets.QWidget):
 
     def filter_folders(self, path, search_string):
 
-        all_folders = []
+        # query the in memory project index, the search is run again when the index is ready
+        results = []
+        if self.index and self.index.ready:
+            results = self.index.search(path, search_string)
 
-        for root, subFolders, _files in os.walk(path):
+        self.set_view_with_search_results(results, search_string)
 
-            for s in subFolders:
-                all_folders.append(os.path.join(root,s))
+    def update_index(self, path):
 
+        if self.index_thread:
+            self.index_thread.kill()
+            self.index_thread = None
 
-        string = search_string
+        self.index = project_index.get_project_index(path, self.parent.project)
+        self.index_thread = project_index.ProjectIndexScan(self.index)
+        self.index_thread.update.connect(self.index_updated)
+        self.index_thread.start()
 
-        results = []
-        for folder in all_folders:
+    def index_updated(self, index):
 
-            search_in = files.reletive_path(path, folder) #os.path.join(self.parent.project.path, "assets")
-            # logger.info(search_in)
-            f = None
-            try:
-                f = re.search(string, search_in, re.IGNORECASE) #os.path.split(folder)[1])
-            except:
-                logger.info("This search pattern {} is invalid".format(string))
-
-            # logger.info(search_in)
-
-            if f:
-                # logger.info("HIT! {}".format(folder))
-                if misc.component_dir(folder):
-
-                    results.append(folder)
-        #
-        # logger.info(" {} -------".format(string))
-        #
-        # for r in results:
-        #     logger.info(r)
-        # logger.info("-------")
-        # if results:
-        self.set_view_with_search_results(results, search_string)
+        self.index_thread = None
+        if self.rootFolder and (self.search_line.text() != "") and (self.search_line.text() != self.search_line.label):
+            self.filter_folders(self.rootFolder._path, self.search_line.text())
 
     def set_branch_root(self, path):
 
@@ -1019,6 +1007,7 @@ class Navigator(QtWidgets.QWidget):
 
             self.parent.set_focus_widget = self.rootFolder.folder_view
 
+            self.update_index(path)
 
             self.current_component = None
             self.component_changed.emit()
@@ -1142,41 +1131,18 @@ def remap( x, oMin, oMax, nMin, nMax ):
 #         return {"type": None, "name": None, "path": None}
 #
 
-class Scandir_list_thread(QtCore.QObject, threading.Thread):
-    update = QtCore.Signal(object)
-    percent = QtCore.Signal(int)
+# folder path -> (mtime, scanned node), shared between scans so a cancelled scan's work is reused
+_node_cache = dict()
+# the cache is dropped when it grows past this many folders, so browsing many projects does not keep every folder
+_NODE_CACHE_SIZE = 20000
+
+
+class Scandir_list_thread(scan_worker.ScanWorker):
 
     def __init__(self, path_to_dir='.'):
 
-        QtCore.QObject.__init__(self)
-        threading.Thread.__init__(self)
+        scan_worker.ScanWorker.__init__(self)
         self._path = path_to_dir
-        self.daemon = True
-        self.killed = False
-        #
-        # self.results_list = Scanner_list(path_to_dir, self.percent)
-
-    def run(self):
-        li = []
-        try:
-            li = self.createModel()
-        except SystemExit:
-            pass
-            # print 'system exit at in {}.thread.run():'.format(self.__class__.__name__)
-        except:
-            print ('exceptions in {}.thread.run():'.format(self.__class__.__name__))
-            print (traceback.print_exc())
-        finally:
-            self.update.emit(li)
-            return
-        # try:
-        #     list = self.createModel()
-        #     self.update.emit(list)
-        # except:
-        #     print traceback.print_exc()
-        #     self.update.emit([])
-        # finally:
-        #     return
 
     def createModel(self):
         li = list()
@@ -1187,6 +1153,8 @@ class Scandir_list_thread(QtCore.QObject, threading.Thread):
             max = len(subdirectories)
 
             for index, dir in enumerate(misc.human_sort(subdirectories)):
+                self.check_cancelled()
+
                 n = os.path.split(dir)[1]
 
                 node = self.node_generator(n, dir)
@@ -1194,7 +1162,7 @@ class Scandir_list_thread(QtCore.QObject, threading.Thread):
                     li.append(node)
 
                 val = remap(index, 0, max, 0, 100)
-                self.percent.emit(val)
+                self.set_percent(val)
 
         return li
 
@@ -1202,45 +1170,25 @@ class Scandir_list_thread(QtCore.QObject, threading.Thread):
 
         path = os.path.join(self._path, dir)
 
-        if misc.catagory_dir(path):
-            return {"type": "catagory", "name": name, "path": path}
-        if misc.component_dir(path):
-            return {"type": "component", "name": name, "path": path}
-        if misc.branch_dir(path):
-            return {"type": "branch", "name": name, "path": path}
-
-        return {"type": None, "name": None, "path": None}
-
-    def start(self):
-        """Start the thread."""
-        self.__run_backup = self.run
-        self.run = self.__run  # Force the Thread to
-
-        threading.Thread.start(self)
-
-    def __run(self):
-        """Hacked run function, which installs the
-    trace."""
-        sys.settrace(self.globaltrace)
-        self.__run_backup()
-        self.run = self.__run_backup
-
-    def globaltrace(self, frame, why, arg):
-        if why == 'call':
-            return self.localtrace
-        else:
-            return None
+        # a folder's type only changes when its content changes, which updates its mtime
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            mtime = None
 
-    def localtrace(self, frame, why, arg):
-        if self.killed:
-            if why == 'line':
-                raise SystemExit()
-        return self.localtrace
+        cached = _node_cache.get(path)
+        if cached and mtime is not None and cached[0] == mtime:
+            return cached[1]
 
-    def kill(self):
-        try:
-            self.update.disconnect()
-            self.percent.disconnect()
-        except:
-            pass
-        self.killed = True
+        node = {"type": None, "name": None, "path": None}
+        if misc.catagory_dir(path):
+            node = {"type": "catagory", "name": name, "path": path}
+        elif misc.component_dir(path):
+            node = {"type": "component", "name": name, "path": path}
+        elif misc.branch_dir(path):
+            node = {"type": "branch", "name": name, "path": path}
+
+        if len(_node_cache) >= _NODE_CACHE_SIZE:
+            _node_cache.clear()
+        _node_cache[path] = (mtime, node)
+        return node
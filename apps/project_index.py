@@ -0,0 +1,261 @@
+'''
+Project tree index shared by the Navigator search box and the Library view.
+
+Every folder of the project is stored with its mtime, sub folder names and type
+(catagory / component / branch). A refresh only lists and re-classifies folders whose
+mtime changed; unchanged folders cost a single stat. Components also keep their public
+state, recomputed when the latest mtime in their sub tree changes.
+
+The index is persisted in the project root and queried in memory.
+'''
+
+import os
+import re
+import json
+import logging
+import threading
+
+import pipeline.libs.misc as misc
+import pipeline.libs.nodes.elements as elements
+from pipeline.apps.scan_worker import ScanWorker, ScanCancelled
+
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+
+logger = logging.getLogger(__name__)
+
+
+INDEX_FILE_NAME = '.pipeline_index.json'
+INDEX_VERSION = 1
+
+_project_indexes = {}
+_project_indexes_lock = threading.Lock()
+
+
+def list_sub_folders(path):
+    if scandir:
+        return sorted(entry.name for entry in scandir(path) if entry.is_dir())
+    return sorted(name for name in os.listdir(path) if os.path.isdir(os.path.join(path, name)))
+
+
+def folder_type(path):
+    if misc.catagory_dir(path):
+        return 'catagory'
+    if misc.component_dir(path):
+        return 'component'
+    if misc.branch_dir(path):
+        return 'branch'
+    return None
+
+
+class ProjectIndex(object):
+
+    def __init__(self, root_path, project=None):
+
+        self.root_path = os.path.normpath(root_path)
+        self.project = project
+        self.index_file = os.path.join(self.root_path, INDEX_FILE_NAME)
+        self.entries = dict()
+        self._components = list()
+        self.ready = False
+        self._refresh_lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.index_file, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('folders', {})
+        except (IOError, OSError, ValueError):
+            self.entries = dict()
+
+        # a persisted index answers queries right away, the background refresh updates it
+        self._components = self._collect_components(self.entries)
+        self.ready = bool(self.entries)
+
+    def save(self):
+        temp_file = self.index_file + '.tmp'
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump({'version': INDEX_VERSION, 'folders': self.entries}, f)
+            # os.replace is not available in python 2
+            if os.name == 'nt' and os.path.exists(self.index_file):
+                os.remove(self.index_file)
+            os.rename(temp_file, self.index_file)
+        except (IOError, OSError):
+            logger.info("Could not save project index {}".format(self.index_file))
+
+    def abs_path(self, rel):
+        if not rel:
+            return self.root_path
+        return os.path.normpath(os.path.join(self.root_path, *rel.split('/')))
+
+    def rel_path(self, path):
+        rel = os.path.relpath(os.path.normpath(path), self.root_path).replace('\\', '/')
+        return '' if rel == '.' else rel
+
+    def refresh(self, progress=None, cancelled=None):
+        '''
+        Walk the project and update the index. Only folders with a changed mtime are
+        listed and classified again. Raises ScanCancelled when cancelled() returns True.
+        '''
+        with self._refresh_lock:
+            old = self.entries
+            new = dict()
+            state = {'visited': 0, 'changed': 0, 'total': max(len(old), 1)}
+
+            try:
+                self._scan('', old, new, state, progress, cancelled)
+            except ScanCancelled:
+                # keep the sub trees that were completed, their parents still hold the old
+                # mtime and are listed again by the next refresh
+                merged = dict(old)
+                merged.update(new)
+                self.entries = merged
+                self._components = self._collect_components(merged)
+                raise
+
+            removed = len(set(old) - set(new))
+            self.entries = new
+            self._components = self._collect_components(new)
+            self.ready = True
+
+            if state['changed'] or removed:
+                self.save()
+
+            logger.debug("Project index {}: {} folders, {} changed, {} removed".format(
+                self.root_path, len(new), state['changed'], removed))
+
+            if progress:
+                progress(100)
+
+        return self
+
+    def _scan(self, rel, old, new, state, progress, cancelled):
+
+        if cancelled and cancelled():
+            raise ScanCancelled()
+
+        path = self.abs_path(rel)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            return 0
+
+        entry = old.get(rel)
+        if entry and entry['mtime'] == mtime:
+            dirs = entry['dirs']
+            folder_kind = entry['type']
+        else:
+            try:
+                dirs = list_sub_folders(path)
+            except OSError:
+                dirs = []
+            folder_kind = folder_type(path) if rel else None
+            state['changed'] += 1
+
+        state['visited'] += 1
+        if progress and state['visited'] % 100 == 0:
+            progress(min(99, int(state['visited'] * 100 / state['total'])))
+
+        # latest mtime in the sub tree, used to detect master/public changes of components
+        signature = mtime
+        for name in dirs:
+            child = '{}/{}'.format(rel, name) if rel else name
+            signature = max(signature, self._scan(child, old, new, state, progress, cancelled))
+
+        public = None
+        if folder_kind == 'component':
+            if entry and entry.get('type') == folder_kind and entry.get('signature') == signature:
+                public = entry.get('public')
+            else:
+                public = self._component_public(path)
+
+        new[rel] = {'mtime': mtime, 'dirs': dirs, 'type': folder_kind, 'signature': signature, 'public': public}
+        return signature
+
+    def _component_public(self, path):
+        if not self.project:
+            return None
+        try:
+            node = elements.ComponentNode(os.path.split(path)[1], path=path, project=self.project)
+            return bool(node.public)
+        except:
+            logger.info("Could not read component state {}".format(path))
+            return False
+
+    def _collect_components(self, entries):
+        return [(rel, entries[rel]) for rel in sorted(entries) if entries[rel]['type'] == 'component']
+
+    def components(self, root=None):
+        '''
+        Return (relative to root, absolute path, entry) for every component under root.
+        '''
+        prefix = self.rel_path(root) if root else ''
+
+        results = []
+        for rel, entry in self._components:
+            if prefix:
+                if not rel.startswith(prefix + '/'):
+                    continue
+                results.append((rel[len(prefix) + 1:], self.abs_path(rel), entry))
+            else:
+                results.append((rel, self.abs_path(rel), entry))
+        return results
+
+    def search(self, root, search_string):
+        '''
+        Return component paths under root whose path relative to root matches search_string.
+        '''
+        try:
+            pattern = re.compile(search_string, re.IGNORECASE)
+        except re.error:
+            logger.info("This search pattern {} is invalid".format(search_string))
+            return []
+
+        return [path for rel, path, entry in self.components(root) if pattern.search(rel.replace('/', os.sep))]
+
+    def public_components(self, root=None):
+        return [{"name": os.path.split(path)[1], "path": path}
+                for rel, path, entry in self.components(root) if entry.get('public')]
+
+
+def get_project_index(path, project=None):
+    '''
+    Return the shared index that covers path: the project index when path is inside
+    the project, otherwise an index rooted at path.
+    '''
+    root = path
+    if project is not None and getattr(project, 'path', None):
+        project_root = os.path.normpath(project.path)
+        rel = os.path.relpath(os.path.normpath(path), project_root)
+        if rel == '.' or not (rel == '..' or rel.startswith('..' + os.sep)):
+            root = project_root
+
+    key = os.path.normcase(os.path.normpath(root))
+    with _project_indexes_lock:
+        index = _project_indexes.get(key)
+        if index is None:
+            index = ProjectIndex(root, project=project)
+            _project_indexes[key] = index
+        elif project is not None:
+            index.project = project
+    return index
+
+
+class ProjectIndexScan(ScanWorker):
+
+    def __init__(self, index):
+
+        ScanWorker.__init__(self)
+        self.index = index
+
+    def createModel(self):
+        return self.index.refresh(progress=self.set_percent, cancelled=self.cancel_token)
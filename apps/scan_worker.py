@@ -0,0 +1,119 @@
+'''
+Cancellable background scans for the Navigator and Library views.
+
+A scan runs on a shared QThreadPool and checks its cancel token between directory
+entries, so kill() stops it at the next entry without tracing every python line.
+Percent signals are only emitted when the integer value changes.
+'''
+
+import threading
+import traceback
+
+from pipeline.libs.Qt import QtCore
+
+
+MAX_SCAN_THREADS = 4
+
+_scan_pool = None
+# workers are kept alive here until their run() returns, even after the view dropped them
+_active_workers = set()
+_active_workers_lock = threading.Lock()
+
+
+class ScanCancelled(Exception):
+    pass
+
+
+class CancelToken(object):
+
+    def __init__(self):
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def __call__(self):
+        return self.cancelled
+
+
+def scan_pool():
+    global _scan_pool
+    if _scan_pool is None:
+        _scan_pool = QtCore.QThreadPool()
+        _scan_pool.setMaxThreadCount(MAX_SCAN_THREADS)
+    return _scan_pool
+
+
+class _ScanRunnable(QtCore.QRunnable):
+
+    def __init__(self, worker):
+        QtCore.QRunnable.__init__(self)
+        self.worker = worker
+
+    def run(self):
+        try:
+            self.worker.run()
+        finally:
+            with _active_workers_lock:
+                _active_workers.discard(self.worker)
+
+
+class ScanWorker(QtCore.QObject):
+    '''
+    Base class for scans. Subclasses implement createModel() and call check_cancelled()
+    between entries; the result of createModel() is emitted with the update signal.
+    '''
+    update = QtCore.Signal(object)
+    percent = QtCore.Signal(int)
+
+    def __init__(self):
+
+        QtCore.QObject.__init__(self)
+        self.cancel_token = CancelToken()
+        self._last_percent = None
+        self._runnable = None
+
+    @property
+    def killed(self):
+        return self.cancel_token.cancelled
+
+    def start(self):
+        self._runnable = _ScanRunnable(self)
+        self._runnable.setAutoDelete(False)
+        with _active_workers_lock:
+            _active_workers.add(self)
+        scan_pool().start(self._runnable)
+
+    def run(self):
+        result = []
+        try:
+            result = self.createModel()
+        except ScanCancelled:
+            return
+        except:
+            print ('exceptions in {}.run():'.format(self.__class__.__name__))
+            print (traceback.print_exc())
+
+        if not self.killed:
+            self.update.emit(result)
+
+    def createModel(self):
+        raise NotImplementedError
+
+    def check_cancelled(self):
+        if self.cancel_token.cancelled:
+            raise ScanCancelled()
+
+    def set_percent(self, value):
+        value = int(value or 0)
+        if value != self._last_percent:
+            self._last_percent = value
+            self.percent.emit(value)
+
+    def kill(self):
+        try:
+            self.update.disconnect()
+            self.percent.disconnect()
+        except:
+            pass
+        self.cancel_token.cancel()